@@ -5,6 +5,7 @@ from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import font as tkfont
 import os
 import json
+import multiprocessing
 import threading
 import queue
 import re
@@ -15,7 +16,6 @@ import logging
 import webbrowser
 from datetime import datetime
 from collections import deque
-from urllib.parse import urlparse
 import psutil  # 메모리 사용량 모니터링용
 import shutil
 from pathlib import Path
@@ -38,12 +38,30 @@ except ImportError:
 # backend_processor 임포트
 try:
     # Docs 기록 기능 버전의 backend_processor 임포트
-    from src.auto_write_txt_to_docs.backend_processor import run_monitoring
+    from src.auto_write_txt_to_docs.backend_processor import (
+        MonitoringStopEvent,
+        get_backend_diagnostics,
+        run_monitoring,
+    )
 except ImportError:
     # ⚠️ 수정: 모듈 레벨에서 root 없이 messagebox 호출하면 불안정 → logging으로 교체
     logging.error("백엔드 처리 모듈(backend_processor.py)을 찾을 수 없습니다.")
+    MonitoringStopEvent = threading.Event
+    get_backend_diagnostics = None
     run_monitoring = None  # 함수 부재 처리
 
+try:
+    from src.auto_write_txt_to_docs.async_engine import select_monitoring_engine
+except ImportError:
+    logging.error("asyncio 감시 엔진 모듈(async_engine.py)을 찾을 수 없습니다.")
+    select_monitoring_engine = None
+
+try:
+    from src.auto_write_txt_to_docs.backend_process import BackendProcessSupervisor
+except ImportError:
+    logging.error("백엔드 프로세스 모듈(backend_process.py)을 찾을 수 없습니다.")
+    BackendProcessSupervisor = None
+
 try:
     from src.auto_write_txt_to_docs.google_auth import (
         GoogleAuthActionRequired,
@@ -71,6 +89,7 @@ try:
         USER_CREDENTIALS_FILE_STR,
         LEGACY_CONFIG_FILE_STR,
         LOG_DIR_STR,
+        PROCESSED_STATE_FILE_STR,
         get_effective_credentials_path,
     )
 except ImportError:
@@ -81,10 +100,12 @@ except ImportError:
     USER_CREDENTIALS_FILE_STR = "developer_credentials.json"
     LEGACY_CONFIG_FILE_STR = "config.json"
     LOG_DIR_STR = "logs"
+    PROCESSED_STATE_FILE_STR = "processed_state.json"
     get_effective_credentials_path = None
 
 try:
     from src.auto_write_txt_to_docs.config_manager import (
+        ADVANCED_CONFIG_KEYS,
         load_app_config,
         load_backup_config,
         normalize_config_data,
@@ -93,6 +114,7 @@ try:
     )
 except ImportError:
     logging.error("설정 관리 모듈(config_manager.py)을 찾을 수 없습니다.")
+    ADVANCED_CONFIG_KEYS = ()
     load_app_config = None
     load_backup_config = None
     normalize_config_data = None
@@ -118,12 +140,197 @@ except ImportError:
     center_window = None
     show_backup_restore_dialog = None
 
+try:
+    from src.auto_write_txt_to_docs.notification_aggregator import NotificationAggregator, SoundRateLimiter
+except ImportError:
+    logging.error("알림 묶음 모듈(notification_aggregator.py)을 찾을 수 없습니다.")
+    NotificationAggregator = None
+    SoundRateLimiter = None
+
 try:
     from src.auto_write_txt_to_docs.result_popup import ResultPopupPresenter
 except ImportError:
     logging.error("작업 결과 팝업 모듈(result_popup.py)을 찾을 수 없습니다.")
     ResultPopupPresenter = None
 
+try:
+    from src.auto_write_txt_to_docs.log_buffer import (
+        LOG_FRAME_INTERVAL_MS,
+        DropOldestLogQueue,
+        LogRenderBuffer,
+        apply_log_frame,
+        trim_text_widget_lines,
+    )
+except ImportError:
+    logging.error("로그 표시 버퍼 모듈(log_buffer.py)을 찾을 수 없습니다.")
+    LOG_FRAME_INTERVAL_MS = 16
+    DropOldestLogQueue = None
+    LogRenderBuffer = None
+    apply_log_frame = None
+    trim_text_widget_lines = None
+
+try:
+    from src.auto_write_txt_to_docs.logging_pipeline import (
+        APP_LOGGER_NAME,
+        BACKEND_LOGGER_NAME,
+        apply_log_levels,
+        configure_logger,
+    )
+except ImportError:
+    logging.error("로깅 파이프라인 모듈(logging_pipeline.py)을 찾을 수 없습니다.")
+    APP_LOGGER_NAME = 'MessengerDocsApp'
+    BACKEND_LOGGER_NAME = 'backend_processor'
+    apply_log_levels = None
+    configure_logger = None
+
+try:
+    from src.auto_write_txt_to_docs.log_viewer import (
+        LogHistory,
+        LogViewport,
+        start_log_search,
+    )
+except ImportError:
+    logging.error("로그 기록 뷰어 모듈(log_viewer.py)을 찾을 수 없습니다.")
+    LogHistory = None
+    LogViewport = None
+    start_log_search = None
+
+try:
+    from src.auto_write_txt_to_docs.result_cards import ResultCardPool, prepend_preview_block
+except ImportError:
+    logging.error("결과 카드 모듈(result_cards.py)을 찾을 수 없습니다.")
+    ResultCardPool = None
+    prepend_preview_block = None
+
+try:
+    from src.auto_write_txt_to_docs.gui_wakeup import GuiWakeupDispatcher
+except ImportError:
+    logging.error("GUI 깨우기 모듈(gui_wakeup.py)을 찾을 수 없습니다.")
+    GuiWakeupDispatcher = None
+
+try:
+    from src.auto_write_txt_to_docs.latency_tracing import (
+        format_latency_report,
+        format_latency_summary,
+        latency_tracker,
+    )
+except ImportError:
+    logging.error("지연 추적 모듈(latency_tracing.py)을 찾을 수 없습니다.")
+    format_latency_report = None
+    format_latency_summary = None
+    latency_tracker = None
+
+try:
+    from src.auto_write_txt_to_docs.metrics import (
+        GUI_WAKEUPS_TOTAL,
+        LOG_QUEUE_DROPPED_TOTAL,
+        PROCESS_MEMORY_RSS_BYTES,
+        MetricsSummaryView,
+        MetricsTextfileExporter,
+        format_metrics_summary,
+        get_metrics_textfile_path,
+        metrics_registry,
+    )
+except ImportError:
+    logging.error("운영 지표 모듈(metrics.py)을 찾을 수 없습니다.")
+    MetricsSummaryView = None
+    MetricsTextfileExporter = None
+    format_metrics_summary = None
+    get_metrics_textfile_path = None
+    metrics_registry = None
+
+try:
+    from src.auto_write_txt_to_docs.monitoring_config import (
+        ENGINE_ADVANCED_CONFIG_KEYS,
+        extract_google_id_from_url,
+        validate_regex_pattern_input,
+    )
+except ImportError:
+    logging.error("감시 설정 모듈(monitoring_config.py)을 찾을 수 없습니다.")
+    ENGINE_ADVANCED_CONFIG_KEYS = ()
+    extract_google_id_from_url = None
+    validate_regex_pattern_input = None
+
+try:
+    from src.auto_write_txt_to_docs.memory_budget import (
+        format_memory_budget_report,
+        format_memory_budget_status,
+        format_memory_eviction,
+        memory_budget,
+    )
+except ImportError:
+    logging.error("메모리 예산 모듈(memory_budget.py)을 찾을 수 없습니다.")
+    memory_budget = None
+
+try:
+    from src.auto_write_txt_to_docs.diagnostics import (
+        build_diagnostics_bundle,
+        collect_memory_report,
+        describe_file_sizes,
+        format_thread_dump,
+        read_log_tails,
+    )
+except ImportError:
+    logging.error("진단 묶음 모듈(diagnostics.py)을 찾을 수 없습니다.")
+    build_diagnostics_bundle = None
+
+try:
+    from src.auto_write_txt_to_docs.profiling import (
+        DEFAULT_PROFILE_SECONDS,
+        ProfilingError,
+        capture_sampling_profile,
+        capture_thread_cprofile,
+        monitoring_profile_hook,
+    )
+except ImportError:
+    logging.error("성능 프로파일 모듈(profiling.py)을 찾을 수 없습니다.")
+    DEFAULT_PROFILE_SECONDS = 30
+    ProfilingError = RuntimeError
+    capture_sampling_profile = None
+    capture_thread_cprofile = None
+    monitoring_profile_hook = None
+
+try:
+    from src.auto_write_txt_to_docs.timeseries_store import (
+        TimeSeriesStore,
+        format_sparkline_report,
+        get_default_timeseries_path,
+    )
+except ImportError:
+    logging.error("처리량 시계열 모듈(timeseries_store.py)을 찾을 수 없습니다.")
+    TimeSeriesStore = None
+    format_sparkline_report = None
+    get_default_timeseries_path = None
+
+try:
+    from src.auto_write_txt_to_docs.history_index import (
+        DEFAULT_MAX_LINES as DEFAULT_HISTORY_MAX_LINES,
+        DEFAULT_RETENTION_DAYS as DEFAULT_HISTORY_RETENTION_DAYS,
+        HISTORY_INDEX_FILE_NAME,
+        compact_history_database,
+        format_history_search_match,
+        search_history,
+    )
+except ImportError:
+    logging.error("기록 색인 모듈(history_index.py)을 찾을 수 없습니다.")
+    DEFAULT_HISTORY_MAX_LINES = None
+    DEFAULT_HISTORY_RETENTION_DAYS = None
+    HISTORY_INDEX_FILE_NAME = "history_index.sqlite3"
+    compact_history_database = None
+    format_history_search_match = None
+    search_history = None
+
+try:
+    from src.auto_write_txt_to_docs.dedupe_filter import (
+        DEDUPE_FILTER_DIR_NAME,
+        format_dedupe_filter_status,
+        get_dedupe_filter_dir,
+        read_dedupe_filter_status,
+    )
+except ImportError:
+    logging.error("장기 중복 필터 모듈(dedupe_filter.py)을 찾을 수 없습니다.")
+    read_dedupe_filter_status = None
+
 try:
     from src.auto_write_txt_to_docs.main_window_ui import build_main_window_ui
 except ImportError:
@@ -146,11 +353,13 @@ except ImportError:
 
 try:
     from src.auto_write_txt_to_docs.update_checker import (
+        CURRENT_VERSION,
         REPOSITORY_RELEASES_URL,
         check_for_new_release,
     )
 except ImportError:
     logging.error("업데이트 확인 모듈(update_checker.py)을 찾을 수 없습니다.")
+    CURRENT_VERSION = "unknown"
     REPOSITORY_RELEASES_URL = "https://github.com/122yjs/auto_write_txt_to_docs/releases"
     check_for_new_release = None
 
@@ -168,66 +377,17 @@ else:
 
 NOTIFICATION_TITLE = "메신저 Docs 자동 기록"
 MAX_NOTIFICATION_PREVIEW_LINES = 2
-FAILURE_NOTIFICATION_DEBOUNCE_SECONDS = 2.0
+NOTIFICATION_DEBOUNCE_SECONDS = 2.0
+FAILURE_NOTIFICATION_DEBOUNCE_SECONDS = NOTIFICATION_DEBOUNCE_SECONDS
 RECENT_RESULT_CARD_LIMIT = 3
+LOG_QUEUE_MAX_SIZE = 20000
+LOG_QUEUE_DRAIN_LIMIT = 500
+MEMORY_CHECK_HIDDEN_INTERVAL_MS = 60000
+GUI_LOG_MEMORY_SHARE = 0.15  # 나머지 0.85는 백엔드 캐시 몫 (backend_processor 참고)
+BACKEND_PROCESS_STOP_TIMEOUT_SECONDS = 10.0  # 별도 프로세스 백엔드가 상태를 저장하고 끝낼 때까지 기다리는 시간
+LOG_VIEWER_POLL_INTERVAL_MS = 250
 ACTIVITY_RESULT_TAB = "최근 추출 결과"
 ACTIVITY_LOG_TAB = "작업 로그"
-GOOGLE_DOC_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{20,}$")
-
-# --- Helper Function: URL에서 ID 추출 ---
-def extract_google_id_from_url(url_or_id):
-    """엄격한 규칙으로 Google Docs URL 또는 문서 ID를 파싱한다."""
-    if not url_or_id or not isinstance(url_or_id, str):
-        return None
-
-    candidate = url_or_id.strip()
-    if not candidate:
-        return None
-
-    if GOOGLE_DOC_ID_PATTERN.fullmatch(candidate):
-        return candidate
-
-    normalized_candidate = candidate
-    if "://" not in normalized_candidate and normalized_candidate.lower().startswith("docs.google.com/"):
-        normalized_candidate = f"https://{normalized_candidate}"
-
-    try:
-        parsed = urlparse(normalized_candidate)
-    except ValueError:
-        return None
-
-    if parsed.scheme and parsed.scheme not in ("http", "https"):
-        return None
-
-    if parsed.netloc.lower() not in {"docs.google.com", "www.docs.google.com"}:
-        return None
-
-    path_parts = [part for part in parsed.path.split("/") if part]
-    if len(path_parts) < 3 or path_parts[0] != "document" or path_parts[1] != "d":
-        return None
-
-    docs_id = path_parts[2].strip()
-    if not GOOGLE_DOC_ID_PATTERN.fullmatch(docs_id):
-        return None
-
-    return docs_id
-
-
-def validate_regex_pattern_input(use_regex_filter, regex_pattern):
-    """정규식 필터 설정의 유효성을 검사하고 오류 메시지를 반환한다."""
-    if not use_regex_filter:
-        return None
-
-    normalized_pattern = (regex_pattern or "").strip()
-    if not normalized_pattern:
-        return "정규식 필터를 사용할 때는 패턴을 입력해주세요."
-
-    try:
-        re.compile(normalized_pattern)
-    except re.error as error:
-        return f"정규식 패턴이 올바르지 않습니다: {error}"
-
-    return None
 
 
 def format_google_modified_time(modified_time_text):
@@ -276,6 +436,17 @@ def extract_docs_update_line_count(message):
         return None
 
 
+def extract_docs_upload_progress(message):
+    """분할 기록 로그에서 (완료한 조각 수, 전체 조각 수)를 추출한다."""
+    if not isinstance(message, str):
+        return None
+
+    match = re.search(r'분할 기록 (\d+)/(\d+)조각 완료', message)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
 def extract_filename_from_log_message(message):
     """백엔드 로그 메시지에서 파일명을 추출한다."""
     if not isinstance(message, str):
@@ -357,20 +528,20 @@ def build_error_notification_summary(error_type, raw_message):
     return first_line
 
 
-def build_failure_notification_signature(filename=None, error_summary=None):
-    """동일 실패 알림 중복 억제용 시그니처를 생성한다."""
+def build_notification_signature(event_type, filename=None, error_summary=None):
+    """동일 알림 중복 억제용 시그니처를 생성한다."""
     normalized_filename = (filename or "").strip()
     normalized_summary = (error_summary or "").strip()
-    return f"{normalized_filename}|{normalized_summary}"
+    return f"{event_type}|{normalized_filename}|{normalized_summary}"
 
 
-def should_emit_debounced_failure_notification(
+def should_emit_debounced_notification(
     signature,
-    recent_failures,
+    recent_notifications,
     current_time=None,
-    debounce_seconds=FAILURE_NOTIFICATION_DEBOUNCE_SECONDS,
+    debounce_seconds=NOTIFICATION_DEBOUNCE_SECONDS,
 ):
-    """같은 실패 알림이 짧은 시간 안에 반복되면 억제한다."""
+    """같은 알림이 짧은 시간 안에 반복되면 억제한다."""
     if not signature:
         return True
 
@@ -379,20 +550,28 @@ def should_emit_debounced_failure_notification(
 
     expired_signatures = [
         key
-        for key, recorded_time in recent_failures.items()
+        for key, recorded_time in recent_notifications.items()
         if current_time - recorded_time >= debounce_seconds
     ]
     for key in expired_signatures:
-        recent_failures.pop(key, None)
+        recent_notifications.pop(key, None)
 
-    last_recorded_time = recent_failures.get(signature)
+    last_recorded_time = recent_notifications.get(signature)
     if last_recorded_time is not None and current_time - last_recorded_time < debounce_seconds:
         return False
 
-    recent_failures[signature] = current_time
+    recent_notifications[signature] = current_time
     return True
 
 
+def build_aggregated_notification(summary):
+    """묶음 창 동안 모인 작업 결과를 요약 알림 제목과 본문으로 만든다."""
+    message_lines = [f"최근 작업 {summary.describe()}"]
+    if summary.failure_count:
+        message_lines.append("실패한 항목은 작업 로그에서 확인하세요.")
+    return NOTIFICATION_TITLE, "\n".join(message_lines)
+
+
 def build_work_result_notification(
     event_type,
     filename=None,
@@ -474,6 +653,8 @@ class MessengerDocsApp:
         # 메모리 모니터링 관련 변수
         self.memory_usage = ctk.StringVar(value="메모리: 확인 중...")
         self.memory_check_interval = 10000  # 10초마다 메모리 사용량 확인
+        self.latency_summary = ctk.StringVar(value="처리 지연: 측정 전")
+        self.metrics_summary = ctk.StringVar(value="처리량 - · API - · 큐 0 · 캐시 적중 -")
 
         # --- 변수 선언 ---
         self.first_run = tk.BooleanVar(value=True)
@@ -507,11 +688,30 @@ class MessengerDocsApp:
 
         self.is_monitoring = False
         self.monitoring_thread = None
-        self.stop_event = threading.Event()
-        self.log_queue = queue.Queue()
+        self.backend_supervisor = None
+        self.stop_event = MonitoringStopEvent()
+        if DropOldestLogQueue:
+            self.log_queue = DropOldestLogQueue(LOG_QUEUE_MAX_SIZE)
+        else:
+            self.log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
         self.result_queue = queue.Queue()
         self.log_popup_window = None
         self.log_popup_text = None
+        self.advanced_config_data = {}
+        self.log_history = None
+        self.log_viewport = None
+        self.log_viewer_queue = queue.Queue()
+        self.log_search_cancel_event = None
+        self.log_popup_widgets = {}
+        self.log_render_buffer = LogRenderBuffer() if LogRenderBuffer else None
+        if memory_budget is not None and self.log_render_buffer is not None:
+            memory_budget.register(
+                "gui_log", "화면 로그", GUI_LOG_MEMORY_SHARE,
+                self.log_render_buffer.estimate_bytes, self.evict_log_display_lines, group="gui",
+            )
+        self.log_flush_after_id = None
+        self.dropped_log_queue_messages = 0
+        self.reported_log_queue_drops = 0
 
         self.tray_icon = None
         self.tray_thread = None
@@ -531,7 +731,10 @@ class MessengerDocsApp:
         }
         self.current_activity_tab = ACTIVITY_RESULT_TAB
         self.recent_results = deque(maxlen=RECENT_RESULT_CARD_LIMIT)
-        self.recent_failure_notifications = {}
+        self.recent_notification_signatures = {}
+        self.notification_aggregator = NotificationAggregator() if NotificationAggregator else None
+        self.notification_flush_after_id = None
+        self.sound_rate_limiter = SoundRateLimiter() if SoundRateLimiter else None
         self.latest_release_info = None
         self._update_check_in_progress = False
         self.google_auth_operation_in_progress = False
@@ -572,9 +775,20 @@ class MessengerDocsApp:
         self.update_readiness_ui()
         self.root.after(50, self.present_main_window)
 
-        # --- 로그 큐 처리 ---
-        self.root.after(100, self.process_log_queue)
-        self.root.after(100, self.process_result_queue)
+        # --- 로그/결과 큐 처리: 백엔드가 큐에 넣을 때만 GUI 스레드를 깨운다 ---
+        if GuiWakeupDispatcher:
+            self.gui_wakeup_dispatcher = GuiWakeupDispatcher(
+                self.root,
+                (self.process_log_queue, self.process_result_queue),
+            )
+            self.gui_wakeup_dispatcher.start()
+        else:
+            self.gui_wakeup_dispatcher = None
+            self.root.after(100, self.process_log_queue)
+            self.root.after(100, self.process_result_queue)
+
+        # --- 운영 지표: 상태 패널 요약과 node exporter용 textfile ---
+        self.start_metrics_export()
         
         # --- 메모리 사용량 모니터링 시작 ---
         self.root.after(1000, self.check_memory_usage)
@@ -894,59 +1108,30 @@ class MessengerDocsApp:
         self.icon_image = self.build_tray_status_icon("ready") or self.base_icon_image
     
     def setup_logging(self):
-        """로깅 시스템 설정"""
+        """로깅 시스템 설정 (파일 쓰기는 비동기 로깅 파이프라인의 리스너 스레드가 담당)"""
         try:
-            # 공통 경로 정책(path_utils)의 로그 디렉토리 사용
-            log_dir = LOG_DIR_STR
-            if not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-                print(f"로그 디렉토리 생성: {log_dir}")
-            
-            # 로그 파일명 (날짜별)
-            log_filename = os.path.join(log_dir, f"messenger_docs_{datetime.now().strftime('%Y%m%d')}.log")
-            print(f"로그 파일 경로: {log_filename}")
-            
-            # 기존 로거 완전 초기화
-            logger_name = 'MessengerDocsApp'
-            if logger_name in logging.Logger.manager.loggerDict:
-                del logging.Logger.manager.loggerDict[logger_name]
-            
-            # 새로운 로거 생성
-            self.logger = logging.getLogger(logger_name)
-            self.logger.setLevel(logging.INFO)
-            self.logger.handlers.clear()  # 모든 핸들러 제거
-            
-            # 파일 핸들러 생성 (mode='a'로 추가 모드 사용)
-            file_handler = logging.FileHandler(log_filename, mode='a', encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            
-            # 포맷터 설정
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
-            
-            # 핸들러 추가
-            self.logger.addHandler(file_handler)
-            
-            # 로깅 시작 메시지 (즉시 기록)
-            self.logger.info("애플리케이션 시작 - 로깅 시스템 초기화 완료")
-            
-            # 강제 flush
-            file_handler.flush()
-            
-            print("로깅 시스템 초기화 완료")
-            
-            # 로그 파일 내용 확인
-            if os.path.exists(log_filename):
-                file_size = os.path.getsize(log_filename)
-                print(f"로그 파일 생성 확인: {log_filename} (크기: {file_size} bytes)")
+            if configure_logger:
+                # 앱/백엔드 로거를 같은 파이프라인에 연결하고 날짜·크기 기준으로 파일을 넘긴다.
+                self.logger = configure_logger(APP_LOGGER_NAME, LOG_DIR_STR)
+                configure_logger(BACKEND_LOGGER_NAME, LOG_DIR_STR)
             else:
-                print(f"로그 파일 생성 실패: {log_filename}")
-            
+                # 공통 경로 정책(path_utils)의 로그 디렉토리 사용
+                os.makedirs(LOG_DIR_STR, exist_ok=True)
+                log_filename = os.path.join(LOG_DIR_STR, f"messenger_docs_{datetime.now().strftime('%Y%m%d')}.log")
+                self.logger = logging.getLogger('MessengerDocsApp')
+                self.logger.setLevel(logging.INFO)
+                self.logger.handlers.clear()
+                file_handler = logging.FileHandler(log_filename, mode='a', encoding='utf-8')
+                file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+                self.logger.addHandler(file_handler)
+
+            self.logger.info("애플리케이션 시작 - 로깅 시스템 초기화 완료")
+            print(f"로깅 시스템 초기화 완료: {LOG_DIR_STR}")
         except Exception as e:
             print(f"로깅 설정 중 오류 발생: {e}")
             import traceback
             traceback.print_exc()
-    
+
     def on_setting_changed(self, *args):
         """설정 변경 감지 및 상태 표시 업데이트"""
         self.settings_changed = True
@@ -1100,6 +1285,9 @@ class MessengerDocsApp:
         pending_line_count = getattr(self, "pending_docs_update_line_count", None)
         if pending_line_count:
             current_file = f"{current_file} · {pending_line_count}줄 기록 준비"
+        upload_progress = getattr(self, "docs_upload_progress", None)
+        if upload_progress:
+            current_file = f"{current_file} · {upload_progress[0]}/{upload_progress[1]}조각 기록됨"
         if hasattr(self, "current_activity_var"):
             self.current_activity_var.set(f"현재 처리 파일: {current_file}")
 
@@ -2255,6 +2443,8 @@ class MessengerDocsApp:
             state_vars={
                 "status_var": self.status_var,
                 "memory_usage": self.memory_usage,
+                "latency_summary": self.latency_summary,
+                "metrics_summary": self.metrics_summary,
                 "watch_folder": self.watch_folder,
                 "watch_folder_drop_hint": self.watch_folder_drop_hint,
                 "launch_on_windows_startup": self.launch_on_windows_startup,
@@ -2415,6 +2605,14 @@ class MessengerDocsApp:
             pystray.MenuItem('감시 일시 정지/재개', self.toggle_monitoring_from_tray),
             pystray.MenuItem('Docs 웹에서 열기', self.open_docs_in_browser_from_tray),
             pystray.MenuItem('로그 보기', self.show_log_popup_from_tray),
+            pystray.MenuItem(
+                '성능 프로파일 캡처',
+                pystray.Menu(
+                    pystray.MenuItem('샘플링 (모든 스레드)', self.capture_sampling_profile_from_tray),
+                    pystray.MenuItem('cProfile (감시 스레드)', self.capture_cprofile_from_tray),
+                ),
+            ),
+            pystray.MenuItem('진단 정보 묶음 만들기', self.create_diagnostics_bundle_from_tray),
             pystray.MenuItem('종료', self.exit_application),
         )
 
@@ -2483,7 +2681,7 @@ class MessengerDocsApp:
             return False
 
     def play_event_sound(self, event_type):
-        """작업 결과 유형에 맞는 시스템 효과음을 재생한다."""
+        """작업 결과 유형에 맞는 시스템 효과음을 재생한다. (연속 재생은 간격을 두고 제한)"""
         if not self.play_event_sounds.get():
             return
 
@@ -2501,6 +2699,10 @@ class MessengerDocsApp:
         if sound_type is None:
             return
 
+        sound_rate_limiter = getattr(self, "sound_rate_limiter", None)
+        if sound_rate_limiter is not None and not sound_rate_limiter.allow():
+            return
+
         try:
             winsound.MessageBeep(sound_type)
         except Exception as exc:
@@ -2514,7 +2716,10 @@ class MessengerDocsApp:
         preview_text="",
         error_summary=None,
     ):
-        """백그라운드 작업 결과를 화면 팝업, 트레이 알림, 효과음으로 전달한다."""
+        """백그라운드 작업 결과를 화면 팝업, 트레이 알림, 효과음으로 전달한다.
+
+        묶음 창 안에 이어지는 이벤트는 바로 알리지 않고 요약 알림 하나로 합친다.
+        """
         notification_title, notification_message = build_work_result_notification(
             event_type,
             filename=filename,
@@ -2525,16 +2730,25 @@ class MessengerDocsApp:
         if not notification_message:
             return False
 
-        if event_type == "failure":
-            failure_signature = build_failure_notification_signature(filename, error_summary)
-            should_emit = should_emit_debounced_failure_notification(
-                failure_signature,
-                self.recent_failure_notifications,
-            )
-            if not should_emit:
-                self.log(f"동일 실패 알림 억제: {failure_signature}")
+        notification_aggregator = getattr(self, "notification_aggregator", None)
+        if notification_aggregator is not None:
+            if not notification_aggregator.admit(event_type, line_count=line_count):
                 return False
+            self.schedule_notification_summary()
 
+        notification_signature = build_notification_signature(event_type, filename, error_summary)
+        should_emit = should_emit_debounced_notification(
+            notification_signature,
+            self.recent_notification_signatures,
+        )
+        if not should_emit:
+            self.log(f"동일 알림 억제: {notification_signature}")
+            return False
+
+        return self.deliver_notification(notification_title, notification_message, event_type)
+
+    def deliver_notification(self, notification_title, notification_message, event_type):
+        """알림 한 건을 화면 팝업, 트레이, 효과음으로 내보낸다."""
         notification_sent = False
         if self.show_success_notifications.get():
             try:
@@ -2551,6 +2765,36 @@ class MessengerDocsApp:
         self.play_event_sound(event_type)
         return notification_sent or (self.play_event_sounds.get() and winsound is not None)
 
+    def schedule_notification_summary(self):
+        """묶음 창이 열려 있으면 창이 끝날 때 요약 알림을 한 번 예약한다."""
+        notification_aggregator = getattr(self, "notification_aggregator", None)
+        if notification_aggregator is None or not notification_aggregator.window_open:
+            return
+        if self.notification_flush_after_id is not None:
+            return
+        if not (hasattr(self, "root") and self.root.winfo_exists()):
+            return
+        self.notification_flush_after_id = self.root.after(
+            int(notification_aggregator.window_seconds * 1000),
+            self.flush_notification_summary,
+        )
+
+    def flush_notification_summary(self):
+        """묶음 창 동안 모인 이벤트를 요약 알림 하나로 보내고, 있었으면 창을 한 번 더 연다."""
+        self.notification_flush_after_id = None
+        notification_aggregator = getattr(self, "notification_aggregator", None)
+        if notification_aggregator is None:
+            return
+
+        summary = notification_aggregator.flush()
+        if summary is None:
+            return
+
+        summary_title, summary_message = build_aggregated_notification(summary)
+        self.log(f"알림 요약: {summary.describe()}")
+        self.deliver_notification(summary_title, summary_message, summary.event_type)
+        self.schedule_notification_summary()
+
     def toggle_monitoring_from_tray(self, *args):
         """트레이 메뉴에서 감시를 일시 정지하거나 재개한다."""
         if not hasattr(self, "root") or not self.root.winfo_exists():
@@ -2572,6 +2816,21 @@ class MessengerDocsApp:
         self.root.after(0, self.show_window)
         self.root.after(0, self.show_log_popup)
 
+    def capture_sampling_profile_from_tray(self, *args):
+        """트레이 메뉴에서 샘플링 프로파일 캡처를 시작한다."""
+        if hasattr(self, "root") and self.root.winfo_exists():
+            self.root.after(0, lambda: self.capture_performance_profile("sampling"))
+
+    def capture_cprofile_from_tray(self, *args):
+        """트레이 메뉴에서 감시 스레드 cProfile 캡처를 시작한다."""
+        if hasattr(self, "root") and self.root.winfo_exists():
+            self.root.after(0, lambda: self.capture_performance_profile("cprofile"))
+
+    def create_diagnostics_bundle_from_tray(self, *args):
+        """트레이 메뉴에서 진단 정보 묶음 만들기를 시작한다."""
+        if hasattr(self, "root") and self.root.winfo_exists():
+            self.root.after(0, self.create_diagnostics_bundle)
+
     def hide_window(self): # X 버튼 클릭 시 호출됨
         """ 메인 창 숨기기 """
         if not self.tray_icon:
@@ -2598,7 +2857,7 @@ class MessengerDocsApp:
 
         if getattr(self, "result_popup_presenter", None):
             try:
-                self.result_popup_presenter.close()
+                self.result_popup_presenter.destroy()
             except Exception as exc:
                 self.log(f"작업 결과 팝업 종료 중 오류: {exc}")
         
@@ -2610,8 +2869,14 @@ class MessengerDocsApp:
             except Exception as e:
                 self.log(f"트레이 아이콘 중지 중 오류: {e}") # 오류 발생해도 계속 진행
 
-        # 2. 감시 스레드 중지 요청 및 대기
-        if self.is_monitoring:
+        # 2. 감시 스레드(또는 백엔드 프로세스) 중지 요청 및 대기
+        supervisor = getattr(self, "backend_supervisor", None)
+        if supervisor is not None:
+            self.log("백엔드 프로세스 중지 시도...")
+            if not supervisor.stop(BACKEND_PROCESS_STOP_TIMEOUT_SECONDS):
+                self.log("경고: 백엔드 프로세스가 시간 내에 종료되지 않아 강제로 종료했습니다.")
+            self.backend_supervisor = None
+        elif self.is_monitoring:
             self.log("감시 스레드 중지 시도...")
             self.stop_event.set()
             if self.monitoring_thread and self.monitoring_thread.is_alive():
@@ -2633,6 +2898,10 @@ class MessengerDocsApp:
                 self.log(f"종료 시 설정 저장 실패: {e}")
         
         # 4. 메인 창 종료 (모든 백그라운드 작업 정리 후)
+        if getattr(self, "gui_wakeup_dispatcher", None) is not None:
+            self.gui_wakeup_dispatcher.stop()
+        if getattr(self, "metrics_exporter", None) is not None:
+            self.metrics_exporter.stop()
         self.log("메인 창 종료 시도...")
         # root.after를 사용하여 메인 루프에서 안전하게 destroy 호출 시도
         if hasattr(self, 'root') and self.root:
@@ -2659,42 +2928,201 @@ class MessengerDocsApp:
     def close_log_popup(self):
         """별도 로그 팝업 창을 닫고 참조를 정리한다."""
         popup_window = self.log_popup_window
+        self.cancel_log_history_search()
         self.log_popup_text = None
         self.log_popup_window = None
+        self.log_popup_widgets = {}
 
         if popup_window and popup_window.winfo_exists():
             popup_window.destroy()
 
-    def sync_log_popup_content(self):
-        """메인 로그 내용을 로그 팝업 창과 동기화한다."""
-        if not (
+    def is_log_popup_open(self):
+        """로그 팝업 창이 열려 있는지 확인한다."""
+        return bool(
             self.log_popup_window
             and self.log_popup_window.winfo_exists()
             and self.log_popup_text
-            and self.root.winfo_exists()
-            and hasattr(self, "log_text")
-        ):
+        )
+
+    def sync_log_popup_content(self):
+        """로그 팝업 창에 디스크 로그 기록의 현재 보이는 구간을 그린다."""
+        if not (self.is_log_popup_open() and self.root.winfo_exists()):
             return
 
         try:
-            log_content = self.log_text.get("1.0", ctk.END)
-            self.render_log_lines(self.log_popup_text, log_content.splitlines())
+            if self.log_viewport is not None:
+                self.render_log_popup_window()
+                return
+            log_buffer = getattr(self, "log_render_buffer", None)
+            if log_buffer is not None:
+                self.flush_log_widgets()
+                self.render_log_lines(self.log_popup_text, log_buffer.snapshot_lines())
         except Exception:
             pass
 
-    def show_log_popup(self):
-        """작업 로그를 별도 창으로 분리해 표시한다."""
-        if self.log_popup_window and self.log_popup_window.winfo_exists():
+    def render_log_popup_window(self, highlight_line=None):
+        """보이는 구간의 줄만 읽어 팝업 텍스트를 다시 그린다."""
+        viewport = self.log_viewport
+        lines = viewport.visible_lines()
+        self.render_log_lines(self.log_popup_text, lines)
+        if highlight_line is not None and viewport.first_line <= highlight_line < viewport.first_line + len(lines):
+            text_line = highlight_line - viewport.first_line + 1
+            self.log_popup_text.tag_add("search", f"{text_line}.0", f"{text_line}.end")
+            self.log_popup_text.see(f"{text_line}.0")
+        elif not viewport.follow_tail:
+            self.log_popup_text.see("1.0")
+        self.update_log_popup_position_widgets()
+
+    def update_log_popup_position_widgets(self):
+        """팝업의 위치 표시(슬라이더, 줄 범위)를 현재 구간에 맞춘다."""
+        viewport = self.log_viewport
+        total_lines = self.log_history.line_count()
+        position_slider = self.log_popup_widgets.get("position_slider")
+        position_label = self.log_popup_widgets.get("position_label")
+        if position_slider is not None:
+            max_first_line = viewport.max_first_line()
+            # 세로 슬라이더는 아래쪽이 from_ 값이므로 맨 위가 0번째 줄이 되도록 뒤집어 둔다.
+            position_slider.configure(from_=max(1, max_first_line), to=0)
+            position_slider.set(viewport.first_line)
+        if position_label is not None:
+            last_line = min(total_lines, viewport.first_line + viewport.window_lines)
+            follow_text = " · 최신 로그 따라가는 중" if viewport.follow_tail else ""
+            position_label.configure(
+                text=f"{viewport.first_line + 1 if total_lines else 0:,}-{last_line:,} / 전체 {total_lines:,}줄{follow_text}"
+            )
+
+    def scroll_log_popup(self, line_delta=None, first_line=None):
+        """팝업의 보이는 구간을 옮기고 다시 그린다."""
+        if not (self.is_log_popup_open() and self.log_viewport is not None):
+            return
+        if first_line is not None:
+            self.log_viewport.scroll_to(first_line)
+        else:
+            self.log_viewport.scroll_by(line_delta or 0)
+        self.render_log_popup_window()
+
+    def poll_log_viewer_queue(self):
+        """색인/검색 스레드가 보낸 결과를 반영하고 새로 추가된 로그를 확인한다."""
+        if not self.is_log_popup_open():
+            return
+
+        try:
+            while True:
+                event_type, payload = self.log_viewer_queue.get_nowait()
+                if event_type == "indexed":
+                    self.log_popup_widgets["indexed"] = True
+                    self.set_log_popup_status(f"로그 기록 색인 완료: {self.log_history.line_count():,}줄")
+                    self.render_log_popup_window()
+                elif event_type == "search_batch":
+                    self.append_log_search_results(payload)
+                elif event_type == "search_done":
+                    total_count, error_message = payload
+                    if error_message:
+                        self.set_log_popup_status(f"검색 실패: {error_message}")
+                    else:
+                        self.set_log_popup_status(f"검색 완료: {total_count:,}건")
+        except queue.Empty:
+            pass
+
+        # 첫 색인이 끝난 뒤에는 파일 핸들러가 기록한 새 줄만 마지막 색인 위치 이후에서 읽어 반영한다.
+        if self.log_popup_widgets.get("indexed") and self.log_history.refresh() and self.log_viewport.follow_tail:
+            self.render_log_popup_window()
+
+        self.root.after(LOG_VIEWER_POLL_INTERVAL_MS, self.poll_log_viewer_queue)
+
+    def set_log_popup_status(self, text):
+        status_label = self.log_popup_widgets.get("status_label")
+        if status_label is not None:
+            status_label.configure(text=text)
+
+    def cancel_log_history_search(self):
+        """진행 중인 전체 기록 검색을 멈춘다."""
+        if self.log_search_cancel_event is not None:
+            self.log_search_cancel_event.set()
+            self.log_search_cancel_event = None
+
+    def start_log_history_search(self):
+        """팝업 검색어로 전체 로그 기록을 백그라운드에서 검색한다."""
+        if not (self.is_log_popup_open() and start_log_search):
+            return
+        query = self.log_popup_widgets["search_var"].get()
+        if not query:
+            self.set_log_popup_status("검색어를 입력하세요.")
+            return
+
+        self.cancel_log_history_search()
+        results_text = self.log_popup_widgets["results_text"]
+        results_text.configure(state='normal')
+        results_text.delete("1.0", ctk.END)
+        results_text.configure(state='disabled')
+        self.log_popup_widgets["result_lines"] = []
+        self.set_log_popup_status(f"'{query}' 검색 중...")
+
+        self.log_search_cancel_event = start_log_search(
+            self.log_history,
+            query,
+            on_batch=lambda batch: self.log_viewer_queue.put(("search_batch", batch)),
+            on_done=lambda total_count, error_message: self.log_viewer_queue.put(("search_done", (total_count, error_message))),
+            use_regex=self.log_popup_widgets["regex_var"].get(),
+            case_sensitive=self.log_popup_widgets["case_sensitive_var"].get(),
+        )
+
+    def append_log_search_results(self, matches):
+        """검색 결과 묶음을 결과 목록 끝에 한 번에 추가한다."""
+        results_text = self.log_popup_widgets.get("results_text")
+        if results_text is None:
+            return
+        result_lines = self.log_popup_widgets.setdefault("result_lines", [])
+        result_lines.extend(search_match.line_number for search_match in matches)
+        results_text.configure(state='normal')
+        results_text.insert(
+            ctk.END,
+            "".join(f"{search_match.line_number + 1:>8}: {search_match.text}\n" for search_match in matches),
+        )
+        results_text.configure(state='disabled')
+        self.set_log_popup_status(f"검색 중... {len(result_lines):,}건")
+
+    def on_log_search_result_click(self, event):
+        """결과 목록에서 누른 줄로 로그 보기 구간을 옮긴다."""
+        results_text = self.log_popup_widgets.get("results_text")
+        result_lines = self.log_popup_widgets.get("result_lines") or []
+        if results_text is None or not result_lines:
+            return
+        clicked_row = int(str(results_text.index(f"@{event.x},{event.y}")).split('.')[0]) - 1
+        if 0 <= clicked_row < len(result_lines):
+            target_line = result_lines[clicked_row]
+            self.log_viewport.center_on(target_line)
+            self.render_log_popup_window(highlight_line=target_line)
+
+    def on_log_popup_mousewheel(self, event):
+        """마우스 휠로 보이는 구간을 몇 줄씩 옮긴다."""
+        direction = -1 if getattr(event, "delta", 0) > 0 or getattr(event, "num", None) == 4 else 1
+        text_widget = self.log_popup_text
+        top_fraction, bottom_fraction = text_widget.yview()
+        # 창 안에서 더 스크롤할 수 있으면 Tk 기본 동작에 맡기고, 끝에 닿았을 때만 구간을 옮긴다.
+        if (direction < 0 and top_fraction > 0.0) or (direction > 0 and bottom_fraction < 1.0):
+            return None
+        self.scroll_log_popup(line_delta=direction * (self.log_viewport.window_lines // 4))
+        return "break"
+
+    def show_log_popup(self, initial_query=None, use_regex=False, case_sensitive=False):
+        """디스크에 남은 전체 로그 기록을 보이는 구간만 그리는 별도 창으로 표시한다."""
+        if self.is_log_popup_open():
             self.log_popup_window.deiconify()
             self.log_popup_window.lift()
             self.log_popup_window.focus_force()
+            if initial_query:
+                self.log_popup_widgets["search_var"].set(initial_query)
+                self.log_popup_widgets["regex_var"].set(use_regex)
+                self.log_popup_widgets["case_sensitive_var"].set(case_sensitive)
+                self.start_log_history_search()
             self.sync_log_popup_content()
             return
 
         popup_window = ctk.CTkToplevel(self.root)
         popup_window.title("작업 로그 팝업")
-        popup_window.geometry("860x560")
-        popup_window.minsize(720, 420)
+        popup_window.geometry("960x680")
+        popup_window.minsize(760, 520)
         popup_window.transient(self.root)
         popup_window.protocol("WM_DELETE_WINDOW", self.close_log_popup)
 
@@ -2703,107 +3131,243 @@ class MessengerDocsApp:
 
         ctk.CTkLabel(
             main_frame,
-            text="작업 로그",
+            text="작업 로그 기록",
             font=self.build_ui_font(17, "bold"),
         ).pack(anchor="w")
         ctk.CTkLabel(
             main_frame,
-            text="기본 창이 좁을 때도 로그를 넓게 확인할 수 있는 별도 창입니다.",
+            text="로그 폴더의 전체 기록을 필요한 구간만 읽어 표시합니다. 검색도 전체 기록을 대상으로 합니다.",
             font=self.build_ui_font(12),
             text_color=("gray40", "gray70"),
         ).pack(anchor="w", pady=(4, 10))
 
-        button_row = ctk.CTkFrame(main_frame, fg_color="transparent")
-        button_row.pack(fill="x", pady=(0, 10))
-
+        search_var = ctk.StringVar(value=initial_query or "")
+        regex_var = ctk.BooleanVar(value=use_regex)
+        case_sensitive_var = ctk.BooleanVar(value=case_sensitive)
+
+        search_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+        search_row.pack(fill="x", pady=(0, 8))
+        search_entry = ctk.CTkEntry(search_row, textvariable=search_var, placeholder_text="전체 기록에서 검색")
+        search_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        search_entry.bind("<Return>", lambda event: self.start_log_history_search())
+        ctk.CTkCheckBox(search_row, text="정규식", variable=regex_var, width=70).pack(side="left", padx=(0, 8))
+        ctk.CTkCheckBox(search_row, text="대소문자 구분", variable=case_sensitive_var, width=100).pack(side="left", padx=(0, 8))
         ctk.CTkButton(
-            button_row,
-            text="로그 지우기",
-            width=98,
-            height=34,
+            search_row,
+            text="검색",
+            width=72,
+            height=32,
             corner_radius=10,
-            command=self.clear_log,
+            command=self.start_log_history_search,
             font=self.build_ui_font(12, "bold"),
-            fg_color=("gray85", "gray28"),
-            hover_color=("gray78", "gray34"),
-            text_color=("gray20", "gray92"),
-        ).pack(side="right")
+        ).pack(side="left")
+
+        button_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_row.pack(fill="x", pady=(0, 8))
+
+        position_label = ctk.CTkLabel(button_row, text="", font=self.build_ui_font(12))
+        position_label.pack(side="left")
 
         ctk.CTkButton(
             button_row,
             text="닫기",
             width=82,
-            height=34,
+            height=32,
             corner_radius=10,
             command=self.close_log_popup,
             font=self.build_ui_font(12, "bold"),
+        ).pack(side="right")
+        ctk.CTkButton(
+            button_row,
+            text="최신 로그",
+            width=90,
+            height=32,
+            corner_radius=10,
+            command=lambda: self.scroll_log_popup(first_line=self.log_viewport.max_first_line()),
+            font=self.build_ui_font(12, "bold"),
+            fg_color=("gray85", "gray28"),
+            hover_color=("gray78", "gray34"),
+            text_color=("gray20", "gray92"),
         ).pack(side="right", padx=(0, 8))
 
+        viewer_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        viewer_frame.pack(fill="both", expand=True)
+
         self.log_popup_text = ctk.CTkTextbox(
-            main_frame,
+            viewer_frame,
             state="disabled",
-            wrap="word",
+            wrap="none",
             font=self.build_ui_font(12),
             corner_radius=12,
         )
-        self.log_popup_text.pack(fill="both", expand=True)
+        self.log_popup_text.pack(side="left", fill="both", expand=True)
         self.configure_log_tags(self.log_popup_text)
+        self.log_popup_text.tag_config("search", background="yellow", foreground="black")
+        self.log_popup_text.bind("<MouseWheel>", self.on_log_popup_mousewheel)
+        self.log_popup_text.bind("<Button-4>", self.on_log_popup_mousewheel)
+        self.log_popup_text.bind("<Button-5>", self.on_log_popup_mousewheel)
+
+        position_slider = ctk.CTkSlider(
+            viewer_frame,
+            orientation="vertical",
+            from_=1,
+            to=0,
+            command=lambda value: self.scroll_log_popup(first_line=int(value)),
+        )
+        position_slider.pack(side="right", fill="y", padx=(8, 0))
+
+        results_text = ctk.CTkTextbox(
+            main_frame,
+            height=150,
+            state="disabled",
+            wrap="none",
+            font=self.build_ui_font(12),
+            corner_radius=12,
+        )
+        results_text.pack(fill="x", pady=(8, 4))
+        results_text.bind("<Button-1>", self.on_log_search_result_click)
+
+        status_label = ctk.CTkLabel(
+            main_frame,
+            text="로그 기록 색인 중...",
+            font=self.build_ui_font(12),
+            text_color=("gray40", "gray70"),
+        )
+        status_label.pack(anchor="w")
 
         self.log_popup_window = popup_window
+        self.log_popup_widgets = {
+            "search_var": search_var,
+            "regex_var": regex_var,
+            "case_sensitive_var": case_sensitive_var,
+            "position_label": position_label,
+            "position_slider": position_slider,
+            "results_text": results_text,
+            "status_label": status_label,
+            "result_lines": [],
+        }
+
+        if LogHistory is not None:
+            if self.log_history is None:
+                self.log_history = LogHistory(LOG_DIR_STR)
+                self.log_viewport = LogViewport(self.log_history)
+            self.log_history.refresh_in_background(
+                on_done=lambda added_count: self.log_viewer_queue.put(("indexed", added_count))
+            )
+            self.root.after(LOG_VIEWER_POLL_INTERVAL_MS, self.poll_log_viewer_queue)
+            if initial_query:
+                self.start_log_history_search()
         self.sync_log_popup_content()
 
         if center_window:
             center_window(popup_window)
 
     def log(self, message):
+        """로그를 파일에 남기고 화면 표시는 다음 프레임으로 모아서 반영한다."""
         try:
-            # GUI 로그 출력
-            if self.root.winfo_exists():
-                self.log_text.configure(state='normal')
-                
-                # 로그 텍스트 크기 제한 (메모리 최적화)
-                self.optimize_log_memory()
-                
-                # 새 로그 추가
-                self.append_log_to_widget(self.log_text, message)
-                self.log_text.configure(state='disabled')
-                self.log_text.see(ctk.END)
-
-                if self.log_popup_window and self.log_popup_window.winfo_exists() and self.log_popup_text:
-                    self.log_popup_text.configure(state='normal')
-                    self.optimize_log_memory(self.log_popup_text)
-                    self.append_log_to_widget(self.log_popup_text, message)
-                    self.log_popup_text.configure(state='disabled')
-                    self.log_popup_text.see(ctk.END)
-            
             # 파일 로그 출력
             if hasattr(self, 'logger'):
                 self.logger.info(message)
+
+            log_buffer = getattr(self, "log_render_buffer", None)
+            if log_buffer is None:
+                self.append_log_immediately(message)
+                return
+
+            log_buffer.push(message)
+            self.schedule_log_flush()
         except Exception: pass
-        
-    def optimize_log_memory(self, target_widget=None):
-        """로그 텍스트 크기가 너무 커지면 오래된 로그 삭제 (메모리 최적화)"""
+
+    def append_log_immediately(self, message):
+        """표시 버퍼를 쓸 수 없을 때 로그 위젯에 바로 한 줄을 추가한다."""
+        if not self.root.winfo_exists():
+            return
+        for target_widget in self.get_log_target_widgets():
+            target_widget.configure(state='normal')
+            self.append_log_to_widget(target_widget, message)
+            if trim_text_widget_lines:
+                trim_text_widget_lines(target_widget, 1000)
+            target_widget.configure(state='disabled')
+            target_widget.see(ctk.END)
+
+    def get_log_target_widgets(self):
+        """현재 로그를 받아야 하는 텍스트 위젯 목록을 반환한다."""
+        target_widgets = []
+        if hasattr(self, "log_text"):
+            target_widgets.append(self.log_text)
+        # 기록 뷰어가 없으면 팝업도 화면 버퍼를 그대로 따라간다.
+        if self.log_viewport is None and self.is_log_popup_open():
+            target_widgets.append(self.log_popup_text)
+        return target_widgets
+
+    def schedule_log_flush(self):
+        """다음 화면 프레임에 로그 위젯 갱신을 한 번만 예약한다."""
+        if self.log_flush_after_id is not None:
+            return
+        if not (hasattr(self, 'root') and self.root.winfo_exists()):
+            return
+        self.log_flush_after_id = self.root.after(LOG_FRAME_INTERVAL_MS, self.flush_log_widgets)
+
+    def flush_log_widgets(self):
+        """모아둔 로그를 프레임당 한 번의 삽입과 잘라내기로 위젯에 반영한다."""
+        self.log_flush_after_id = None
+        log_buffer = getattr(self, "log_render_buffer", None)
+        if log_buffer is None or not log_buffer.has_pending():
+            return
+
+        frame = log_buffer.take_frame()
         try:
-            if target_widget is None:
-                target_widget = self.log_text
-
-            max_lines = 1000
-            current_line_count = int(target_widget.index("end-1c").split('.')[0])
-            if current_line_count > max_lines:
-                lines_to_remove = current_line_count - max_lines
-                target_widget.delete("1.0", f"{lines_to_remove + 1}.0")
+            if not self.root.winfo_exists():
+                return
+            for target_widget in self.get_log_target_widgets():
+                apply_log_frame(
+                    target_widget,
+                    frame,
+                    self.get_log_tag_name,
+                    max_lines=log_buffer.max_lines,
+                    end_index=ctk.END,
+                )
         except Exception as e:
-            # 오류 발생 시 조용히 무시 (로깅 시스템 자체에서 오류가 발생하므로 로그 출력 안 함)
-            print(f"로그 메모리 최적화 오류: {e}")
-    def log_threadsafe(self, message): self.log_queue.put(message)
-    def extracted_result_threadsafe(self, result_payload): self.result_queue.put(result_payload)
+            print(f"로그 화면 갱신 오류: {e}")
+
+    def log_threadsafe(self, message):
+        """백그라운드 스레드의 로그를 GUI 큐에 넣는다. (가득 차면 오래된 일반 로그부터 버려진다)"""
+        try:
+            self.log_queue.put_nowait(message)
+        except queue.Full:
+            self.dropped_log_queue_messages += 1
+        self.wake_gui_thread()
+
+    def extracted_result_threadsafe(self, result_payload):
+        self.result_queue.put(result_payload)
+        self.wake_gui_thread()
+
+    def wake_gui_thread(self):
+        """큐에 일이 들어왔음을 GUI 스레드에 알린다. (디스패처가 없으면 주기 확인에 맡김)"""
+        dispatcher = getattr(self, "gui_wakeup_dispatcher", None)
+        if dispatcher is not None:
+            dispatcher.notify()
 
     def render_recent_result_cards(self):
-        """최근 추출 결과 카드를 다시 그린다."""
+        """최근 추출 결과를 재사용 카드 풀에 반영한다."""
         result_cards_frame = getattr(self, "result_cards_frame", None)
         if not result_cards_frame or not hasattr(result_cards_frame, "winfo_exists") or not result_cards_frame.winfo_exists():
             return
+        if not ResultCardPool:
+            self.rebuild_recent_result_cards(result_cards_frame)
+            return
 
+        try:
+            card_pool = getattr(self, "result_card_pool", None)
+            if card_pool is None or card_pool.parent is not result_cards_frame:
+                card_pool = ResultCardPool(result_cards_frame, self.build_ui_font, RECENT_RESULT_CARD_LIMIT, ctk_module=ctk)
+                self.result_card_pool = card_pool
+            card_pool.render(self.recent_results)
+        except Exception:
+            pass
+
+    def rebuild_recent_result_cards(self, result_cards_frame):
+        """카드 풀 모듈이 없을 때 최근 결과 카드를 매번 새로 만들어 그린다."""
         try:
             for child in result_cards_frame.winfo_children():
                 child.destroy()
@@ -2847,7 +3411,7 @@ class MessengerDocsApp:
                     anchor="w",
                 ).pack(anchor="w", pady=(4, 0))
 
-                badge = ctk.CTkLabel(
+                ctk.CTkLabel(
                     header_row,
                     text=card["result_type"],
                     font=self.build_ui_font(11, "bold"),
@@ -2856,8 +3420,7 @@ class MessengerDocsApp:
                     text_color=accent_text,
                     padx=10,
                     pady=4,
-                )
-                badge.pack(side="right", padx=(10, 0))
+                ).pack(side="right", padx=(10, 0))
 
                 ctk.CTkLabel(
                     card_frame,
@@ -2933,27 +3496,43 @@ class MessengerDocsApp:
         self.register_activity_event(ACTIVITY_RESULT_TAB)
 
         try:
-            if hasattr(self, "result_preview_text"):
+            if hasattr(self, "result_preview_text") and prepend_preview_block:
+                # 새 블록만 앞에 넣고 넘치는 뒤쪽 줄만 잘라낸다.
+                prepend_preview_block(self.result_preview_text, preview_block)
+            elif hasattr(self, "result_preview_text"):
                 self.result_preview_text.configure(state='normal')
                 existing_text = self.result_preview_text.get("1.0", ctk.END).strip()
                 new_text = preview_block if not existing_text else preview_block + existing_text + "\n"
+                lines = new_text.splitlines()
                 self.result_preview_text.delete("1.0", ctk.END)
-                self.result_preview_text.insert("1.0", new_text)
-
-                lines = self.result_preview_text.get("1.0", ctk.END).splitlines()
-                if len(lines) > 28:
-                    self.result_preview_text.delete("1.0", ctk.END)
-                    self.result_preview_text.insert("1.0", "\n".join(lines[:28]) + "\n")
-
+                self.result_preview_text.insert("1.0", "\n".join(lines[:28]) + "\n")
                 self.result_preview_text.configure(state='disabled')
                 self.result_preview_text.see("1.0")
         except Exception:
             pass
 
+    def report_dropped_log_queue_messages(self):
+        """로그 큐가 넘쳐 버려진 줄 수를 화면 로그의 생략 안내로 알린다."""
+        total_dropped = getattr(self, "dropped_log_queue_messages", 0) + getattr(self.log_queue, "dropped_count", 0)
+        newly_dropped = total_dropped - getattr(self, "reported_log_queue_drops", 0)
+        if newly_dropped <= 0:
+            return
+        self.reported_log_queue_drops = total_dropped
+        log_buffer = getattr(self, "log_render_buffer", None)
+        if log_buffer is not None:
+            log_buffer.record_dropped(newly_dropped)
+            self.schedule_log_flush()
+        else:
+            self.log(f"--- 로그가 너무 빠르게 쌓여 {newly_dropped}줄을 화면 표시에서 생략했습니다 ---")
+
     def process_log_queue(self):
+        """로그 큐를 한 번에 LOG_QUEUE_DRAIN_LIMIT개까지 비운다. 남은 로그가 있으면 True를 반환한다."""
+        self.report_dropped_log_queue_messages()
+        drained_count = 0
         try:
-            while True:
+            while drained_count < LOG_QUEUE_DRAIN_LIMIT:
                 msg = self.log_queue.get_nowait()
+                drained_count += 1
                 self.log(msg)
                 
                 # 상태 메시지에 따른 상태 표시 업데이트
@@ -2969,8 +3548,13 @@ class MessengerDocsApp:
                 elif "처리 완료:" in msg: # 파일 처리 완료 후 다시 감시 중 상태로
                     self.update_status("감시 중", f"마지막 확인: {current_time_str}")
                     self.current_processing_filename = None
+                    self.refresh_latency_summary()
                 elif "Google Docs에" in msg and "줄 추가 시도" in msg:
                     self.pending_docs_update_line_count = extract_docs_update_line_count(msg)
+                    self.docs_upload_progress = None
+                    self.update_runtime_summary_ui()
+                elif "Google Docs 분할 기록" in msg and "조각 완료" in msg:
+                    self.docs_upload_progress = extract_docs_upload_progress(msg)
                     self.update_runtime_summary_ui()
                 elif "Google Docs 업데이트 완료" in msg:
                     self.update_status("Docs 업데이트 완료", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
@@ -2978,6 +3562,7 @@ class MessengerDocsApp:
                     if self.is_monitoring:
                         self.root.after(2000, lambda: self.update_status("감시 중", f"마지막 업데이트 후 대기: {datetime.now().strftime('%H:%M:%S')}"))
                     self.pending_docs_update_line_count = None
+                    self.docs_upload_progress = None
                     self.update_runtime_summary_ui()
                 elif "Google Docs 중복 파일명 기록 완료" in msg:
                     duplicate_filename = extract_filename_from_log_message(msg) or self.current_processing_filename
@@ -3037,9 +3622,12 @@ class MessengerDocsApp:
             pass
         except Exception:
             pass
-        finally:
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                self.root.after(100, self.process_log_queue)
+        # 처리 한도에 걸렸거나 중간 예외로 멈춘 경우 모두 남은 로그를 이어서 비운다.
+        has_more_work = not self.log_queue.empty()
+        if getattr(self, "gui_wakeup_dispatcher", None) is None and hasattr(self, 'root') and self.root.winfo_exists():
+            # 한 번에 처리할 양을 넘겼으면 이벤트 루프에 양보한 뒤 바로 이어서 비운다.
+            self.root.after(1 if has_more_work else 100, self.process_log_queue)
+        return has_more_work
 
     def process_result_queue(self):
         """백엔드에서 전달된 추출 결과 미리보기를 처리합니다."""
@@ -3058,9 +3646,9 @@ class MessengerDocsApp:
             pass
         except Exception:
             pass
-        finally:
-            if hasattr(self, 'root') and self.root.winfo_exists():
-                self.root.after(100, self.process_result_queue)
+        if getattr(self, "gui_wakeup_dispatcher", None) is None and hasattr(self, 'root') and self.root.winfo_exists():
+            self.root.after(100, self.process_result_queue)
+        return not self.result_queue.empty()
     def save_config(self):
         regex_error = self.validate_current_regex_filter()
         if regex_error:
@@ -3086,7 +3674,8 @@ class MessengerDocsApp:
 
     def get_current_config_data(self):
         """현재 UI 상태를 설정 딕셔너리로 변환한다."""
-        return {
+        config_data = dict(getattr(self, "advanced_config_data", {}))
+        config_data.update({
             "first_run": self.first_run.get(),
             "launch_on_windows_startup": self.launch_on_windows_startup.get(),
             "check_updates_on_startup": self.check_updates_on_startup.get(),
@@ -3102,7 +3691,8 @@ class MessengerDocsApp:
             # 테마 설정 추가
             "appearance_mode": self.appearance_mode.get(),
             "max_cache_size": self.parse_max_cache_size(fallback=10000),
-        }
+        })
+        return config_data
 
     def apply_config_data(self, config_data):
         """설정 딕셔너리를 UI 상태에 반영한다."""
@@ -3121,6 +3711,16 @@ class MessengerDocsApp:
         self.use_regex_filter.set(normalized_config.get("use_regex_filter", False))
         self.regex_pattern.set(normalized_config.get("regex_pattern", ""))
         self.max_cache_size.set(str(normalized_config.get("max_cache_size", 10000)))
+        # 화면에 입력 칸이 없는 고급 설정은 그대로 보관했다가 저장할 때 다시 넣는다.
+        self.advanced_config_data = {
+            key: normalized_config[key] for key in ADVANCED_CONFIG_KEYS if key in normalized_config
+        }
+        if apply_log_levels:
+            apply_log_levels(normalized_config.get("log_levels"))
+        if getattr(self, "notification_aggregator", None) is not None:
+            self.notification_aggregator.set_window_seconds(normalized_config.get("notification_window_seconds"))
+        if memory_budget is not None and "memory_budget_mb" in normalized_config:
+            memory_budget.set_budget_mb(normalized_config["memory_budget_mb"])
 
         appearance_mode = normalized_config.get("appearance_mode", "System")
         self.appearance_mode.set(appearance_mode)
@@ -3234,9 +3834,18 @@ class MessengerDocsApp:
             "regex_pattern": self.regex_pattern.get() if self.use_regex_filter.get() else "",
             "max_cache_size": max_cache_size,
         }
+        advanced_config_data = getattr(self, "advanced_config_data", {})
+        for advanced_key in ENGINE_ADVANCED_CONFIG_KEYS:
+            if advanced_key in advanced_config_data:
+                current_config[advanced_key] = advanced_config_data[advanced_key]
+
+        if advanced_config_data.get("isolate_backend_process") and BackendProcessSupervisor is not None:
+            self.start_backend_process(current_config)
+            return
         
+        engine_func = select_monitoring_engine(current_config) if select_monitoring_engine else run_monitoring
         self.monitoring_thread = threading.Thread(
-            target=run_monitoring, 
+            target=engine_func,
             args=(current_config, self.log_threadsafe, self.stop_event),
             kwargs={
                 "extracted_result_callback": self.extracted_result_threadsafe,
@@ -3245,16 +3854,55 @@ class MessengerDocsApp:
             daemon=True
         )
         self.monitoring_thread.start()
-        
+        self.on_monitoring_started()
+        self.log("백그라운드 감시 시작됨.")
+
+    def on_monitoring_started(self):
         self.disable_settings_widgets()
         self.update_monitoring_action_ui()
         if hasattr(self, "current_activity_var"):
             self.current_activity_var.set("현재 처리 파일: 감시 시작됨")
         self.update_status("감시 중")
-        self.log("백그라운드 감시 시작됨.")
+
+    def start_backend_process(self, current_config):
+        """감시 엔진을 별도 프로세스로 띄운다. Google 서비스는 자식이 저장된 토큰으로 다시 만든다."""
+        self.backend_supervisor = BackendProcessSupervisor(
+            current_config,
+            self.log_threadsafe,
+            self.extracted_result_threadsafe,
+            on_exit=self.on_backend_process_exit,
+        )
+        try:
+            self.backend_supervisor.start()
+        except Exception as error:
+            self.backend_supervisor = None
+            self.log(f"오류: 백엔드 프로세스를 시작하지 못했습니다 - {error}")
+            self.on_monitoring_stopped()
+            return
+        self.on_monitoring_started()
+        self.log("별도 프로세스에서 감시 시작됨.")
+
+    def on_backend_process_exit(self, exitcode):
+        """감독 스레드에서 불린다. 중지 요청 없이 끝났으면(재시작 포기 포함) 화면 상태를 되돌린다."""
+        supervisor = getattr(self, "backend_supervisor", None)
+        if supervisor is None or supervisor.stop_requested.is_set():
+            return
+        self.log_threadsafe(f"백엔드 프로세스가 종료되어 감시를 멈춥니다. (종료 코드 {exitcode})")
+        self.root.after(0, self.on_monitoring_stopped)
 
     def stop_monitoring(self):
-        if self.is_monitoring and self.monitoring_thread and self.monitoring_thread.is_alive():
+        supervisor = getattr(self, "backend_supervisor", None)
+        if self.is_monitoring and supervisor is not None:
+            self.log("감시 중지 요청...")
+            self.update_status("감시 중지 중...")
+            self.update_monitoring_action_ui()
+
+            def stop_and_finalize():
+                if supervisor.stop(BACKEND_PROCESS_STOP_TIMEOUT_SECONDS):
+                    self.log_threadsafe("백엔드 프로세스가 상태를 저장하고 종료되었습니다.")
+                self.root.after(0, self.on_monitoring_stopped)
+            threading.Thread(target=stop_and_finalize, daemon=True).start()
+        elif self.is_monitoring and self.monitoring_thread and self.monitoring_thread.is_alive():
             self.log("감시 중지 요청...")
             self.update_status("감시 중지 중...")
             self.stop_event.set()
@@ -3270,6 +3918,7 @@ class MessengerDocsApp:
     def on_monitoring_stopped(self):
         self.is_monitoring = False
         self.monitoring_thread = None
+        self.backend_supervisor = None
         was_runtime_locked = self.is_docs_target_runtime_locked()
         was_user_locked = self.is_docs_target_user_locked()
         if was_runtime_locked:
@@ -3707,11 +4356,13 @@ class MessengerDocsApp:
     def clear_log(self):
         """로그 텍스트 지우기"""
         try:
+            if getattr(self, "log_render_buffer", None) is not None:
+                self.log_render_buffer.clear()
             self.log_text.configure(state='normal')
             self.log_text.delete("1.0", ctk.END)
             self.log_text.configure(state='disabled')
 
-            if self.log_popup_window and self.log_popup_window.winfo_exists() and self.log_popup_text:
+            if self.log_viewport is None and self.is_log_popup_open():
                 self.log_popup_text.configure(state='normal')
                 self.log_popup_text.delete("1.0", ctk.END)
                 self.log_popup_text.configure(state='disabled')
@@ -3724,8 +4375,8 @@ class MessengerDocsApp:
         """로그 검색 대화 상자 표시"""
         search_window = ctk.CTkToplevel(self.root)
         search_window.title("로그 검색")
-        search_window.geometry("500x200")
-        search_window.minsize(500, 200)
+        search_window.geometry("560x200")
+        search_window.minsize(560, 200)
         search_window.transient(self.root)  # 부모 창 위에 표시
         search_window.grab_set()  # 모달 창으로 설정
         
@@ -3754,6 +4405,13 @@ class MessengerDocsApp:
             variable=case_sensitive_var
         )
         case_sensitive_check.pack(side="left", padx=(0, 15))
+
+        regex_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            options_frame,
+            text="정규식",
+            variable=regex_var
+        ).pack(side="left", padx=(0, 15))
         
         # 버튼 프레임
         button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -3765,54 +4423,53 @@ class MessengerDocsApp:
             if not search_text:
                 messagebox.showinfo("알림", "검색어를 입력하세요.", parent=search_window)
                 return
-            
+
             self.log_text.tag_remove("search", "1.0", ctk.END)  # 기존 검색 결과 제거
-            
-            # 대소문자 구분 옵션
-            if case_sensitive_var.get():
-                search_text = search_text  # 그대로 사용
-            else:
-                search_text = search_text.lower()  # 소문자로 변환
-            
-            self.log_text.configure(state='normal')
-            
-            # 검색 시작
+            self.log_text.tag_config("search", background="yellow", foreground="black")
+
+            # Tk 기본 검색으로 이전 결과 끝에서부터 이어서 찾으므로 전체 내용을 한 번만 훑는다.
+            match_length_var = tk.IntVar(master=search_window)
             start_pos = "1.0"
             found_count = 0
-            
-            while True:
-                if not case_sensitive_var.get():
-                    # 대소문자 구분 없이 검색
-                    current_text = self.log_text.get("1.0", ctk.END).lower()
-                    pos = current_text.find(search_text, self.log_text.index(start_pos).split('.')[0])
-                else:
-                    # 대소문자 구분하여 검색
-                    pos = self.log_text.search(search_text, start_pos, stopindex=ctk.END)
-                
-                if not pos:
-                    break
-                
-                line, char = pos.split('.')
-                end_pos = f"{line}.{int(char) + len(search_text)}"
-                
-                # 검색 결과 강조 표시
-                self.log_text.tag_add("search", pos, end_pos)
-                self.log_text.tag_config("search", background="yellow", foreground="black")
-                
-                # 다음 검색 위치 설정
-                start_pos = end_pos
-                found_count += 1
-            
-            self.log_text.configure(state='disabled')
-            
+            try:
+                while True:
+                    pos = self.log_text.search(
+                        search_text,
+                        start_pos,
+                        stopindex=ctk.END,
+                        nocase=not case_sensitive_var.get(),
+                        regexp=regex_var.get(),
+                        count=match_length_var,
+                    )
+                    if not pos:
+                        break
+
+                    match_length = max(1, match_length_var.get())
+                    end_pos = f"{pos}+{match_length}c"
+                    self.log_text.tag_add("search", pos, end_pos)
+                    start_pos = end_pos
+                    found_count += 1
+            except tk.TclError as e:
+                messagebox.showerror("검색 오류", f"검색어를 해석할 수 없습니다: {e}", parent=search_window)
+                return
+
             # 검색 결과 표시
             if found_count > 0:
                 messagebox.showinfo("검색 결과", f"{found_count}개의 결과를 찾았습니다.", parent=search_window)
                 # 첫 번째 검색 결과로 스크롤
                 self.log_text.see("search.first")
             else:
-                messagebox.showinfo("검색 결과", "검색 결과가 없습니다.", parent=search_window)
-        
+                messagebox.showinfo("검색 결과", "화면 로그에는 결과가 없습니다. 전체 기록 검색을 사용해 보세요.", parent=search_window)
+
+        def search_full_history():
+            search_text = search_var.get()
+            search_window.destroy()
+            self.show_log_popup(
+                initial_query=search_text or None,
+                use_regex=regex_var.get(),
+                case_sensitive=case_sensitive_var.get(),
+            )
+
         # 검색 버튼
         search_button = ctk.CTkButton(
             button_frame,
@@ -3821,6 +4478,13 @@ class MessengerDocsApp:
             width=100
         )
         search_button.pack(side="left", padx=(0, 10))
+
+        ctk.CTkButton(
+            button_frame,
+            text="전체 기록 검색",
+            command=search_full_history,
+            width=120
+        ).pack(side="left", padx=(0, 10))
         
         # 닫기 버튼
         close_button = ctk.CTkButton(
@@ -4184,23 +4848,71 @@ class MessengerDocsApp:
             memory_usage_mb = memory_info.rss / 1024 / 1024
             
             # 메모리 사용량 표시 업데이트
-            self.memory_usage.set(f"메모리: {memory_usage_mb:.1f} MB")
-            
-            # 메모리 사용량이 너무 높으면 경고
-            if memory_usage_mb > 200:  # 200MB 이상이면 경고
-                self.log(f"경고: 메모리 사용량이 높습니다 ({memory_usage_mb:.1f} MB). 프로그램을 재시작하는 것이 좋습니다.")
-                
-                # 메모리 사용량이 매우 높으면 자동 최적화 시도
-                if memory_usage_mb > 300:  # 300MB 이상이면 강제 최적화
-                    self.log("메모리 사용량이 매우 높습니다. 자동 최적화를 시도합니다.")
-                    self.optimize_memory()
+            memory_status = f"메모리: {memory_usage_mb:.1f} MB"
+            backend_status = self.read_backend_process_status()
+            if backend_status:
+                memory_status += f" (백엔드 프로세스 {backend_status['rss_bytes'] / 1024 / 1024:.1f} MB)"
+            if memory_budget is not None:
+                # 화면 버퍼는 GUI 스레드에서, 백엔드 캐시는 처리 루프에서 각자 예산을 맞춘다.
+                for eviction in memory_budget.enforce("gui"):
+                    self.log(f"메모리 예산 정리 - {format_memory_eviction(eviction)}")
+                memory_status += f" · {format_memory_budget_status(memory_budget.snapshot())}"
+            dedupe_filter_status = self.read_dedupe_filter_status()
+            if dedupe_filter_status:
+                memory_status += f" · {format_dedupe_filter_status(dedupe_filter_status)}"
+            self.memory_usage.set(memory_status)
+            if metrics_registry is not None:
+                metrics_registry.gauge(PROCESS_MEMORY_RSS_BYTES, "앱 프로세스 RSS(바이트)").set(memory_info.rss)
+            self.refresh_metrics_summary()
+
+            # 예산 밖의 메모리(라이브러리, 조각난 힙 등)가 매우 크면 마지막 수단으로 정리한다.
+            if memory_usage_mb > 300:
+                self.log("메모리 사용량이 매우 높습니다. 자동 최적화를 시도합니다.")
+                self.optimize_memory()
         except Exception as e:
             print(f"메모리 사용량 확인 중 오류: {e}")
         finally:
-            # 주기적으로 메모리 사용량 확인
+            # 주기적으로 메모리 사용량 확인 (창이 숨겨져 있으면 표시할 곳이 없으므로 드물게)
             if hasattr(self, 'root') and self.root.winfo_exists():
-                self.root.after(self.memory_check_interval, self.check_memory_usage)
+                self.root.after(self.get_memory_check_interval(), self.check_memory_usage)
+
+    def get_memory_check_interval(self):
+        """창이 트레이로 숨겨졌으면 긴 간격, 보이면 기본 간격을 반환한다."""
+        try:
+            if self.root.state() == "withdrawn":
+                return MEMORY_CHECK_HIDDEN_INTERVAL_MS
+        except Exception:
+            pass
+        return self.memory_check_interval
     
+    def evict_log_display_lines(self, bytes_to_free):
+        """화면 로그 버퍼와 위젯에서 오래된 줄을 지워 bytes_to_free만큼 줄인다."""
+        log_buffer = self.log_render_buffer
+        history_lines = len(log_buffer.history)
+        current_bytes = log_buffer.estimate_bytes()
+        if not history_lines or current_bytes <= 0:
+            return ""
+        keep_lines = int(history_lines * max(0.0, 1 - bytes_to_free / current_bytes))
+        removed_lines = log_buffer.trim_history(keep_lines)
+        if removed_lines and hasattr(self, "log_text") and trim_text_widget_lines:
+            self.log_text.configure(state='normal')
+            trim_text_widget_lines(self.log_text, len(log_buffer.history))
+            self.log_text.configure(state='disabled')
+        return f"오래된 줄 {removed_lines}개 제거" if removed_lines else ""
+
+    def show_memory_budget_report(self):
+        """자료구조별 메모리 예산 사용량을 보여준다."""
+        if memory_budget is None:
+            messagebox.showerror("진단 오류", "메모리 예산 모듈을 불러오지 못했습니다.", parent=self.root)
+            return
+        messagebox.showinfo(
+            "메모리 예산",
+            "중복 판정 캐시와 화면 로그가 쓰는 메모리의 어림값입니다. 몫을 넘으면 오래된 항목부터 정리합니다.\n"
+            "(크기는 마지막 확인 시점 기준이며, 백엔드 캐시는 파일을 처리할 때 확인합니다.)\n\n"
+            + format_memory_budget_report(memory_budget.snapshot()),
+            parent=self.root,
+        )
+
     def optimize_memory(self):
         """메모리 사용량 최적화 시도"""
         try:
@@ -4208,12 +4920,7 @@ class MessengerDocsApp:
             if hasattr(self, 'log_text') and self.root.winfo_exists():
                 self.log_text.configure(state='normal')
                 # 로그 텍스트를 더 적극적으로 정리 (최근 200줄만 유지)
-                log_content = self.log_text.get("1.0", ctk.END)
-                lines = log_content.split('\n')
-                if len(lines) > 200:
-                    lines_to_keep = lines[-200:]
-                    self.log_text.delete("1.0", ctk.END)
-                    self.log_text.insert("1.0", "\n".join(lines_to_keep) + "\n")
+                if trim_text_widget_lines and trim_text_widget_lines(self.log_text, 200):
                     self.log_text.insert("1.0", "--- 메모리 최적화: 로그가 정리되었습니다 ---\n\n")
                 self.log_text.configure(state='disabled')
             
@@ -4287,6 +4994,361 @@ class MessengerDocsApp:
         )
 
     # ---------------- 메뉴바 생성 ----------------
+    def start_metrics_export(self):
+        """GUI 쪽 지표를 등록하고 textfile 내보내기 스레드를 시작한다."""
+        self.metrics_exporter = None
+        self.metrics_summary_view = None
+        if metrics_registry is None:
+            return
+        metrics_registry.gauge(
+            LOG_QUEUE_DROPPED_TOTAL,
+            "화면 로그 큐가 넘쳐 버린 줄 수",
+            lambda: getattr(self.log_queue, "dropped_count", 0),
+        )
+        dispatcher = getattr(self, "gui_wakeup_dispatcher", None)
+        if dispatcher is not None:
+            metrics_registry.gauge(GUI_WAKEUPS_TOTAL, "GUI 스레드가 큐 처리를 위해 깨어난 횟수", lambda: dispatcher.meter.total_count)
+        self.metrics_summary_view = MetricsSummaryView(metrics_registry)
+        self.metrics_exporter = MetricsTextfileExporter(metrics_registry, get_metrics_textfile_path(LOG_DIR_STR))
+        self.metrics_exporter.start()
+
+    def refresh_metrics_summary(self):
+        """상태 패널의 처리량/API 지연/큐 깊이/캐시 적중률 요약을 갱신한다."""
+        summary_view = getattr(self, "metrics_summary_view", None)
+        if summary_view is None or not hasattr(self, "metrics_summary"):
+            return
+        self.metrics_summary.set(format_metrics_summary(summary_view.refresh()))
+
+    def read_backend_process_status(self):
+        """백엔드를 별도 프로세스로 돌리는 중이면 공유 메모리 상태를, 아니면 None을 반환한다."""
+        supervisor = getattr(self, "backend_supervisor", None)
+        if supervisor is None:
+            return None
+        return supervisor.read_status()
+
+    def get_latency_snapshot(self):
+        """감시 엔진이 있는 프로세스의 구간별 지연 통계."""
+        supervisor = getattr(self, "backend_supervisor", None)
+        if supervisor is not None:
+            return supervisor.latency_snapshot()
+        return latency_tracker.snapshot()
+
+    def refresh_latency_summary(self):
+        """상태 패널의 처리 지연 요약(p50/p95/p99)을 최신 값으로 바꾼다."""
+        if latency_tracker is None or not hasattr(self, "latency_summary"):
+            return
+        self.latency_summary.set(format_latency_summary(self.get_latency_snapshot()))
+
+    def show_latency_report(self):
+        """구간별 처리 지연 통계를 보여준다."""
+        if latency_tracker is None:
+            messagebox.showerror("진단 오류", "지연 추적 모듈을 불러오지 못했습니다.", parent=self.root)
+            return
+        messagebox.showinfo(
+            "처리 지연 통계",
+            "파일 변경 감지부터 Google Docs 기록까지 구간별 소요 시간입니다.\n\n"
+            + format_latency_report(self.get_latency_snapshot()),
+            parent=self.root,
+        )
+
+    def build_diagnostics_sections(self):
+        """진단 묶음에 넣을 (파일명, 수집 함수) 목록을 만든다. 설정처럼 Tk 변수가 필요한 값은 여기서 미리 읽는다."""
+        effective_config = self.get_current_config_data()
+        if normalize_config_data:
+            effective_config = normalize_config_data(effective_config)
+        log_queue = self.log_queue
+        result_queue = self.result_queue
+        wakeup_dispatcher = getattr(self, "gui_wakeup_dispatcher", None)
+
+        def collect_queue_depths():
+            queue_depths = {
+                "log_queue_depth": log_queue.qsize(),
+                "log_queue_dropped": getattr(log_queue, "dropped_count", 0)
+                + getattr(self, "dropped_log_queue_messages", 0),
+                "result_queue_depth": result_queue.qsize(),
+            }
+            if wakeup_dispatcher is not None:
+                queue_depths["gui_wakeups"] = wakeup_dispatcher.get_stats()
+            if get_backend_diagnostics:
+                queue_depths["backend"] = get_backend_diagnostics()
+            return queue_depths
+
+        state_paths = [CONFIG_FILE_STR, CACHE_FILE_STR, PROCESSED_STATE_FILE_STR, LOG_DIR_STR]
+
+        sections = [
+            ("threads.txt", format_thread_dump),
+            ("queues_and_state.json", collect_queue_depths),
+            ("file_sizes.json", lambda: describe_file_sizes(state_paths)),
+            ("config.json", lambda: effective_config),
+        ]
+        if metrics_registry is not None:
+            sections.append(("metrics.prom", metrics_registry.render_prometheus_text))
+        if latency_tracker is not None:
+            sections.append(("latency.json", self.get_latency_snapshot))
+        if memory_budget is not None:
+            sections.append(("memory_budget.json", memory_budget.snapshot))
+        if getattr(self, "backend_supervisor", None) is not None:
+            # 별도 프로세스 모드에서는 위 백엔드 상태가 비어 있으므로 공유 메모리 카운터를 함께 넣는다.
+            sections.append(("backend_process.json", self.read_backend_process_status))
+        sections.append(("memory.txt", collect_memory_report))
+        sections.append(("logs/", lambda: read_log_tails(LOG_DIR_STR)))
+        return sections
+
+    def create_diagnostics_bundle(self):
+        """진단 정보를 백그라운드에서 zip으로 묶고, 끝나면 경로를 로그에 남긴다."""
+        if build_diagnostics_bundle is None:
+            messagebox.showerror("진단 오류", "진단 묶음 모듈을 불러오지 못했습니다.", parent=self.root)
+            return
+        sections = self.build_diagnostics_sections()
+
+        def run_collection():
+            try:
+                bundle_path = build_diagnostics_bundle(
+                    LOG_DIR_STR,
+                    sections,
+                    metadata={"app_version": CURRENT_VERSION, "is_monitoring": self.is_monitoring},
+                )
+            except Exception as error:
+                self.log_threadsafe(f"진단 정보 묶음 만들기 실패: {error}")
+                return
+            self.log_threadsafe(f"진단 정보 묶음 저장 완료: {bundle_path}")
+
+        threading.Thread(target=run_collection, name="DiagnosticsBundle", daemon=True).start()
+        self.log("진단 정보 수집 시작: 완료되면 로그 폴더에 zip 파일을 저장합니다.")
+
+    def capture_performance_profile(self, mode):
+        """성능 프로파일을 백그라운드에서 캡처하고, 끝나면 저장 경로를 로그에 남긴다."""
+        if capture_sampling_profile is None:
+            messagebox.showerror("진단 오류", "성능 프로파일 모듈을 불러오지 못했습니다.", parent=self.root)
+            return
+        if mode == "cprofile" and not self.is_monitoring:
+            messagebox.showinfo(
+                "성능 프로파일",
+                "cProfile 모드는 감시 스레드를 기록합니다. 감시를 시작한 뒤 다시 시도해 주세요.",
+                parent=self.root,
+            )
+            return
+
+        duration_seconds = DEFAULT_PROFILE_SECONDS
+        mode_label = "샘플링" if mode == "sampling" else "cProfile"
+
+        def run_capture():
+            try:
+                if mode == "sampling":
+                    output_path = capture_sampling_profile(LOG_DIR_STR, duration_seconds)
+                else:
+                    output_path = capture_thread_cprofile(monitoring_profile_hook, LOG_DIR_STR, duration_seconds)
+            except ProfilingError as error:
+                self.log_threadsafe(f"성능 프로파일({mode_label}) 캡처 실패: {error}")
+                return
+            except Exception as error:
+                self.log_threadsafe(f"성능 프로파일({mode_label}) 캡처 중 오류: {error}")
+                return
+            self.log_threadsafe(f"성능 프로파일({mode_label}) 저장 완료: {output_path}")
+
+        threading.Thread(target=run_capture, name="ProfileCapture", daemon=True).start()
+        self.log(f"성능 프로파일({mode_label}) 캡처 시작: {int(duration_seconds)}초 후 로그 폴더에 저장합니다.")
+
+    def show_throughput_history(self):
+        """분 단위 처리량 시계열을 24시간/7일 스파크라인으로 보여준다."""
+        if TimeSeriesStore is None:
+            messagebox.showerror("진단 오류", "처리량 시계열 모듈을 불러오지 못했습니다.", parent=self.root)
+            return
+        store = TimeSeriesStore(get_default_timeseries_path(LOG_DIR_STR))
+        try:
+            report_text = (
+                "[최근 24시간 · 30분 단위]\n"
+                + format_sparkline_report(store, 24)
+                + "\n\n[최근 7일 · 3시간 30분 단위]\n"
+                + format_sparkline_report(store, 24 * 7)
+            )
+        except OSError as error:
+            messagebox.showerror("진단 오류", f"처리량 기록을 읽지 못했습니다:\n{error}", parent=self.root)
+            return
+        messagebox.showinfo("처리량 기록", report_text, parent=self.root)
+
+    def read_dedupe_filter_status(self):
+        """장기 중복 필터를 켰으면 세대 파일 머리에서 줄 수/크기/추정 오탐률을 읽는다. (백엔드 프로세스와 무관)"""
+        advanced_config_data = getattr(self, "advanced_config_data", {})
+        if read_dedupe_filter_status is None or advanced_config_data.get("long_term_dedupe") is not True:
+            return None
+        docs_id = extract_google_id_from_url(self.docs_input.get().strip()) if extract_google_id_from_url else None
+        filter_dir = get_dedupe_filter_dir(
+            os.path.join(os.path.dirname(PROCESSED_STATE_FILE_STR), DEDUPE_FILTER_DIR_NAME),
+            advanced_config_data.get("dedupe_scope"),
+            docs_id,
+        )
+        return read_dedupe_filter_status(filter_dir)
+
+    def get_history_index_path(self):
+        return os.path.join(os.path.dirname(PROCESSED_STATE_FILE_STR), HISTORY_INDEX_FILE_NAME)
+
+    def show_history_search_dialog(self):
+        """Docs에 기록한 줄을 로컬 기록 색인에서 찾는 창을 연다."""
+        if search_history is None:
+            messagebox.showerror("기록 검색 오류", "기록 색인 모듈을 불러오지 못했습니다.", parent=self.root)
+            return
+        history_window = getattr(self, "history_search_window", None)
+        if history_window is not None and history_window.winfo_exists():
+            history_window.deiconify()
+            history_window.lift()
+            history_window.focus_force()
+            return
+
+        history_window = ctk.CTkToplevel(self.root)
+        history_window.title("기록 검색")
+        history_window.geometry("900x560")
+        history_window.minsize(700, 420)
+        history_window.transient(self.root)
+
+        main_frame = ctk.CTkFrame(history_window)
+        main_frame.pack(fill="both", expand=True, padx=18, pady=18)
+        ctk.CTkLabel(
+            main_frame,
+            text="Docs에 기록한 줄 검색",
+            font=self.build_ui_font(17, "bold"),
+        ).pack(anchor="w")
+        ctk.CTkLabel(
+            main_frame,
+            text="언제, 어느 파일에서 기록한 줄인지 최근 기록부터 보여줍니다. 세 글자 이상이면 색인으로 바로 찾습니다.",
+            font=self.build_ui_font(12),
+            text_color=("gray40", "gray70"),
+        ).pack(anchor="w", pady=(4, 10))
+
+        search_var = ctk.StringVar()
+        search_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+        search_row.pack(fill="x", pady=(0, 8))
+        search_entry = ctk.CTkEntry(search_row, textvariable=search_var, placeholder_text="기록한 줄에서 검색")
+        search_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        search_entry.bind("<Return>", lambda event: self.start_history_search())
+        search_entry.focus_set()
+        ctk.CTkButton(
+            search_row,
+            text="검색",
+            width=72,
+            height=32,
+            corner_radius=10,
+            command=self.start_history_search,
+            font=self.build_ui_font(12, "bold"),
+        ).pack(side="left")
+
+        results_text = ctk.CTkTextbox(
+            main_frame,
+            state="disabled",
+            wrap="none",
+            font=self.build_ui_font(12),
+            corner_radius=12,
+        )
+        results_text.pack(fill="both", expand=True)
+
+        button_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+        button_row.pack(fill="x", pady=(8, 0))
+        status_label = ctk.CTkLabel(button_row, text="", font=self.build_ui_font(12), text_color=("gray40", "gray70"))
+        status_label.pack(side="left")
+        ctk.CTkButton(
+            button_row,
+            text="닫기",
+            width=82,
+            height=32,
+            corner_radius=10,
+            command=history_window.destroy,
+            font=self.build_ui_font(12, "bold"),
+        ).pack(side="right")
+        ctk.CTkButton(
+            button_row,
+            text="오래된 기록 정리",
+            width=120,
+            height=32,
+            corner_radius=10,
+            command=self.compact_history_index,
+            font=self.build_ui_font(12, "bold"),
+            fg_color=("gray85", "gray28"),
+            hover_color=("gray78", "gray34"),
+            text_color=("gray20", "gray92"),
+        ).pack(side="right", padx=(0, 8))
+
+        self.history_search_window = history_window
+        self.history_search_widgets = {
+            "search_var": search_var,
+            "results_text": results_text,
+            "status_label": status_label,
+        }
+        self.history_search_queue = queue.Queue()
+        if center_window:
+            center_window(history_window)
+
+    def set_history_search_status(self, text):
+        status_label = getattr(self, "history_search_widgets", {}).get("status_label")
+        if status_label is not None:
+            status_label.configure(text=text)
+
+    def start_history_search(self):
+        """검색어로 기록 색인을 백그라운드에서 찾는다."""
+        query = self.history_search_widgets["search_var"].get().strip()
+        if not query:
+            self.set_history_search_status("검색어를 입력하세요.")
+            return
+        history_path = self.get_history_index_path()
+        self.set_history_search_status(f"'{query}' 검색 중...")
+
+        def worker():
+            try:
+                matches, elapsed_seconds = search_history(history_path, query)
+                self.history_search_queue.put(("search_done", (matches, elapsed_seconds, None)))
+            except Exception as e:
+                self.history_search_queue.put(("search_done", ([], 0.0, str(e))))
+
+        threading.Thread(target=worker, name="HistorySearchWorker", daemon=True).start()
+        self.root.after(LOG_VIEWER_POLL_INTERVAL_MS, self.poll_history_search_queue)
+
+    def compact_history_index(self):
+        """보관 설정을 넘은 오래된 기록을 백그라운드에서 지운다."""
+        advanced_config_data = getattr(self, "advanced_config_data", {})
+        retention_days = advanced_config_data.get("history_retention_days", DEFAULT_HISTORY_RETENTION_DAYS)
+        max_lines = advanced_config_data.get("history_max_lines", DEFAULT_HISTORY_MAX_LINES)
+        history_path = self.get_history_index_path()
+        self.set_history_search_status("오래된 기록 정리 중...")
+
+        def worker():
+            try:
+                removed_count = compact_history_database(history_path, retention_days, max_lines)
+                self.history_search_queue.put(("compact_done", (removed_count, None)))
+            except Exception as e:
+                self.history_search_queue.put(("compact_done", (0, str(e))))
+
+        threading.Thread(target=worker, name="HistoryCompactWorker", daemon=True).start()
+        self.root.after(LOG_VIEWER_POLL_INTERVAL_MS, self.poll_history_search_queue)
+
+    def poll_history_search_queue(self):
+        """검색/정리 스레드 결과를 창에 반영한다. 결과가 올 때까지 짧게 다시 확인한다."""
+        history_window = getattr(self, "history_search_window", None)
+        if history_window is None or not history_window.winfo_exists():
+            return
+        try:
+            event_type, payload = self.history_search_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(LOG_VIEWER_POLL_INTERVAL_MS, self.poll_history_search_queue)
+            return
+
+        if event_type == "compact_done":
+            removed_count, error_message = payload
+            if error_message:
+                self.set_history_search_status(f"정리 실패: {error_message}")
+            else:
+                self.set_history_search_status(f"정리 완료: 오래된 줄 {removed_count:,}개 삭제")
+            return
+
+        matches, elapsed_seconds, error_message = payload
+        results_text = self.history_search_widgets["results_text"]
+        results_text.configure(state="normal")
+        results_text.delete("1.0", ctk.END)
+        results_text.insert(ctk.END, "".join(format_history_search_match(search_match) + "\n" for search_match in matches))
+        results_text.configure(state="disabled")
+        if error_message:
+            self.set_history_search_status(f"검색 실패: {error_message}")
+        else:
+            self.set_history_search_status(f"검색 완료: {len(matches):,}건 ({elapsed_seconds * 1000:.0f}ms)")
+
     def _create_menubar(self):
         """Tkinter 기본 Menu 위젯을 사용해 상단 메뉴바(설정)를 추가"""
         menubar = tk.Menu(self.root)
@@ -4311,6 +5373,26 @@ class MessengerDocsApp:
 
         menubar.add_cascade(label="설정", menu=settings_menu)
 
+        history_menu = tk.Menu(menubar, tearoff=0)
+        history_menu.add_command(label="Docs에 기록한 줄 검색", command=self.show_history_search_dialog)
+        menubar.add_cascade(label="기록", menu=history_menu)
+
+        diagnostics_menu = tk.Menu(menubar, tearoff=0)
+        diagnostics_menu.add_command(label="처리 지연 통계", command=self.show_latency_report)
+        diagnostics_menu.add_command(label="메모리 예산 현황", command=self.show_memory_budget_report)
+        diagnostics_menu.add_command(label="처리량 기록 (24시간/7일)", command=self.show_throughput_history)
+        diagnostics_menu.add_command(label="진단 정보 묶음 만들기 (zip)", command=self.create_diagnostics_bundle)
+        diagnostics_menu.add_separator()
+        diagnostics_menu.add_command(
+            label="성능 프로파일 캡처 - 샘플링 (모든 스레드)",
+            command=lambda: self.capture_performance_profile("sampling"),
+        )
+        diagnostics_menu.add_command(
+            label="성능 프로파일 캡처 - cProfile (감시 스레드)",
+            command=lambda: self.capture_performance_profile("cprofile"),
+        )
+        menubar.add_cascade(label="진단", menu=diagnostics_menu)
+
         # 추후 도움말 메뉴 등 추가 가능
         self.root.config(menu=menubar)
 
@@ -4324,4 +5406,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 백엔드를 별도 프로세스로 돌릴 때 PyInstaller 실행 파일이 자식 프로세스로 다시 실행되면 여기서 넘긴다.
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,22 @@
+"""벤치마크 스크립트 공통 준비.
+
+src 모듈은 가져오는 순간 사용자 설정/로그 폴더 경로를 정하므로, 그 전에 설정 폴더를 임시 폴더로 바꾼다.
+"""
+
+import contextlib
+import os
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@contextlib.contextmanager
+def isolated_app_dirs():
+    """임시 폴더를 설정 폴더(XDG_CONFIG_HOME/APPDATA)로 쓰게 하고 그 경로를 준다. src는 이 안에서 가져온다."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["XDG_CONFIG_HOME"] = temp_dir
+        os.environ["APPDATA"] = temp_dir
+        if PROJECT_ROOT not in sys.path:
+            sys.path.insert(0, PROJECT_ROOT)
+        yield temp_dir
@@ -0,0 +1,113 @@
+"""로그 화면 렌더링 처리량과 최대 정지 시간을 측정한다.
+
+사용법: python scripts/bench_log_rendering.py [메시지 수]
+DISPLAY가 있으면 실제 Tk Text 위젯을, 없으면 메모리 위젯을 사용한다.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.auto_write_txt_to_docs.log_buffer import (  # noqa: E402
+    DEFAULT_LOG_DISPLAY_LINES,
+    LogRenderBuffer,
+    apply_log_frame,
+)
+
+FRAME_MESSAGES = 200
+
+
+class MemoryTextWidget:
+    """줄 목록으로 Tk Text의 최소 동작만 흉내 낸다."""
+
+    def __init__(self):
+        self.lines = []
+
+    def configure(self, **_kwargs):
+        pass
+
+    def index(self, index):
+        return f"{len(self.lines) + 1}.0"
+
+    def insert(self, _index, text, _tag=None):
+        self.lines.extend(text.splitlines())
+
+    def delete(self, start, end):
+        if start == "end-2l":
+            del self.lines[-1:]
+            return
+        start_line = int(start.split(".")[0]) - 1
+        end_line = len(self.lines) if end == "end" else int(end.split(".")[0]) - 1
+        del self.lines[start_line:end_line]
+
+    def get(self, *_args):
+        return "\n".join(self.lines) + "\n"
+
+    def see(self, _index):
+        pass
+
+    def update_idletasks(self):
+        pass
+
+
+def create_text_widget():
+    if os.environ.get("DISPLAY") or sys.platform == "win32":
+        import tkinter
+
+        root = tkinter.Tk()
+        widget = tkinter.Text(root)
+        widget.pack()
+        return root, widget
+    return None, MemoryTextWidget()
+
+
+def run_legacy(widget, messages):
+    """기존 방식: 메시지마다 삽입하고 전체 내용을 읽어 줄 수를 검사한다."""
+    worst = 0.0
+    start = time.perf_counter()
+    for message in messages:
+        step_start = time.perf_counter()
+        widget.configure(state="normal")
+        widget.insert("end", message + "\n")
+        lines = widget.get("1.0", "end").split("\n")
+        if len(lines) > DEFAULT_LOG_DISPLAY_LINES:
+            widget.delete("1.0", f"{len(lines) - DEFAULT_LOG_DISPLAY_LINES}.0")
+        widget.configure(state="disabled")
+        widget.see("end")
+        worst = max(worst, time.perf_counter() - step_start)
+    return time.perf_counter() - start, worst
+
+
+def run_batched(widget, messages):
+    """새 방식: 버퍼에 모았다가 프레임 단위로 한 번에 반영한다."""
+    log_buffer = LogRenderBuffer()
+    worst = 0.0
+    start = time.perf_counter()
+    for index, message in enumerate(messages, start=1):
+        log_buffer.push(message)
+        if index % FRAME_MESSAGES == 0 or index == len(messages):
+            step_start = time.perf_counter()
+            apply_log_frame(widget, log_buffer.take_frame(), lambda _line: None)
+            worst = max(worst, time.perf_counter() - step_start)
+    return time.perf_counter() - start, worst
+
+
+def main():
+    message_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    messages = [f"[{index:06d}] 처리 시작: sample_{index % 37}.txt" for index in range(message_count)]
+
+    for label, runner in (("기존(메시지마다 삽입)", run_legacy), ("프레임 일괄 반영", run_batched)):
+        root, widget = create_text_widget()
+        elapsed, worst = runner(widget, messages)
+        if root is not None:
+            root.destroy()
+        print(
+            f"{label}: {message_count / elapsed:,.0f} msg/s, "
+            f"최대 정지 {worst * 1000:.2f} ms, 총 {elapsed:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""결과 카드 갱신에 드는 Tk 처리 시간을 초당 10건 속도로 측정한다.
+
+사용법: python scripts/bench_result_cards.py [결과 수]
+실제 Tk 창이 필요하므로 화면(DISPLAY)이 없는 환경에서는 측정하지 않고 종료한다.
+"""
+
+import os
+import statistics
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.auto_write_txt_to_docs.result_cards import ResultCardPool  # noqa: E402
+
+RESULTS_PER_SECOND = 10
+CARD_LIMIT = 3
+
+
+def build_card(index):
+    return {
+        "file_title": f"sample_{index}.txt",
+        "extracted_time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "line_count": index % 50 + 1,
+        "preview_text": "\n".join(f"{index}번 결과의 {line}번째 줄" for line in range(4)),
+        "result_type": "중복 기록" if index % 5 == 0 else "성공",
+    }
+
+
+def rebuild_all_cards(ctk, parent, cards):
+    """기존 방식: 모든 카드를 지우고 새 위젯과 폰트로 다시 만든다."""
+    for child in parent.winfo_children():
+        child.destroy()
+    for card in cards:
+        card_frame = ctk.CTkFrame(parent, corner_radius=12)
+        card_frame.pack(fill="x", pady=(0, 10))
+        header_row = ctk.CTkFrame(card_frame, fg_color="transparent")
+        header_row.pack(fill="x", padx=14, pady=(14, 8))
+        ctk.CTkLabel(header_row, text=card["file_title"], font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w")
+        ctk.CTkLabel(header_row, text=card["extracted_time"], font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(header_row, text=card["result_type"], font=ctk.CTkFont(size=11, weight="bold")).pack(side="right")
+        ctk.CTkLabel(card_frame, text=card["preview_text"], font=ctk.CTkFont(size=12), justify="left").pack(fill="x")
+
+
+def measure(root, render, result_count):
+    """결과마다 render와 화면 갱신에 걸린 시간을 모은다."""
+    recent_results = deque(maxlen=CARD_LIMIT)
+    samples = []
+    interval = 1.0 / RESULTS_PER_SECOND
+    for index in range(result_count):
+        recent_results.appendleft(build_card(index))
+        started = time.perf_counter()
+        render(list(recent_results))
+        root.update()
+        elapsed = time.perf_counter() - started
+        samples.append(elapsed)
+        time.sleep(max(0.0, interval - elapsed))
+    return samples
+
+
+def main():
+    result_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    if not (os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin")):
+        print("화면이 없는 환경이라 측정을 건너뜁니다. (Tk 창 필요)")
+        return
+
+    import customtkinter as ctk
+
+    root = ctk.CTk()
+    root.geometry("820x600")
+
+    rebuild_frame = ctk.CTkScrollableFrame(root)
+    rebuild_frame.pack(fill="both", expand=True)
+    rebuild_samples = measure(root, lambda cards: rebuild_all_cards(ctk, rebuild_frame, cards), result_count)
+    rebuild_frame.destroy()
+
+    pool_frame = ctk.CTkScrollableFrame(root)
+    pool_frame.pack(fill="both", expand=True)
+    pool = ResultCardPool(pool_frame, lambda size, weight="normal": ctk.CTkFont(size=size, weight=weight), CARD_LIMIT, ctk_module=ctk)
+    pool_samples = measure(root, pool.render, result_count)
+
+    root.destroy()
+    for label, samples in (("전체 재생성", rebuild_samples), ("카드 풀 재사용", pool_samples)):
+        print(
+            f"{label}: 결과당 평균 {statistics.mean(samples) * 1000:.2f} ms, "
+            f"최대 {max(samples) * 1000:.2f} ms ({result_count}건, 초당 {RESULTS_PER_SECOND}건)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""긴 따라잡기 읽기 단계(줄 나누기 + 지문 계산)를 한 스레드와 프로세스 풀로 비교한다.
+
+사용법: python scripts/benchmark_catchup_pool.py [MB] [작업자 수]
+
+UTF-8과 cp949로 같은 합성 채팅 로그를 만들어 파일마다 잰다.
+- 한 스레드: read_file_changes와 같은 경로 (UTF-8은 바이트 경로, cp949는 디코딩 우선 경로)
+- 프로세스 풀: catchup_pool.CatchupPool.fingerprint_file_range (풀 시작 시간 포함)
+
+CPU가 하나뿐인 환경에서는 감시 엔진이 풀을 쓰지 않는다. 이 스크립트는 비교를 위해 그래도 돌린다.
+"""
+
+import os
+import sys
+import time
+
+from _bench_env import isolated_app_dirs
+
+WRITE_BLOCK_LINES = 100000
+
+
+def write_log(filepath, megabytes, encoding):
+    target_bytes = megabytes * 1024 * 1024
+    written_bytes = 0
+    index = 0
+    with open(filepath, "wb") as target_file:
+        while written_bytes < target_bytes:
+            block = "".join(
+                f"[2025-06-05 오후 3:{line_index % 60:02d}] 사용자{line_index % 23}: 메시지 본문 {line_index} 확인했습니다\r\n"
+                for line_index in range(index, index + WRITE_BLOCK_LINES)
+            ).encode(encoding)
+            target_file.write(block)
+            written_bytes += len(block)
+            index += WRITE_BLOCK_LINES
+    return written_bytes
+
+
+def serial_read(backend_processor, filepath, size, encoding):
+    raw_content = backend_processor.read_file_tail_bytes(filepath, 0, lambda _message: None)
+    if encoding == "utf-8":
+        return backend_processor.fingerprint_raw_lines(backend_processor.split_raw_lines(raw_content))
+    content = backend_processor.decode_with_multiple_encodings(filepath, raw_content, lambda _message: None)
+    return backend_processor.fingerprint_lines(backend_processor.split_decoded_lines(content))
+
+
+def pooled_read(pool, filepath, size, encoding):
+    return pool.fingerprint_file_range(filepath, 0, size, encoding)[1]
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    worker_count = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    with isolated_app_dirs() as temp_dir:
+        from src.auto_write_txt_to_docs import backend_processor
+        from src.auto_write_txt_to_docs.catchup_pool import CatchupPool
+
+        print(f"CPU {os.cpu_count()}개, 로그 {megabytes}MB")
+        for encoding in ("utf-8", "cp949"):
+            filepath = os.path.join(temp_dir, f"chat-{encoding}.txt")
+            size = write_log(filepath, megabytes, encoding)
+            backend_processor.file_encodings[filepath] = encoding
+
+            started_at = time.perf_counter()
+            serial_fingerprints = serial_read(backend_processor, filepath, size, encoding)
+            serial_seconds = time.perf_counter() - started_at
+
+            pool = CatchupPool(max_workers=worker_count)
+            try:
+                started_at = time.perf_counter()
+                pooled_fingerprints = pooled_read(pool, filepath, size, encoding)
+                pooled_seconds = time.perf_counter() - started_at
+            finally:
+                pool.shutdown()
+            assert pooled_fingerprints == serial_fingerprints
+
+            size_megabytes = size / 1024 / 1024
+            print(
+                f"{encoding:>6}: 한 스레드 {serial_seconds:.2f}초 ({size_megabytes / serial_seconds:.0f}MB/s), "
+                f"프로세스 풀({pool.max_workers}개) {pooled_seconds:.2f}초 ({size_megabytes / pooled_seconds:.0f}MB/s), "
+                f"{serial_seconds / pooled_seconds:.2f}배, {len(serial_fingerprints)}줄"
+            )
+            del serial_fingerprints, pooled_fingerprints
+            os.remove(filepath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""장기 중복 필터에 줄 지문을 채우고 여는 시간, 넣기/확인 속도, 실제 오탐률, 크기를 잰다.
+
+사용법: python scripts/benchmark_dedupe_filter.py [넣을 줄 수] [목표 오탐률] [세대 수]
+
+- 열기: 비트열을 mmap으로 붙이기만 하므로 줄 수와 상관없이 일정해야 한다.
+- 오탐률: 넣지 않은 무작위 지문 20만 개 중 필터가 "있다"고 답한 비율을 추정치와 비교한다.
+- 크기: 같은 줄 수를 정확한 라인 캐시(OrderedDict)에 넣었을 때의 메모리를 tracemalloc으로 잰다. (100만 줄까지)
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from _bench_env import isolated_app_dirs
+
+ADD_BATCH_SIZE = 10_000
+PROBE_COUNT = 200_000
+EXACT_CACHE_SAMPLE_MAX = 1_000_000
+
+
+def measure_exact_cache_bytes(fingerprints):
+    tracemalloc.start()
+    cache = OrderedDict.fromkeys(fingerprints)
+    size_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del cache
+    return size_bytes
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 3_000_000
+    false_positive_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    generations = int(sys.argv[3]) if len(sys.argv) > 3 else 12
+
+    with isolated_app_dirs() as temp_dir:
+        from src.auto_write_txt_to_docs import dedupe_filter as dedupe_filter_module
+
+        directory = os.path.join(temp_dir, dedupe_filter_module.DEDUPE_FILTER_DIR_NAME)
+        generator = random.Random(11)
+        dedupe_filter = dedupe_filter_module.GenerationalDedupeFilter()
+        dedupe_filter.open(directory, false_positive_rate, generations=generations)
+
+        added_fingerprints = []
+        started_at = time.perf_counter()
+        for batch_start in range(0, line_count, ADD_BATCH_SIZE):
+            batch = [generator.getrandbits(64) for _ in range(min(ADD_BATCH_SIZE, line_count - batch_start))]
+            if len(added_fingerprints) < PROBE_COUNT:
+                added_fingerprints.extend(batch)
+            dedupe_filter.add_many(batch)
+        add_seconds = time.perf_counter() - started_at
+        dedupe_filter.close()
+
+        started_at = time.perf_counter()
+        dedupe_filter.open(directory, false_positive_rate, generations=generations)
+        open_seconds = time.perf_counter() - started_at
+        status = dedupe_filter.status()
+
+        started_at = time.perf_counter()
+        known_count = len(dedupe_filter.find_known(added_fingerprints[:PROBE_COUNT]))
+        known_seconds = time.perf_counter() - started_at
+        unknown_fingerprints = [generator.getrandbits(64) for _ in range(PROBE_COUNT)]
+        started_at = time.perf_counter()
+        false_positive_count = len(dedupe_filter.find_known(unknown_fingerprints))
+        unknown_seconds = time.perf_counter() - started_at
+        dedupe_filter.close()
+
+        sample_count = min(line_count, EXACT_CACHE_SAMPLE_MAX)
+        exact_bytes = measure_exact_cache_bytes(generator.getrandbits(64) for _ in range(sample_count))
+        exact_bytes_estimate = exact_bytes / sample_count * line_count
+
+        print(f"줄 {line_count:,}개, 목표 오탐률 {false_positive_rate:.3%}, 세대 {generations}개 (세대당 {dedupe_filter_module.GENERATION_CAPACITY:,}줄)")
+        print(f"넣기: {add_seconds:.1f}초 ({line_count / add_seconds:,.0f}줄/초)")
+        print(f"열기: {open_seconds * 1000:.1f}ms, {dedupe_filter_module.format_dedupe_filter_status(status)}")
+        print(
+            f"확인(넣은 줄): {known_count:,}/{PROBE_COUNT:,}개 찾음 ({PROBE_COUNT / known_seconds:,.0f}줄/초), "
+            f"확인(새 줄): 오탐 {false_positive_count / PROBE_COUNT:.4%} ({PROBE_COUNT / unknown_seconds:,.0f}줄/초)"
+        )
+        print(
+            f"크기: 필터 {status['bytes'] / 1024 / 1024:.1f}MB (파일, mmap) vs 정확한 라인 캐시 "
+            f"약 {exact_bytes_estimate / 1024 / 1024:.0f}MB (힙)"
+        )
+
+
+if __name__ == "__main__":
+    main()
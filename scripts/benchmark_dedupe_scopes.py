@@ -0,0 +1,130 @@
+"""중복 제거 범위(dedupe_scope)마다 같은 채팅 파일을 처리하는 CPU 시간과 중복 상태 메모리를 비교한다.
+
+사용법: python scripts/benchmark_dedupe_scopes.py [파일 수] [파일당 줄 수] [추가 기록 횟수]
+
+- 파일마다 처음 내용을 한 번 처리한 뒤, 같은 양의 줄을 여러 번 덧붙이며 process_file을 다시 부른다.
+- CPU: process_file 전체를 time.process_time으로 잰다. (Docs는 호출만 기록하는 가짜 서비스)
+- 메모리: 처리가 끝난 뒤 라인 캐시와 파일별 지문 집합의 크기를 tracemalloc으로 잰다.
+- 저장: 라인 캐시 저장에 걸린 시간과 파일 크기를 잰다. (파일별 범위와 끄기는 저장하지 않는다)
+
+Linux에서는 덧붙일 때마다 ctime이 바뀌어 파일을 새로 만든 것으로 보므로, Windows처럼 생성 시각으로 고정해 잰다.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from _bench_env import isolated_app_dirs
+
+
+class IdleTimer:
+    """상태 저장 지연 타이머 대신 아무것도 하지 않아 측정 중 저장 스레드가 끼어들지 않게 한다."""
+
+    def __init__(self, *_args, **_kwargs):
+        self.daemon = True
+
+    def start(self):
+        pass
+
+    def cancel(self):
+        pass
+
+
+class RecordingDocsService:
+    def __init__(self):
+        self.inserted_chars = 0
+
+    def documents(self):
+        return self
+
+    def batchUpdate(self, documentId, body):
+        self.inserted_chars += sum(len(request["insertText"]["text"]) for request in body["requests"])
+        return self
+
+    def execute(self):
+        return {}
+
+
+def build_lines(file_index, start, count):
+    # 파일 사이에 겹치는 줄(공지 등)을 조금 섞어 전역/문서 범위가 실제로 거르는 줄이 생기게 한다.
+    return [
+        f"[2025-06-05 오후 3:{index % 60:02d}] 사용자{index % 23}: 공지 {index % 50}" if index % 10 == 0
+        else f"[2025-06-05 오후 3:{index % 60:02d}] 사용자{index % 23}: 파일{file_index} 메시지 본문 {index}"
+        for index in range(start, start + count)
+    ]
+
+
+def measure_state_bytes(backend_processor):
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    cache_copy = type(backend_processor.added_lines_cache)(backend_processor.added_lines_cache)
+    hash_copies = [set(state.get("seen_line_hashes", ())) for state in backend_processor.processed_file_states.values()]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del cache_copy, hash_copies
+    return sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+
+
+def run(backend_processor, temp_dir, scope, ttl_seconds, file_count, lines_per_file, append_rounds):
+    backend_processor.added_lines_cache.clear()
+    backend_processor.processed_file_states.clear()
+    backend_processor.configure_dedupe_scope({"dedupe_scope": scope, "dedupe_ttl_seconds": ttl_seconds, "docs_id": "bench-doc"})
+    scope_dir = os.path.join(temp_dir, f"{scope}-{ttl_seconds}")
+    os.makedirs(scope_dir)
+    config = {"docs_id": "bench-doc"}
+    docs_service = RecordingDocsService()
+    services = {"docs": docs_service}
+    filepaths = [os.path.join(scope_dir, f"chat{file_index}.txt") for file_index in range(file_count)]
+
+    cpu_seconds = 0.0
+    for round_index in range(append_rounds + 1):
+        for file_index, filepath in enumerate(filepaths):
+            with open(filepath, "a", encoding="utf-8") as chat_file:
+                chat_file.write("\n".join(build_lines(file_index, round_index * lines_per_file, lines_per_file)) + "\n")
+            if filepath in backend_processor.processed_file_states:
+                backend_processor.processed_file_states[filepath]["last_attempt_time"] = 0
+            started_at = time.process_time()
+            backend_processor.process_file(filepath, config, services, lambda _message: None)
+            cpu_seconds += time.process_time() - started_at
+
+    started_at = time.perf_counter()
+    backend_processor.save_line_cache(lambda _message: None)
+    save_seconds = time.perf_counter() - started_at
+    cache_path = backend_processor.get_line_cache_path()
+    cache_bytes = os.path.getsize(cache_path) if backend_processor.uses_line_cache() and os.path.exists(cache_path) else 0
+    return cpu_seconds, measure_state_bytes(backend_processor), save_seconds, cache_bytes, docs_service.inserted_chars
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    lines_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    append_rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    with isolated_app_dirs() as temp_dir:
+        from src.auto_write_txt_to_docs import backend_processor
+
+        build_identity = backend_processor.build_file_identity_from_stat
+        backend_processor.build_file_identity_from_stat = lambda stat_result: {
+            **build_identity(stat_result), 'file_ctime_ns': 1,
+        }
+        backend_processor.threading.Timer = IdleTimer
+        backend_processor.PROCESSED_STATE_FILE = os.path.join(temp_dir, "processed_state.json")
+        backend_processor.LINE_CACHE_FILE = os.path.join(temp_dir, "line_cache.json")
+        backend_processor.MAX_GLOBAL_CACHE_SIZE = file_count * lines_per_file * (append_rounds + 1)
+        total_lines = file_count * lines_per_file * (append_rounds + 1)
+        print(f"파일 {file_count}개 x 처리 {append_rounds + 1}회 x {lines_per_file:,}줄 = {total_lines:,}줄")
+        for scope, ttl_seconds in (("global", 0), ("global", 3600), ("document", 0), ("file", 0), ("off", 0)):
+            cpu_seconds, state_bytes, save_seconds, cache_bytes, inserted_chars = run(
+                backend_processor, temp_dir, scope, ttl_seconds, file_count, lines_per_file, append_rounds
+            )
+            label = f"{scope}{f' (TTL {ttl_seconds}초)' if ttl_seconds else ''}"
+            print(
+                f"{label}: CPU {cpu_seconds:.2f}초, 중복 상태 {state_bytes / 1024 / 1024:.1f}MB, "
+                f"캐시 저장 {save_seconds * 1000:.0f}ms ({cache_bytes / 1024 / 1024:.1f}MB), "
+                f"기록 {inserted_chars / 1024 / 1024:.1f}M자"
+            )
+
+
+if __name__ == "__main__":
+    main()
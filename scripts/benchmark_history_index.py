@@ -0,0 +1,73 @@
+"""기록 색인에 합성 채팅 줄을 넣고 검색 시간을 잰다.
+
+사용법: python scripts/benchmark_history_index.py [줄 수] [기록 하나당 줄 수]
+
+- 쓰기: write_history_batch로 WRITE_BATCH_MAX_RECORDS개 기록씩 한 트랜잭션에 넣는다. (작성 스레드와 같은 단위)
+- 검색: 세 글자 이상(FTS5 trigram)과 두 글자(instr로 최근 줄부터 훑기)를 각각 여러 번 재 중앙값을 낸다.
+- 정리: 최대 줄 수를 절반으로 줄여 compact_history_database 시간을 잰다.
+"""
+
+import os
+import statistics
+import sys
+import time
+
+from _bench_env import isolated_app_dirs
+
+SEARCH_REPEAT = 5
+
+
+def build_batches(line_count, lines_per_record, batch_records):
+    batch = []
+    for record_start in range(0, line_count, lines_per_record):
+        lines = [
+            f"[2025-06-05 오후 3:{index % 60:02d}] 사용자{index % 23}: 메시지 본문 {index} 확인했습니다"
+            for index in range(record_start, min(line_count, record_start + lines_per_record))
+        ]
+        batch.append((time.time(), "benchmark-doc", "chat.txt", "/benchmark/chat.txt", record_start, record_start + 1, lines))
+        if len(batch) >= batch_records:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def median_search_seconds(history_index, path, query):
+    timings = []
+    for _ in range(SEARCH_REPEAT):
+        matches, elapsed_seconds = history_index.search_history(path, query)
+        timings.append(elapsed_seconds)
+    return statistics.median(timings), len(matches)
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    lines_per_record = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with isolated_app_dirs() as temp_dir:
+        from src.auto_write_txt_to_docs import history_index
+
+        path = os.path.join(temp_dir, history_index.HISTORY_INDEX_FILE_NAME)
+        connection, use_fts = history_index.connect_history_database(path)
+        started_at = time.perf_counter()
+        for batch in build_batches(line_count, lines_per_record, history_index.WRITE_BATCH_MAX_RECORDS):
+            history_index.write_history_batch(connection, batch)
+        write_seconds = time.perf_counter() - started_at
+        connection.close()
+
+        print(f"줄 {line_count:,}개, 기록당 {lines_per_record}줄, FTS5 {'사용' if use_fts else '없음'}")
+        print(
+            f"쓰기: {write_seconds:.1f}초 ({line_count / write_seconds:,.0f}줄/초), "
+            f"DB {os.path.getsize(path) / 1024 / 1024:.0f}MB"
+        )
+        for query in (f"본문 {line_count // 2} 확인", "확인했습니다", "사용자7:", "본문"):
+            median_seconds, match_count = median_search_seconds(history_index, path, query)
+            print(f"검색 '{query}': {median_seconds * 1000:.1f}ms ({match_count}건, 최대 {history_index.SEARCH_RESULT_LIMIT}건)")
+
+        started_at = time.perf_counter()
+        removed_count = history_index.compact_history_database(path, retention_days=0, max_lines=line_count // 2)
+        print(f"정리: {removed_count:,}줄 삭제 {time.perf_counter() - started_at:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
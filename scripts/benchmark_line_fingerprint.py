@@ -0,0 +1,75 @@
+"""중복 판정용 줄 지문 계산 속도(줄/초)를 비교한다.
+
+사용법: python scripts/benchmark_line_fingerprint.py [줄 수] [반복 횟수]
+
+- 이전 방식: 판정에서 SHA-256 hex를 한 번, 기록에서 다시 한 번 계산하고 전역 캐시는 원문으로 찾는다.
+- 현재 방식: fingerprint_lines로 blake2b 64비트 지문을 한 번 계산해 판정과 기록에 함께 쓴다.
+
+짧은 채팅 줄을 흉내 낸 입력의 절반은 새 줄, 절반은 전역 캐시에 이미 있는 줄이다.
+"""
+
+import hashlib
+import statistics
+import sys
+import time
+from collections import OrderedDict
+
+from _bench_env import isolated_app_dirs
+
+
+def build_lines(line_count):
+    return [f"[오후 3:{index % 60:02d}] 사용자{index % 17}: 메시지 본문 {index} 확인했습니다" for index in range(line_count)]
+
+
+def legacy_dedupe(lines, global_cache, file_seen_hashes):
+    """이전 backend_processor의 판정과 기록 과정"""
+    truly_new_lines = [
+        line for line in lines
+        if line not in global_cache and hashlib.sha256(line.encode("utf-8")).hexdigest() not in file_seen_hashes
+    ]
+    for line in lines:
+        file_seen_hashes.add(hashlib.sha256(line.encode("utf-8")).hexdigest())
+    return truly_new_lines
+
+
+def fingerprint_dedupe(backend_processor, lines, file_seen_hashes):
+    fingerprints = backend_processor.fingerprint_lines(lines)
+    truly_new_lines = backend_processor.select_new_lines(lines, fingerprints, file_seen_hashes)
+    file_seen_hashes.update(fingerprints)
+    return truly_new_lines
+
+
+def measure(run_once, repeat_count):
+    samples = []
+    for _ in range(repeat_count):
+        started_at = time.perf_counter()
+        run_once()
+        samples.append(time.perf_counter() - started_at)
+    return statistics.median(samples)
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    repeat_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    with isolated_app_dirs():
+        from src.auto_write_txt_to_docs import backend_processor
+
+    lines = build_lines(line_count)
+    cached_lines = lines[::2]
+    legacy_cache = OrderedDict((line, None) for line in cached_lines)
+    backend_processor.added_lines_cache = OrderedDict(
+        (fingerprint, None) for fingerprint in backend_processor.fingerprint_lines(cached_lines)
+    )
+
+    legacy_seconds = measure(lambda: legacy_dedupe(lines, legacy_cache, set()), repeat_count)
+    fingerprint_seconds = measure(lambda: fingerprint_dedupe(backend_processor, lines, set()), repeat_count)
+    assert legacy_dedupe(lines, legacy_cache, set()) == fingerprint_dedupe(backend_processor, lines, set())
+
+    print(f"{line_count}줄, {repeat_count}회 중앙값")
+    print(f"SHA-256 hex 2회: {line_count / legacy_seconds:,.0f}줄/초")
+    print(f"blake2b 64비트 1회: {line_count / fingerprint_seconds:,.0f}줄/초 ({legacy_seconds / fingerprint_seconds:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""따라잡기 읽기에서 줄 나누기/지문/중복 제거까지의 시간(MB당)과 최대 할당량을 비교한다.
+
+사용법: python scripts/benchmark_line_splitting.py [MB] [중복 비율(0~1)]
+
+- 디코딩 우선: 꼬리 전체를 str로 디코딩하고 strip().split('\\n')과 줄마다 strip()을 한 뒤 지문을 계산한다.
+- 바이트 경로: bytes.split(b'\\n')으로 나누고 바이트에서 지문을 계산해, 중복 제거를 통과한 줄만 디코딩한다.
+
+할당량은 tracemalloc의 최대값이라 실제 RSS보다 작게 나올 수 있다. 상대 비교용으로 읽는다.
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from _bench_env import isolated_app_dirs
+
+REPEAT_COUNT = 5
+
+
+def build_content(megabytes):
+    lines = []
+    size = 0
+    index = 0
+    while size < megabytes * 1024 * 1024:
+        line = f"[2025-06-05 오후 3:{index % 60:02d}] 사용자{index % 23}: 메시지 본문 {index} 확인했습니다\r\n"
+        lines.append(line)
+        size += len(line.encode("utf-8"))
+        index += 1
+    return "".join(lines).encode("utf-8")
+
+
+def decode_first(backend_processor, raw_content):
+    lines = backend_processor.split_decoded_lines(raw_content.decode("utf-8"))
+    fingerprints = backend_processor.fingerprint_lines(lines)
+    return backend_processor.select_new_lines(lines, fingerprints, set())
+
+
+def byte_split(backend_processor, raw_content):
+    raw_lines = backend_processor.split_raw_lines(raw_content)
+    fingerprints = backend_processor.fingerprint_raw_lines(raw_lines)
+    return backend_processor.decode_surviving_lines(raw_lines, fingerprints, set())
+
+
+def measure(path_func, backend_processor, raw_content):
+    seconds = []
+    for _ in range(REPEAT_COUNT):
+        started_at = time.perf_counter()
+        path_func(backend_processor, raw_content)
+        seconds.append(time.perf_counter() - started_at)
+    tracemalloc.start()
+    path_func(backend_processor, raw_content)
+    _current, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(seconds), peak_bytes
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    duplicate_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.9
+
+    with isolated_app_dirs():
+        from src.auto_write_txt_to_docs import backend_processor
+
+    raw_content = build_content(megabytes)
+    all_lines = backend_processor.split_decoded_lines(raw_content.decode("utf-8"))
+    duplicate_lines = all_lines[: int(len(all_lines) * duplicate_ratio)]
+    backend_processor.added_lines_cache = OrderedDict(
+        (fingerprint, None) for fingerprint in backend_processor.fingerprint_lines(duplicate_lines)
+    )
+    assert decode_first(backend_processor, raw_content) == byte_split(backend_processor, raw_content)
+
+    content_megabytes = len(raw_content) / 1024 / 1024
+    print(f"{content_megabytes:.1f}MB, {len(all_lines)}줄, 중복 {duplicate_ratio:.0%}, {REPEAT_COUNT}회 중앙값")
+    for label, path_func in (("디코딩 우선", decode_first), ("바이트 경로", byte_split)):
+        seconds, peak_bytes = measure(path_func, backend_processor, raw_content)
+        print(
+            f"{label}: {seconds / content_megabytes * 1000:.1f}ms/MB, "
+            f"최대 할당 {peak_bytes / 1024 / 1024:.1f}MB ({peak_bytes / len(raw_content):.2f}배)"
+        )
+
+
+if __name__ == "__main__":
+    main()
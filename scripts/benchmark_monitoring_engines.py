@@ -0,0 +1,105 @@
+"""스레드 엔진(run_monitoring)과 asyncio 엔진(run_monitoring_async)의 처리 시간과 Docs 출력을 비교한다.
+
+사용법: python scripts/benchmark_monitoring_engines.py [파일 수] [파일당 줄 수] [Docs 지연(ms)]
+
+실제 watchdog 감시자로 임시 폴더를 감시하고, 파일을 한꺼번에 만든 뒤 모든 파일이 가짜 Docs에
+기록될 때까지의 시간을 잰다. 가짜 Docs는 batchUpdate마다 지정한 지연만큼 잠든다.
+두 엔진의 Docs 삽입 문자열(추출 시각 줄 제외)이 같은지도 확인한다.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+
+from _bench_env import isolated_app_dirs
+
+WAIT_TIMEOUT_SECONDS = 120.0
+EXTRACTED_TIME_PATTERN = re.compile(r"# 추출된 시간: .*\n")
+
+
+class LatencyDocsService:
+    def __init__(self, latency_seconds):
+        self.latency_seconds = latency_seconds
+        self.texts = []
+        self.lock = threading.Lock()
+
+    def documents(self):
+        return self
+
+    def batchUpdate(self, documentId, body):
+        self.pending_body = body
+        return self
+
+    def execute(self):
+        time.sleep(self.latency_seconds)
+        with self.lock:
+            for request in self.pending_body["requests"]:
+                if "insertText" in request:
+                    self.texts.append(EXTRACTED_TIME_PATTERN.sub("", request["insertText"]["text"]))
+        return {}
+
+
+def run_engine(engine_func, backend_processor, work_dir, file_count, line_count, latency_seconds):
+    watch_folder = os.path.join(work_dir, "watch")
+    os.makedirs(watch_folder)
+    backend_processor.PROCESSED_STATE_FILE = os.path.join(work_dir, "processed_state.json")
+    backend_processor.LINE_CACHE_FILE = os.path.join(work_dir, "added_lines_cache.json")
+    backend_processor.processed_file_states.clear()
+    backend_processor.added_lines_cache.clear()
+
+    docs_service = LatencyDocsService(latency_seconds)
+    stop_event = backend_processor.MonitoringStopEvent()
+    config = {"watch_folder": watch_folder, "docs_id": "benchmark-doc", "file_extensions": ".txt"}
+    engine_thread = threading.Thread(
+        target=engine_func,
+        args=(config, lambda _message: None, stop_event),
+        kwargs={"preloaded_services": {"docs": docs_service}},
+        daemon=True,
+    )
+    engine_thread.start()
+    time.sleep(0.5)  # 감시자가 시작될 때까지 기다린다.
+
+    started_at = time.perf_counter()
+    for file_index in range(file_count):
+        lines = [f"file{file_index:03d} line{line_index:04d}" for line_index in range(line_count)]
+        with open(os.path.join(watch_folder, f"chat{file_index:03d}.txt"), "w", encoding="utf-8") as chat_file:
+            chat_file.write("\n".join(lines) + "\n")
+    while len(docs_service.texts) < file_count:
+        if time.perf_counter() - started_at > WAIT_TIMEOUT_SECONDS:
+            raise RuntimeError(f"제한 시간 안에 {len(docs_service.texts)}/{file_count}개만 기록되었습니다.")
+        time.sleep(0.005)
+    elapsed_seconds = time.perf_counter() - started_at
+    stop_event.set()
+    engine_thread.join(timeout=10)
+    return elapsed_seconds, docs_service.texts
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    line_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    latency_seconds = (float(sys.argv[3]) if len(sys.argv) > 3 else 40.0) / 1000
+
+    with isolated_app_dirs() as temp_dir:
+        from src.auto_write_txt_to_docs import backend_processor
+        from src.auto_write_txt_to_docs.async_engine import run_monitoring_async
+
+        results = {}
+        for label, engine_func in (("thread", backend_processor.run_monitoring), ("asyncio", run_monitoring_async)):
+            work_dir = os.path.join(temp_dir, label)
+            os.makedirs(work_dir)
+            results[label] = run_engine(
+                engine_func, backend_processor, work_dir, file_count, line_count, latency_seconds
+            )
+
+    print(f"파일 {file_count}개 x {line_count}줄, Docs 지연 {latency_seconds * 1000:.0f}ms")
+    for label, (elapsed_seconds, texts) in results.items():
+        print(f"{label:>8}: {elapsed_seconds:.2f}초, 파일당 {elapsed_seconds / file_count * 1000:.1f}ms, Docs 기록 {len(texts)}회")
+    # 감시자 이벤트 순서는 실행마다 다를 수 있으므로 기록 내용만 순서 없이 비교한다.
+    same_output = sorted(results["thread"][1]) == sorted(results["asyncio"][1])
+    print(f"Docs 출력 일치: {'예' if same_output else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Docs 응답 시간 초과를 섞어 넣고 다시 보낸 비율과 문서에 중복된 기록 수를 비교한다.
+
+사용법: python scripts/benchmark_write_journal.py [기록 수] [시간 초과 비율(0~1)] [반영 뒤 시간 초과 비율(0~1)]
+
+- 저널 없음: 이전 동작처럼 실패하면 무조건 다시 보낸다.
+- 저널: commit_docs_insert가 모호한 실패 뒤 문서를 확인하고, 반영되지 않았을 때만 다시 보낸다.
+
+시간 초과 중 "반영 뒤 시간 초과" 비율만큼은 Google에 이미 반영된 뒤 응답만 끊긴 경우다.
+"""
+
+import os
+import random
+import sys
+
+from _bench_env import isolated_app_dirs
+
+
+class TimeoutInjectingDocsService:
+    def __init__(self, timeout_rate, applied_rate, seed):
+        self.random = random.Random(seed)
+        self.timeout_rate = timeout_rate
+        self.applied_rate = applied_rate
+        self.text = "\n"
+        self.revision = 1
+        self.batch_calls = 0
+        self.get_calls = 0
+        self.pending_call = None
+
+    def documents(self):
+        return self
+
+    def batchUpdate(self, documentId, body):
+        self.pending_call = ("batch", body)
+        return self
+
+    def get(self, documentId, fields):
+        self.pending_call = ("get", fields)
+        return self
+
+    def execute(self):
+        kind, payload = self.pending_call
+        if kind == "get":
+            self.get_calls += 1
+            if payload.startswith("revisionId"):
+                end_index = len(self.text.encode("utf-16-le")) // 2 + 1
+                return {"revisionId": f"rev-{self.revision}", "body": {"content": [{"endIndex": end_index}]}}
+            return {"body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": self.text}}]}}]}}
+        self.batch_calls += 1
+        timed_out = self.random.random() < self.timeout_rate
+        if timed_out and self.random.random() >= self.applied_rate:
+            raise TimeoutError("응답 시간 초과 (반영 안 됨)")
+        self.text = self.text[:-1] + payload["requests"][0]["insertText"]["text"] + "\n"
+        self.revision += 1
+        if timed_out:
+            raise TimeoutError("응답 시간 초과 (반영됨)")
+        return {"writeControl": {"requiredRevisionId": f"rev-{self.revision}"}}
+
+
+def send_until_success(send_once):
+    while True:
+        try:
+            send_once()
+            return
+        except TimeoutError:
+            continue
+
+
+def run(backend_processor, record_count, timeout_rate, applied_rate, use_journal):
+    docs_service = TimeoutInjectingDocsService(timeout_rate, applied_rate, seed=7)
+    texts = [f"\n# 기록 {index:05d}\n본문 {index}\n\n" for index in range(record_count)]
+    for text in texts:
+        if use_journal:
+            send_until_success(lambda: backend_processor.commit_docs_insert(
+                docs_service, "benchmark-doc", text, "/benchmark/chat.txt", lambda _message: None
+            ))
+        else:
+            requests = [{"insertText": {"endOfSegmentLocation": {"segmentId": ""}, "text": text}}]
+            send_until_success(lambda: backend_processor.execute_docs_batch_update(
+                docs_service, "benchmark-doc", requests
+            ))
+    duplicate_count = sum(docs_service.text.count(text) - 1 for text in texts)
+    missing_count = sum(1 for text in texts if text not in docs_service.text)
+    return docs_service, duplicate_count, missing_count
+
+
+def main():
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    timeout_rate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    applied_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+
+    with isolated_app_dirs() as temp_dir:
+        from src.auto_write_txt_to_docs import backend_processor
+
+        backend_processor.write_journal.open(os.path.join(temp_dir, "docs_write_journal.jsonl"))
+        print(f"기록 {record_count}건, 시간 초과 {timeout_rate:.0%} (그중 반영 뒤 {applied_rate:.0%})")
+        for label, use_journal in (("저널 없음", False), ("저널", True)):
+            docs_service, duplicate_count, missing_count = run(
+                backend_processor, record_count, timeout_rate, applied_rate, use_journal
+            )
+            resend_count = docs_service.batch_calls - record_count
+            print(
+                f"{label}: batchUpdate {docs_service.batch_calls}회 (다시 보냄 {resend_count / record_count:.1%}), "
+                f"확인용 get {docs_service.get_calls}회, 중복 기록 {duplicate_count}건, 누락 {missing_count}건"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""헤드리스 데몬과 GUI 프로세스의 시작 시간과 RSS를 비교한다.
+
+사용법: python scripts/measure_daemon_footprint.py [반복 횟수]
+
+- 헤드리스: 임시 설정으로 데몬을 띄워 "파일 시스템 감시자 시작됨"이 찍힐 때까지의 시간과
+  2초 뒤 RSS를 잰 다음 SIGTERM으로 종료한다.
+- GUI: main_gui 모듈을 가져오기만 한 프로세스(customtkinter/PIL/pystray 로드까지)의 시간과 RSS를 잰다.
+  창을 띄운 실제 GUI는 이보다 크므로 하한값으로 읽는다. 화면이 없는 리눅스에서는 pystray를 dummy로 둔다.
+"""
+
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import psutil
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+READY_MARKER = "파일 시스템 감시자 시작됨"
+SETTLE_SECONDS = 2.0
+START_TIMEOUT_SECONDS = 30.0
+GUI_IMPORT_PROBE = (
+    "import os, time, psutil; started = time.perf_counter(); import main_gui; "
+    "print(time.perf_counter() - started, psutil.Process().memory_info().rss, flush=True)"
+)
+
+
+def build_isolated_environment(temp_dir):
+    """사용자 설정/캐시를 건드리지 않도록 설정 폴더를 임시 폴더로 바꾼다."""
+    environment = dict(os.environ)
+    environment["XDG_CONFIG_HOME"] = temp_dir
+    environment["APPDATA"] = temp_dir
+    environment.setdefault("PYSTRAY_BACKEND", "dummy")
+    environment["PYTHONIOENCODING"] = "utf-8"
+    return environment
+
+
+def measure_headless(temp_dir, environment):
+    watch_folder = os.path.join(temp_dir, "watch")
+    os.makedirs(watch_folder, exist_ok=True)
+    config_path = os.path.join(temp_dir, "daemon_config.json")
+    with open(config_path, "w", encoding="utf-8") as config_file:
+        json.dump({"watch_folder": watch_folder, "docs_input": "EXAMPLE_DOC_ID_1234567890"}, config_file)
+
+    started_at = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.auto_write_txt_to_docs.daemon", "--config", config_path],
+        cwd=PROJECT_ROOT,
+        env=environment,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+    )
+    try:
+        ready_seconds = None
+        for line in process.stdout:
+            if READY_MARKER in line:
+                ready_seconds = time.perf_counter() - started_at
+                break
+            if time.perf_counter() - started_at > START_TIMEOUT_SECONDS:
+                break
+        if ready_seconds is None:
+            raise RuntimeError("데몬이 제한 시간 안에 감시를 시작하지 않았습니다.")
+        time.sleep(SETTLE_SECONDS)
+        rss_bytes = psutil.Process(process.pid).memory_info().rss
+    finally:
+        if os.name == "nt":
+            process.terminate()
+        else:
+            process.send_signal(signal.SIGTERM)
+        process.communicate(timeout=30)
+    return ready_seconds, rss_bytes
+
+
+def measure_gui_import(environment):
+    started_at = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", GUI_IMPORT_PROBE],
+        cwd=PROJECT_ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return time.perf_counter() - started_at, int(output[-1])
+
+
+def summarize(label, samples):
+    seconds = [sample[0] for sample in samples]
+    rss_megabytes = [sample[1] / 1024 / 1024 for sample in samples]
+    print(
+        f"{label}: 시작 {statistics.median(seconds):.2f}초 (중앙값), "
+        f"RSS {statistics.median(rss_megabytes):.1f} MB (중앙값, {len(samples)}회)"
+    )
+
+
+def main():
+    repeat_count = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with tempfile.TemporaryDirectory() as temp_dir:
+        environment = build_isolated_environment(temp_dir)
+        headless_samples = [measure_headless(temp_dir, environment) for _ in range(repeat_count)]
+        gui_samples = [measure_gui_import(environment) for _ in range(repeat_count)]
+    summarize("헤드리스 데몬 (감시 시작까지)", headless_samples)
+    summarize("GUI 모듈 로드만 (창 생성 전, 하한값)", gui_samples)
+
+
+if __name__ == "__main__":
+    main()
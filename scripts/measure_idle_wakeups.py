@@ -0,0 +1,87 @@
+"""감시가 한가할 때 GUI 스레드가 1분에 몇 번 깨어나는지 기존 폴링과 디스패처 방식으로 비교한다.
+
+사용법: python scripts/measure_idle_wakeups.py [측정 초]
+실제 Tk 이벤트 루프가 필요하므로 화면(DISPLAY)이 없는 환경에서는 측정하지 않고 종료한다.
+"""
+
+import os
+import queue
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.auto_write_txt_to_docs.gui_wakeup import GuiWakeupDispatcher  # noqa: E402
+
+LEGACY_POLL_INTERVAL_MS = 100
+LEGACY_MEMORY_CHECK_INTERVAL_MS = 10000
+
+
+def run_legacy_polling(root, duration_seconds):
+    """기존 방식: 로그/결과 큐를 100ms마다, 메모리를 10초마다 확인한다."""
+    log_queue = queue.Queue()
+    result_queue = queue.Queue()
+    wakeups = [0]
+
+    def poll(target_queue):
+        wakeups[0] += 1
+        try:
+            while True:
+                target_queue.get_nowait()
+        except queue.Empty:
+            pass
+        root.after(LEGACY_POLL_INTERVAL_MS, poll, target_queue)
+
+    def check_memory():
+        wakeups[0] += 1
+        root.after(LEGACY_MEMORY_CHECK_INTERVAL_MS, check_memory)
+
+    root.after(LEGACY_POLL_INTERVAL_MS, poll, log_queue)
+    root.after(LEGACY_POLL_INTERVAL_MS, poll, result_queue)
+    root.after(1000, check_memory)
+    run_for(root, duration_seconds)
+    return wakeups[0]
+
+
+def run_dispatcher(root, duration_seconds):
+    """새 방식: 큐에 일이 들어올 때만 깨어난다. (유휴 상태라 들어오는 일이 없음)"""
+    log_queue = queue.Queue()
+
+    def drain():
+        try:
+            while True:
+                log_queue.get_nowait()
+        except queue.Empty:
+            return False
+
+    dispatcher = GuiWakeupDispatcher(root, [drain])
+    dispatcher.start()
+    run_for(root, duration_seconds)
+    return dispatcher.get_stats()["total_wakeups"]
+
+
+def run_for(root, duration_seconds):
+    deadline = time.monotonic() + duration_seconds
+    while time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.01)
+
+
+def main():
+    duration_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 30.0
+    if not (os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin")):
+        print("화면이 없는 환경이라 측정을 건너뜁니다. (Tk 창 필요)")
+        return
+
+    import tkinter as tk
+
+    for label, runner in (("기존 폴링", run_legacy_polling), ("깨우기 디스패처", run_dispatcher)):
+        root = tk.Tk()
+        root.withdraw()
+        wakeups = runner(root, duration_seconds)
+        root.destroy()
+        print(f"{label}: 유휴 {duration_seconds:.0f}초 동안 {wakeups}회, 분당 {wakeups * 60.0 / duration_seconds:.1f}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+"""asyncio 기반 감시 엔진. run_monitoring과 같은 인자를 받고 같은 Google Docs 출력을 낸다.
+
+단계와 동시성 한도:
+
+- 접수: watchdog 스레드가 loop.call_soon_threadsafe로 이벤트를 넘긴다. 같은 파일의 이벤트는
+  하나로 합치므로 접수 대기열은 파일 수를 넘지 않는다.
+- 읽기: read_queue(크기 제한)에서 꺼내 read_executor(작업자 read_concurrency개)로
+  read_file_changes를 실행한다.
+- 기록: write_queue(크기 제한)에서 꺼내 docs_executor(작업자 1개)로 write_file_changes를 실행한다.
+  전역 라인 캐시를 고치고 같은 문서 끝에 이어 쓰므로 한 번에 하나만 실행한다.
+
+읽기를 여러 개 돌려도 기록은 접수 순서대로 한다. 앞 단계가 밀리면 큐의 put()이 기다리므로
+자연스럽게 역압이 걸린다. 재시도와 상태 저장 디바운스는 threading.Timer 대신 loop.call_later로
+예약한다. 같은 파일은 읽기/기록 중에 다시 들어오지 않고, 끝난 뒤 한 번 더 처리한다.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from . import backend_processor
+from .backend_processor import (
+    BACKEND_LOGGER_NAME,
+    FileEventHandler,
+    Observer,
+    TraceContext,
+    apply_engine_runtime_config,
+    file_queue,
+    flush_processed_state_save,
+    handle_file_processing_error,
+    install_engine_scheduler,
+    prepare_monitoring_session,
+    read_file_changes,
+    run_monitoring,
+    save_line_cache,
+    write_file_changes,
+)
+from .catchup_pool import catchup_pool
+from .dedupe_filter import dedupe_filter
+from .history_index import history_index
+from .memory_budget import format_memory_eviction, memory_budget
+from .metrics import FILE_QUEUE_DEPTH, metrics_registry
+from .monitoring_config import normalize_monitoring_engine
+from .profiling import monitoring_profile_hook
+from .timeseries_store import TimeSeriesRecorder, TimeSeriesStore
+
+
+DEFAULT_READ_CONCURRENCY = 2
+READ_QUEUE_SIZE = 8
+WRITE_QUEUE_SIZE = 4
+STOP_POLL_SECONDS = 0.2  # 깨우기 함수를 걸 수 없는 일반 Event의 중지 신호를 확인하는 간격
+OBSERVER_JOIN_SECONDS = 2.0
+
+
+def select_monitoring_engine(config):
+    """설정의 monitoring_engine 값에 맞는 엔진 함수를 반환한다. (둘 다 run_monitoring과 인자가 같다)"""
+    if normalize_monitoring_engine(config.get("monitoring_engine")) == "asyncio":
+        return run_monitoring_async
+    return run_monitoring
+
+
+class LoopTimer:
+    """threading.Timer 대신 이벤트 루프의 call_later로 예약한다. 아무 스레드에서나 만들 수 있다.
+
+    콜백은 파일 저장처럼 블로킹일 수 있으므로 루프가 아닌 executor에서 실행한다.
+    """
+
+    def __init__(self, loop, delay_seconds, callback, executor):
+        self.loop = loop
+        self.delay_seconds = delay_seconds
+        self.callback = callback
+        self.executor = executor
+        self.cancelled = False
+        loop.call_soon_threadsafe(self._schedule)
+
+    def _schedule(self):
+        if not self.cancelled:
+            self.loop.call_later(self.delay_seconds, self._fire)
+
+    def _fire(self):
+        if self.cancelled:
+            return
+        try:
+            self.loop.run_in_executor(self.executor, self.callback)
+        except RuntimeError:
+            pass  # 엔진이 이미 끝나 executor가 닫혔다. 남은 상태는 종료 처리에서 저장했다.
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class LoopEngineScheduler:
+    """backend_processor의 재시도/상태 저장 예약을 이벤트 루프로 돌린다."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def start_timer(self, delay_seconds, callback):
+        return LoopTimer(self.engine.loop, delay_seconds, callback, self.engine.io_executor)
+
+    def requeue(self, filepath):
+        self.engine.loop.call_soon_threadsafe(self.engine.submit, filepath, None, None)
+
+
+class AsyncFileEventHandler(FileEventHandler):
+    """감지한 파일을 file_queue 대신 이벤트 루프로 넘긴다."""
+
+    def __init__(self, log_func, config, engine):
+        super().__init__(log_func, config)
+        self.engine = engine
+
+    def enqueue(self, queue_item):
+        self.engine.loop.call_soon_threadsafe(self.engine.submit, *queue_item)
+
+
+class AsyncMonitoringEngine:
+    def __init__(
+        self,
+        config,
+        log_func,
+        services,
+        extracted_result_callback=None,
+        read_concurrency=DEFAULT_READ_CONCURRENCY,
+        read_queue_size=READ_QUEUE_SIZE,
+        write_queue_size=WRITE_QUEUE_SIZE,
+    ):
+        self.config = config
+        self.log_func = log_func
+        self.services = services
+        self.extracted_result_callback = extracted_result_callback
+        self.read_concurrency = max(1, int(read_concurrency))
+        self.read_queue_size = read_queue_size
+        self.write_queue_size = write_queue_size
+        self.loop = None
+        self.read_executor = None
+        self.docs_executor = None
+        self.io_executor = None
+        self.pending = {}  # 접수했지만 아직 읽기 큐에 넣지 못한 파일: 경로 -> (이벤트 유형, 추적)
+        self.active_paths = set()  # 읽기/기록 단계에 있는 파일
+        self.rerun = {}  # 처리 중에 다시 바뀐 파일
+        self.settle_handles = {}  # 재처리 지연으로 call_later에 걸어 둔 파일
+        self.control_event = None  # 중지 신호나 프로파일 요청이 오면 다른 스레드에서 켠다.
+        self.next_sequence = 0
+        self.next_release_sequence = 0
+
+    # --- 접수 ---
+    def submit(self, filepath, event_type=None, trace=None):
+        """루프 스레드에서만 부른다. 같은 파일이 이미 대기/처리 중이면 하나로 합친다."""
+        settle_handle = self.settle_handles.pop(filepath, None)
+        if settle_handle is not None:
+            settle_handle.cancel()
+        if filepath in self.active_paths:
+            self.rerun[filepath] = merge_file_events(self.rerun.get(filepath), (event_type, trace))
+            return
+        self.pending[filepath] = merge_file_events(self.pending.get(filepath), (event_type, trace))
+        self.idle_event.clear()
+        self.intake_ready.set()
+
+    def schedule_settle_recheck(self, filepath, delay_seconds, trace):
+        if filepath in self.settle_handles:
+            return
+        self.settle_handles[filepath] = self.loop.call_later(
+            max(0.0, delay_seconds), self._fire_settle_recheck, filepath, trace
+        )
+
+    def _fire_settle_recheck(self, filepath, trace):
+        self.settle_handles.pop(filepath, None)
+        self.submit(filepath, None, trace)
+
+    def finish(self, filepath):
+        self.active_paths.discard(filepath)
+        rerun_item = self.rerun.pop(filepath, None)
+        if rerun_item is not None:
+            self.submit(filepath, *rerun_item)
+        self._update_idle()
+
+    def _update_idle(self):
+        if not self.pending and not self.active_paths and not self.settle_handles:
+            self.idle_event.set()
+
+    def queue_depth(self):
+        return len(self.pending) + (self.read_queue.qsize() if self.read_queue else 0)
+
+    # --- 단계 ---
+    async def dispatch_pending(self):
+        while True:
+            await self.intake_ready.wait()
+            while self.pending:
+                filepath = next(iter(self.pending))
+                event_type, trace = self.pending.pop(filepath)
+                self.active_paths.add(filepath)
+                sequence = self.next_sequence
+                self.next_sequence += 1
+                # 읽기 단계가 밀리면 여기서 기다린다. 그동안 들어온 이벤트는 pending에서 합쳐진다.
+                await self.read_queue.put((sequence, filepath, event_type, trace))
+            self.intake_ready.clear()
+
+    async def read_stage(self):
+        while True:
+            sequence, filepath, event_type, trace = await self.read_queue.get()
+            changes = None
+            try:
+                if trace is None:
+                    trace = TraceContext(filepath)
+                trace.mark("dequeued")
+                changes = await self.loop.run_in_executor(
+                    self.read_executor, read_file_changes, filepath, self.log_func, event_type, trace
+                )
+            except Exception as error:
+                handle_file_processing_error(filepath, error, self.log_func)
+            finally:
+                self.read_queue.task_done()
+            await self.release_in_order(sequence, filepath, changes)
+
+    async def release_in_order(self, sequence, filepath, changes):
+        """읽기가 먼저 끝나도 접수 순서대로 기록 큐에 넣는다. (스레드 엔진과 같은 기록 순서)"""
+        async with self.release_condition:
+            await self.release_condition.wait_for(lambda: self.next_release_sequence == sequence)
+            try:
+                if changes is None:
+                    self.finish(filepath)
+                elif changes.settle_delay is not None:
+                    self.schedule_settle_recheck(filepath, changes.settle_delay, changes.trace)
+                    self.finish(filepath)
+                else:
+                    await self.write_queue.put(changes)
+            finally:
+                self.next_release_sequence += 1
+                self.release_condition.notify_all()
+
+    async def write_stage(self):
+        while True:
+            changes = await self.write_queue.get()
+            try:
+                await self.loop.run_in_executor(self.docs_executor, self.write_and_enforce_budget, changes)
+            except Exception as error:
+                handle_file_processing_error(changes.filepath, error, self.log_func)
+            finally:
+                self.write_queue.task_done()
+                self.finish(changes.filepath)
+
+    def write_and_enforce_budget(self, changes):
+        write_file_changes(changes, self.config, self.services, self.log_func, self.extracted_result_callback)
+        # 백엔드 캐시는 기록 작업자만 고치므로 정리도 같은 작업자에서 한다.
+        for eviction in memory_budget.maybe_enforce("backend"):
+            self.log_func(f"백엔드: 메모리 예산 정리 - {format_memory_eviction(eviction)}")
+
+    def wake_control_loop(self):
+        """다른 스레드에서 불러 run()의 제어 루프를 깨운다."""
+        try:
+            self.loop.call_soon_threadsafe(self.control_event.set)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 닫혔다.
+
+    async def wait_for_control(self, stop_wakes_loop):
+        if stop_wakes_loop:
+            await self.control_event.wait()
+            return
+        # 일반 Event는 set() 해도 루프를 깨우지 않으므로 중지 신호를 주기적으로 확인한다.
+        try:
+            await asyncio.wait_for(self.control_event.wait(), STOP_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+    async def wait_until_idle(self):
+        self._update_idle()
+        await self.idle_event.wait()
+
+    # --- 실행 ---
+    async def run(self, stop_event, observer_factory=Observer, drain_timeout_seconds=0.0):
+        backend_logger = logging.getLogger(BACKEND_LOGGER_NAME)
+        self.loop = asyncio.get_running_loop()
+        self.read_queue = asyncio.Queue(self.read_queue_size)
+        self.write_queue = asyncio.Queue(self.write_queue_size)
+        self.intake_ready = asyncio.Event()
+        self.idle_event = asyncio.Event()
+        self.release_condition = asyncio.Condition()
+        self.control_event = asyncio.Event()
+        stop_wakes_loop = hasattr(stop_event, "add_wake_callback")
+        self.read_executor = ThreadPoolExecutor(self.read_concurrency, thread_name_prefix="AsyncEngineRead")
+        self.docs_executor = ThreadPoolExecutor(1, thread_name_prefix="AsyncEngineDocs")
+        self.io_executor = ThreadPoolExecutor(1, thread_name_prefix="AsyncEngineIO")
+        previous_scheduler = install_engine_scheduler(LoopEngineScheduler(self))
+        queue_depth_gauge = metrics_registry.gauge(FILE_QUEUE_DEPTH)
+        queue_depth_gauge.set_function(self.queue_depth)
+
+        observer = None
+        stage_tasks = []
+        try:
+            if observer_factory is not None:
+                observer = observer_factory()
+                try:
+                    observer.schedule(
+                        AsyncFileEventHandler(self.log_func, self.config, self),
+                        self.config.get('watch_folder'),
+                        recursive=False,
+                    )
+                    observer.start()
+                    self.log_func("백엔드: 파일 시스템 감시자 시작됨. (asyncio 엔진)")
+                except Exception as e:
+                    self.log_func(f"오류: 감시자 시작 실패 - {e}")
+                    return False
+
+            stage_tasks.append(asyncio.create_task(self.dispatch_pending()))
+            stage_tasks.extend(asyncio.create_task(self.read_stage()) for _ in range(self.read_concurrency))
+            stage_tasks.append(asyncio.create_task(self.write_stage()))
+            if stop_wakes_loop:
+                stop_event.add_wake_callback(self.wake_control_loop)
+            monitoring_profile_hook.attach(wake_func=self.wake_control_loop)
+            # 중지 신호나 프로파일 요청이 올 때까지 잠든다.
+            while True:
+                self.control_event.clear()
+                monitoring_profile_hook.step()
+                if stop_event.is_set():
+                    break
+                await self.wait_for_control(stop_wakes_loop)
+            self.log_func("백엔드: 중지 신호 수신됨.")
+            backend_logger.info("중지 신호 수신됨 (asyncio 엔진)")
+            return True
+        finally:
+            if stop_wakes_loop:
+                stop_event.remove_wake_callback(self.wake_control_loop)
+            self.log_func("백엔드: 종료 처리 시작...")
+            if observer is not None:
+                observer.stop()
+                await self.loop.run_in_executor(None, observer.join, OBSERVER_JOIN_SECONDS)
+                self.log_func("백엔드: 감시자 종료 완료.")
+            if drain_timeout_seconds > 0 and stage_tasks:
+                try:
+                    await asyncio.wait_for(self.wait_until_idle(), drain_timeout_seconds)
+                    self.log_func("백엔드: 남은 파일을 모두 처리한 뒤 종료합니다.")
+                except asyncio.TimeoutError:
+                    self.log_func("경고: 제한 시간 안에 처리하지 못한 파일이 남아 있습니다. 다음 변경 때 이어서 처리합니다.")
+            for task in stage_tasks:
+                task.cancel()
+            await asyncio.gather(*stage_tasks, return_exceptions=True)
+            for handle in self.settle_handles.values():
+                handle.cancel()
+            # 진행 중인 Docs 기록은 끝까지 기다린다. (처리 위치는 기록이 끝나야 앞으로 간다)
+            for executor in (self.read_executor, self.docs_executor, self.io_executor):
+                await self.loop.run_in_executor(None, executor.shutdown, True)
+            monitoring_profile_hook.detach()
+            install_engine_scheduler(previous_scheduler)
+            queue_depth_gauge.set_function(lambda: file_queue.qsize())
+
+
+def merge_file_events(existing, incoming):
+    """같은 파일의 (이벤트 유형, 추적) 두 개를 합친다. 'created'는 상태 초기화에 쓰이므로 남기고,
+    추적은 먼저 감지한 것을 남긴다."""
+    if existing is None:
+        return incoming
+    existing_type, existing_trace = existing
+    incoming_type, incoming_trace = incoming
+    event_type = "created" if "created" in (existing_type, incoming_type) else (incoming_type or existing_type)
+    return event_type, existing_trace or incoming_trace
+
+
+def run_monitoring_async(
+    config,
+    log_func_threadsafe,
+    stop_event,
+    extracted_result_callback=None,
+    preloaded_services=None,
+    drain_timeout_seconds=0.0,
+    observer_factory=Observer,
+):
+    """run_monitoring 대신 쓸 수 있는 asyncio 엔진 진입점. 호출한 스레드에서 이벤트 루프를 돈다."""
+    google_services, can_start = prepare_monitoring_session(config, log_func_threadsafe, preloaded_services)
+    if not can_start:
+        return
+    apply_engine_runtime_config(config)
+    engine = AsyncMonitoringEngine(
+        config,
+        log_func_threadsafe,
+        google_services,
+        extracted_result_callback=extracted_result_callback,
+    )
+    timeseries_recorder = TimeSeriesRecorder(TimeSeriesStore(backend_processor.TIMESERIES_FILE))
+    timeseries_recorder.start()
+    try:
+        asyncio.run(engine.run(stop_event, observer_factory, drain_timeout_seconds))
+    except Exception as e:
+        log_func_threadsafe(f"오류: asyncio 감시 엔진 예외 - {e}")
+        logging.getLogger(BACKEND_LOGGER_NAME).error(f"asyncio 감시 엔진 예외: {e}", exc_info=True)
+    finally:
+        save_line_cache(log_func_threadsafe)
+        flush_processed_state_save(log_func_threadsafe)
+        timeseries_recorder.stop()
+        catchup_pool.shutdown()
+        history_index.close()
+        dedupe_filter.close()
+        log_func_threadsafe("백엔드: 모든 작업 완료.")
@@ -0,0 +1,471 @@
+"""감시 엔진(run_monitoring)을 GUI와 다른 프로세스에서 실행한다.
+
+- 자식 프로세스는 spawn 방식으로 띄운다. (Tk/pystray 상태를 fork로 물려받지 않는다)
+- 로그 줄과 추출 결과는 ("log", 메시지) / ("result", 결과) 이벤트로 큐를 통해 넘어온다.
+- 처리량, 큐 깊이, 지연 통계 같은 실시간 카운터는 공유 메모리 블록에 주기적으로 덮어쓴다.
+  GUI는 락 없이 이 블록을 읽어 자기 지표 레지스트리에 비춰 보이므로 상태 패널과
+  Prometheus 내보내기는 스레드 모드와 같은 코드로 동작한다.
+- 자식이 비정상 종료하면 감독자가 잠시 기다렸다가 다시 띄운다. 상태 파일은 원자적으로
+  저장되므로 다시 뜬 자식은 마지막으로 저장된 처리 위치부터 이어서 읽는다.
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import psutil
+
+from .async_engine import select_monitoring_engine
+from .backend_processor import MonitoringStopEvent
+from .latency_tracing import SUMMARY_STAGES, latency_tracker
+from .metrics import (
+    BYTES_READ_TOTAL,
+    DEFAULT_HISTOGRAM_BUCKETS,
+    DOCS_API_CALLS_TOTAL,
+    DOCS_API_ERRORS_TOTAL,
+    DOCS_API_LATENCY,
+    DRIVE_API_CALLS_TOTAL,
+    DRIVE_API_ERRORS_TOTAL,
+    FILE_QUEUE_DEPTH,
+    FILES_PROCESSED_TOTAL,
+    GOOGLE_SERVICE_BUILDS_TOTAL,
+    GOOGLE_TOKEN_REFRESH_FAILURES_TOTAL,
+    GOOGLE_TOKEN_REFRESH_TOTAL,
+    LINE_CACHE_SIZE,
+    LINES_DEDUPED_TOTAL,
+    LINES_READ_TOTAL,
+    LINES_WRITTEN_TOTAL,
+    RETRIES_TOTAL,
+    metrics_registry,
+)
+
+
+STATUS_PUBLISH_INTERVAL_SECONDS = 0.5
+STOP_FLAG_POLL_SECONDS = 0.1
+EVENT_POLL_SECONDS = 0.2
+REGISTRY_MIRROR_INTERVAL_SECONDS = 1.0
+DEFAULT_STOP_TIMEOUT_SECONDS = 10.0
+TERMINATE_GRACE_SECONDS = 2.0
+RESTART_BACKOFF_SECONDS = (1.0, 2.0, 5.0, 10.0, 30.0)
+MAX_RESTARTS_PER_WINDOW = 5
+RESTART_WINDOW_SECONDS = 600.0
+REMOTE_METRICS_SOURCE = "backend_process"
+MICROSECONDS = 1_000_000
+SEQLOCK_READ_ATTEMPTS = 100
+
+# 자식 프로세스가 세는 카운터. 순서가 곧 공유 메모리 배치이므로 끝에만 추가한다.
+STATUS_COUNTER_NAMES = (
+    FILES_PROCESSED_TOTAL,
+    BYTES_READ_TOTAL,
+    LINES_READ_TOTAL,
+    LINES_WRITTEN_TOTAL,
+    LINES_DEDUPED_TOTAL,
+    RETRIES_TOTAL,
+    DOCS_API_CALLS_TOTAL,
+    DOCS_API_ERRORS_TOTAL,
+    DRIVE_API_CALLS_TOTAL,
+    DRIVE_API_ERRORS_TOTAL,
+    GOOGLE_TOKEN_REFRESH_TOTAL,
+    GOOGLE_TOKEN_REFRESH_FAILURES_TOTAL,
+    GOOGLE_SERVICE_BUILDS_TOTAL,
+)
+STATUS_GAUGE_NAMES = (FILE_QUEUE_DEPTH, LINE_CACHE_SIZE)
+PROCESS_FIELD_NAMES = ("pid", "heartbeat_ms", "rss_bytes")
+API_LATENCY_BUCKET_SLOTS = len(DEFAULT_HISTOGRAM_BUCKETS) + 1
+LATENCY_FIELD_NAMES = ("count", "p50", "p95", "p99")
+
+PROCESS_OFFSET = 1  # 0번 칸은 seqlock 순번이다.
+COUNTER_OFFSET = PROCESS_OFFSET + len(PROCESS_FIELD_NAMES)
+GAUGE_OFFSET = COUNTER_OFFSET + len(STATUS_COUNTER_NAMES)
+API_LATENCY_OFFSET = GAUGE_OFFSET + len(STATUS_GAUGE_NAMES)  # 버킷들, 합(µs), 개수
+LATENCY_OFFSET = API_LATENCY_OFFSET + API_LATENCY_BUCKET_SLOTS + 2
+STATUS_SLOT_COUNT = LATENCY_OFFSET + len(SUMMARY_STAGES) * len(LATENCY_FIELD_NAMES)
+
+
+def get_spawn_context():
+    return multiprocessing.get_context("spawn")
+
+
+def seconds_to_microseconds(seconds):
+    return -1 if seconds is None else int(round(seconds * MICROSECONDS))
+
+
+def microseconds_to_seconds(value):
+    return None if value < 0 else value / MICROSECONDS
+
+
+class SharedStatusBlock:
+    """int64 배열 하나로 된 공유 메모리 상태 블록. 쓰는 쪽은 하나뿐이라 seqlock으로 충분하다.
+
+    쓰기 전후로 0번 칸 순번을 1씩 올린다. 읽는 쪽은 순번이 짝수이고 읽기 전후가 같을 때만
+    값을 받아들이므로, 반쯤 덮어쓴 값을 보지 않는다.
+    """
+
+    def __init__(self, array=None, context=None):
+        if array is None:
+            array = (context or get_spawn_context()).RawArray("q", STATUS_SLOT_COUNT)
+        self.array = array
+
+    def publish(self, values):
+        sequence = self.array[0]
+        self.array[0] = sequence + 1
+        self.array[1:STATUS_SLOT_COUNT] = values
+        self.array[0] = sequence + 2
+
+    def read_values(self):
+        """일관된 값 목록을 반환한다. 쓰기와 계속 겹치면 None."""
+        for _attempt in range(SEQLOCK_READ_ATTEMPTS):
+            sequence_before = self.array[0]
+            if sequence_before % 2:
+                time.sleep(0)
+                continue
+            values = self.array[1:STATUS_SLOT_COUNT]
+            if self.array[0] == sequence_before:
+                return values
+        return None
+
+    def clear(self):
+        self.publish([0] * (STATUS_SLOT_COUNT - 1))
+
+
+def collect_status_values(registry=metrics_registry, tracker=latency_tracker, pid=None, rss_bytes=None, now=time.time):
+    """현재 프로세스의 지표를 공유 블록 배치 순서의 정수 목록으로 만든다. (0번 seqlock 칸 제외)"""
+    values = [0] * (STATUS_SLOT_COUNT - 1)
+
+    def put(slot, value):
+        values[slot - 1] = int(value)
+
+    put(PROCESS_OFFSET, os.getpid() if pid is None else pid)
+    put(PROCESS_OFFSET + 1, now() * 1000)
+    if rss_bytes is None:
+        try:
+            rss_bytes = psutil.Process().memory_info().rss
+        except Exception:
+            rss_bytes = 0
+    put(PROCESS_OFFSET + 2, rss_bytes)
+    for index, name in enumerate(STATUS_COUNTER_NAMES):
+        put(COUNTER_OFFSET + index, registry.get_value(name))
+    for index, name in enumerate(STATUS_GAUGE_NAMES):
+        put(GAUGE_OFFSET + index, registry.get_value(name))
+
+    api_histogram = registry.histogram(DOCS_API_LATENCY)
+    with api_histogram.lock:
+        bucket_counts = list(api_histogram.bucket_counts)
+        total_sum, total_count = api_histogram.total_sum, api_histogram.total_count
+    for index, count in enumerate(bucket_counts[:API_LATENCY_BUCKET_SLOTS]):
+        put(API_LATENCY_OFFSET + index, count)
+    put(API_LATENCY_OFFSET + API_LATENCY_BUCKET_SLOTS, seconds_to_microseconds(total_sum))
+    put(API_LATENCY_OFFSET + API_LATENCY_BUCKET_SLOTS + 1, total_count)
+
+    latency_snapshot = tracker.snapshot()
+    for stage_index, stage in enumerate(SUMMARY_STAGES):
+        stage_summary = latency_snapshot.get(stage)
+        if not stage_summary:
+            continue
+        base_slot = LATENCY_OFFSET + stage_index * len(LATENCY_FIELD_NAMES)
+        put(base_slot, stage_summary["count"])
+        for field_index, field_name in enumerate(LATENCY_FIELD_NAMES[1:], start=1):
+            put(base_slot + field_index, seconds_to_microseconds(stage_summary[field_name]))
+    return values
+
+
+def decode_status_values(values):
+    """collect_status_values() 목록을 읽기 쉬운 dict로 되돌린다."""
+
+    def get(slot):
+        return values[slot - 1]
+
+    api_buckets_end = API_LATENCY_OFFSET + API_LATENCY_BUCKET_SLOTS
+    latency = {}
+    for stage_index, stage in enumerate(SUMMARY_STAGES):
+        base_slot = LATENCY_OFFSET + stage_index * len(LATENCY_FIELD_NAMES)
+        stage_count = get(base_slot)
+        if stage_count:
+            latency[stage] = {
+                "count": stage_count,
+                "p50": microseconds_to_seconds(get(base_slot + 1)),
+                "p95": microseconds_to_seconds(get(base_slot + 2)),
+                "p99": microseconds_to_seconds(get(base_slot + 3)),
+            }
+    return {
+        "pid": get(PROCESS_OFFSET),
+        "heartbeat_ms": get(PROCESS_OFFSET + 1),
+        "rss_bytes": get(PROCESS_OFFSET + 2),
+        "counters": {name: get(COUNTER_OFFSET + index) for index, name in enumerate(STATUS_COUNTER_NAMES)},
+        "gauges": {name: get(GAUGE_OFFSET + index) for index, name in enumerate(STATUS_GAUGE_NAMES)},
+        "api_latency": {
+            "bucket_counts": [get(slot) for slot in range(API_LATENCY_OFFSET, api_buckets_end)],
+            "sum": get(api_buckets_end) / MICROSECONDS,
+            "count": get(api_buckets_end + 1),
+        },
+        "latency": latency,
+    }
+
+
+def backend_child_main(config, event_queue, stop_flag, status_array, publish_interval=STATUS_PUBLISH_INTERVAL_SECONDS, run_func=None):
+    """자식 프로세스 진입점. 공유 stop_flag가 켜지면 감시 엔진에 중지를 전달한다.
+
+    multiprocessing.Event는 기다리던 프로세스가 죽으면 부모의 set()이 멈출 수 있어
+    락 없는 공유 값 하나를 짧은 간격으로 확인한다.
+    """
+    status_block = SharedStatusBlock(status_array)
+    engine_stop_event = MonitoringStopEvent()
+    publisher_stop = threading.Event()
+
+    def forward_stop_flag():
+        while not stop_flag.value:
+            time.sleep(STOP_FLAG_POLL_SECONDS)
+        engine_stop_event.set()
+
+    def publish_status():
+        while not publisher_stop.wait(publish_interval):
+            try:
+                status_block.publish(collect_status_values())
+            except Exception:
+                continue
+
+    threading.Thread(target=forward_stop_flag, name="BackendStopForwarder", daemon=True).start()
+    publisher_thread = threading.Thread(target=publish_status, name="BackendStatusPublisher", daemon=True)
+    publisher_thread.start()
+    try:
+        (run_func or select_monitoring_engine(config))(
+            config,
+            lambda message: event_queue.put(("log", message)),
+            engine_stop_event,
+            extracted_result_callback=lambda payload: event_queue.put(("result", payload)),
+        )
+    finally:
+        publisher_stop.set()
+        publisher_thread.join(timeout=publish_interval * 2)
+        status_block.publish(collect_status_values())
+        event_queue.put(("exited", os.getpid()))
+
+
+class BackendProcessSupervisor:
+    """자식 프로세스를 띄우고 이벤트를 전달하며, 비정상 종료하면 다시 띄운다.
+
+    자식이 종료 코드 0으로 스스로 끝나면(인증 실패 등으로 감시를 시작하지 못한 경우)
+    다시 띄워도 같은 결과이므로 재시작하지 않고 on_exit만 부른다.
+    """
+
+    def __init__(
+        self,
+        config,
+        log_func,
+        result_func=None,
+        on_exit=None,
+        registry=metrics_registry,
+        context=None,
+        target=backend_child_main,
+        backoff_seconds=RESTART_BACKOFF_SECONDS,
+        max_restarts=MAX_RESTARTS_PER_WINDOW,
+        restart_window_seconds=RESTART_WINDOW_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.config = dict(config)
+        self.log_func = log_func
+        self.result_func = result_func
+        self.on_exit = on_exit
+        self.registry = registry
+        self.context = context or get_spawn_context()
+        self.target = target
+        self.backoff_seconds = tuple(backoff_seconds)
+        self.max_restarts = max_restarts
+        self.restart_window_seconds = restart_window_seconds
+        self.clock = clock
+        self.status_block = SharedStatusBlock(context=self.context)
+        self.stop_requested = threading.Event()
+        self.restart_times = []
+        self.restart_count = 0
+        self.carried_counters = {name: 0 for name in STATUS_COUNTER_NAMES}
+        self.carried_api_latency = ([0] * API_LATENCY_BUCKET_SLOTS, 0.0, 0)
+        self.process = None
+        self.event_queue = None
+        self.stop_flag = None
+        self.supervisor_thread = None
+        self.last_mirrored_at = None
+        self.last_exitcode = None
+
+    # --- 수명 관리 ---
+    def start(self):
+        self.stop_requested.clear()
+        self._spawn()
+        self.supervisor_thread = threading.Thread(target=self._supervise, name="BackendProcessSupervisor", daemon=True)
+        self.supervisor_thread.start()
+
+    def _spawn(self):
+        self.status_block.clear()
+        self.event_queue = self.context.Queue()
+        self.stop_flag = self.context.RawValue("b", 0)
+        self.process = self.context.Process(
+            target=self.target,
+            args=(self.config, self.event_queue, self.stop_flag, self.status_block.array),
+            name="AutoWriteBackend",
+            daemon=True,
+        )
+        self.process.start()
+        self.log_func(f"백엔드 프로세스 시작 (PID {self.process.pid})")
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def stop(self, timeout_seconds=DEFAULT_STOP_TIMEOUT_SECONDS):
+        """자식에게 중지를 알리고 기한까지 기다린다. 넘기면 terminate, 그래도 남으면 kill한다.
+
+        제때 스스로 끝났으면 True를 반환한다.
+        """
+        self.stop_requested.set()
+        process = self.process
+        if process is None:
+            return True
+        if self.stop_flag is not None:
+            self.stop_flag.value = 1
+        process.join(timeout_seconds)
+        stopped_cleanly = not process.is_alive()
+        if not stopped_cleanly:
+            self.log_func(f"경고: 백엔드 프로세스가 {timeout_seconds:.0f}초 안에 끝나지 않아 강제로 종료합니다.")
+            process.terminate()
+            process.join(TERMINATE_GRACE_SECONDS)
+            if process.is_alive():
+                process.kill()
+                process.join(TERMINATE_GRACE_SECONDS)
+        if self.supervisor_thread is not None and self.supervisor_thread is not threading.current_thread():
+            self.supervisor_thread.join(TERMINATE_GRACE_SECONDS + EVENT_POLL_SECONDS * 2)
+        return stopped_cleanly
+
+    # --- 감독 스레드 ---
+    def _supervise(self):
+        while True:
+            self._dispatch_events(EVENT_POLL_SECONDS)
+            self._mirror_if_due()
+            if self.process.is_alive():
+                continue
+            self._dispatch_remaining_events()
+            self.mirror_into_registry()
+            self.last_exitcode = self.process.exitcode
+            if self.stop_requested.is_set() or self.last_exitcode == 0:
+                break
+            delay_seconds = self._next_restart_delay()
+            if delay_seconds is None:
+                self.log_func(
+                    f"오류: 백엔드 프로세스가 {self.restart_window_seconds / 60:.0f}분 동안 "
+                    f"{self.max_restarts}번 넘게 비정상 종료되어 다시 시작하지 않습니다. (종료 코드 {self.last_exitcode})"
+                )
+                break
+            self.log_func(
+                f"경고: 백엔드 프로세스가 비정상 종료되었습니다 (종료 코드 {self.last_exitcode}). "
+                f"{delay_seconds:.0f}초 후 다시 시작합니다."
+            )
+            if self.stop_requested.wait(delay_seconds):
+                break
+            self._carry_over_counters()
+            self.restart_count += 1
+            self._spawn()
+        self._clear_registry_gauges()
+        if self.on_exit is not None:
+            self.on_exit(self.last_exitcode)
+
+    def _next_restart_delay(self):
+        current_time = self.clock()
+        self.restart_times = [
+            restarted_at for restarted_at in self.restart_times
+            if current_time - restarted_at < self.restart_window_seconds
+        ]
+        if len(self.restart_times) >= self.max_restarts:
+            return None
+        delay_seconds = self.backoff_seconds[min(len(self.restart_times), len(self.backoff_seconds) - 1)]
+        self.restart_times.append(current_time)
+        return delay_seconds
+
+    def _dispatch_events(self, timeout_seconds):
+        try:
+            event = self.event_queue.get(timeout=timeout_seconds)
+        except (queue.Empty, EOFError, OSError):
+            return
+        self._handle_event(event)
+        self._dispatch_remaining_events()
+
+    def _dispatch_remaining_events(self):
+        while True:
+            try:
+                event = self.event_queue.get_nowait()
+            except (queue.Empty, EOFError, OSError):
+                return
+            self._handle_event(event)
+
+    def _handle_event(self, event):
+        event_type, payload = event
+        if event_type == "log":
+            self.log_func(payload)
+        elif event_type == "result" and self.result_func is not None:
+            self.result_func(payload)
+
+    # --- 상태 읽기 ---
+    def _carry_over_counters(self):
+        """다시 띄운 자식은 0부터 세므로 이전 자식의 누적값을 더해 둔다. (카운터가 줄어들지 않게)"""
+        values = self.status_block.read_values()
+        if values is None:
+            return
+        status = decode_status_values(values)
+        for name, value in status["counters"].items():
+            self.carried_counters[name] += value
+        carried_buckets, carried_sum, carried_count = self.carried_api_latency
+        api_latency = status["api_latency"]
+        self.carried_api_latency = (
+            [carried + count for carried, count in zip(carried_buckets, api_latency["bucket_counts"])],
+            carried_sum + api_latency["sum"],
+            carried_count + api_latency["count"],
+        )
+
+    def read_status(self):
+        """자식 프로세스의 최신 상태 dict를 반환한다. 카운터는 재시작 전 누적값을 포함한다."""
+        values = self.status_block.read_values()
+        if values is None:
+            return None
+        status = decode_status_values(values)
+        status["counters"] = {
+            name: value + self.carried_counters[name] for name, value in status["counters"].items()
+        }
+        carried_buckets, carried_sum, carried_count = self.carried_api_latency
+        api_latency = status["api_latency"]
+        status["api_latency"] = {
+            "bucket_counts": [carried + count for carried, count in zip(carried_buckets, api_latency["bucket_counts"])],
+            "sum": carried_sum + api_latency["sum"],
+            "count": carried_count + api_latency["count"],
+        }
+        status["alive"] = self.is_alive()
+        status["restart_count"] = self.restart_count
+        return status
+
+    def latency_snapshot(self):
+        """latency_tracker.snapshot()과 같은 모양의 자식 프로세스 지연 통계."""
+        status = self.read_status()
+        return status["latency"] if status else {}
+
+    def mirror_into_registry(self):
+        """자식 프로세스 카운터를 이 프로세스 지표 레지스트리에 비춘다."""
+        status = self.read_status()
+        if status is None or self.registry is None:
+            return
+        for name, value in status["counters"].items():
+            self.registry.counter(name).set_remote(REMOTE_METRICS_SOURCE, value)
+        for name, value in status["gauges"].items():
+            self.registry.gauge(name).set_remote(value)
+        api_latency = status["api_latency"]
+        self.registry.histogram(DOCS_API_LATENCY).set_remote(
+            REMOTE_METRICS_SOURCE, api_latency["bucket_counts"], api_latency["sum"], api_latency["count"]
+        )
+        self.last_mirrored_at = self.clock()
+
+    def _mirror_if_due(self):
+        if self.last_mirrored_at is None or self.clock() - self.last_mirrored_at >= REGISTRY_MIRROR_INTERVAL_SECONDS:
+            self.mirror_into_registry()
+
+    def _clear_registry_gauges(self):
+        """자식이 없으면 큐 깊이 같은 현재값은 의미가 없으므로 이 프로세스 값으로 돌린다."""
+        if self.registry is None:
+            return
+        for name in STATUS_GAUGE_NAMES:
+            self.registry.gauge(name).set_remote(None)
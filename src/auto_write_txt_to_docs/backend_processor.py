@@ -11,7 +11,8 @@ from googleapiclient.errors import HttpError
 import traceback
 import logging
 import hashlib
-from collections import OrderedDict
+import heapq
+from collections import OrderedDict, deque
 from datetime import datetime # Docs 헤더에 타임스탬프 사용 위해 유지
 
 # google_auth 모듈 임포트
@@ -22,6 +23,51 @@ except ImportError:
     GoogleAuthActionRequired = Exception
     get_google_services = None
 
+from .catchup_pool import CHUNK_SAFE_ENCODINGS, LineSpans, catchup_pool
+from .dedupe_filter import (
+    DEDUPE_FILTER_DIR_NAME,
+    DEFAULT_FALSE_POSITIVE_RATE as DEFAULT_LONG_TERM_DEDUPE_FALSE_POSITIVE_RATE,
+    DEFAULT_GENERATION_DAYS as DEFAULT_LONG_TERM_DEDUPE_GENERATION_DAYS,
+    DEFAULT_GENERATIONS as DEFAULT_LONG_TERM_DEDUPE_GENERATIONS,
+    dedupe_filter,
+    format_dedupe_filter_status,
+    get_dedupe_filter_dir,
+)
+from .history_index import (
+    DEFAULT_MAX_LINES as DEFAULT_HISTORY_MAX_LINES,
+    DEFAULT_RETENTION_DAYS as DEFAULT_HISTORY_RETENTION_DAYS,
+    HISTORY_INDEX_FILE_NAME,
+    history_index,
+)
+from .latency_tracing import TraceContext, latency_tracker
+from .memory_budget import (
+    estimate_container_bytes,
+    estimate_items_bytes,
+    format_memory_eviction,
+    memory_budget,
+)
+from .logging_pipeline import BACKEND_LOGGER_NAME, configure_logger
+from .monitoring_config import DEFAULT_DEDUPE_SCOPE, normalize_dedupe_scope, normalize_dedupe_ttl_seconds
+from .profiling import monitoring_profile_hook
+from .timeseries_store import TIMESERIES_FILE_NAME, TimeSeriesRecorder, TimeSeriesStore
+from .write_journal import WRITE_JOURNAL_FILE_NAME, write_journal
+from .metrics import (
+    BYTES_READ_TOTAL,
+    DOCS_AMBIGUOUS_WRITES_TOTAL,
+    DOCS_API_CALLS_TOTAL,
+    DOCS_API_ERRORS_TOTAL,
+    DOCS_API_LATENCY,
+    DOCS_RESENDS_AVOIDED_TOTAL,
+    FILE_QUEUE_DEPTH,
+    FILES_PROCESSED_TOTAL,
+    LINE_CACHE_SIZE,
+    LINES_DEDUPED_TOTAL,
+    LINES_READ_TOTAL,
+    LINES_WRITTEN_TOTAL,
+    RETRIES_TOTAL,
+    metrics_registry,
+)
+
 try:
     from .path_utils import (
         CACHE_FILE_STR,
@@ -42,46 +88,121 @@ processed_file_states = {} # 파일별 마지막 처리 상태 (성공 바이트
 file_encodings = {}  # 파일별 성공한 인코딩 저장
 PROCESSING_DELAY = 1.0
 RETRY_DELAY = 5.0
+DOCS_UPLOAD_CHUNK_CHARS = 200000  # 기록 문자열이 이보다 길면 조각으로 나눠 보내고 조각마다 처리 위치를 저장
 DEFAULT_MAX_GLOBAL_CACHE_SIZE = 10000
 MAX_GLOBAL_CACHE_SIZE = DEFAULT_MAX_GLOBAL_CACHE_SIZE
+DEDUPE_SCOPE = DEFAULT_DEDUPE_SCOPE  # off / file / document / global (monitoring_config.DEDUPE_SCOPES)
+DEDUPE_TTL_SECONDS = 0  # 0보다 크면 라인 캐시 줄은 마지막으로 본 뒤 이 시간이 지나면 다시 새 줄로 본다.
+DEDUPE_WARMUP_MAX_CHARS = 20_000_000  # 대상 문서로 중복 캐시를 예열할 때 읽는 최대 글자 수 (문서 끝쪽부터)
+DOCS_TEXT_FIELDS = 'body/content/paragraph/elements/textRun/content'
 PROCESSED_STATE_SAVE_DEBOUNCE_SECONDS = 1.0
+PROCESSED_STATE_SPILL_DIR_NAME = "processed_state_spill"  # 메모리 예산을 넘어 디스크로 내린 파일별 해시 집합
 processed_state_lock = threading.RLock()
 processed_state_dirty = False
 processed_state_save_timer = None
+STOP_EVENT_POLL_SECONDS = 0.5  # 큐를 깨우지 못하는 일반 Event로 중지 신호를 받을 때만 사용
+MONITORING_STOP_SENTINEL = object()
+MONITORING_WAKE_SENTINEL = object()  # 처리할 파일 없이 메인 루프를 한 바퀴 돌게 한다. (프로파일 요청 등)
+settle_deadlines = []  # (재확인 시각, 파일 경로) 힙 - 메인 루프 스레드에서만 사용
+settle_deadline_paths = set()
+settle_deadline_traces = {}  # 재확인 대기 중인 파일의 지연 추적 컨텍스트
+
+
+class MonitoringStopEvent(threading.Event):
+    """set() 할 때 파일 큐에 깨우기 항목을 넣어, 큐에서 대기 중인 메인 루프를 바로 깨운다.
+
+    파일 큐에서 기다리지 않는 엔진(asyncio)은 add_wake_callback으로 깨울 함수를 건다.
+    """
+
+    wakes_file_queue = True
+
+    def __init__(self):
+        super().__init__()
+        self.wake_callbacks_lock = threading.Lock()
+        self.wake_callbacks = []
+
+    def add_wake_callback(self, callback):
+        """set() 때 부를 함수를 건다. 이미 set() 됐으면 바로 부른다."""
+        with self.wake_callbacks_lock:
+            self.wake_callbacks.append(callback)
+        if self.is_set():
+            callback()
+
+    def remove_wake_callback(self, callback):
+        with self.wake_callbacks_lock:
+            if callback in self.wake_callbacks:
+                self.wake_callbacks.remove(callback)
+
+    def set(self):
+        super().set()
+        file_queue.put(MONITORING_STOP_SENTINEL)
+        with self.wake_callbacks_lock:
+            wake_callbacks = list(self.wake_callbacks)
+        for callback in wake_callbacks:
+            callback()
+
+
+class ThreadEngineScheduler:
+    """재시도/상태 저장 타이머와 재시도 큐 등록 방법. 스레드 엔진은 threading.Timer와 file_queue를 쓴다.
+
+    asyncio 엔진은 실행하는 동안 install_engine_scheduler()로 이벤트 루프용 구현을 끼운다.
+    """
+
+    def start_timer(self, delay_seconds, callback):
+        """delay_seconds 뒤 callback을 부르고 cancel()이 있는 객체를 반환한다."""
+        timer = threading.Timer(delay_seconds, callback)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def requeue(self, filepath):
+        file_queue.put(filepath)
+
+
+engine_scheduler = ThreadEngineScheduler()
+
+
+def install_engine_scheduler(scheduler):
+    """엔진 스케줄러를 바꾸고 이전 스케줄러를 반환한다."""
+    global engine_scheduler
+    previous_scheduler = engine_scheduler
+    engine_scheduler = scheduler
+    return previous_scheduler
 
 # 로깅 설정
 def setup_backend_logging():
-    """백엔드 로깅 시스템 설정"""
-    logger = logging.getLogger('backend_processor')
-    logger.setLevel(logging.INFO)
-    
-    # 기존 핸들러 제거 (중복 방지)
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
-    # 공통 경로 정책(path_utils)의 로그 디렉토리 사용
-    logs_dir = LOG_DIR_STR
-    os.makedirs(logs_dir, exist_ok=True)
-    
-    # 파일 핸들러 설정
-    log_filename = os.path.join(logs_dir, f"backend_log_{datetime.now().strftime('%Y%m%d')}.log")
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-    
-    # 로그 포맷 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    return logger
+    """백엔드 로거를 비동기 파일 파이프라인에 연결한다. (파일 쓰기는 리스너 스레드에서 처리)"""
+    return configure_logger(BACKEND_LOGGER_NAME, LOG_DIR_STR)
 
 # 라인 캐시 관련 설정
 added_lines_cache = OrderedDict() # 최근 N개 전역 라인 캐시 (중복 방지)
+pending_dedupe_warmup = None  # 예열 스레드가 만든 문서 줄 지문. 다음 기록 단계가 전역 캐시에 합친다.
+line_cache_docs_id = None  # dedupe_scope가 document일 때 라인 캐시 파일을 나눌 대상 문서 ID
 LINE_CACHE_FILE = CACHE_FILE_STR
 PROCESSED_STATE_FILE = PROCESSED_STATE_FILE_STR
+TIMESERIES_FILE = os.path.join(LOG_DIR_STR, TIMESERIES_FILE_NAME)
+WRITE_JOURNAL_FILE = os.path.join(os.path.dirname(PROCESSED_STATE_FILE_STR), WRITE_JOURNAL_FILE_NAME)
+HISTORY_INDEX_FILE = os.path.join(os.path.dirname(PROCESSED_STATE_FILE_STR), HISTORY_INDEX_FILE_NAME)
+DEDUPE_FILTER_DIR = os.path.join(os.path.dirname(PROCESSED_STATE_FILE_STR), DEDUPE_FILTER_DIR_NAME)
+
+# --- 운영 지표 ---
+files_processed_counter = metrics_registry.counter(FILES_PROCESSED_TOTAL, "처리를 마친 파일 수")
+bytes_read_counter = metrics_registry.counter(BYTES_READ_TOTAL, "감시 파일에서 새로 읽은 바이트 수")
+lines_read_counter = metrics_registry.counter(LINES_READ_TOTAL, "새로 읽은 비어 있지 않은 줄 수")
+lines_written_counter = metrics_registry.counter(LINES_WRITTEN_TOTAL, "Google Docs에 기록한 줄 수")
+lines_deduped_counter = metrics_registry.counter(LINES_DEDUPED_TOTAL, "중복 캐시에 걸려 기록하지 않은 줄 수")
+retries_counter = metrics_registry.counter(RETRIES_TOTAL, "Google Docs 기록 재시도 예약 횟수")
+docs_api_calls_counter = metrics_registry.counter(DOCS_API_CALLS_TOTAL, "Docs batchUpdate 호출 수")
+docs_api_errors_counter = metrics_registry.counter(DOCS_API_ERRORS_TOTAL, "실패한 Docs batchUpdate 호출 수")
+docs_api_latency_histogram = metrics_registry.histogram(DOCS_API_LATENCY, "Docs batchUpdate 응답 시간(초)")
+docs_ambiguous_writes_counter = metrics_registry.counter(
+    DOCS_AMBIGUOUS_WRITES_TOTAL, "반영 여부를 알 수 없게 실패한 Docs 기록 수 (시간 초과, 연결 끊김, 5xx)"
+)
+docs_resends_avoided_counter = metrics_registry.counter(
+    DOCS_RESENDS_AVOIDED_TOTAL, "이미 반영된 것을 확인해 다시 보내지 않은 Docs 기록 수"
+)
+metrics_registry.gauge(FILE_QUEUE_DEPTH, "처리를 기다리는 파일 큐 항목 수", lambda: file_queue.qsize())
+metrics_registry.gauge(LINE_CACHE_SIZE, "전역 중복 라인 캐시 크기", lambda: len(added_lines_cache))
 
 
 def configure_max_global_cache_size(config, log_func=None):
@@ -109,6 +230,89 @@ def configure_max_global_cache_size(config, log_func=None):
     return MAX_GLOBAL_CACHE_SIZE
 
 
+def configure_dedupe_scope(config, log_func=None):
+    """실행 중 사용할 중복 제거 범위와 라인 캐시 TTL을 설정합니다. 라인 캐시를 불러오기 전에 불러야 합니다."""
+    global DEDUPE_SCOPE, DEDUPE_TTL_SECONDS, line_cache_docs_id
+    config = config if isinstance(config, dict) else {}
+    DEDUPE_SCOPE = normalize_dedupe_scope(config.get('dedupe_scope', DEFAULT_DEDUPE_SCOPE))
+    DEDUPE_TTL_SECONDS = normalize_dedupe_ttl_seconds(config.get('dedupe_ttl_seconds', 0))
+    line_cache_docs_id = config.get('docs_id') if DEDUPE_SCOPE == "document" else None
+    if not uses_line_cache():
+        added_lines_cache.clear()
+    if log_func:
+        ttl_text = f", TTL {DEDUPE_TTL_SECONDS}초" if DEDUPE_TTL_SECONDS and uses_line_cache() else ""
+        log_func(f"백엔드: 중복 제거 범위 - {DEDUPE_SCOPE}{ttl_text}")
+    return DEDUPE_SCOPE
+
+
+def uses_line_cache():
+    """문서별/전역 범위만 라인 캐시(added_lines_cache)를 읽고 고치고 저장합니다."""
+    return DEDUPE_SCOPE in ("document", "global")
+
+
+def uses_fingerprints():
+    """중복 제거를 끄면 줄 지문을 계산하지 않습니다."""
+    return DEDUPE_SCOPE != "off"
+
+
+def get_line_cache_path():
+    """라인 캐시 파일 경로. 문서별 범위면 대상 문서 ID마다 다른 파일을 씁니다."""
+    if DEDUPE_SCOPE == "document" and line_cache_docs_id:
+        document_key = hashlib.sha256(str(line_cache_docs_id).encode('utf-8')).hexdigest()[:16]
+        cache_root, cache_extension = os.path.splitext(LINE_CACHE_FILE)
+        return f"{cache_root}.{document_key}{cache_extension}"
+    return LINE_CACHE_FILE
+
+
+def open_long_term_dedupe_filter(config, log_func):
+    """long_term_dedupe가 켜져 있으면 라인 캐시 뒤에서 확인할 장기 중복 필터를 엽니다.
+
+    라인 캐시를 쓰지 않는 범위나 TTL을 쓸 때는 열지 않습니다. (TTL이 지난 줄을 다시 새 줄로 봐야 하므로)
+    """
+    dedupe_filter.close()
+    if not isinstance(config, dict) or config.get('long_term_dedupe') is not True:
+        return False
+    if not uses_line_cache() or DEDUPE_TTL_SECONDS:
+        log_func("백엔드: 중복 제거 범위가 file/off이거나 TTL을 쓰므로 장기 중복 필터를 열지 않습니다.")
+        return False
+    filter_dir = get_dedupe_filter_dir(DEDUPE_FILTER_DIR, DEDUPE_SCOPE, line_cache_docs_id)
+    started_at = time.perf_counter()
+    try:
+        dedupe_filter.open(
+            filter_dir,
+            config.get('long_term_dedupe_false_positive_rate', DEFAULT_LONG_TERM_DEDUPE_FALSE_POSITIVE_RATE),
+            config.get('long_term_dedupe_generation_days', DEFAULT_LONG_TERM_DEDUPE_GENERATION_DAYS),
+            config.get('long_term_dedupe_generations', DEFAULT_LONG_TERM_DEDUPE_GENERATIONS),
+            log_func=log_func,
+        )
+    except OSError as e:
+        dedupe_filter.close()
+        log_func(f"경고: 장기 중복 필터({filter_dir})를 열지 못했습니다 - {e}")
+        return False
+    log_func(
+        f"백엔드: {format_dedupe_filter_status(dedupe_filter.status())} "
+        f"({(time.perf_counter() - started_at) * 1000:.0f}ms에 열림)"
+    )
+    return True
+
+
+def promote_long_term_duplicates(line_fingerprints, file_seen_hashes):
+    """라인 캐시와 파일별 지문에 없는 줄 중 장기 중복 필터에 있는 줄을 라인 캐시로 다시 올립니다.
+
+    다시 올린 지문 수를 반환합니다. 이후 판정은 라인 캐시만 보면 됩니다.
+    """
+    if not dedupe_filter.is_open():
+        return 0
+    cache = added_lines_cache
+    candidates = [
+        fingerprint for fingerprint in line_fingerprints
+        if fingerprint not in cache and fingerprint not in file_seen_hashes
+    ]
+    known_fingerprints = dedupe_filter.find_known(candidates)
+    remember_global_fingerprints(known_fingerprints)
+    return len(known_fingerprints)
+
+
 def build_extraction_record(filepath, extracted_lines, extracted_at=None):
     """Google Docs 기록 문자열과 GUI 미리보기용 메타데이터를 생성합니다."""
     extracted_datetime = extracted_at or datetime.now()
@@ -158,6 +362,31 @@ def build_duplicate_only_record(filepath, duplicate_line_count, extracted_at=Non
     }
 
 
+def split_extraction_record(extraction_record, lines, max_chars):
+    """기록 문자열을 줄 경계에서 max_chars 이하 조각으로 나눕니다. [(조각 문자열, 여기까지 담은 줄 수)]
+
+    조각을 순서대로 이어 붙이면 document_text와 같습니다. 한 줄이 max_chars보다 길면 그 줄만 한 조각이 됩니다.
+    """
+    document_text = extraction_record['document_text']
+    header_length = len(document_text) - len(extraction_record['full_text']) - 2
+    line_char_limit = max_chars - 1  # 마지막 조각 끝의 빈 줄 자리
+    chunks = []
+    pieces = [document_text[:header_length]]
+    piece_chars = header_length
+    piece_has_line = False
+    for index, line in enumerate(lines):
+        if piece_has_line and piece_chars + len(line) + 1 > line_char_limit:
+            chunks.append(("".join(pieces), index))
+            pieces = []
+            piece_chars = 0
+        pieces.append(line + "\n")
+        piece_chars += len(line) + 1
+        piece_has_line = True
+    pieces.append("\n")
+    chunks.append(("".join(pieces), len(lines)))
+    return chunks
+
+
 def get_file_state(filepath):
     """파일별 처리 상태 딕셔너리를 반환합니다."""
     with processed_state_lock:
@@ -183,7 +412,12 @@ def detect_file_reset_reason(filepath, current_identity, event_type=None):
 
         last_byte_offset = int(state.get('last_byte_offset', state.get('size', 0)) or 0)
         seen_hashes = state.get('seen_line_hashes') or set()
-        has_previous_progress = last_byte_offset > 0 or bool(seen_hashes)
+        has_previous_progress = (
+            last_byte_offset > 0
+            or bool(seen_hashes)
+            or bool(state.get('seen_line_hashes_spill'))
+            or bool(state.get('legacy_line_hashes'))
+        )
         if not has_previous_progress:
             return None
 
@@ -205,10 +439,107 @@ def detect_file_reset_reason(filepath, current_identity, event_type=None):
 
 
 def hash_line_for_dedupe(line):
-    """라인 문자열을 파일별 중복 판정용 해시로 변환합니다."""
+    """라인 문자열을 중복 판정용 64비트 지문(정수)으로 변환합니다."""
+    return int.from_bytes(hashlib.blake2b(line.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def fingerprint_lines(lines):
+    """여러 줄의 지문을 한 번에 계산합니다. 전역/파일별 판정과 기록에 같은 목록을 재사용합니다."""
+    blake2b = hashlib.blake2b
+    from_bytes = int.from_bytes
+    return [from_bytes(blake2b(line.encode('utf-8'), digest_size=8).digest(), 'little') for line in lines]
+
+
+def fingerprint_raw_lines(raw_lines):
+    """UTF-8 바이트 줄의 지문. fingerprint_lines(디코딩한 줄)와 같은 값이 나온다."""
+    blake2b = hashlib.blake2b
+    from_bytes = int.from_bytes
+    return [from_bytes(blake2b(line, digest_size=8).digest(), 'little') for line in raw_lines]
+
+
+def hash_line_legacy(line):
+    """이전 버전이 processed_state.json에 저장한 SHA-256 hex 해시. (호환 판정용)"""
     return hashlib.sha256(line.encode('utf-8')).hexdigest()
 
 
+def split_loaded_line_hashes(items):
+    """저장된 해시 목록을 (64비트 지문 집합, 이전 버전 hex 해시 집합)으로 나눕니다."""
+    fingerprints = set()
+    legacy_hashes = set()
+    for item in items or ():
+        if isinstance(item, int) and not isinstance(item, bool):
+            fingerprints.add(item)
+        elif isinstance(item, str) and item:
+            legacy_hashes.add(item)
+    return fingerprints, legacy_hashes
+
+
+def select_new_lines(lines, fingerprints, file_seen_hashes, legacy_hashes=None):
+    """전역 캐시와 파일별 지문 어디에도 없는 줄만 남깁니다.
+
+    이전 버전 hex 해시가 남아 있는 파일만 SHA-256을 추가로 계산합니다.
+    """
+    global_cache = added_lines_cache
+    if legacy_hashes:
+        return [
+            line for line, fingerprint in zip(lines, fingerprints)
+            if fingerprint not in global_cache
+            and fingerprint not in file_seen_hashes
+            and hash_line_legacy(line) not in legacy_hashes
+        ]
+    return [
+        line for line, fingerprint in zip(lines, fingerprints)
+        if fingerprint not in global_cache and fingerprint not in file_seen_hashes
+    ]
+
+
+def locate_new_line_positions(line_fingerprints, file_seen_hashes, lines=None, legacy_hashes=None):
+    """중복 제거를 통과한 줄들이 지문 목록에서 몇 번째인지 반환합니다. (select_new_lines와 같은 판정)"""
+    global_cache = added_lines_cache
+    return [
+        index for index, fingerprint in enumerate(line_fingerprints)
+        if fingerprint not in global_cache
+        and fingerprint not in file_seen_hashes
+        and not (legacy_hashes and hash_line_legacy(lines[index]) in legacy_hashes)
+    ]
+
+
+def find_line_end_offsets(filepath, start_offset, end_offset, line_positions):
+    """비어 있지 않은 줄 번호마다 그 줄 바로 다음 바이트 오프셋을 찾습니다. 바이트로 줄을 셀 수 없으면 None
+
+    줄 번호는 split_decoded_lines 결과(곧 지문 목록)의 위치와 같습니다.
+    """
+    encoding = file_encodings.get(filepath, 'utf-8')
+    if encoding not in CHUNK_SAFE_ENCODINGS + ('utf-8-sig',):
+        return None
+    with open(filepath, 'rb') as source_file:
+        source_file.seek(start_offset)
+        raw_content = source_file.read(end_offset - start_offset)
+    if b'\x00' in raw_content:  # UTF-16으로 보이는 내용은 줄바꿈 바이트로 나눌 수 없다.
+        return None
+    wanted_positions = set(line_positions)
+    found_offsets = {}
+    position = start_offset
+    line_index = 0
+    for raw_line in raw_content.split(b'\n'):
+        position += len(raw_line) + 1
+        if not raw_line.strip() or not raw_line.decode(encoding, errors='replace').strip():
+            continue
+        if line_index in wanted_positions:
+            found_offsets[line_index] = min(position, end_offset)
+        line_index += 1
+    if len(found_offsets) != len(wanted_positions):
+        return None
+    return [found_offsets[line_position] for line_position in line_positions]
+
+
+def get_file_legacy_hashes(filepath):
+    """이전 버전에서 불러온 파일별 SHA-256 hex 해시 집합 (없으면 빈 집합)"""
+    with processed_state_lock:
+        state = processed_file_states.get(filepath)
+        return (state.get('legacy_line_hashes') if state else None) or set()
+
+
 def get_file_seen_hashes(filepath):
     """파일별로 이미 처리한 라인 해시 집합을 반환합니다."""
     with processed_state_lock:
@@ -218,8 +549,12 @@ def get_file_seen_hashes(filepath):
         if isinstance(seen_hashes, set):
             return seen_hashes
 
-        if isinstance(seen_hashes, list):
-            seen_hashes = {str(item) for item in seen_hashes if item}
+        if seen_hashes is None and state.get('seen_line_hashes_spill'):
+            seen_hashes = restore_spilled_hashes(state)
+        elif isinstance(seen_hashes, list):
+            seen_hashes, legacy_hashes = split_loaded_line_hashes(seen_hashes)
+            if legacy_hashes:
+                state['legacy_line_hashes'] = legacy_hashes
         else:
             seen_hashes = set()
 
@@ -229,30 +564,78 @@ def get_file_seen_hashes(filepath):
 
 def remember_file_lines(filepath, lines):
     """현재 파일에서 확인한 라인들을 파일별 중복 상태에 기록합니다."""
-    if not lines:
+    if lines:
+        remember_file_fingerprints(filepath, fingerprint_lines(lines))
+
+
+def remember_file_fingerprints(filepath, fingerprints):
+    """이미 계산한 지문을 파일별 중복 상태에 기록합니다."""
+    if not fingerprints:
         return
 
     with processed_state_lock:
-        seen_hashes = get_file_seen_hashes(filepath)
-        for line in lines:
-            seen_hashes.add(hash_line_for_dedupe(line))
+        get_file_seen_hashes(filepath).update(fingerprints)
 
 
 def remember_global_lines(lines):
     """최근 N개 범위만 유지하는 전역 라인 캐시에 기록합니다."""
-    if not lines:
+    if lines:
+        remember_global_fingerprints(fingerprint_lines([str(line) for line in lines]))
+
+
+def remember_global_fingerprints(fingerprints):
+    """이미 계산한 지문을 전역 라인 캐시에 기록합니다. (원문 대신 지문만 보관)"""
+    if not fingerprints:
         return
 
-    for line in lines:
-        normalized_line = str(line)
-        if normalized_line in added_lines_cache:
-            added_lines_cache.move_to_end(normalized_line)
+    cache = added_lines_cache
+    move_to_end = cache.move_to_end
+    seen_at = line_cache_stamp()
+    for fingerprint in fingerprints:
+        if fingerprint in cache:
+            move_to_end(fingerprint)
+            if seen_at is not None:
+                cache[fingerprint] = seen_at
         else:
-            added_lines_cache[normalized_line] = None
+            cache[fingerprint] = seen_at
+    dedupe_filter.add_many(fingerprints)
 
     optimize_cache_size(None)
 
 
+def remember_dedupe_fingerprints(filepath, fingerprints):
+    """기록한 줄의 지문을 설정한 중복 제거 범위가 쓰는 곳에만 남깁니다. (범위가 off면 지문이 None)"""
+    if not fingerprints:
+        return
+    if uses_line_cache():
+        remember_global_fingerprints(fingerprints)
+    remember_file_fingerprints(filepath, fingerprints)
+
+
+def line_cache_stamp():
+    """TTL을 쓸 때만 라인 캐시 값에 마지막으로 본 시각을 넣습니다. (안 쓰면 None으로 메모리를 아낀다)"""
+    return time.time() if DEDUPE_TTL_SECONDS else None
+
+
+def expire_line_cache(now=None):
+    """TTL이 지난 라인 캐시 줄을 오래된 쪽부터 지우고 지운 수를 반환합니다.
+
+    캐시는 마지막으로 본 순서로 정렬돼 있으므로 TTL 안의 첫 줄에서 멈춘다.
+    """
+    if not DEDUPE_TTL_SECONDS:
+        return 0
+    cutoff = (time.time() if now is None else now) - DEDUPE_TTL_SECONDS
+    cache = added_lines_cache
+    removed_count = 0
+    while cache:
+        seen_at = cache[next(iter(cache))]
+        if seen_at is not None and seen_at >= cutoff:
+            break
+        cache.popitem(last=False)
+        removed_count += 1
+    return removed_count
+
+
 def get_last_attempt_time(filepath):
     """최근 처리 시도 시간을 반환합니다. (레거시 timestamp 키도 호환)"""
     with processed_state_lock:
@@ -286,7 +669,9 @@ def reset_file_processing_state(filepath):
         state.pop('retry_scheduled', None)
         state.pop('file_ctime_ns', None)
         state.pop('file_mtime_ns', None)
+        discard_spilled_hashes(state)
         state['seen_line_hashes'] = set()
+        state.pop('legacy_line_hashes', None)
         if 'timestamp' in state:
             del state['timestamp']
 
@@ -312,6 +697,7 @@ def mark_file_processed(filepath, current_byte_offset, current_time, file_identi
 def schedule_retry(filepath, log_func, reason, current_time=None):
     """Google Docs 반영 실패 시 같은 파일을 다시 큐에 넣습니다."""
     backend_logger = logging.getLogger('backend_processor')
+    retries_counter.inc()
     if current_time is None:
         current_time = time.time()
 
@@ -322,7 +708,7 @@ def schedule_retry(filepath, log_func, reason, current_time=None):
             del state['timestamp']
 
         if state.get('retry_scheduled'):
-            backend_logger.debug(f"이미 재시도 예약됨: {filepath}")
+            backend_logger.debug("이미 재시도 예약됨: %s", filepath)
             return
 
         state['retry_scheduled'] = True
@@ -337,37 +723,276 @@ def schedule_retry(filepath, log_func, reason, current_time=None):
                 return
             if not retry_state.pop('retry_scheduled', False):
                 return
-        file_queue.put(filepath)
+        engine_scheduler.requeue(filepath)
         backend_logger.info(f"재시도 큐 등록 완료: {filepath}")
         schedule_processed_state_save(log_func)
 
-    retry_timer = threading.Timer(RETRY_DELAY, requeue_file)
-    retry_timer.daemon = True
-    retry_timer.start()
+    engine_scheduler.start_timer(RETRY_DELAY, requeue_file)
+
+
+def schedule_settle_recheck(filepath, delay_seconds, current_time=None, trace=None):
+    """짧은 시간 내 재처리로 건너뛴 파일을 지연 시간이 지난 뒤 메인 루프가 다시 확인하도록 예약합니다."""
+    if filepath in settle_deadline_paths:
+        return
+    if current_time is None:
+        current_time = time.time()
+    settle_deadline_paths.add(filepath)
+    if trace is not None:
+        settle_deadline_traces[filepath] = trace
+    heapq.heappush(settle_deadlines, (current_time + max(0.0, delay_seconds), filepath))
+
+
+def pop_due_settle_rechecks(current_time=None):
+    """재확인 시각이 지난 파일 경로를 꺼냅니다."""
+    if current_time is None:
+        current_time = time.time()
+    due_paths = []
+    while settle_deadlines and settle_deadlines[0][0] <= current_time:
+        _deadline, filepath = heapq.heappop(settle_deadlines)
+        settle_deadline_paths.discard(filepath)
+        due_paths.append(filepath)
+    return due_paths
+
+
+def get_next_wait_timeout(stop_event, current_time=None):
+    """메인 루프가 큐에서 기다릴 최대 시간을 계산합니다. (None이면 일이 들어올 때까지 대기)"""
+    timeout = None
+    if settle_deadlines:
+        if current_time is None:
+            current_time = time.time()
+        timeout = max(0.0, settle_deadlines[0][0] - current_time)
+    if not getattr(stop_event, "wakes_file_queue", False):
+        # 일반 Event는 set() 해도 큐를 깨우지 않으므로 중지 신호를 주기적으로 확인한다.
+        timeout = STOP_EVENT_POLL_SECONDS if timeout is None else min(timeout, STOP_EVENT_POLL_SECONDS)
+    return timeout
+
+
+def wait_for_next_file(stop_event):
+    """다음 처리할 (파일 경로, 이벤트 유형, 지연 추적)을 반환합니다. 중지 신호로 깨어났거나 시간이 다 되면 None."""
+    due_paths = pop_due_settle_rechecks()
+    if due_paths:
+        for filepath in due_paths[1:]:
+            file_queue.put((filepath, None, settle_deadline_traces.pop(filepath, None)))
+        filepath = due_paths[0]
+        return filepath, None, settle_deadline_traces.pop(filepath, None) or TraceContext.start(filepath, "dequeued")
+
+    try:
+        queue_item = file_queue.get(timeout=get_next_wait_timeout(stop_event))
+    except queue.Empty:
+        return None
+    file_queue.task_done()
+    if queue_item is MONITORING_STOP_SENTINEL or queue_item is MONITORING_WAKE_SENTINEL:
+        return None
+    if not isinstance(queue_item, tuple):
+        queue_item = (queue_item,)
+    # 재시도 등록처럼 추적 없이 들어온 항목은 큐에서 꺼낸 시점부터 잰다.
+    filepath, event_type, trace = (queue_item + (None, None))[:3]
+    if trace is None:
+        trace = TraceContext(filepath)
+    trace.mark("dequeued")
+    return filepath, event_type, trace
+
+
+def get_backend_diagnostics(max_files=200):
+    """진단 묶음에 넣을 백엔드 큐/상태 크기를 반환합니다."""
+    with processed_state_lock:
+        per_file_hash_counts = sorted(
+            (
+                (filepath, len(state.get('seen_line_hashes', ())))
+                for filepath, state in processed_file_states.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        pending_retry_files = [
+            filepath for filepath, state in processed_file_states.items() if state.get('retry_scheduled')
+        ]
+        tracked_file_count = len(processed_file_states)
+        spilled_file_count = sum(1 for state in processed_file_states.values() if state.get('seen_line_hashes_spill'))
+        state_save_pending = processed_state_save_timer is not None
+    return {
+        "file_queue_depth": file_queue.qsize(),
+        "settle_rechecks_pending": len(settle_deadlines),
+        "pending_retry_timers": len(pending_retry_files),
+        "pending_retry_files": pending_retry_files[:max_files],
+        "processed_state_save_pending": state_save_pending,
+        "processed_file_states_count": tracked_file_count,
+        "seen_line_hashes_total": sum(count for _filepath, count in per_file_hash_counts),
+        "seen_line_hashes_per_file": dict(per_file_hash_counts[:max_files]),
+        "seen_line_hashes_spilled_files": spilled_file_count,
+        "added_lines_cache_size": len(added_lines_cache),
+        "max_global_cache_size": MAX_GLOBAL_CACHE_SIZE,
+        "long_term_dedupe_filter": dedupe_filter.status(),
+        "file_encodings_count": len(file_encodings),
+    }
 
 
 def remove_file_processing_state(filepath):
     """파일 처리 상태와 인코딩 캐시를 함께 제거합니다."""
     with processed_state_lock:
-        processed_file_states.pop(filepath, None)
+        state = processed_file_states.pop(filepath, None)
+        if state:
+            discard_spilled_hashes(state)
     file_encodings.pop(filepath, None)
 
 
+# --- 메모리 예산 (파일별 해시 집합은 디스크로, 전역 캐시/인코딩은 오래된 것부터 제거) ---
+def get_hash_spill_dir():
+    return os.path.join(os.path.dirname(os.path.abspath(PROCESSED_STATE_FILE)), PROCESSED_STATE_SPILL_DIR_NAME)
+
+
+def read_spilled_hashes(spill_path):
+    """디스크로 내린 해시 목록을 읽는다. 파일이 없거나 깨졌으면 빈 목록을 반환한다."""
+    try:
+        with open(spill_path, 'r', encoding='utf-8') as spill_file:
+            loaded_hashes = json.load(spill_file)
+    except (OSError, ValueError):
+        logging.getLogger(BACKEND_LOGGER_NAME).warning("디스크로 내린 해시 집합을 읽지 못했습니다: %s", spill_path)
+        return []
+    return [item for item in loaded_hashes if isinstance(item, int) and not isinstance(item, bool)] if isinstance(loaded_hashes, list) else []
+
+
+def discard_spilled_hashes(state):
+    """상태에 연결된 해시 파일을 지운다. (processed_state_lock 안에서 호출)"""
+    spill_path = state.pop('seen_line_hashes_spill', None)
+    if spill_path:
+        try:
+            os.remove(spill_path)
+        except OSError:
+            pass
+
+
+def iter_state_seen_hashes(state):
+    """메모리에 있거나 디스크로 내린 해시를 모두 돌려준다. (저장용, 메모리로 다시 올리지 않는다)"""
+    spill_path = state.get('seen_line_hashes_spill')
+    if spill_path and state.get('seen_line_hashes') is None:
+        return read_spilled_hashes(spill_path)
+    return state.get('seen_line_hashes', set())
+
+
+def restore_spilled_hashes(state):
+    """디스크로 내린 해시 집합을 다시 메모리로 올린다. (processed_state_lock 안에서 호출)"""
+    seen_hashes = set(read_spilled_hashes(state['seen_line_hashes_spill']))
+    discard_spilled_hashes(state)
+    return seen_hashes
+
+
+def spill_file_seen_hashes(filepath):
+    """파일 하나의 해시 집합을 디스크로 내리고, 줄어든 어림 바이트 수를 반환한다."""
+    with processed_state_lock:
+        state = processed_file_states.get(filepath)
+        seen_hashes = state.get('seen_line_hashes') if state else None
+        if not isinstance(seen_hashes, set) or not seen_hashes:
+            return 0
+        spill_dir = get_hash_spill_dir()
+        spill_path = os.path.join(spill_dir, hashlib.sha1(filepath.encode('utf-8')).hexdigest() + ".json")
+        os.makedirs(spill_dir, exist_ok=True)
+        with open(spill_path, 'w', encoding='utf-8') as spill_file:
+            json.dump(list(seen_hashes), spill_file)
+        freed_bytes = estimate_container_bytes(seen_hashes)
+        state.pop('seen_line_hashes', None)
+        state['seen_line_hashes_spill'] = spill_path
+        return freed_bytes
+
+
+def clear_hash_spill_dir():
+    """이전 실행에서 남은 해시 파일을 지운다. (processed_state.json에 모두 저장되어 있다)"""
+    spill_dir = get_hash_spill_dir()
+    if not os.path.isdir(spill_dir):
+        return
+    for entry in os.scandir(spill_dir):
+        if entry.name.endswith(".json"):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def estimate_seen_hashes_bytes():
+    with processed_state_lock:
+        return sum(
+            estimate_container_bytes(state['seen_line_hashes'])
+            for state in processed_file_states.values()
+            if isinstance(state.get('seen_line_hashes'), set)
+        )
+
+
+def evict_seen_hashes(bytes_to_free):
+    """가장 오래 처리하지 않은 파일의 해시 집합부터 디스크로 내린다."""
+    with processed_state_lock:
+        candidates = sorted(
+            (
+                (state.get('last_attempt_time', 0), filepath)
+                for filepath, state in processed_file_states.items()
+                if isinstance(state.get('seen_line_hashes'), set) and state['seen_line_hashes']
+            ),
+        )
+        freed_bytes = 0
+        spilled_count = 0
+        for _last_attempt_time, filepath in candidates:
+            if freed_bytes >= bytes_to_free:
+                break
+            freed_bytes += spill_file_seen_hashes(filepath)
+            spilled_count += 1
+    return f"파일 {spilled_count}개 해시를 디스크로 이동" if spilled_count else ""
+
+
+def estimate_line_cache_bytes():
+    return estimate_container_bytes(added_lines_cache)
+
+
+def evict_line_cache(bytes_to_free):
+    """가장 오래 쓰지 않은 전역 캐시 줄부터 제거한다."""
+    cache_size = len(added_lines_cache)
+    per_line_bytes = estimate_items_bytes(iter(added_lines_cache), cache_size) / cache_size if cache_size else 0
+    if per_line_bytes <= 0:
+        return ""
+    remove_count = min(cache_size, int(bytes_to_free / per_line_bytes) + 1)
+    for _ in range(remove_count):
+        added_lines_cache.popitem(last=False)
+    return f"오래된 줄 {remove_count}개 제거"
+
+
+def estimate_file_encodings_bytes():
+    return estimate_container_bytes(file_encodings)
+
+
+def evict_file_encodings(bytes_to_free):
+    """먼저 기억한 인코딩부터 잊는다. (다음 읽기 때 다시 감지한다)"""
+    encoding_count = len(file_encodings)
+    per_entry_bytes = estimate_file_encodings_bytes() / encoding_count if encoding_count else 0
+    if per_entry_bytes <= 0:
+        return ""
+    remove_count = min(encoding_count, int(bytes_to_free / per_entry_bytes) + 1)
+    for filepath in list(file_encodings)[:remove_count]:
+        file_encodings.pop(filepath, None)
+    return f"인코딩 {remove_count}개 제거"
+
+
+# 등록 순서가 정리 우선순위다. 백엔드 자료구조는 처리 루프 스레드에서만 정리한다.
+memory_budget.register("seen_line_hashes", "파일별 해시", 0.45, estimate_seen_hashes_bytes, evict_seen_hashes)
+memory_budget.register("line_cache", "전역 라인 캐시", 0.35, estimate_line_cache_bytes, evict_line_cache)
+memory_budget.register("file_encodings", "인코딩 캐시", 0.05, estimate_file_encodings_bytes, evict_file_encodings)
+
+
 def _build_serializable_processed_state():
     """현재 처리 상태를 JSON 저장용 딕셔너리로 변환합니다."""
     with processed_state_lock:
         serializable_state = {}
         for filepath, state in processed_file_states.items():
+            fingerprints, legacy_hashes = split_loaded_line_hashes(iter_state_seen_hashes(state))
+            legacy_hashes.update(state.get('legacy_line_hashes') or ())
             serializable_state[filepath] = {
                 'last_byte_offset': int(state.get('last_byte_offset', state.get('size', 0))),
                 'size': int(state.get('last_byte_offset', state.get('size', 0))),
                 'last_attempt_time': float(state.get('last_attempt_time', state.get('timestamp', 0))),
-                'seen_line_hashes': sorted(
-                    str(item) for item in state.get('seen_line_hashes', set()) if item
-                ),
+                'seen_line_hashes': sorted(fingerprints),
                 'file_ctime_ns': int(state.get('file_ctime_ns', 0) or 0),
                 'file_mtime_ns': int(state.get('file_mtime_ns', 0) or 0),
             }
+            if legacy_hashes:
+                # 이전 버전 hex 해시는 해당 파일이 초기화될 때까지 따로 보관한다.
+                serializable_state[filepath]['legacy_line_hashes'] = sorted(legacy_hashes)
         return serializable_state
 
 
@@ -383,14 +1008,28 @@ def _cancel_processed_state_save_timer_locked():
     processed_state_save_timer = None
 
 
+def write_json_atomically(path, data, indent):
+    """임시 파일에 쓴 뒤 바꿔치기한다. 쓰는 도중 프로세스가 죽어도 이전 파일이 그대로 남는다."""
+    target_dir = os.path.dirname(path)
+    if target_dir:
+        os.makedirs(target_dir, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
 def _write_processed_state_snapshot(serializable_state, log_func):
     """직렬화된 처리 상태 스냅샷을 파일에 기록합니다."""
     try:
-        target_dir = os.path.dirname(PROCESSED_STATE_FILE)
-        if target_dir:
-            os.makedirs(target_dir, exist_ok=True)
-        with open(PROCESSED_STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(serializable_state, f, ensure_ascii=False, indent=2)
+        write_json_atomically(PROCESSED_STATE_FILE, serializable_state, indent=2)
         if log_func:
             log_func(f"백엔드: 처리 상태 저장 완료 ({PROCESSED_STATE_FILE}, {len(serializable_state)}개).")
     except Exception as e:
@@ -408,12 +1047,12 @@ def schedule_processed_state_save(log_func):
     with processed_state_lock:
         processed_state_dirty = True
         _cancel_processed_state_save_timer_locked()
-        processed_state_save_timer = threading.Timer(PROCESSED_STATE_SAVE_DEBOUNCE_SECONDS, flush_callback)
-        processed_state_save_timer.daemon = True
-        processed_state_save_timer.start()
+        processed_state_save_timer = engine_scheduler.start_timer(PROCESSED_STATE_SAVE_DEBOUNCE_SECONDS, flush_callback)
 
-    if log_func:
-        log_func(f"백엔드: 처리 상태 저장 예약 ({PROCESSED_STATE_SAVE_DEBOUNCE_SECONDS:.1f}초 후).")
+    # 파일마다 호출되는 경로이므로 화면 로그에는 남기지 않고, 디버그 레벨일 때만 파일에 기록한다.
+    backend_logger = logging.getLogger(BACKEND_LOGGER_NAME)
+    if backend_logger.isEnabledFor(logging.DEBUG):
+        backend_logger.debug("처리 상태 저장 예약 (%.1f초 후)", PROCESSED_STATE_SAVE_DEBOUNCE_SECONDS)
 
 
 def flush_processed_state_save(log_func):
@@ -438,6 +1077,7 @@ def load_processed_state(log_func):
 
     with processed_state_lock:
         _cancel_processed_state_save_timer_locked()
+    clear_hash_spill_dir()
 
     if not os.path.exists(PROCESSED_STATE_FILE):
         log_func(f"백엔드: 처리 상태 파일({PROCESSED_STATE_FILE}) 없음. 새로 시작합니다.")
@@ -471,17 +1111,20 @@ def load_processed_state(log_func):
             except (TypeError, ValueError):
                 last_attempt_time = 0
 
+            # 이전 버전은 SHA-256 hex 문자열을 저장했으므로 지문과 따로 보관해 계속 판정에 쓴다.
+            fingerprints, legacy_hashes = split_loaded_line_hashes(state.get('seen_line_hashes'))
+            legacy_hashes.update(split_loaded_line_hashes(state.get('legacy_line_hashes'))[1])
             sanitized_state[filepath] = {
                 'last_byte_offset': byte_offset,
                 'size': byte_offset,
                 'last_attempt_time': last_attempt_time,
-                'seen_line_hashes': {
-                    str(item) for item in state.get('seen_line_hashes', []) if item
-                },
+                'seen_line_hashes': fingerprints,
                 'retry_scheduled': False,
                 'file_ctime_ns': int(state.get('file_ctime_ns', 0) or 0),
                 'file_mtime_ns': int(state.get('file_mtime_ns', 0) or 0),
             }
+            if legacy_hashes:
+                sanitized_state[filepath]['legacy_line_hashes'] = legacy_hashes
 
         with processed_state_lock:
             processed_file_states = sanitized_state
@@ -514,8 +1157,15 @@ def save_processed_state(log_func):
 def load_line_cache(log_func):
     """ 프로그램 시작 시 라인 캐시 파일을 로드합니다. """
     global added_lines_cache
-    cache_path = LINE_CACHE_FILE
-    if not os.path.exists(cache_path) and LEGACY_CACHE_FILE_STR != LINE_CACHE_FILE and os.path.exists(LEGACY_CACHE_FILE_STR):
+    if not uses_line_cache():
+        added_lines_cache = OrderedDict()
+        log_func(f"백엔드: 중복 제거 범위가 {DEDUPE_SCOPE}이므로 라인 캐시를 불러오지 않습니다.")
+        return
+    cache_path = get_line_cache_path()
+    if (
+        not os.path.exists(cache_path) and cache_path == LINE_CACHE_FILE
+        and LEGACY_CACHE_FILE_STR != LINE_CACHE_FILE and os.path.exists(LEGACY_CACHE_FILE_STR)
+    ):
         cache_path = LEGACY_CACHE_FILE_STR
         log_func(f"백엔드: 레거시 라인 캐시를 불러옵니다 ({cache_path}).")
 
@@ -525,7 +1175,8 @@ def load_line_cache(log_func):
                 loaded_lines = json.load(f)
             added_lines_cache = OrderedDict()
             if isinstance(loaded_lines, list):
-                remember_global_lines(loaded_lines)
+                restore_line_cache_items(loaded_lines)
+            expire_line_cache()
             log_func(f"백엔드: 라인 캐시({cache_path}) 로드됨 ({len(added_lines_cache)}개).")
             
             # 캐시 크기 제한 (메모리 최적화)
@@ -537,9 +1188,135 @@ def load_line_cache(log_func):
             log_func(f"경고: 라인 캐시 로드 실패 - {e}")
             added_lines_cache = OrderedDict()
     else:
-        log_func(f"백엔드: 라인 캐시 파일({LINE_CACHE_FILE}) 없음. 새로 시작합니다.")
+        log_func(f"백엔드: 라인 캐시 파일({cache_path}) 없음. 새로 시작합니다.")
         added_lines_cache = OrderedDict()
 
+
+def restore_line_cache_items(loaded_lines):
+    """저장된 라인 캐시 항목을 오래된 순서대로 되살립니다.
+
+    항목은 지문(정수), TTL을 쓸 때 저장한 [지문, 마지막으로 본 시각], 또는 이전 버전의 줄 원문이다.
+    시각이 없는 항목은 불러온 시각을 마지막으로 본 시각으로 삼는다.
+    """
+    loaded_at = line_cache_stamp()
+    cache = added_lines_cache
+    for item in loaded_lines:
+        seen_at = loaded_at
+        if isinstance(item, list) and len(item) == 2:
+            item, stored_seen_at = item
+            if loaded_at is not None and isinstance(stored_seen_at, (int, float)):
+                seen_at = min(float(stored_seen_at), loaded_at)
+        if not isinstance(item, int) or isinstance(item, bool):
+            # 이전 버전 캐시 파일은 줄 원문을 담고 있으므로 지문으로 바꿔 불러온다.
+            item = hash_line_for_dedupe(str(item))
+        cache.pop(item, None)
+        cache[item] = seen_at
+    optimize_cache_size(None)
+
+
+def serialize_line_cache():
+    """라인 캐시 저장 형식. TTL을 쓰면 마지막으로 본 시각을 함께 남긴다."""
+    if DEDUPE_TTL_SECONDS:
+        return [[fingerprint, seen_at] for fingerprint, seen_at in added_lines_cache.items()]
+    return list(added_lines_cache.keys())
+
+def fingerprint_document_lines(text_runs, max_lines, max_chars=DEDUPE_WARMUP_MAX_CHARS):
+    """문서 글자 조각을 이어 읽으며 줄 지문을 계산하고, 문서 끝쪽 max_lines개만 순서대로 반환합니다.
+
+    문서가 max_chars보다 길면 앞부분은 건너뛴다. 잘려서 시작하는 첫 줄은 원래 줄과 지문이 다르므로 버린다.
+    """
+    text_runs = list(text_runs)
+    chars_to_skip = max(0, sum(len(text_run) for text_run in text_runs) - max_chars)
+    drop_first_line = chars_to_skip > 0
+    recent_fingerprints = deque(maxlen=max(0, max_lines))
+    partial_line = ""
+    for text_run in text_runs:
+        if chars_to_skip:
+            if len(text_run) <= chars_to_skip:
+                chars_to_skip -= len(text_run)
+                continue
+            text_run = text_run[chars_to_skip:]
+            chars_to_skip = 0
+        pieces = (partial_line + text_run).split('\n')
+        partial_line = pieces.pop()
+        for piece in pieces:
+            if drop_first_line:
+                drop_first_line = False
+                continue
+            line = piece.strip()
+            if line:
+                recent_fingerprints.append(hash_line_for_dedupe(line))
+    line = partial_line.strip()
+    if line and not drop_first_line:
+        recent_fingerprints.append(hash_line_for_dedupe(line))
+    return list(recent_fingerprints)
+
+
+def run_dedupe_warmup(docs_service, docs_id, log_func, http_factory=None):
+    """대상 문서 본문을 한 번 읽어 줄 지문을 만들고 기록 단계가 가져가도록 남겨 둡니다.
+
+    http_factory가 있으면 이 스레드 전용 HTTP 연결로 요청합니다. httplib2 연결은 스레드 사이에 나눠 쓸 수 없습니다.
+    """
+    global pending_dedupe_warmup
+    backend_logger = logging.getLogger('backend_processor')
+    try:
+        started_at = time.perf_counter()
+        request = docs_service.documents().get(documentId=docs_id, fields=DOCS_TEXT_FIELDS)
+        document = request.execute(http=http_factory()) if http_factory else request.execute()
+        docs_api_calls_counter.inc()
+        fetched_at = time.perf_counter()
+        fingerprints = fingerprint_document_lines(iter_document_text_runs(document), MAX_GLOBAL_CACHE_SIZE)
+        hashed_at = time.perf_counter()
+    except Exception as e:
+        log_func(f"경고: 대상 문서로 중복 캐시를 예열하지 못했습니다 - {e}")
+        backend_logger.warning(f"중복 캐시 예열 실패: {e}")
+        return None
+    pending_dedupe_warmup = fingerprints
+    timing_text = f"조회 {fetched_at - started_at:.2f}초, 지문 계산 {hashed_at - fetched_at:.2f}초"
+    log_func(f"백엔드: 대상 문서에서 중복 캐시 예열 준비 - {len(fingerprints)}줄 ({timing_text})")
+    backend_logger.info(f"중복 캐시 예열 준비 - {len(fingerprints)}줄 ({timing_text})")
+    return fingerprints
+
+
+def start_dedupe_warmup(config, google_services, log_func):
+    """warm_dedupe_from_document가 켜져 있으면 예열 스레드를 시작합니다. 감시 시작을 기다리게 하지 않습니다."""
+    google_services = google_services or {}
+    docs_service = google_services.get('docs')
+    docs_id = config.get('docs_id')
+    if config.get('warm_dedupe_from_document') is not True or not docs_service or not docs_id or not uses_line_cache():
+        return None
+    warmup_thread = threading.Thread(
+        target=run_dedupe_warmup, args=(docs_service, docs_id, log_func, google_services.get('http_factory')),
+        name="DedupeWarmup", daemon=True,
+    )
+    warmup_thread.start()
+    return warmup_thread
+
+
+def apply_pending_dedupe_warmup():
+    """예열한 지문을 전역 라인 캐시의 가장 오래된 쪽에 넣습니다. 기록 단계에서만 부릅니다.
+
+    감시 중 이미 기록한 줄이 가장 최근 항목으로 남아야 max_cache_size를 넘을 때 예열한 줄부터 밀려난다.
+    """
+    global pending_dedupe_warmup
+    fingerprints = pending_dedupe_warmup
+    if fingerprints is None:
+        return 0
+    pending_dedupe_warmup = None
+    if not uses_line_cache():
+        return 0
+    existing_items = list(added_lines_cache.items())
+    seeded_fingerprints = [fingerprint for fingerprint in fingerprints if fingerprint not in added_lines_cache]
+    # TTL을 쓰면 예열한 줄은 가장 오래된 기존 줄과 같은 시각으로 두어 만료 순서를 지킨다.
+    seeded_at = existing_items[0][1] if existing_items else line_cache_stamp()
+    added_lines_cache.clear()
+    added_lines_cache.update(dict.fromkeys(seeded_fingerprints, seeded_at))
+    added_lines_cache.update(existing_items)
+    dedupe_filter.add_many(seeded_fingerprints)
+    optimize_cache_size(None)
+    return len(seeded_fingerprints)
+
+
 def optimize_cache_size(log_func):
     """ 라인 캐시 크기가 너무 크면 일부 항목을 제거합니다. (메모리 최적화) """
     items_to_remove = len(added_lines_cache) - MAX_GLOBAL_CACHE_SIZE
@@ -552,47 +1329,51 @@ def optimize_cache_size(log_func):
     if log_func:
         log_func(f"백엔드: 라인 캐시 크기 최적화 - 가장 오래된 {items_to_remove}개 항목 제거됨 (현재 {len(added_lines_cache)}개)")
         try:
-            with open(LINE_CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(list(added_lines_cache.keys()), f, ensure_ascii=False)
+            with open(get_line_cache_path(), 'w', encoding='utf-8') as f:
+                json.dump(serialize_line_cache(), f, ensure_ascii=False)
             log_func("백엔드: 최적화된 라인 캐시 저장 완료")
         except Exception as e:
             log_func(f"경고: 최적화된 라인 캐시 저장 실패 - {e}")
 
 def save_line_cache(log_func):
     """ 프로그램 종료 시 라인 캐시 데이터를 파일에 저장합니다. """
+    if not uses_line_cache():
+        return
+    cache_path = get_line_cache_path()
     log_func(f"백엔드: 라인 캐시 저장 시도 ({len(added_lines_cache)}개)...")
     try:
-        with open(LINE_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(list(added_lines_cache.keys()), f, ensure_ascii=False, indent=4)
-        log_func(f"백엔드: 라인 캐시 저장 완료 ({LINE_CACHE_FILE}).")
+        write_json_atomically(cache_path, serialize_line_cache(), indent=4)
+        log_func(f"백엔드: 라인 캐시 저장 완료 ({cache_path}).")
     except Exception as e:
         log_func(f"오류: 라인 캐시 저장 실패 - {e}")
+    try:
+        dedupe_filter.flush()
+    except (OSError, ValueError) as e:
+        log_func(f"경고: 장기 중복 필터 저장 실패 - {e}")
 
 # --- 파일 읽기 헬퍼 함수 ---
 def read_file_with_multiple_encodings(filepath, start_byte_offset, log_func):
     """파일을 바이트 오프셋 기준으로 읽고, 여러 인코딩으로 디코딩을 시도합니다."""
+    raw_content = read_file_tail_bytes(filepath, start_byte_offset, log_func)
+    if raw_content is None:
+        return None
+    if raw_content == b"":
+        return ""
+    return decode_with_multiple_encodings(filepath, raw_content, log_func)
+
+
+def read_file_tail_bytes(filepath, start_byte_offset, log_func):
+    """바이트 오프셋 뒤의 내용을 그대로 읽습니다. 읽기 실패 시 None을 반환합니다."""
     backend_logger = logging.getLogger('backend_processor')
-    
-    # 기본 인코딩 목록
-    default_encodings = ['utf-8', 'cp949', 'utf-8-sig', 'euc-kr']
-    
-    # 이전에 성공한 인코딩이 있으면 먼저 시도
-    if filepath in file_encodings:
-        known_encoding = file_encodings[filepath]
-        encodings = [known_encoding] + [enc for enc in default_encodings if enc != known_encoding]
-        backend_logger.debug(f"파일 '{os.path.basename(filepath)}'에 이전 성공 인코딩 사용: {known_encoding}")
-    else:
-        encodings = default_encodings
-    
     try:
         file_size = os.path.getsize(filepath)
         if start_byte_offset >= file_size:
-            return ""
+            return b""
 
         with open(filepath, 'rb') as f:
             if start_byte_offset > 0:
                 f.seek(start_byte_offset)
-            raw_content = f.read()
+            return f.read()
     except FileNotFoundError:
         raise
     except OSError as e:
@@ -600,8 +1381,21 @@ def read_file_with_multiple_encodings(filepath, start_byte_offset, log_func):
         backend_logger.error(f"파일 바이트 읽기 실패: {filepath} - {e}")
         return None
 
-    if raw_content == b"":
-        return ""
+
+def decode_with_multiple_encodings(filepath, raw_content, log_func):
+    """읽은 바이트를 여러 인코딩으로 디코딩합니다. 성공한 인코딩은 다음 읽기에 먼저 씁니다."""
+    backend_logger = logging.getLogger('backend_processor')
+    
+    # 기본 인코딩 목록
+    default_encodings = ['utf-8', 'cp949', 'utf-8-sig', 'euc-kr']
+    
+    # 이전에 성공한 인코딩이 있으면 먼저 시도
+    if filepath in file_encodings:
+        known_encoding = file_encodings[filepath]
+        encodings = [known_encoding] + [enc for enc in default_encodings if enc != known_encoding]
+        backend_logger.debug("파일 '%s'에 이전 성공 인코딩 사용: %s", os.path.basename(filepath), known_encoding)
+    else:
+        encodings = default_encodings
 
     content = None
     successful_encoding = None
@@ -609,20 +1403,20 @@ def read_file_with_multiple_encodings(filepath, start_byte_offset, log_func):
     for enc in encodings:
         try:
             content = raw_content.decode(enc)
-            backend_logger.debug(f"파일 디코딩 성공 ({enc}): {os.path.basename(filepath)}")
+            backend_logger.debug("파일 디코딩 성공 (%s): %s", enc, os.path.basename(filepath))
             successful_encoding = enc
             break # 읽기 성공 시 종료
         except UnicodeDecodeError as e:
-            backend_logger.debug(f"인코딩 {enc} 실패: {e}")
+            backend_logger.debug("인코딩 %s 실패: %s", enc, e)
             continue # 실패 시 다음 인코딩 시도
         except Exception as e:
-            backend_logger.debug(f"인코딩 {enc} 처리 중 예외: {e}")
+            backend_logger.debug("인코딩 %s 처리 중 예외: %s", enc, e)
             continue
     
     # 성공한 인코딩 저장
     if successful_encoding:
         file_encodings[filepath] = successful_encoding
-        backend_logger.debug(f"파일 '{os.path.basename(filepath)}'의 인코딩으로 {successful_encoding} 저장됨")
+        backend_logger.debug("파일 '%s'의 인코딩으로 %s 저장됨", os.path.basename(filepath), successful_encoding)
     
     if content is None:
         log_func(f"오류: 파일 '{os.path.basename(filepath)}' 읽기 최종 실패.")
@@ -630,6 +1424,73 @@ def read_file_with_multiple_encodings(filepath, start_byte_offset, log_func):
     
     return content
 
+
+def split_decoded_lines(content):
+    """디코딩한 내용을 앞뒤 공백을 지운 비어 있지 않은 줄 목록으로 나눕니다."""
+    return [line.strip() for line in content.strip().split('\n') if line.strip()]
+
+
+UTF16_BOMS = (b'\xff\xfe', b'\xfe\xff')
+
+
+def can_split_raw_bytes(filepath, raw_content):
+    """디코딩 없이 바이트에서 줄을 나눠도 결과가 같은지 판단합니다.
+
+    UTF-8(또는 인코딩을 아직 모르는 파일)이나 ASCII 내용만 해당한다. cp949/euc-kr은
+    줄바꿈 바이트가 다중 바이트 문자 안에 나오지 않지만 지문은 UTF-8 기준이라 줄마다 변환이
+    필요하므로 기존처럼 먼저 디코딩한다. UTF-16은 줄바꿈이 2바이트라 항상 먼저 디코딩한다.
+    """
+    if raw_content.startswith(UTF16_BOMS) or b'\x00' in raw_content:
+        return False
+    if raw_content.isascii():
+        return True
+    return file_encodings.get(filepath, 'utf-8') == 'utf-8'
+
+
+def split_raw_lines(raw_content):
+    """바이트 그대로 줄을 나누고 ASCII 공백만 지웁니다. (NBSP, 전각 공백은 decode_surviving_lines에서)"""
+    return [line for line in map(bytes.strip, raw_content.split(b'\n')) if line]
+
+
+def decode_surviving_lines(raw_lines, line_fingerprints, file_seen_hashes, encoding='utf-8'):
+    """중복 제거를 통과한 줄만 디코딩합니다. 디코딩할 수 없는 줄이 있으면 None
+
+    raw_lines가 LineSpans(프로세스 풀 경로)이면 통과한 줄만 파일에서 위치로 다시 읽는다.
+
+    bytes.strip()은 str.strip()과 달리 NBSP, 전각 공백, 제어 문자 0x1C~0x1F를 지우지 않는다. 그런 줄은
+    지문이 캐시와 맞지 않아 반드시 여기까지 오므로, 디코딩한 뒤 다시 지우고 지문을 고쳐 한 번 더
+    판정한다. 지문 목록은 제자리에서 고친다. (공백만 남은 줄은 목록에서 뺀다)
+    """
+    global_cache = added_lines_cache
+    decoded_lines = []
+    emptied_indexes = []
+    survivor_indexes = [
+        index for index, fingerprint in enumerate(line_fingerprints)
+        if fingerprint not in global_cache and fingerprint not in file_seen_hashes
+    ]
+    if isinstance(raw_lines, LineSpans):
+        payloads = raw_lines.fetch(survivor_indexes)
+    else:
+        payloads = [raw_lines[index] for index in survivor_indexes]
+    for index, payload in zip(survivor_indexes, payloads):
+        try:
+            line = payload.decode(encoding)
+        except UnicodeDecodeError:
+            return None
+        normalized_line = line.strip()
+        if normalized_line != line:
+            if not normalized_line:
+                emptied_indexes.append(index)
+                continue
+            fingerprint = hash_line_for_dedupe(normalized_line)
+            line_fingerprints[index] = fingerprint
+            if fingerprint in global_cache or fingerprint in file_seen_hashes:
+                continue
+        decoded_lines.append(normalized_line)
+    for index in reversed(emptied_indexes):
+        del line_fingerprints[index]
+    return decoded_lines
+
 # --- 파일 변경 이벤트 핸들러 ---
 class FileEventHandler(FileSystemEventHandler):
     """ 설정된 필터에 맞는 파일의 생성 또는 수정 이벤트만 감지하여 큐에 넣음 """
@@ -690,230 +1551,663 @@ class FileEventHandler(FileSystemEventHandler):
         
         # 파일이 필터 조건에 맞는지 확인
         if not self.is_file_match(filepath):
-            self.backend_logger.debug(f"필터링됨: {filepath}")
+            self.backend_logger.debug("필터링됨: %s", filepath)
             return
             
         self.log_func(f"파일 감지됨 ({event.event_type}): {os.path.basename(filepath)}")
         self.backend_logger.info(f"파일 감지됨 ({event.event_type}): {filepath}")
-        file_queue.put((filepath, event.event_type)) # 처리 큐에 파일 경로 추가
+        self.enqueue((filepath, event.event_type, TraceContext.start(filepath))) # 처리 큐에 파일 경로 추가
+
+    def enqueue(self, queue_item):
+        """감지한 (파일 경로, 이벤트 유형, 지연 추적)을 엔진에 넘긴다. watchdog 스레드에서 불린다."""
+        file_queue.put(queue_item)
         
     def on_created(self, event): self.process(event)
     def on_modified(self, event): self.process(event)
 
+def execute_docs_batch_update(docs_service, docs_id, requests):
+    """Docs batchUpdate를 실행하고 호출 수, 오류 수, 응답 시간을 지표에 남깁니다."""
+    docs_api_calls_counter.inc()
+    started_at = time.perf_counter()
+    try:
+        return docs_service.documents().batchUpdate(documentId=docs_id, body={'requests': requests}).execute()
+    except Exception:
+        docs_api_errors_counter.inc()
+        raise
+    finally:
+        docs_api_latency_histogram.observe(time.perf_counter() - started_at)
+
+
+def is_ambiguous_docs_error(error):
+    """요청이 Google에 반영됐는지 알 수 없는 실패인지 판단합니다. (시간 초과, 연결 끊김, 5xx 응답)"""
+    if isinstance(error, HttpError):
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+        try:
+            return status is None or int(status) >= 500
+        except (TypeError, ValueError):
+            return True
+    return isinstance(error, (TimeoutError, ConnectionError, OSError))
+
+
+def fetch_docs_revision(docs_service, docs_id):
+    """필드를 revisionId와 본문 끝 위치로 좁혀 문서를 조회합니다. (revision_id, end_index)"""
+    docs_api_calls_counter.inc()
+    document = docs_service.documents().get(
+        documentId=docs_id, fields='revisionId,body/content/endIndex'
+    ).execute()
+    content = (document.get('body') or {}).get('content') or []
+    end_index = content[-1].get('endIndex') if content else None
+    return document.get('revisionId'), end_index
+
+
+def iter_document_text_runs(document):
+    """documents().get 응답에서 문단 글자 조각(textRun.content)을 문서 순서대로 내보냅니다."""
+    for structural_element in (document.get('body') or {}).get('content') or []:
+        for element in (structural_element.get('paragraph') or {}).get('elements') or []:
+            content = (element.get('textRun') or {}).get('content')
+            if content:
+                yield content
+
+
+def fetch_docs_text(docs_service, docs_id):
+    """문서 본문 글자만 이어 붙여 반환합니다. 끝 위치로 판단할 수 없을 때만 씁니다."""
+    docs_api_calls_counter.inc()
+    document = docs_service.documents().get(documentId=docs_id, fields=DOCS_TEXT_FIELDS).execute()
+    return "".join(iter_document_text_runs(document))
+
+
+def verify_journal_entry(docs_service, docs_id, entry):
+    """응답을 받지 못한 기록이 문서에 반영됐는지 확인합니다.
+
+    revisionId가 보내기 전과 같으면 반영되지 않은 것이고, 끝 위치가 정확히 기록 길이만큼 늘었으면
+    반영된 것이다. 그 사이 다른 사람이 문서를 고쳐 둘 다로 판단할 수 없으면 본문에서 기록 문자열을 찾는다.
+    """
+    revision_id, end_index = fetch_docs_revision(docs_service, docs_id)
+    write_journal.remember_document_state(docs_id, revision_id, end_index)
+    if entry['base_revision_id'] is not None and revision_id == entry['base_revision_id']:
+        return False
+    if (
+        entry['base_end_index'] is not None
+        and end_index is not None
+        and end_index - entry['base_end_index'] == entry['text_units']
+    ):
+        return True
+    return entry['text'] in fetch_docs_text(docs_service, docs_id)
+
+
+def commit_docs_insert(docs_service, docs_id, text, filepath, log_func, start_offset=None, end_offset=None):
+    """insertText 하나를 저널에 먼저 적고 보냅니다.
+
+    응답이 모호하게 실패하면 문서를 확인해, 이미 반영됐으면 성공으로 보고 다시 보내지 않습니다.
+    반영되지 않았으면 원래 예외를 올려 재시도하게 합니다. 확인마저 실패하면 저널에 남겨 두고,
+    다음 시도가 보내기 전에 다시 확인합니다. (resolve_pending_docs_writes)
+    """
+    backend_logger = logging.getLogger('backend_processor')
+    entry = write_journal.begin(docs_id, filepath, text, start_offset, end_offset)
+    requests = [{'insertText': {'endOfSegmentLocation': {'segmentId': ''}, 'text': text}}]
+    try:
+        response = execute_docs_batch_update(docs_service, docs_id, requests)
+    except Exception as error:
+        if not is_ambiguous_docs_error(error):
+            write_journal.discard(entry)
+            raise
+        docs_ambiguous_writes_counter.inc()
+        try:
+            applied = verify_journal_entry(docs_service, docs_id, entry)
+        except Exception as verify_error:
+            backend_logger.warning(f"Docs 기록 반영 여부 확인 실패, 다음 시도 전에 다시 확인: {verify_error}")
+            raise error
+        if not applied:
+            write_journal.discard(entry)
+            raise
+        write_journal.complete(entry)
+        docs_resends_avoided_counter.inc()
+        log_func(f"  - Google Docs 응답은 실패({type(error).__name__})했지만 기록이 반영된 것을 확인했습니다.")
+        backend_logger.info(f"모호한 Docs 실패 뒤 반영 확인, 다시 보내지 않음: {os.path.basename(filepath)}")
+        return
+    write_control = response.get('writeControl') if isinstance(response, dict) else None
+    write_journal.complete(entry, (write_control or {}).get('requiredRevisionId'))
+
+
+def read_range_lines(filepath, start_offset, end_offset, log_func):
+    """파일의 [start_offset, end_offset) 구간을 디코딩해 비어 있지 않은 줄 목록으로 반환합니다."""
+    with open(filepath, 'rb') as source_file:
+        source_file.seek(start_offset)
+        raw_content = source_file.read(end_offset - start_offset)
+    content = decode_with_multiple_encodings(filepath, raw_content, log_func) if raw_content else None
+    return split_decoded_lines(content) if content else []
+
+
+def resolve_pending_docs_writes(changes, docs_service, docs_id, log_func):
+    """이전 시도에서 응답을 받지 못한 이 파일의 기록을 확인합니다.
+
+    이미 반영됐으면 그 기록의 끝까지 처리 위치를 옮기고 True를 반환합니다. (남은 내용은 다시 읽어 처리)
+    반영되지 않았거나 이어 받을 수 없는 기록은 저널에서 지웁니다.
+    """
+    for entry in write_journal.pending_for(changes.filepath):
+        if (
+            entry['docs_id'] != docs_id
+            or entry['start_offset'] != changes.last_byte_offset
+            or entry['end_offset'] is None
+            or entry['end_offset'] > changes.current_byte_size
+        ):
+            write_journal.discard(entry)
+            continue
+        if not verify_journal_entry(docs_service, docs_id, entry):
+            write_journal.discard(entry)
+            continue
+        write_journal.complete(entry)
+        docs_resends_avoided_counter.inc()
+        committed_lines = read_range_lines(changes.filepath, entry['start_offset'], entry['end_offset'], log_func)
+        if uses_fingerprints():
+            remember_dedupe_fingerprints(changes.filepath, fingerprint_lines(committed_lines))
+        # 구간에서 중복으로 걸러 보내지 않은 줄과 머리 줄은 빼고, 저널 본문에 실제로 들어간 줄만 색인한다.
+        sent_lines = set(entry['text'].split("\n"))
+        history_index.record(
+            docs_id, changes.filepath, [line for line in committed_lines if line in sent_lines],
+            start_offset=entry['start_offset'], end_offset=entry['end_offset'],
+        )
+        mark_file_processed(
+            changes.filepath, entry['end_offset'], changes.current_time, file_identity=changes.current_identity
+        )
+        schedule_processed_state_save(log_func)
+        log_func(
+            f"  - 이전에 응답을 받지 못한 Google Docs 기록이 반영된 것을 확인했습니다. 다시 보내지 않습니다. "
+            f"(파일: {os.path.basename(changes.filepath)})"
+        )
+        return True
+    return False
+
+
 # --- 핵심 파일 처리 함수 (Docs 기록 버전) ---
-def process_file(filepath, config, services, log_func, extracted_result_callback=None, event_type=None):
-    """ 감지된 파일을 읽고, 중복 제거 후 Google Docs에 기록 """
-    # 백엔드 로거 가져오기
+class FileChanges:
+    """read_file_changes()가 읽은 새 줄과, 처리 후 상태 갱신에 필요한 파일 정보.
+
+    바이트 경로로 읽었으면 new_lines 대신 raw_lines(디코딩 전 바이트 줄 또는 LineSpans)와
+    그 인코딩(raw_encoding)이 채워진다. line_fingerprints는 어느 쪽이든 줄 순서대로 계산해 둔 지문이다.
+    """
+
+    __slots__ = (
+        "filepath", "trace", "current_time", "current_identity", "current_byte_size",
+        "last_byte_offset", "new_lines", "settle_delay", "raw_lines", "line_fingerprints", "raw_encoding",
+    )
+
+    def __init__(self, filepath, trace, current_time, current_identity, current_byte_size,
+                 last_byte_offset=0, new_lines=(), settle_delay=None, raw_lines=None, line_fingerprints=None,
+                 raw_encoding='utf-8'):
+        self.filepath = filepath
+        self.trace = trace
+        self.current_time = current_time
+        self.current_identity = current_identity
+        self.current_byte_size = current_byte_size
+        self.last_byte_offset = last_byte_offset
+        self.new_lines = new_lines
+        self.settle_delay = settle_delay
+        self.raw_lines = raw_lines
+        self.line_fingerprints = line_fingerprints
+        self.raw_encoding = raw_encoding
+
+    def fall_back_to_decoded_lines(self, log_func):
+        """바이트 경로로 읽었지만 UTF-8이 아니었을 때 여러 인코딩으로 다시 디코딩합니다.
+
+        지운 공백과 빈 줄은 ASCII라 cp949/euc-kr에서도 같게 디코딩되므로 남은 줄을 이어 붙여 쓴다.
+        """
+        content = decode_with_multiple_encodings(self.filepath, b'\n'.join(self.raw_lines), log_func)
+        self.raw_lines = None
+        self.new_lines = split_decoded_lines(content) if content else []
+        self.line_fingerprints = fingerprint_lines(self.new_lines)
+
+
+def read_file_changes(filepath, log_func, event_type=None, trace=None):
+    """1단계: 마지막 처리 위치 뒤에 새로 쓰인 줄을 읽는다.
+
+    읽을 내용이 없으면 상태만 갱신하고 None을 반환한다. 직전 시도 직후라 아직 읽으면 안 되면
+    settle_delay(초)가 채워진 FileChanges를 반환하므로, 엔진이 그만큼 뒤에 다시 넣어야 한다.
+    """
+    backend_logger = logging.getLogger('backend_processor')
+    current_time = time.time()
+    current_stat = os.stat(filepath)
+    current_identity = build_file_identity_from_stat(current_stat)
+    reset_reason = detect_file_reset_reason(filepath, current_identity, event_type=event_type)
+    if reset_reason:
+        reset_file_processing_state(filepath)
+        file_title = os.path.basename(filepath)
+        if reset_reason == "created_event":
+            log_func(f"  - 같은 경로의 새 파일 생성이 감지되어 이전 처리 상태를 초기화합니다: {file_title}")
+            backend_logger.info(f"같은 경로의 새 파일 생성 감지 - 처리 상태 초기화: {filepath}")
+        else:
+            log_func(f"  - 파일 재생성이 감지되어 이전 처리 상태를 초기화합니다: {file_title}")
+            backend_logger.info(f"파일 재생성 감지 - 처리 상태 초기화: {filepath}")
+
+    current_byte_size = current_stat.st_size
+    last_byte_offset = get_last_successful_offset(filepath)
+    if trace is None:
+        trace = TraceContext(filepath)
+    if current_byte_size == last_byte_offset:  # 크기 변경 없음
+        return None
+
+    last_processed_time = get_last_attempt_time(filepath)
+    if current_time - last_processed_time < PROCESSING_DELAY:
+        backend_logger.debug("짧은 시간 내 재처리 방지: %s", os.path.basename(filepath))
+        return FileChanges(
+            filepath, trace, current_time, current_identity, current_byte_size,
+            settle_delay=last_processed_time + PROCESSING_DELAY - current_time,
+        )
+
+    mark_processing_attempt(filepath, current_time)
+    log_func(f"처리 시작: {os.path.basename(filepath)}")
+    backend_logger.info(f"파일 처리 시작: {filepath}")
+    if current_byte_size <= last_byte_offset:
+        log_func(f"  - 파일 크기 감소 감지. 전체 내용 다시 읽기...")
+        backend_logger.info(f"파일 크기 감소로 인해 '{os.path.basename(filepath)}'의 처리 상태 초기화")
+        reset_file_processing_state(filepath)
+        last_byte_offset = 0
+    trace.mark("settled")
+    bytes_read_counter.inc(current_byte_size - last_byte_offset)
+
+    # 대부분 중복인 긴 따라잡기에서는 바이트에서 줄을 나누고 지문만 계산해 두고,
+    # 중복 제거를 통과한 줄만 기록 단계에서 디코딩한다. 아주 많이 밀렸으면 프로세스 풀에 맡긴다.
+    raw_lines = None
+    raw_encoding = 'utf-8'
+    line_fingerprints = None
+    new_lines = []
+    raw_content = None
+    compute_fingerprints = uses_fingerprints()  # 중복 제거를 끄면 지문 없이 디코딩만 한다.
+    pooled = read_with_catchup_pool(filepath, last_byte_offset, current_byte_size) if compute_fingerprints else None
+    if pooled is not None:
+        raw_lines, line_fingerprints, raw_encoding = pooled
+    else:
+        raw_content = read_file_tail_bytes(filepath, last_byte_offset, log_func)
+    if (
+        compute_fingerprints and raw_content
+        and can_split_raw_bytes(filepath, raw_content) and not get_file_legacy_hashes(filepath)
+    ):
+        raw_lines = split_raw_lines(raw_content)
+    if raw_lines is None and raw_content:
+        new_raw_content = decode_with_multiple_encodings(filepath, raw_content, log_func)
+        new_lines = split_decoded_lines(new_raw_content) if new_raw_content else []
+    line_count = len(raw_lines) if raw_lines is not None else len(new_lines)
+
+    # 파일 읽기 실패 또는 빈 내용 처리
+    if not line_count:
+        backend_logger.debug("파일 내용 없음 또는 읽기 실패: %s", os.path.basename(filepath))
+        mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
+        schedule_processed_state_save(log_func)
+        return None
+
+    trace.mark("read")
+    lines_read_counter.inc(line_count)
+    if line_fingerprints is not None or not compute_fingerprints:
+        pass
+    elif raw_lines is not None:
+        line_fingerprints = fingerprint_raw_lines(raw_lines)
+    else:
+        line_fingerprints = fingerprint_lines(new_lines)
+    return FileChanges(
+        filepath, trace, current_time, current_identity, current_byte_size,
+        last_byte_offset=last_byte_offset, new_lines=new_lines,
+        raw_lines=raw_lines, line_fingerprints=line_fingerprints, raw_encoding=raw_encoding,
+    )
+
+
+def read_with_catchup_pool(filepath, start_offset, end_offset):
+    """밀린 양이 기준을 넘으면 프로세스 풀로 지문을 계산한다. 쓰지 않았거나 실패하면 None"""
+    if not catchup_pool.should_use(end_offset - start_offset) or get_file_legacy_hashes(filepath):
+        return None
+    backend_logger = logging.getLogger('backend_processor')
+    try:
+        pooled = catchup_pool.fingerprint_file_range(filepath, start_offset, end_offset, file_encodings.get(filepath))
+    except FileNotFoundError:
+        raise
+    except Exception as error:  # 작업자 종료(BrokenProcessPool) 등은 한 스레드 경로로 다시 읽는다.
+        backend_logger.warning(f"따라잡기 프로세스 풀 실패, 한 스레드로 다시 읽음: {filepath} - {error}")
+        return None
+    if pooled is None:
+        backend_logger.debug("조각 인코딩이 달라 한 스레드로 다시 읽음: %s", os.path.basename(filepath))
+        return None
+    line_spans, line_fingerprints, encoding = pooled
+    if encoding is not None:
+        file_encodings[filepath] = encoding
+    backend_logger.info(
+        f"따라잡기 프로세스 풀로 읽음: {os.path.basename(filepath)} ({(end_offset - start_offset) / 1024 / 1024:.0f}MB, "
+        f"{len(line_fingerprints)}줄)"
+    )
+    return line_spans, line_fingerprints, encoding or 'utf-8'
+
+
+def write_file_changes(changes, config, services, log_func, extracted_result_callback=None):
+    """2~5단계: 이미 기록한 줄을 거르고 Google Docs에 기록한 뒤 처리 상태를 갱신한다.
+
+    전역 라인 캐시를 고치므로 한 번에 하나의 호출만 실행해야 한다.
+    """
     backend_logger = logging.getLogger('backend_processor')
-    # 필요한 서비스 및 설정 가져오기
     docs_service = services.get('docs') if services else None
     docs_id = config.get('docs_id')
+    filepath = changes.filepath
+    trace = changes.trace
+    current_time = changes.current_time
+    current_identity = changes.current_identity
+    current_byte_size = changes.current_byte_size
 
-    try:
-        # --- 1. 새로운 내용 식별 ---
-        current_time = time.time()
-        current_stat = os.stat(filepath)
-        current_identity = build_file_identity_from_stat(current_stat)
-        reset_reason = detect_file_reset_reason(filepath, current_identity, event_type=event_type)
-        if reset_reason:
-            reset_file_processing_state(filepath)
-            file_title = os.path.basename(filepath)
-            if reset_reason == "created_event":
-                log_func(f"  - 같은 경로의 새 파일 생성이 감지되어 이전 처리 상태를 초기화합니다: {file_title}")
-                backend_logger.info(f"같은 경로의 새 파일 생성 감지 - 처리 상태 초기화: {filepath}")
-            else:
-                log_func(f"  - 파일 재생성이 감지되어 이전 처리 상태를 초기화합니다: {file_title}")
-                backend_logger.info(f"파일 재생성 감지 - 처리 상태 초기화: {filepath}")
-
-        current_byte_size = current_stat.st_size
-        last_byte_offset = get_last_successful_offset(filepath)
-        new_raw_content = None
-
-        if current_byte_size > last_byte_offset:
-            last_processed_time = get_last_attempt_time(filepath)
-            if current_time - last_processed_time < PROCESSING_DELAY:
-                backend_logger.debug(f"짧은 시간 내 재처리 방지: {os.path.basename(filepath)}")
-                return # 짧은 시간 내 재처리 방지
-
-            mark_processing_attempt(filepath, current_time)
-            log_func(f"처리 시작: {os.path.basename(filepath)}")
-            backend_logger.info(f"파일 처리 시작: {filepath}")
-            new_raw_content = read_file_with_multiple_encodings(filepath, last_byte_offset, log_func)
-        elif current_byte_size < last_byte_offset:
-            last_processed_time = get_last_attempt_time(filepath)
-            if current_time - last_processed_time < PROCESSING_DELAY:
-                backend_logger.debug(f"짧은 시간 내 재처리 방지: {os.path.basename(filepath)}")
-                return # 짧은 시간 내 재처리 방지
-
-            mark_processing_attempt(filepath, current_time)
-            log_func(f"처리 시작: {os.path.basename(filepath)}")
-            backend_logger.info(f"파일 처리 시작: {filepath}")
-            log_func(f"  - 파일 크기 감소 감지. 전체 내용 다시 읽기...")
-            backend_logger.info(f"파일 크기 감소로 인해 '{os.path.basename(filepath)}'의 처리 상태 초기화")
-            reset_file_processing_state(filepath)
-            last_byte_offset = 0
-            new_raw_content = read_file_with_multiple_encodings(filepath, 0, log_func)
-        else: # 크기 변경 없음
-            return
+    apply_pending_dedupe_warmup()
 
-        # 파일 읽기 실패 또는 빈 내용 처리
-        if new_raw_content is None or not new_raw_content.strip():
-            backend_logger.debug(f"파일 내용 없음 또는 읽기 실패: {os.path.basename(filepath)}")
-            mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
-            schedule_processed_state_save(log_func)
+    # 이전 시도에서 응답을 받지 못한 기록이 있으면 다시 보내기 전에 반영 여부부터 확인한다.
+    if docs_service and docs_id and write_journal.has_pending():
+        try:
+            resolved = resolve_pending_docs_writes(changes, docs_service, docs_id, log_func)
+        except Exception as e:
+            backend_logger.error(f"Docs 기록 반영 여부 확인 실패: {e}", exc_info=True)
+            schedule_retry(filepath, log_func, f"이전 Google Docs 기록의 반영 여부 확인 실패 ({e})", current_time)
             return
-
-        new_lines = [line.strip() for line in new_raw_content.strip().split('\n') if line.strip()]
-        if not new_lines:
-            backend_logger.debug(f"처리할 새 라인 없음: {os.path.basename(filepath)}")
-            mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
-            schedule_processed_state_save(log_func)
+        if resolved:
+            if get_last_successful_offset(filepath) < current_byte_size:
+                engine_scheduler.requeue(filepath)  # 확인한 기록 뒤에 붙은 내용은 다시 읽어 처리한다.
+                return
+            files_processed_counter.inc()
+            log_func(f"처리 완료: {os.path.basename(filepath)}")
+            backend_logger.info(f"파일 처리 완료: {os.path.basename(filepath)}")
             return
 
-        # --- 2. 라인 캐시 기반 중복 제거 ---
-        global added_lines_cache
-        file_seen_hashes = get_file_seen_hashes(filepath)
-        should_record_duplicate_file_marker = last_byte_offset == 0 and not file_seen_hashes
-        truly_new_lines = [
-            line for line in new_lines
-            if line not in added_lines_cache and hash_line_for_dedupe(line) not in file_seen_hashes
-        ]
-
-        if not truly_new_lines: # 추가할 새 라인 없음
-            duplicate_line_count = len(new_lines)
-            file_title = os.path.basename(filepath)
-            if should_record_duplicate_file_marker:
-                if not docs_id:
-                    schedule_retry(filepath, log_func, "중복 새 파일의 파일명 기록을 위한 Google Docs 문서 ID가 없습니다", current_time)
-                    return
+    # --- 2. 라인 캐시 기반 중복 제거 ---
+    if uses_fingerprints():
+        expire_line_cache()
+        file_seen_hashes, legacy_hashes, truly_new_lines = deduplicate_changes(changes, log_func)
+        should_record_duplicate_file_marker = (
+            changes.last_byte_offset == 0 and not file_seen_hashes and not legacy_hashes
+        )
+        new_line_count = len(changes.line_fingerprints)
+    else:
+        # 중복 제거를 끈 범위는 지문 계산, 판정, 캐시/파일별 해시 갱신과 저장을 모두 건너뛴다.
+        file_seen_hashes = legacy_hashes = frozenset()
+        should_record_duplicate_file_marker = False
+        truly_new_lines = list(changes.new_lines)
+        new_line_count = len(truly_new_lines)
+    line_fingerprints = changes.line_fingerprints
+    trace.mark("deduped")
+    lines_deduped_counter.inc(new_line_count - len(truly_new_lines))
+
+    if not truly_new_lines: # 추가할 새 라인 없음
+        duplicate_line_count = new_line_count
+        file_title = os.path.basename(filepath)
+        if should_record_duplicate_file_marker:
+            if not docs_id:
+                schedule_retry(filepath, log_func, "중복 새 파일의 파일명 기록을 위한 Google Docs 문서 ID가 없습니다", current_time)
+                return
 
-                if not docs_service:
-                    schedule_retry(filepath, log_func, "중복 새 파일의 파일명 기록을 위한 Google Docs 서비스가 준비되지 않았습니다", current_time)
-                    return
+            if not docs_service:
+                schedule_retry(filepath, log_func, "중복 새 파일의 파일명 기록을 위한 Google Docs 서비스가 준비되지 않았습니다", current_time)
+                return
 
+            log_func(
+                f"  - 중복 내용만 감지됨. 파일명 기록 시도 (파일: {file_title}, 중복 {duplicate_line_count}줄)"
+            )
+            duplicate_record = build_duplicate_only_record(filepath, duplicate_line_count)
+            try:
+                requests = [{'insertText': {'endOfSegmentLocation': {'segmentId': ''}, 'text': duplicate_record['document_text']}}]
+                execute_docs_batch_update(docs_service, docs_id, requests)
+                trace.mark("written")
                 log_func(
-                    f"  - 중복 내용만 감지됨. 파일명 기록 시도 (파일: {file_title}, 중복 {duplicate_line_count}줄)"
-                )
-                duplicate_record = build_duplicate_only_record(filepath, duplicate_line_count)
-                try:
-                    requests = [{'insertText': {'endOfSegmentLocation': {'segmentId': ''}, 'text': duplicate_record['document_text']}}]
-                    docs_service.documents().batchUpdate(documentId=docs_id, body={'requests': requests}).execute()
-                    log_func(
-                        f"  - Google Docs 중복 파일명 기록 완료 (파일: {file_title}, 중복 {duplicate_line_count}줄)"
-                    )
-                    backend_logger.info(
-                        f"Google Docs 중복 파일명 기록 완료: {file_title} / 중복 {duplicate_line_count}줄"
-                    )
-                    if extracted_result_callback:
-                        try:
-                            extracted_result_callback(duplicate_record)
-                        except Exception as callback_error:
-                            backend_logger.warning(f"추출 결과 콜백 처리 실패: {callback_error}")
-                except HttpError as error:
-                    log_func(f"오류: Docs 업데이트 API 오류 - {error}")
-                    backend_logger.error(f"Docs 업데이트 API 오류: {error}")
-                    schedule_retry(filepath, log_func, "중복 새 파일 파일명 기록 중 Google Docs API 오류", current_time)
-                    return
-                except Exception as e:
-                    log_func(f"오류: Docs 업데이트 중 예외 발생 - {e}")
-                    backend_logger.error(f"Docs 업데이트 중 예외 발생: {e}", exc_info=True)
-                    log_func(traceback.format_exc())
-                    schedule_retry(filepath, log_func, "중복 새 파일 파일명 기록 중 Google Docs 업데이트 예외", current_time)
-                    return
-            else:
-                log_func(
-                    f"  - 중복 내용만 감지되어 Google Docs 기록 생략 (파일: {file_title}, 중복 {duplicate_line_count}줄)"
+                    f"  - Google Docs 중복 파일명 기록 완료 (파일: {file_title}, 중복 {duplicate_line_count}줄)"
                 )
                 backend_logger.info(
-                    f"중복 내용만 감지되어 Google Docs 기록 생략: {file_title} / 중복 {duplicate_line_count}줄"
+                    f"Google Docs 중복 파일명 기록 완료: {file_title} / 중복 {duplicate_line_count}줄"
                 )
+                if extracted_result_callback:
+                    try:
+                        extracted_result_callback(duplicate_record)
+                    except Exception as callback_error:
+                        backend_logger.warning(f"추출 결과 콜백 처리 실패: {callback_error}")
+            except HttpError as error:
+                log_func(f"오류: Docs 업데이트 API 오류 - {error}")
+                backend_logger.error(f"Docs 업데이트 API 오류: {error}")
+                schedule_retry(filepath, log_func, "중복 새 파일 파일명 기록 중 Google Docs API 오류", current_time)
+                return
+            except Exception as e:
+                log_func(f"오류: Docs 업데이트 중 예외 발생 - {e}")
+                backend_logger.error(f"Docs 업데이트 중 예외 발생: {e}", exc_info=True)
+                log_func(traceback.format_exc())
+                schedule_retry(filepath, log_func, "중복 새 파일 파일명 기록 중 Google Docs 업데이트 예외", current_time)
+                return
+        else:
+            log_func(
+                f"  - 중복 내용만 감지되어 Google Docs 기록 생략 (파일: {file_title}, 중복 {duplicate_line_count}줄)"
+            )
+            backend_logger.info(
+                f"중복 내용만 감지되어 Google Docs 기록 생략: {file_title} / 중복 {duplicate_line_count}줄"
+            )
 
-            remember_global_lines(new_lines)
-            remember_file_lines(filepath, new_lines)
-            mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
-            schedule_processed_state_save(log_func)
-            log_func(f"처리 완료: {os.path.basename(filepath)}")
-            backend_logger.info(f"파일 처리 완료: {os.path.basename(filepath)}")
-            return
+        remember_dedupe_fingerprints(filepath, line_fingerprints)
+        mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
+        schedule_processed_state_save(log_func)
+        latency_tracker.record(trace, "duplicate")
+        files_processed_counter.inc()
+        log_func(f"처리 완료: {os.path.basename(filepath)}")
+        backend_logger.info(f"파일 처리 완료: {os.path.basename(filepath)}")
+        return
 
-        filtered_content = "\n".join(truly_new_lines) # Docs에 추가할 실제 내용
+    filtered_content = "\n".join(truly_new_lines) # Docs에 추가할 실제 내용
 
-        # --- 3. Google Docs 업데이트 ---
-        if not docs_id:
-            schedule_retry(filepath, log_func, "Google Docs 문서 ID가 없습니다", current_time)
-            return
+    # --- 3. Google Docs 업데이트 ---
+    if not docs_id:
+        schedule_retry(filepath, log_func, "Google Docs 문서 ID가 없습니다", current_time)
+        return
 
-        if not docs_service:
-            schedule_retry(filepath, log_func, "Google Docs 서비스가 준비되지 않았습니다", current_time)
-            return
+    if not docs_service:
+        schedule_retry(filepath, log_func, "Google Docs 서비스가 준비되지 않았습니다", current_time)
+        return
 
-        extraction_record = build_extraction_record(filepath, truly_new_lines)
-        text_to_insert = extraction_record['document_text']
+    extraction_record = build_extraction_record(filepath, truly_new_lines)
+    text_to_insert = extraction_record['document_text']
 
+    log_func(
+        f"  - Google Docs에 {len(truly_new_lines)}줄 추가 시도 (파일: {os.path.basename(filepath)}, ID: {docs_id})..."
+    )
+    try:
+        if len(text_to_insert) > DOCS_UPLOAD_CHUNK_CHARS:
+            upload_record_in_chunks(
+                changes, docs_service, docs_id, extraction_record, truly_new_lines,
+                file_seen_hashes, legacy_hashes, log_func,
+            )
+        else:
+            # 단일 insertText 요청 사용 (저널에 먼저 적고 보낸다)
+            commit_docs_insert(
+                docs_service, docs_id, text_to_insert, filepath, log_func,
+                start_offset=changes.last_byte_offset, end_offset=current_byte_size,
+            )
+            history_index.record(
+                docs_id, filepath, truly_new_lines, start_offset=changes.last_byte_offset, end_offset=current_byte_size
+            )
+        trace.mark("written")
         log_func(
-            f"  - Google Docs에 {len(truly_new_lines)}줄 추가 시도 (파일: {os.path.basename(filepath)}, ID: {docs_id})..."
+            f"  - Google Docs 업데이트 완료 (파일: {os.path.basename(filepath)}, {len(truly_new_lines)}줄 추가)"
+        )
+        backend_logger.info(
+            f"Google Docs 업데이트 완료: {os.path.basename(filepath)} / {len(truly_new_lines)}줄 추가"
         )
+    except HttpError as error:
+        log_func(f"오류: Docs 업데이트 API 오류 - {error}")
+        backend_logger.error(f"Docs 업데이트 API 오류: {error}")
+        schedule_retry(filepath, log_func, "Google Docs API 오류", current_time)
+        return
+    except Exception as e:
+        log_func(f"오류: Docs 업데이트 중 예외 발생 - {e}")
+        backend_logger.error(f"Docs 업데이트 중 예외 발생: {e}", exc_info=True)
+        log_func(traceback.format_exc())
+        schedule_retry(filepath, log_func, "Google Docs 업데이트 예외", current_time)
+        return
+
+    # --- 4. 라인 캐시 업데이트 (Docs 업데이트 성공 시) ---
+    backend_logger.debug("라인 캐시에 새로운 %s줄 추가", len(truly_new_lines))
+    remember_dedupe_fingerprints(filepath, line_fingerprints)
+
+    if extracted_result_callback:
         try:
-            # 단일 insertText 요청 사용
-            requests = [{'insertText': {'endOfSegmentLocation': {'segmentId': ''}, 'text': text_to_insert}}]
-            docs_service.documents().batchUpdate(documentId=docs_id, body={'requests': requests}).execute()
-            log_func(
-                f"  - Google Docs 업데이트 완료 (파일: {os.path.basename(filepath)}, {len(truly_new_lines)}줄 추가)"
-            )
-            backend_logger.info(
-                f"Google Docs 업데이트 완료: {os.path.basename(filepath)} / {len(truly_new_lines)}줄 추가"
+            extracted_result_callback(extraction_record)
+        except Exception as callback_error:
+            backend_logger.warning(f"추출 결과 콜백 처리 실패: {callback_error}")
+
+    # --- 5. 최종 상태 업데이트 ---
+    mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
+    schedule_processed_state_save(log_func)
+    latency_tracker.record(trace)
+    files_processed_counter.inc()
+    lines_written_counter.inc(len(truly_new_lines))
+    log_func(f"처리 완료: {os.path.basename(filepath)}")
+    backend_logger.info(f"파일 처리 완료: {os.path.basename(filepath)}")
+
+
+def deduplicate_changes(changes, log_func):
+    """전역/문서별 라인 캐시와 파일별 지문으로 이미 기록한 줄을 거릅니다.
+
+    (파일별 지문 집합, 이전 버전 hex 해시 집합, 새 줄 목록)을 반환한다.
+    """
+    filepath = changes.filepath
+    file_seen_hashes = get_file_seen_hashes(filepath)
+    legacy_hashes = get_file_legacy_hashes(filepath)
+    if changes.line_fingerprints is None:
+        changes.line_fingerprints = fingerprint_lines(changes.new_lines)
+    promoted_count = promote_long_term_duplicates(changes.line_fingerprints, file_seen_hashes)
+    if promoted_count:
+        logging.getLogger('backend_processor').debug(
+            "장기 중복 필터에서 찾은 줄 %d개: %s", promoted_count, os.path.basename(filepath)
+        )
+    truly_new_lines = None
+    if changes.raw_lines is not None:
+        # 지문은 읽기 단계에서 한 번만 계산해 전역/파일별 판정과 기록에 함께 쓴다.
+        truly_new_lines = decode_surviving_lines(
+            changes.raw_lines, changes.line_fingerprints, file_seen_hashes, changes.raw_encoding
+        )
+        if truly_new_lines is None:
+            logging.getLogger('backend_processor').debug(
+                "디코딩할 수 없는 줄이 있어 다시 디코딩: %s", os.path.basename(filepath)
             )
-        except HttpError as error:
-            log_func(f"오류: Docs 업데이트 API 오류 - {error}")
-            backend_logger.error(f"Docs 업데이트 API 오류: {error}")
-            schedule_retry(filepath, log_func, "Google Docs API 오류", current_time)
-            return
-        except Exception as e:
-            log_func(f"오류: Docs 업데이트 중 예외 발생 - {e}")
-            backend_logger.error(f"Docs 업데이트 중 예외 발생: {e}", exc_info=True)
-            log_func(traceback.format_exc())
-            schedule_retry(filepath, log_func, "Google Docs 업데이트 예외", current_time)
-            return
+            changes.fall_back_to_decoded_lines(log_func)
+    if truly_new_lines is None:
+        truly_new_lines = select_new_lines(
+            changes.new_lines, changes.line_fingerprints, file_seen_hashes, legacy_hashes
+        )
+    return file_seen_hashes, legacy_hashes, truly_new_lines
 
-        # --- 4. 라인 캐시 업데이트 (Docs 업데이트 성공 시) ---
-        backend_logger.debug(f"라인 캐시에 새로운 {len(truly_new_lines)}줄 추가")
-        remember_global_lines(new_lines)
-        remember_file_lines(filepath, new_lines)
 
-        if extracted_result_callback:
-            try:
-                extracted_result_callback(extraction_record)
-            except Exception as callback_error:
-                backend_logger.warning(f"추출 결과 콜백 처리 실패: {callback_error}")
+def upload_record_in_chunks(changes, docs_service, docs_id, extraction_record, new_lines,
+                            file_seen_hashes, legacy_hashes, log_func):
+    """큰 기록을 조각으로 나눠 순서대로 보내고, 조각마다 그 마지막 줄까지를 처리 완료로 저장합니다.
 
-        # --- 5. 최종 상태 업데이트 ---
-        mark_file_processed(filepath, current_byte_size, current_time, file_identity=current_identity)
+    중간 조각이 실패하면 예외를 그대로 올립니다. 재시도는 저장된 위치부터 다시 읽고, 이미 보낸 줄은
+    파일별 지문으로 걸러지므로 남은 줄만 새 기록으로 보냅니다.
+    """
+    filepath = changes.filepath
+    file_title = os.path.basename(filepath)
+    line_fingerprints = changes.line_fingerprints
+    chunks = split_extraction_record(extraction_record, new_lines, DOCS_UPLOAD_CHUNK_CHARS)
+    if line_fingerprints is None:  # 중복 제거를 끈 범위는 읽은 줄이 모두 새 줄이다.
+        line_positions = list(range(len(new_lines)))
+    else:
+        line_positions = locate_new_line_positions(
+            line_fingerprints, file_seen_hashes, changes.new_lines, legacy_hashes
+        )
+    checkpoint_positions = [line_positions[line_end - 1] for _chunk_text, line_end in chunks[:-1]]
+    checkpoint_offsets = find_line_end_offsets(
+        filepath, changes.last_byte_offset, changes.current_byte_size, checkpoint_positions
+    )
+    chunk_end_offsets = (checkpoint_offsets or [None] * len(checkpoint_positions)) + [changes.current_byte_size]
+    line_start = 0
+    for chunk_index, (chunk_text, line_end) in enumerate(chunks):
+        chunk_start_offset = changes.last_byte_offset if chunk_index == 0 else chunk_end_offsets[chunk_index - 1]
+        try:
+            commit_docs_insert(
+                docs_service, docs_id, chunk_text, filepath, log_func,
+                start_offset=chunk_start_offset, end_offset=chunk_end_offsets[chunk_index],
+            )
+        except Exception:
+            if chunk_index:
+                log_func(f"  - Google Docs 분할 기록 {chunk_index + 1}/{len(chunks)}조각에서 중단. 앞 조각까지 처리 위치를 저장했습니다.")
+            raise
+        log_func(f"  - Google Docs 분할 기록 {chunk_index + 1}/{len(chunks)}조각 완료 (파일: {file_title})")
+        history_index.record(
+            docs_id, filepath, new_lines[line_start:line_end],
+            start_offset=chunk_start_offset, end_offset=chunk_end_offsets[chunk_index],
+        )
+        line_start = line_end
+        if chunk_index + 1 == len(chunks):
+            break
+        # 보낸 조각의 마지막 줄까지(그 사이 중복 줄 포함)를 처리한 것으로 남긴다.
+        if line_fingerprints is not None:
+            remember_dedupe_fingerprints(filepath, line_fingerprints[:checkpoint_positions[chunk_index] + 1])
+        if checkpoint_offsets is not None:
+            mark_file_processed(
+                filepath, checkpoint_offsets[chunk_index], changes.current_time, file_identity=changes.current_identity
+            )
         schedule_processed_state_save(log_func)
-        log_func(f"처리 완료: {os.path.basename(filepath)}")
-        backend_logger.info(f"파일 처리 완료: {os.path.basename(filepath)}")
 
-    except FileNotFoundError:
-         log_func(f"오류: 파일 처리 중 사라짐 - {os.path.basename(filepath)}")
-         backend_logger.warning(f"파일 처리 중 사라짐: {filepath}")
-         remove_file_processing_state(filepath)
-         schedule_processed_state_save(log_func)
+
+def handle_file_processing_error(filepath, error, log_func):
+    """파일 하나를 처리하다 난 예외를 기록한다. 파일이 사라졌으면 처리 상태도 지운다."""
+    backend_logger = logging.getLogger('backend_processor')
+    if isinstance(error, FileNotFoundError):
+        log_func(f"오류: 파일 처리 중 사라짐 - {os.path.basename(filepath)}")
+        backend_logger.warning(f"파일 처리 중 사라짐: {filepath}")
+        remove_file_processing_state(filepath)
+        schedule_processed_state_save(log_func)
+        return
+    log_func(f"오류: {os.path.basename(filepath)} 처리 중 예기치 않은 예외 - {error}")
+    backend_logger.error(f"파일 처리 중 예기치 않은 예외: {filepath} - {error}", exc_info=error)
+    log_func("".join(traceback.format_exception(type(error), error, error.__traceback__)))
+
+
+def process_file(filepath, config, services, log_func, extracted_result_callback=None, event_type=None, trace=None):
+    """ 감지된 파일을 읽고, 중복 제거 후 Google Docs에 기록 """
+    try:
+        changes = read_file_changes(filepath, log_func, event_type=event_type, trace=trace)
+        if changes is None:
+            return
+        if changes.settle_delay is not None:
+            schedule_settle_recheck(filepath, changes.settle_delay, changes.current_time, trace=changes.trace)
+            return # 짧은 시간 내 재처리 방지
+        write_file_changes(changes, config, services, log_func, extracted_result_callback)
     except Exception as e:
-        log_func(f"오류: {os.path.basename(filepath)} 처리 중 예기치 않은 예외 - {e}")
-        backend_logger.error(f"파일 처리 중 예기치 않은 예외: {filepath} - {e}", exc_info=True)
-        log_func(traceback.format_exc())
+        handle_file_processing_error(filepath, e, log_func)
 
 
 # --- 메인 모니터링 함수 ---
-def run_monitoring(
-    config,
-    log_func_threadsafe,
-    stop_event,
-    extracted_result_callback=None,
-    preloaded_services=None,
-):
-    """ 백그라운드에서 폴더 감시 및 파일 처리를 실행하는 메인 루프 """
+def drain_pending_files(config, services, log_func, timeout_seconds, extracted_result_callback=None):
+    """중지 신호 뒤 큐와 재확인 대기에 남은 파일을 제한 시간 안에 처리하고 처리 건수를 반환합니다."""
+    backend_logger = logging.getLogger(BACKEND_LOGGER_NAME)
+    deadline = time.monotonic() + timeout_seconds
+    # 일반 Event는 큐를 깨우지 않으므로 wait_for_next_file이 짧게 나눠 기다린다.
+    drain_wait_event = threading.Event()
+    drained_count = 0
+    while time.monotonic() < deadline and (not file_queue.empty() or settle_deadlines):
+        try:
+            next_file = wait_for_next_file(drain_wait_event)
+            if next_file is None:
+                continue
+            filepath, event_type, trace = next_file
+            process_file(
+                filepath,
+                config,
+                services,
+                log_func,
+                extracted_result_callback=extracted_result_callback,
+                event_type=event_type,
+                trace=trace,
+            )
+            drained_count += 1
+        except Exception as e:
+            log_func(f"오류: 종료 전 남은 파일 처리 중 예외 - {e}")
+            backend_logger.error(f"종료 전 남은 파일 처리 중 예외: {e}", exc_info=True)
+    if not file_queue.empty() or settle_deadlines:
+        log_func("경고: 제한 시간 안에 처리하지 못한 파일이 남아 있습니다. 다음 변경 때 이어서 처리합니다.")
+    return drained_count
+
+
+def prepare_monitoring_session(config, log_func_threadsafe, preloaded_services=None):
+    """감시 엔진 공통 준비: 백엔드 로깅, 라인 캐시/처리 상태 로드, Google 서비스 로드.
+
+    (google_services, can_start)를 반환한다. 재인증이 필요하면 can_start가 False다.
+    """
     watch_folder = config.get('watch_folder')
-    
+
     # 백엔드 로깅 시스템 초기화
     backend_logger = setup_backend_logging()
     backend_logger.info(f"감시 시작 - 폴더: {watch_folder}")
@@ -921,11 +2215,26 @@ def run_monitoring(
     log_func_threadsafe(f"백엔드: 감시 시작 - 폴더: {watch_folder}")
     resolved_max_cache_size = configure_max_global_cache_size(config, log_func_threadsafe)
     backend_logger.info(f"라인 캐시 최대 크기 적용 완료: {resolved_max_cache_size}")
+    backend_logger.info(f"중복 제거 범위 적용 완료: {configure_dedupe_scope(config, log_func_threadsafe)}")
 
     load_line_cache(log_func_threadsafe) # 라인 캐시 로드
     backend_logger.info(f"라인 캐시 로드 완료 - 캐시된 라인 수: {len(added_lines_cache)}")
+    if open_long_term_dedupe_filter(config, log_func_threadsafe):
+        backend_logger.info(f"장기 중복 필터 열림: {dedupe_filter.directory}")
     load_processed_state(log_func_threadsafe) # 처리 상태 로드
     backend_logger.info(f"처리 상태 로드 완료 - 추적 파일 수: {len(processed_file_states)}")
+    try:
+        write_journal.open(WRITE_JOURNAL_FILE, log_func_threadsafe)
+    except Exception as e:
+        # 저널 없이도 기록은 할 수 있으므로 메모리에만 두고 계속한다.
+        write_journal.open(None)
+        log_func_threadsafe(f"경고: Docs 기록 저널({WRITE_JOURNAL_FILE})을 열지 못했습니다 - {e}")
+    if history_index.open(
+        HISTORY_INDEX_FILE,
+        config.get('history_retention_days', DEFAULT_HISTORY_RETENTION_DAYS),
+        config.get('history_max_lines', DEFAULT_HISTORY_MAX_LINES),
+    ):
+        backend_logger.info(f"기록 색인 열림: {HISTORY_INDEX_FILE}")
 
     google_services = preloaded_services
     if google_services and 'docs' in google_services:
@@ -965,7 +2274,7 @@ def run_monitoring(
             )
             log_func_threadsafe(error_msg)
             backend_logger.warning(f"백그라운드에서 Google 재인증 필요 감지: {auth_error.reason_code}")
-            return
+            return google_services, False
         except Exception as e: # get_google_services() 호출 중 발생한 예외
             error_msg = f"오류: Google 서비스 초기화 중 예외 발생 - {e}. "\
                         "인증 설정, 네트워크 연결 또는 API 할당량을 확인하세요."
@@ -987,7 +2296,42 @@ def run_monitoring(
         log_func_threadsafe(f"백엔드: 파일 확장자 필터 - {config.get('file_extensions')}")
     if config.get('use_regex_filter') and config.get('regex_pattern'):
         log_func_threadsafe(f"백엔드: 정규식 필터 - {config.get('regex_pattern')}")
-    
+    start_dedupe_warmup(config, google_services, log_func_threadsafe)
+    return google_services, True
+
+
+def apply_engine_runtime_config(config):
+    """감시 루프를 시작하기 직전에 재확인 대기열을 비우고 런타임 설정을 적용한다."""
+    settle_deadlines.clear()
+    settle_deadline_paths.clear()
+    settle_deadline_traces.clear()
+    if 'latency_log_sample_rate' in config:
+        latency_tracker.set_sample_rate(config['latency_log_sample_rate'])
+    if 'memory_budget_mb' in config:
+        memory_budget.set_budget_mb(config['memory_budget_mb'])
+    if 'catchup_pool_threshold_mb' in config:
+        catchup_pool.configure(config['catchup_pool_threshold_mb'])
+
+
+def run_monitoring(
+    config,
+    log_func_threadsafe,
+    stop_event,
+    extracted_result_callback=None,
+    preloaded_services=None,
+    drain_timeout_seconds=0.0,
+):
+    """ 백그라운드에서 폴더 감시 및 파일 처리를 실행하는 메인 루프
+
+    drain_timeout_seconds가 0보다 크면 중지 신호 뒤 감시자를 멈추고, 큐와 재확인 대기에 남은
+    파일을 그 시간 안에 마저 처리한 다음 상태를 저장한다. (헤드리스 데몬의 SIGTERM 처리용)
+    """
+    google_services, can_start = prepare_monitoring_session(config, log_func_threadsafe, preloaded_services)
+    if not can_start:
+        return
+    backend_logger = logging.getLogger(BACKEND_LOGGER_NAME)
+    watch_folder = config.get('watch_folder')
+
     # 이벤트 핸들러 생성 (필터링 설정 포함)
     event_handler = FileEventHandler(log_func_threadsafe, config)
     observer = Observer()
@@ -1000,15 +2344,20 @@ def run_monitoring(
         return
 
     # --- 메인 루프 ---
+    apply_engine_runtime_config(config)
+    # 분 단위 처리량 시계열은 별도 스레드가 지표 증가분을 모아 기록한다.
+    timeseries_recorder = TimeSeriesRecorder(TimeSeriesStore(TIMESERIES_FILE))
+    timeseries_recorder.start()
+    monitoring_profile_hook.attach(wake_func=lambda: file_queue.put(MONITORING_WAKE_SENTINEL))
     try:
         while not stop_event.is_set():
             try:
-                queue_item = file_queue.get_nowait()
-                if isinstance(queue_item, tuple):
-                    filepath, event_type = queue_item
-                else:
-                    filepath = queue_item
-                    event_type = None
+                monitoring_profile_hook.step()
+                # 파일 이벤트, 재시도 등록, 재확인 시각, 중지 신호 중 하나가 올 때까지 잠든다.
+                next_file = wait_for_next_file(stop_event)
+                if next_file is None:
+                    continue
+                filepath, event_type, trace = next_file
                 # 파일 처리 함수 호출
                 backend_logger.info(f"파일 처리 시작: {os.path.basename(filepath)}")
                 process_file(
@@ -1018,11 +2367,12 @@ def run_monitoring(
                     log_func_threadsafe,
                     extracted_result_callback=extracted_result_callback,
                     event_type=event_type,
+                    trace=trace,
                 )
                 backend_logger.info(f"파일 처리 완료: {os.path.basename(filepath)}")
-                file_queue.task_done() # 큐 작업 완료 알림
-            except queue.Empty:
-                stop_event.wait(timeout=0.5) # 큐 비었으면 CPU 사용 줄이며 대기
+                # 백엔드 캐시는 이 스레드만 고치므로 정리도 여기서 한다. (처리할 때만 커진다)
+                for eviction in memory_budget.maybe_enforce("backend"):
+                    log_func_threadsafe(f"백엔드: 메모리 예산 정리 - {format_memory_eviction(eviction)}")
             except Exception as e: # 개별 파일 처리 오류가 루프 중단시키지 않도록
                  log_func_threadsafe(f"오류: 파일 처리 루프 내 예외 - {e}\n{traceback.format_exc()}")
                  backend_logger.error(f"파일 처리 루프 내 예외: {e}", exc_info=True)
@@ -1042,7 +2392,21 @@ def run_monitoring(
             backend_logger.warning(f"Observer 스레드 join 중 오류: {e}")
         log_func_threadsafe("백엔드: 감시자 종료 완료.")
         backend_logger.info("감시자 종료 완료")
+        if drain_timeout_seconds > 0:
+            drained_count = drain_pending_files(
+                config,
+                google_services,
+                log_func_threadsafe,
+                drain_timeout_seconds,
+                extracted_result_callback=extracted_result_callback,
+            )
+            log_func_threadsafe(f"백엔드: 남은 파일 {drained_count}건 처리 후 종료합니다.")
         save_line_cache(log_func_threadsafe) # 최종 라인 캐시 저장
         flush_processed_state_save(log_func_threadsafe) # 최종 처리 상태 저장
+        timeseries_recorder.stop()
+        monitoring_profile_hook.detach()
+        catchup_pool.shutdown()
+        history_index.close()
+        dedupe_filter.close()
         log_func_threadsafe("백엔드: 모든 작업 완료.")
         backend_logger.info("모든 작업 완료")
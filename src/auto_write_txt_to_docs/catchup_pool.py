@@ -0,0 +1,196 @@
+"""긴 따라잡기 읽기에서 디코딩/줄 나누기/지문 계산을 프로세스 풀로 나눠 한다.
+
+장애 뒤 수백 MB가 밀려 있으면 이 작업이 GIL 아래 한 스레드에서 CPU를 다 쓴다.
+부모는 줄바꿈 경계에 맞춘 (파일, 시작, 끝) 조각만 넘기고, 작업자는 파일을 mmap으로 직접 읽어
+조각마다 줄 지문 배열과 줄 위치(시작 오프셋, 길이) 배열만 돌려준다. 중복 판정과 순서는
+부모가 정하고, 통과한 줄의 내용만 부모가 위치로 다시 읽어 디코딩한다. (LineSpans.fetch)
+
+작업자 프로세스가 가져오므로 이 모듈은 표준 라이브러리만 쓴다.
+"""
+
+import hashlib
+import mmap
+import os
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+
+CHUNK_BYTES = 8 * 1024 * 1024
+DEFAULT_THRESHOLD_MB = 64  # 이보다 많이 밀린 파일만 풀로 읽는다. 0이면 끈다.
+MAX_WORKERS = 4
+# 줄바꿈 바이트가 다중 바이트 문자 안에 나오지 않는 인코딩만 조각으로 나눌 수 있다. (UTF-16 제외)
+CHUNK_SAFE_ENCODINGS = ('utf-8', 'cp949', 'euc-kr')
+
+
+def normalize_threshold_mb(value):
+    try:
+        threshold_mb = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_THRESHOLD_MB
+    return max(0, threshold_mb)
+
+
+class LineSpans:
+    """파일 안 줄 위치 목록. 필요한 줄만 fetch()로 읽는다."""
+
+    __slots__ = ("filepath", "starts", "lengths")
+
+    def __init__(self, filepath, starts, lengths):
+        self.filepath = filepath
+        self.starts = starts
+        self.lengths = lengths
+
+    def __len__(self):
+        return len(self.starts)
+
+    def fetch(self, indexes):
+        """지정한 줄의 바이트를 순서대로 읽는다. 파일은 읽는 동안만 연다."""
+        if not indexes:
+            return []
+        starts = self.starts
+        lengths = self.lengths
+        with open(self.filepath, 'rb') as source_file:
+            with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return [mapped[starts[index]:starts[index] + lengths[index]] for index in indexes]
+
+    def __iter__(self):
+        return iter(self.fetch(range(len(self.starts))))
+
+
+def plan_chunks(filepath, start_offset, end_offset, chunk_bytes=CHUNK_BYTES):
+    """[start_offset, end_offset)를 줄바꿈 바로 뒤에서 끊은 조각 목록으로 나눈다."""
+    boundaries = [start_offset]
+    with open(filepath, 'rb') as source_file:
+        with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            position = start_offset + chunk_bytes
+            while position < end_offset:
+                newline_position = mapped.find(b'\n', position, end_offset)
+                if newline_position < 0:
+                    break
+                boundaries.append(newline_position + 1)
+                position = newline_position + 1 + chunk_bytes
+    if boundaries[-1] != end_offset:
+        boundaries.append(end_offset)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def fingerprint_chunk(filepath, start_offset, end_offset, encodings):
+    """작업자에서 실행한다. (인코딩, 지문 배열, 시작 오프셋 배열, 길이 배열)을 반환한다.
+
+    ASCII만 있는 조각은 어느 인코딩으로도 같으므로 인코딩 자리에 None을 돌려준다.
+    주어진 인코딩 어느 것으로도 디코딩하지 못하면 인코딩 자리에 False를 돌려준다.
+    지문은 backend_processor.hash_line_for_dedupe와 같은 값(str.strip()한 줄의 UTF-8 blake2b)이다.
+    """
+    with open(filepath, 'rb') as source_file:
+        with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            chunk = mapped[start_offset:end_offset]
+    if b'\x00' in chunk:  # UTF-16으로 보이면 부모가 디코딩 우선 경로로 읽는다.
+        return False, array('Q'), array('Q'), array('Q')
+    if chunk.isascii():
+        return (None,) + fingerprint_chunk_lines(chunk, start_offset, None)
+    for encoding in encodings:
+        try:
+            return (encoding,) + fingerprint_chunk_lines(chunk, start_offset, encoding)
+        except UnicodeDecodeError:
+            continue
+    return False, array('Q'), array('Q'), array('Q')
+
+
+def fingerprint_chunk_lines(chunk, start_offset, encoding):
+    blake2b = hashlib.blake2b
+    from_bytes = int.from_bytes
+    fingerprints = array('Q')
+    starts = array('Q')
+    lengths = array('Q')
+    position = start_offset
+    for raw_line in chunk.split(b'\n'):
+        line_start = position
+        position += len(raw_line) + 1
+        line = raw_line.strip()
+        if not line:
+            continue
+        if encoding is None:
+            data = line
+        else:
+            text = line.decode(encoding)
+            normalized_text = text.strip()
+            if not normalized_text:
+                continue
+            if encoding == 'utf-8' and len(normalized_text) == len(text):
+                data = line
+            else:
+                data = normalized_text.encode('utf-8')
+        fingerprints.append(from_bytes(blake2b(data, digest_size=8).digest(), 'little'))
+        starts.append(line_start + len(raw_line) - len(raw_line.lstrip()))
+        lengths.append(len(line))
+    return fingerprints, starts, lengths
+
+
+class CatchupPool:
+    """첫 사용 때 프로세스 풀을 만들고 감시 엔진이 끝날 때 닫는다."""
+
+    def __init__(self, max_workers=None, context=None, chunk_bytes=CHUNK_BYTES):
+        self.max_workers = max_workers or min(MAX_WORKERS, os.cpu_count() or 1)
+        self.context = context
+        self.chunk_bytes = chunk_bytes
+        self.executor = None
+        self.executor_lock = threading.Lock()  # asyncio 엔진은 읽기 작업자 여러 개가 동시에 부른다.
+        self.threshold_bytes = DEFAULT_THRESHOLD_MB * 1024 * 1024
+
+    def configure(self, threshold_mb):
+        self.threshold_bytes = normalize_threshold_mb(threshold_mb) * 1024 * 1024
+
+    def should_use(self, backlog_bytes):
+        # CPU가 하나면 프로세스를 나눠도 빨라지지 않고 복사 비용만 든다.
+        return bool(self.threshold_bytes) and backlog_bytes >= self.threshold_bytes and (os.cpu_count() or 1) > 1
+
+    def get_executor(self):
+        with self.executor_lock:
+            if self.executor is None:
+                # Windows와 같은 동작을 하도록 spawn으로 띄운다. (fork한 자식이 감시 스레드 잠금을 물려받지 않게)
+                self.executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=self.context or multiprocessing.get_context("spawn")
+                )
+            return self.executor
+
+    def fingerprint_file_range(self, filepath, start_offset, end_offset, known_encoding=None):
+        """(LineSpans, 지문 목록, 인코딩)을 반환한다. 조각마다 인코딩이 다르거나 디코딩할 수 없으면 None"""
+        encodings = [known_encoding] if known_encoding in CHUNK_SAFE_ENCODINGS else []
+        encodings += [encoding for encoding in CHUNK_SAFE_ENCODINGS if encoding not in encodings]
+        chunks = plan_chunks(filepath, start_offset, end_offset, self.chunk_bytes)
+        results = list(self.get_executor().map(
+            fingerprint_chunk,
+            [filepath] * len(chunks),
+            [chunk_start for chunk_start, _chunk_end in chunks],
+            [chunk_end for _chunk_start, chunk_end in chunks],
+            [encodings] * len(chunks),
+        ))
+        chunk_encodings = {encoding for encoding, _fingerprints, _starts, _lengths in results if encoding is not None}
+        if False in chunk_encodings or len(chunk_encodings) > 1:
+            return None
+        encoding = chunk_encodings.pop() if chunk_encodings else None
+        fingerprints = []
+        starts = array('Q')
+        lengths = array('Q')
+        for _encoding, chunk_fingerprints, chunk_starts, chunk_lengths in results:
+            fingerprints.extend(chunk_fingerprints)
+            starts.extend(chunk_starts)
+            lengths.extend(chunk_lengths)
+        return LineSpans(filepath, starts, lengths), fingerprints, encoding
+
+    def shutdown(self):
+        with self.executor_lock:
+            executor, self.executor = self.executor, None
+        if executor is None:
+            return
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            # cancel_futures는 3.9부터 있다. 그 전에는 남은 조각까지 끝내고 닫는다.
+            executor.shutdown(wait=True)
+
+
+catchup_pool = CatchupPool()
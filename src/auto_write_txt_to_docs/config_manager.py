@@ -2,6 +2,37 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from src.auto_write_txt_to_docs.catchup_pool import DEFAULT_THRESHOLD_MB, normalize_threshold_mb
+from src.auto_write_txt_to_docs.dedupe_filter import (
+    DEFAULT_FALSE_POSITIVE_RATE as DEFAULT_LONG_TERM_DEDUPE_FALSE_POSITIVE_RATE,
+    DEFAULT_GENERATION_DAYS as DEFAULT_LONG_TERM_DEDUPE_GENERATION_DAYS,
+    DEFAULT_GENERATIONS as DEFAULT_LONG_TERM_DEDUPE_GENERATIONS,
+    normalize_false_positive_rate,
+    normalize_generation_days,
+    normalize_generations,
+)
+from src.auto_write_txt_to_docs.history_index import (
+    DEFAULT_MAX_LINES as DEFAULT_HISTORY_MAX_LINES,
+    DEFAULT_RETENTION_DAYS as DEFAULT_HISTORY_RETENTION_DAYS,
+    normalize_max_lines,
+    normalize_retention_days,
+)
+from src.auto_write_txt_to_docs.latency_tracing import (
+    DEFAULT_LATENCY_LOG_SAMPLE_RATE,
+    normalize_latency_sample_rate,
+)
+from src.auto_write_txt_to_docs.memory_budget import DEFAULT_MEMORY_BUDGET_MB, normalize_memory_budget_mb
+from src.auto_write_txt_to_docs.monitoring_config import (
+    DEFAULT_DEDUPE_SCOPE,
+    DEFAULT_MONITORING_ENGINE,
+    normalize_dedupe_scope,
+    normalize_dedupe_ttl_seconds,
+    normalize_monitoring_engine,
+)
+from src.auto_write_txt_to_docs.notification_aggregator import (
+    DEFAULT_NOTIFICATION_WINDOW_SECONDS,
+    normalize_notification_window_seconds,
+)
 from src.auto_write_txt_to_docs.path_utils import CONFIG_FILE_STR, LEGACY_CONFIG_FILE_STR
 
 
@@ -19,14 +50,50 @@ CONFIG_DEFAULTS = {
     "regex_pattern": "",
     "appearance_mode": "System",
     "max_cache_size": 10000,
+    "log_levels": {},
+    "notification_window_seconds": DEFAULT_NOTIFICATION_WINDOW_SECONDS,
+    "latency_log_sample_rate": DEFAULT_LATENCY_LOG_SAMPLE_RATE,
+    "memory_budget_mb": DEFAULT_MEMORY_BUDGET_MB,
+    "isolate_backend_process": False,
+    "monitoring_engine": DEFAULT_MONITORING_ENGINE,
+    "catchup_pool_threshold_mb": DEFAULT_THRESHOLD_MB,
+    "warm_dedupe_from_document": False,
+    "history_retention_days": DEFAULT_HISTORY_RETENTION_DAYS,
+    "history_max_lines": DEFAULT_HISTORY_MAX_LINES,
+    "dedupe_scope": DEFAULT_DEDUPE_SCOPE,
+    "dedupe_ttl_seconds": 0,
+    "long_term_dedupe": False,
+    "long_term_dedupe_false_positive_rate": DEFAULT_LONG_TERM_DEDUPE_FALSE_POSITIVE_RATE,
+    "long_term_dedupe_generation_days": DEFAULT_LONG_TERM_DEDUPE_GENERATION_DAYS,
+    "long_term_dedupe_generations": DEFAULT_LONG_TERM_DEDUPE_GENERATIONS,
 }
 
+# 설정 화면에 입력 칸이 없어 설정 파일에서만 바꾸는 고급 설정 키
+ADVANCED_CONFIG_KEYS = (
+    "log_levels",
+    "notification_window_seconds",
+    "latency_log_sample_rate",
+    "memory_budget_mb",
+    "isolate_backend_process",
+    "monitoring_engine",
+    "catchup_pool_threshold_mb",
+    "warm_dedupe_from_document",
+    "history_retention_days",
+    "history_max_lines",
+    "dedupe_scope",
+    "dedupe_ttl_seconds",
+    "long_term_dedupe",
+    "long_term_dedupe_false_positive_rate",
+    "long_term_dedupe_generation_days",
+    "long_term_dedupe_generations",
+)
+
 BACKUP_VERSION = "1.0"
 
 
 def get_default_config():
     """기본 설정값 사본을 반환한다."""
-    return dict(CONFIG_DEFAULTS)
+    return {key: (dict(value) if isinstance(value, dict) else value) for key, value in CONFIG_DEFAULTS.items()}
 
 
 def normalize_config_data(config_data):
@@ -45,6 +112,48 @@ def normalize_config_data(config_data):
     except (TypeError, ValueError):
         normalized_config["max_cache_size"] = CONFIG_DEFAULTS["max_cache_size"]
 
+    normalized_config["notification_window_seconds"] = normalize_notification_window_seconds(
+        normalized_config["notification_window_seconds"]
+    )
+
+    normalized_config["latency_log_sample_rate"] = normalize_latency_sample_rate(
+        normalized_config["latency_log_sample_rate"]
+    )
+
+    normalized_config["memory_budget_mb"] = normalize_memory_budget_mb(normalized_config["memory_budget_mb"])
+
+    # 문자열 "false"가 켜짐으로 읽히지 않도록 진짜 True만 켜짐으로 본다.
+    normalized_config["isolate_backend_process"] = normalized_config["isolate_backend_process"] is True
+    normalized_config["monitoring_engine"] = normalize_monitoring_engine(normalized_config["monitoring_engine"])
+    normalized_config["catchup_pool_threshold_mb"] = normalize_threshold_mb(
+        normalized_config["catchup_pool_threshold_mb"]
+    )
+    normalized_config["warm_dedupe_from_document"] = normalized_config["warm_dedupe_from_document"] is True
+    normalized_config["history_retention_days"] = normalize_retention_days(normalized_config["history_retention_days"])
+    normalized_config["history_max_lines"] = normalize_max_lines(normalized_config["history_max_lines"])
+    normalized_config["dedupe_scope"] = normalize_dedupe_scope(normalized_config["dedupe_scope"])
+    normalized_config["dedupe_ttl_seconds"] = normalize_dedupe_ttl_seconds(normalized_config["dedupe_ttl_seconds"])
+    normalized_config["long_term_dedupe"] = normalized_config["long_term_dedupe"] is True
+    normalized_config["long_term_dedupe_false_positive_rate"] = normalize_false_positive_rate(
+        normalized_config["long_term_dedupe_false_positive_rate"]
+    )
+    normalized_config["long_term_dedupe_generation_days"] = normalize_generation_days(
+        normalized_config["long_term_dedupe_generation_days"]
+    )
+    normalized_config["long_term_dedupe_generations"] = normalize_generations(
+        normalized_config["long_term_dedupe_generations"]
+    )
+
+    log_levels = normalized_config["log_levels"]
+    if isinstance(log_levels, dict):
+        normalized_config["log_levels"] = {
+            str(logger_name): str(level_name).upper()
+            for logger_name, level_name in log_levels.items()
+            if isinstance(logger_name, str) and isinstance(level_name, str)
+        }
+    else:
+        normalized_config["log_levels"] = {}
+
     return normalized_config
 
 
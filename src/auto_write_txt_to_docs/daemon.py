@@ -0,0 +1,196 @@
+"""GUI 없이 감시 엔진만 실행하는 헤드리스 데몬.
+
+customtkinter, PIL, pystray를 가져오지 않으므로 화면이 없는 리눅스 서버에서도 실행된다.
+
+- SIGTERM / SIGINT: 감시자를 멈추고 큐에 남은 파일을 마저 처리한 뒤 상태를 저장하고 종료한다.
+- SIGHUP: 설정 파일을 다시 읽어 감시 엔진을 재시작한다. 새 설정이 잘못되었으면 이전 설정을 유지한다.
+
+실행 예::
+
+    auto_write_daemon --config ~/.config/MessengerDocsAutoWriter/config.json --log-format json
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+
+from .async_engine import select_monitoring_engine
+from .backend_processor import MonitoringStopEvent
+from .config_manager import load_app_config
+from .logging_pipeline import apply_log_levels
+from .monitoring_config import MonitoringConfigError, build_monitoring_config
+from .path_utils import CONFIG_FILE_STR, LEGACY_CONFIG_FILE_STR
+
+
+DAEMON_LOGGER_NAME = "auto_write_daemon"
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 20.0
+ENGINE_JOIN_POLL_SECONDS = 0.5  # 메인 스레드가 시그널을 받을 수 있도록 나눠 기다린다.
+EXIT_OK = 0
+EXIT_ENGINE_STOPPED = 1
+EXIT_CONFIG_ERROR = 2
+
+daemon_logger = logging.getLogger(DAEMON_LOGGER_NAME)
+
+
+class JsonLogFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나씩 출력한다. (journald, 로그 수집기용)"""
+
+    def format(self, record):
+        payload = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def configure_stdout_logging(log_format="text", stream=None):
+    """데몬 로그를 표준 출력으로 보낸다."""
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if log_format == "json":
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    daemon_logger.handlers = [handler]
+    daemon_logger.setLevel(logging.INFO)
+    daemon_logger.propagate = False
+    return handler
+
+
+class MonitoringDaemon:
+    """감시 엔진을 작업 스레드에서 돌리고, 메인 스레드는 시그널을 받아 중지/재시작을 요청한다."""
+
+    def __init__(
+        self,
+        config_path=CONFIG_FILE_STR,
+        legacy_config_path=LEGACY_CONFIG_FILE_STR,
+        drain_timeout_seconds=DEFAULT_DRAIN_TIMEOUT_SECONDS,
+        run_func=None,
+        stop_event_factory=MonitoringStopEvent,
+    ):
+        self.config_path = config_path
+        self.legacy_config_path = legacy_config_path
+        self.drain_timeout_seconds = drain_timeout_seconds
+        self.run_func = run_func
+        self.stop_event_factory = stop_event_factory
+        self.shutdown_requested = threading.Event()
+        self.reload_requested = threading.Event()
+        self.stop_event = None
+
+    def log(self, message):
+        daemon_logger.info(message)
+
+    def load_monitoring_config(self):
+        """설정 파일을 읽어 감시 엔진 설정을 만든다. 로그 레벨 설정도 함께 적용한다."""
+        try:
+            config_data, resolved_path, _loaded_from_legacy, config_exists = load_app_config(
+                self.config_path, self.legacy_config_path
+            )
+        except (OSError, ValueError) as error:
+            raise MonitoringConfigError(f"설정 파일을 읽지 못했습니다: {error}") from error
+        if not config_exists:
+            raise MonitoringConfigError(f"설정 파일이 없습니다: {resolved_path}")
+        apply_log_levels(config_data.get("log_levels"))
+        monitoring_config = build_monitoring_config(config_data)
+        self.log(f"설정 로드 완료: {resolved_path} (감시 폴더: {monitoring_config['watch_folder']})")
+        return monitoring_config
+
+    def request_shutdown(self, signum=None, _frame=None):
+        if signum is not None:
+            self.log(f"종료 신호 수신({signal.Signals(signum).name}): 남은 파일을 처리한 뒤 종료합니다.")
+        self.shutdown_requested.set()
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    def request_reload(self, signum=None, _frame=None):
+        if signum is not None:
+            self.log(f"설정 다시 읽기 신호 수신({signal.Signals(signum).name}).")
+        self.reload_requested.set()
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGTERM, self.request_shutdown)
+        signal.signal(signal.SIGINT, self.request_shutdown)
+        if hasattr(signal, "SIGHUP"):  # Windows에는 SIGHUP이 없다.
+            signal.signal(signal.SIGHUP, self.request_reload)
+
+    def run_engine_once(self, monitoring_config):
+        """감시 엔진을 한 번 실행하고 멈출 때까지 기다린다."""
+        self.reload_requested.clear()
+        self.stop_event = self.stop_event_factory()
+        if self.shutdown_requested.is_set():
+            return
+        # run_func를 주지 않으면 설정의 monitoring_engine에 맞는 엔진을 고른다.
+        run_func = self.run_func or select_monitoring_engine(monitoring_config)
+        engine_thread = threading.Thread(
+            target=run_func,
+            args=(monitoring_config, self.log, self.stop_event),
+            kwargs={"drain_timeout_seconds": self.drain_timeout_seconds},
+            name="MonitoringEngine",
+        )
+        engine_thread.start()
+        while engine_thread.is_alive():
+            engine_thread.join(ENGINE_JOIN_POLL_SECONDS)
+
+    def run(self):
+        """종료 코드를 반환한다. (0: 신호로 정상 종료, 1: 엔진이 스스로 멈춤, 2: 설정 오류)"""
+        try:
+            monitoring_config = self.load_monitoring_config()
+        except MonitoringConfigError as error:
+            daemon_logger.error(f"감시를 시작할 수 없습니다: {error}")
+            return EXIT_CONFIG_ERROR
+
+        while not self.shutdown_requested.is_set():
+            self.run_engine_once(monitoring_config)
+            if self.shutdown_requested.is_set():
+                break
+            if not self.reload_requested.is_set():
+                daemon_logger.error("감시 엔진이 중지 요청 없이 종료되었습니다. 로그를 확인하세요.")
+                return EXIT_ENGINE_STOPPED
+            try:
+                monitoring_config = self.load_monitoring_config()
+            except MonitoringConfigError as error:
+                daemon_logger.error(f"새 설정을 적용하지 못해 이전 설정으로 다시 시작합니다: {error}")
+        self.log("데몬 종료.")
+        return EXIT_OK
+
+
+def build_argument_parser():
+    parser = argparse.ArgumentParser(
+        prog="auto_write_daemon",
+        description="GUI 없이 폴더를 감시해 Google Docs에 기록합니다. (SIGTERM: 정리 후 종료, SIGHUP: 설정 다시 읽기)",
+    )
+    parser.add_argument("--config", default=CONFIG_FILE_STR, help=f"설정 파일 경로 (기본값: {CONFIG_FILE_STR})")
+    parser.add_argument("--log-format", choices=("text", "json"), default="text", help="표준 출력 로그 형식")
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=DEFAULT_DRAIN_TIMEOUT_SECONDS,
+        help="종료 신호 뒤 남은 파일을 처리할 최대 시간(초)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_argument_parser().parse_args(argv)
+    configure_stdout_logging(args.log_format)
+    daemon = MonitoringDaemon(
+        config_path=args.config,
+        legacy_config_path=args.config if args.config != CONFIG_FILE_STR else LEGACY_CONFIG_FILE_STR,
+        drain_timeout_seconds=max(0.0, args.drain_timeout),
+    )
+    daemon.install_signal_handlers()
+    daemon.log(f"헤드리스 데몬 시작 (PID {os.getpid()})")
+    return daemon.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""정확한 라인 캐시(added_lines_cache)에서 밀려난 오래전 줄까지 거르는 장기 중복 필터.
+
+줄 지문(64비트)을 Bloom 필터 비트열에 넣고, 비트열은 캐시 폴더의 파일을 mmap으로 붙여 쓴다.
+시작할 때 비트열을 읽어 들이지 않으므로 필터 크기와 상관없이 바로 열린다.
+
+필터는 기간(세대)별 파일로 나뉜다. 가장 최근 세대에만 넣고, 세대가 기간을 넘기거나 목표 오탐률로
+담을 수 있는 줄 수(GENERATION_CAPACITY)를 채우면 새 세대를 연다. 보관 기간(세대 기간 x 세대 수)
+동안 아무 줄도 들어가지 않은 세대 파일은 지운다. 확인은 모든 세대를 보므로 세대 하나의 오탐률은
+목표 오탐률을 세대 수로 나눈 값으로 잡는다.
+
+상태(read_dedupe_filter_status)는 파일 머리만 읽으므로 GUI나 다른 프로세스에서 불러도 된다.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+
+DEDUPE_FILTER_DIR_NAME = "dedupe_filter"
+FILTER_FILE_SUFFIX = ".bloom"
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+MAX_FALSE_POSITIVE_RATE = 0.5
+DEFAULT_GENERATION_DAYS = 30
+DEFAULT_GENERATIONS = 12  # 기본 보관 기간은 약 1년
+MAX_GENERATIONS = 120
+GENERATION_CAPACITY = 1_000_000  # 세대 하나가 목표 오탐률을 지키며 담는 줄 수
+MAX_GENERATION_FILES = 256  # 짧은 기간에 줄이 몰려 세대가 계속 늘어도 디스크 사용량을 묶어 둔다.
+
+# magic, 버전, 해시 개수, 비트 수, 넣은 줄 수, 만든 시각, 마지막으로 넣은 시각
+FILTER_HEADER = struct.Struct("<8sIIQQdd")
+FILTER_HEADER_SIZE = 64
+FILTER_MAGIC = b"DDBLOOM1"
+FILTER_VERSION = 1
+LOW_32_BITS = 0xFFFFFFFF
+
+
+def normalize_false_positive_rate(value):
+    """목표 오탐률을 (0, 0.5] 실수로 맞춘다. 잘못된 값은 기본값으로 바꾼다."""
+    try:
+        rate = float(str(value).strip())
+    except (TypeError, ValueError):
+        return DEFAULT_FALSE_POSITIVE_RATE
+    if not 0 < rate <= MAX_FALSE_POSITIVE_RATE:
+        return DEFAULT_FALSE_POSITIVE_RATE
+    return rate
+
+
+def normalize_generation_days(value):
+    """세대 하나의 기간(일)을 1 이상 정수로 맞춘다. 잘못된 값은 기본값으로 바꾼다."""
+    try:
+        days = int(str(value).strip())
+    except (TypeError, ValueError):
+        return DEFAULT_GENERATION_DAYS
+    return days if days > 0 else DEFAULT_GENERATION_DAYS
+
+
+def normalize_generations(value):
+    """보관할 세대 수를 1~MAX_GENERATIONS 정수로 맞춘다. 잘못된 값은 기본값으로 바꾼다."""
+    try:
+        generations = int(str(value).strip())
+    except (TypeError, ValueError):
+        return DEFAULT_GENERATIONS
+    if generations <= 0:
+        return DEFAULT_GENERATIONS
+    return min(generations, MAX_GENERATIONS)
+
+
+def get_dedupe_filter_dir(base_dir, dedupe_scope=None, docs_id=None):
+    """필터 폴더 경로. 문서별 중복 제거 범위면 라인 캐시처럼 대상 문서마다 따로 둔다."""
+    if dedupe_scope == "document" and docs_id:
+        return f"{base_dir}.{hashlib.sha256(str(docs_id).encode('utf-8')).hexdigest()[:16]}"
+    return base_dir
+
+
+def size_bloom_filter(capacity, false_positive_rate):
+    """capacity개를 넣었을 때 오탐률을 맞추는 (비트 수, 해시 개수). 비트 수는 8의 배수다."""
+    bit_count = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+    bit_count = max(64, (bit_count + 7) // 8 * 8)
+    hash_count = max(1, round(bit_count / capacity * math.log(2)))
+    return bit_count, hash_count
+
+
+def estimate_false_positive_rate(bit_count, hash_count, item_count):
+    """넣은 줄 수로 추정한 오탐률. (1 - e^(-kn/m))^k"""
+    if item_count <= 0 or bit_count <= 0:
+        return 0.0
+    return (1.0 - math.exp(-hash_count * item_count / bit_count)) ** hash_count
+
+
+class BloomGeneration:
+    """세대 파일 하나. 머리(64바이트) 뒤에 비트열이 이어지고, 파일 전체를 mmap으로 붙인다."""
+
+    def __init__(self, path, file_handle, mapped, hash_count, bit_count, item_count, created_at, last_added_at):
+        self.path = path
+        self.file_handle = file_handle
+        self.mapped = mapped
+        self.hash_count = hash_count
+        self.bit_count = bit_count
+        self.item_count = item_count
+        self.created_at = created_at
+        self.last_added_at = last_added_at
+
+    @classmethod
+    def create(cls, path, capacity, false_positive_rate, now):
+        bit_count, hash_count = size_bloom_filter(capacity, false_positive_rate)
+        with open(path, "wb") as filter_file:
+            filter_file.write(FILTER_HEADER.pack(FILTER_MAGIC, FILTER_VERSION, hash_count, bit_count, 0, now, now))
+            # 비트열은 0으로 채운 빈 공간으로 늘린다. (지원하는 파일 시스템에서는 실제로 쓰지 않는다)
+            filter_file.truncate(FILTER_HEADER_SIZE + bit_count // 8)
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path):
+        """세대 파일을 붙인다. 머리나 크기가 맞지 않으면 ValueError."""
+        file_handle = open(path, "r+b")
+        try:
+            header = read_filter_header(file_handle)
+            _magic, _version, hash_count, bit_count, item_count, created_at, last_added_at = header
+            if os.fstat(file_handle.fileno()).st_size != FILTER_HEADER_SIZE + bit_count // 8:
+                raise ValueError("필터 파일 크기가 머리와 다릅니다.")
+            mapped = mmap.mmap(file_handle.fileno(), 0)
+        except Exception:
+            file_handle.close()
+            raise
+        return cls(path, file_handle, mapped, hash_count, bit_count, item_count, created_at, last_added_at)
+
+    def first_position_and_step(self, fingerprint):
+        # 지문이 이미 고른 64비트 해시이므로 두 32비트 반쪽으로 이중 해싱한다. (Kirsch-Mitzenmacher)
+        bit_count = self.bit_count
+        return (fingerprint & LOW_32_BITS) % bit_count, ((fingerprint >> 32) | 1) % bit_count
+
+    def __contains__(self, fingerprint):
+        mapped = self.mapped
+        bit_count = self.bit_count
+        position, step = self.first_position_and_step(fingerprint)
+        for _ in range(self.hash_count):
+            if not (mapped[FILTER_HEADER_SIZE + (position >> 3)] >> (position & 7)) & 1:
+                return False
+            position += step
+            if position >= bit_count:
+                position -= bit_count
+        return True
+
+    def add(self, fingerprint, now):
+        """지문을 넣는다. 새로 켠 비트가 있을 때만 줄 수를 늘린다."""
+        mapped = self.mapped
+        bit_count = self.bit_count
+        position, step = self.first_position_and_step(fingerprint)
+        added = False
+        for _ in range(self.hash_count):
+            byte_index = FILTER_HEADER_SIZE + (position >> 3)
+            current = mapped[byte_index]
+            bit = 1 << (position & 7)
+            if not current & bit:
+                mapped[byte_index] = current | bit
+                added = True
+            position += step
+            if position >= bit_count:
+                position -= bit_count
+        if added:
+            self.item_count += 1
+        self.last_added_at = now
+        return added
+
+    def write_header(self):
+        """줄 수와 마지막으로 넣은 시각을 매핑된 머리에 쓴다. 다른 프로세스의 상태 읽기에 바로 보인다."""
+        FILTER_HEADER.pack_into(
+            self.mapped, 0, FILTER_MAGIC, FILTER_VERSION, self.hash_count, self.bit_count,
+            self.item_count, self.created_at, self.last_added_at,
+        )
+
+    def flush(self):
+        self.write_header()
+        self.mapped.flush()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.mapped.close()
+            self.file_handle.close()
+
+
+def read_filter_header(file_handle):
+    """세대 파일 머리를 읽어 확인한다. 형식이 다르면 ValueError."""
+    header = file_handle.read(FILTER_HEADER.size)
+    if len(header) != FILTER_HEADER.size:
+        raise ValueError("필터 파일 머리가 잘렸습니다.")
+    unpacked = FILTER_HEADER.unpack(header)
+    magic, version, hash_count, bit_count = unpacked[:4]
+    if magic != FILTER_MAGIC or version != FILTER_VERSION or hash_count <= 0 or bit_count <= 0 or bit_count % 8:
+        raise ValueError("필터 파일 형식이 다릅니다.")
+    return unpacked
+
+
+def list_generation_files(directory):
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return sorted(os.path.join(directory, name) for name in names if name.endswith(FILTER_FILE_SUFFIX))
+
+
+def summarize_generations(generations):
+    """세대별 (비트 수, 해시 개수, 줄 수) 목록으로 상태 딕셔너리를 만든다."""
+    no_false_positive = 1.0
+    for bit_count, hash_count, item_count in generations:
+        no_false_positive *= 1.0 - estimate_false_positive_rate(bit_count, hash_count, item_count)
+    return {
+        "generation_count": len(generations),
+        "item_count": sum(item_count for _bit_count, _hash_count, item_count in generations),
+        "bytes": sum(FILTER_HEADER_SIZE + bit_count // 8 for bit_count, _hash_count, _item_count in generations),
+        # 모든 세대를 확인하므로 어느 한 세대에서라도 오탐이 나면 전체 오탐이다.
+        "estimated_false_positive_rate": 1.0 - no_false_positive,
+    }
+
+
+def read_dedupe_filter_status(directory):
+    """세대 파일 머리만 읽어 상태를 만든다. 필터가 없으면 None"""
+    generations = []
+    for path in list_generation_files(directory):
+        try:
+            with open(path, "rb") as filter_file:
+                _magic, _version, hash_count, bit_count, item_count, _created_at, _last_added_at = (
+                    read_filter_header(filter_file)
+                )
+        except (OSError, ValueError):
+            continue
+        generations.append((bit_count, hash_count, item_count))
+    if not generations:
+        return None
+    return summarize_generations(generations)
+
+
+def format_dedupe_filter_status(status):
+    """상태 패널에 보일 한 줄 요약을 만든다."""
+    return (
+        f"장기 중복 필터 {status['item_count']:,}줄/{status['generation_count']}세대 "
+        f"{status['bytes'] / 1024 / 1024:.1f} MB · 오탐 약 {status['estimated_false_positive_rate']:.3%}"
+    )
+
+
+class GenerationalDedupeFilter:
+    """기간별 세대 파일로 나눈 Bloom 필터. 감시 엔진의 기록 단계(단일 작성자)에서 넣고 확인한다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.directory = None
+        self.generations = []  # 오래된 세대부터
+        self.false_positive_rate = DEFAULT_FALSE_POSITIVE_RATE
+        self.generation_seconds = DEFAULT_GENERATION_DAYS * 86400
+        self.generation_limit = DEFAULT_GENERATIONS
+        self.capacity = GENERATION_CAPACITY
+
+    def is_open(self):
+        return self.directory is not None
+
+    def open(self, directory, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE,
+             generation_days=DEFAULT_GENERATION_DAYS, generations=DEFAULT_GENERATIONS,
+             capacity=GENERATION_CAPACITY, log_func=None, now=None):
+        """세대 파일을 붙이고 보관 기간이 지난 세대는 지운다. 열린 세대 수를 반환한다."""
+        self.close()
+        now = time.time() if now is None else now
+        os.makedirs(directory, exist_ok=True)
+        with self.lock:
+            self.false_positive_rate = normalize_false_positive_rate(false_positive_rate)
+            self.generation_seconds = normalize_generation_days(generation_days) * 86400
+            self.generation_limit = normalize_generations(generations)
+            self.capacity = max(1, int(capacity))
+            loaded = []
+            for path in list_generation_files(directory):
+                try:
+                    loaded.append(BloomGeneration.open(path))
+                except (OSError, ValueError) as e:
+                    if log_func:
+                        log_func(f"경고: 장기 중복 필터 파일을 건너뜁니다 ({os.path.basename(path)}) - {e}")
+            loaded.sort(key=lambda generation: generation.created_at)
+            self.generations = loaded
+            self.directory = directory
+            self._drop_expired_generations(now)
+            return len(self.generations)
+
+    def _drop_expired_generations(self, now):
+        retention_seconds = self.generation_seconds * self.generation_limit
+        while self.generations and (
+            now - self.generations[0].last_added_at > retention_seconds
+            or len(self.generations) > MAX_GENERATION_FILES
+        ):
+            expired = self.generations.pop(0)
+            expired.close()
+            try:
+                os.remove(expired.path)
+            except OSError:
+                pass
+
+    def _writable_generation(self, now):
+        newest = self.generations[-1] if self.generations else None
+        if newest is None or newest.item_count >= self.capacity or now - newest.created_at >= self.generation_seconds:
+            path = os.path.join(self.directory, f"{int(now * 1000):015d}{FILTER_FILE_SUFFIX}")
+            while os.path.exists(path):
+                now += 0.001
+                path = os.path.join(self.directory, f"{int(now * 1000):015d}{FILTER_FILE_SUFFIX}")
+            per_generation_rate = self.false_positive_rate / self.generation_limit
+            newest = BloomGeneration.create(path, self.capacity, per_generation_rate, now)
+            self.generations.append(newest)
+            self._drop_expired_generations(now)
+        return newest
+
+    def add_many(self, fingerprints, now=None):
+        """지문을 가장 최근 세대에 넣는다. 세대가 차거나 기간이 지나면 새 세대를 연다."""
+        if not fingerprints or self.directory is None:
+            return
+        now = time.time() if now is None else now
+        with self.lock:
+            if self.directory is None:
+                return
+            generation = self._writable_generation(now)
+            for fingerprint in fingerprints:
+                if generation.item_count >= self.capacity:
+                    generation.write_header()
+                    generation = self._writable_generation(now)
+                generation.add(fingerprint, now)
+            # 비트는 이미 매핑된 파일에 있으므로 머리도 묶음마다 맞춰 둔다. (비정상 종료 뒤 줄 수가 모자라지 않게)
+            generation.write_header()
+
+    def find_known(self, fingerprints):
+        """어느 세대에라도 있는 지문만 골라 반환한다. (Bloom 필터라 오탐이 섞일 수 있다)"""
+        if not fingerprints or self.directory is None:
+            return []
+        with self.lock:
+            generations = self.generations[::-1]  # 최근 세대에서 먼저 찾는 경우가 많다.
+            return [
+                fingerprint for fingerprint in fingerprints
+                if any(fingerprint in generation for generation in generations)
+            ]
+
+    def status(self):
+        with self.lock:
+            if self.directory is None:
+                return None
+            return summarize_generations([
+                (generation.bit_count, generation.hash_count, generation.item_count) for generation in self.generations
+            ])
+
+    def flush(self):
+        with self.lock:
+            for generation in self.generations:
+                generation.flush()
+
+    def close(self):
+        with self.lock:
+            generations, self.generations = self.generations, []
+            self.directory = None
+        for generation in generations:
+            try:
+                generation.close()
+            except (OSError, ValueError):
+                pass
+
+
+dedupe_filter = GenerationalDedupeFilter()
@@ -0,0 +1,184 @@
+"""지원 요청에 첨부할 진단 정보 묶음(zip)을 만든다.
+
+각 항목은 순서대로 수집하며, 전체 제한 시간이 지나면 남은 항목은 건너뛰고
+그 사실을 summary.json에 남긴다. 항목 하나의 크기도 제한해 zip이 커지지 않게 한다.
+"""
+
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+import traceback
+import zipfile
+from datetime import datetime
+
+import psutil
+
+
+DIAGNOSTICS_TIME_LIMIT_SECONDS = 20.0
+DIAGNOSTICS_MAX_ENTRY_BYTES = 4 * 1024 * 1024
+DIAGNOSTICS_LOG_TAIL_BYTES = 512 * 1024
+DIAGNOSTICS_LOG_TAIL_FILES = 2
+TRACEMALLOC_SAMPLE_SECONDS = 2.0
+TRACEMALLOC_TOP_COUNT = 25
+TRUNCATED_MARKER = "\n... (크기 제한으로 이후 내용 생략)\n"
+
+
+def format_thread_dump(current_frames=sys._current_frames):
+    """모든 스레드의 현재 호출 스택을 텍스트로 만든다."""
+    threads_by_id = {thread.ident: thread for thread in threading.enumerate()}
+    sections = []
+    for thread_id, frame in current_frames().items():
+        thread = threads_by_id.get(thread_id)
+        if thread is not None:
+            title = f"스레드 {thread.name} (id={thread_id}, daemon={thread.daemon})"
+        else:
+            title = f"스레드 id={thread_id}"
+        sections.append(title + "\n" + "".join(traceback.format_stack(frame)))
+    return "\n".join(sections)
+
+
+def describe_file_sizes(paths):
+    """파일 경로별 크기(바이트)를 반환한다. 디렉터리는 안의 파일을 한 단계만 나열한다."""
+    sizes = {}
+    for path in paths:
+        if not path:
+            continue
+        if os.path.isdir(path):
+            try:
+                entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+            except OSError as error:
+                sizes[path] = f"읽기 실패: {error}"
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        sizes[entry.path] = entry.stat().st_size
+                except OSError:
+                    continue
+        else:
+            try:
+                sizes[path] = os.path.getsize(path)
+            except OSError:
+                sizes[path] = None
+    return sizes
+
+
+def collect_memory_report(sample_seconds=TRACEMALLOC_SAMPLE_SECONDS, top_count=TRACEMALLOC_TOP_COUNT, sleep=time.sleep):
+    """RSS와 tracemalloc 상위 할당 위치를 텍스트로 만든다."""
+    lines = []
+    try:
+        memory_info = psutil.Process().memory_info()
+        lines.append(f"RSS: {memory_info.rss / 1024 / 1024:.1f} MB, VMS: {memory_info.vms / 1024 / 1024:.1f} MB")
+    except Exception as error:
+        lines.append(f"psutil 메모리 정보 읽기 실패: {error}")
+
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        # 추적을 지금 켜면 이후 할당만 보이므로 잠시 기다린 뒤 찍는다.
+        tracemalloc.start()
+        sleep(sample_seconds)
+        lines.append(f"tracemalloc: 진단 시작 후 {sample_seconds:.0f}초 동안의 할당만 포함합니다.")
+    try:
+        snapshot = tracemalloc.take_snapshot()
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        if started_here:
+            tracemalloc.stop()
+    lines.append(f"tracemalloc 추적 중: {traced_current / 1024:.1f} KB (최대 {traced_peak / 1024:.1f} KB)")
+    lines.append("")
+    for index, statistic in enumerate(snapshot.statistics("lineno")[:top_count], start=1):
+        lines.append(f"{index:2d}. {statistic}")
+    return "\n".join(lines) + "\n"
+
+
+def read_log_tails(log_dir, file_count=DIAGNOSTICS_LOG_TAIL_FILES, tail_bytes=DIAGNOSTICS_LOG_TAIL_BYTES):
+    """가장 최근 .log 파일들의 끝부분을 {파일명: 텍스트}로 반환한다."""
+    try:
+        log_paths = [
+            os.path.join(log_dir, name) for name in os.listdir(log_dir) if name.endswith(".log")
+        ]
+    except OSError:
+        return {}
+    log_paths.sort(key=lambda path: os.path.getmtime(path), reverse=True)
+    tails = {}
+    for log_path in log_paths[:file_count]:
+        try:
+            with open(log_path, "rb") as log_file:
+                log_file.seek(0, os.SEEK_END)
+                file_size = log_file.tell()
+                log_file.seek(max(0, file_size - tail_bytes))
+                tails[os.path.basename(log_path)] = log_file.read().decode("utf-8", errors="replace")
+        except OSError:
+            continue
+    return tails
+
+
+def limit_text(text, max_bytes=DIAGNOSTICS_MAX_ENTRY_BYTES):
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return encoded
+    return encoded[:max_bytes].decode("utf-8", errors="ignore").encode("utf-8") + TRUNCATED_MARKER.encode("utf-8")
+
+
+def to_json_text(value):
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str)
+
+
+def build_diagnostics_bundle(
+    output_dir,
+    sections,
+    time_limit_seconds=DIAGNOSTICS_TIME_LIMIT_SECONDS,
+    max_entry_bytes=DIAGNOSTICS_MAX_ENTRY_BYTES,
+    clock=time.monotonic,
+    now=None,
+    metadata=None,
+):
+    """(zip 안 파일명, 수집 함수) 목록을 차례로 실행해 zip으로 묶고 경로를 반환한다.
+
+    수집 함수가 str이 아닌 값을 돌려주면 JSON으로 저장한다. 이름이 '/'로 끝나는 항목이
+    dict를 돌려주면 {파일명: 텍스트}로 보고 그 폴더 아래 여러 파일로 저장한다.
+    """
+    started_at = clock()
+    timestamp = now or datetime.now()
+    bundle_path = os.path.join(output_dir, f"diagnostics_{timestamp.strftime('%Y%m%d_%H%M%S')}.zip")
+    os.makedirs(output_dir, exist_ok=True)
+    summary = {
+        "created_at": timestamp.isoformat(timespec="seconds"),
+        "python": sys.version,
+        "platform": platform.platform(),
+        **(metadata or {}),
+        "sections": {},
+    }
+
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for entry_name, collect_func in sections:
+            if clock() - started_at > time_limit_seconds:
+                summary["sections"][entry_name] = {"status": "skipped", "reason": "제한 시간 초과"}
+                continue
+            section_started_at = clock()
+            try:
+                collected = collect_func()
+            except Exception as error:
+                summary["sections"][entry_name] = {
+                    "status": "error",
+                    "error": f"{type(error).__name__}: {error}",
+                }
+                continue
+
+            if entry_name.endswith("/") and isinstance(collected, dict):
+                for file_name, file_text in collected.items():
+                    bundle.writestr(entry_name + file_name, limit_text(str(file_text), max_entry_bytes))
+            else:
+                text = collected if isinstance(collected, str) else to_json_text(collected)
+                bundle.writestr(entry_name, limit_text(text, max_entry_bytes))
+            summary["sections"][entry_name] = {
+                "status": "ok",
+                "seconds": round(clock() - section_started_at, 3),
+            }
+        summary["total_seconds"] = round(clock() - started_at, 3)
+        bundle.writestr("summary.json", to_json_text(summary))
+    return bundle_path
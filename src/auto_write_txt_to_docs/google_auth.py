@@ -3,8 +3,10 @@ import logging
 import os
 from datetime import datetime
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -31,6 +33,25 @@ except ImportError:
         TOKEN_FILE_STR = "token.json"
         get_effective_credentials_path = None
 
+try:
+    from src.auto_write_txt_to_docs.metrics import (
+        DRIVE_API_CALLS_TOTAL,
+        DRIVE_API_ERRORS_TOTAL,
+        GOOGLE_SERVICE_BUILDS_TOTAL,
+        GOOGLE_TOKEN_REFRESH_FAILURES_TOTAL,
+        GOOGLE_TOKEN_REFRESH_TOTAL,
+        metrics_registry,
+    )
+except ImportError:
+    from .metrics import (
+        DRIVE_API_CALLS_TOTAL,
+        DRIVE_API_ERRORS_TOTAL,
+        GOOGLE_SERVICE_BUILDS_TOTAL,
+        GOOGLE_TOKEN_REFRESH_FAILURES_TOTAL,
+        GOOGLE_TOKEN_REFRESH_TOTAL,
+        metrics_registry,
+    )
+
 
 SCOPES = [
     "https://www.googleapis.com/auth/documents",
@@ -38,6 +59,15 @@ SCOPES = [
 ]
 
 
+token_refresh_counter = metrics_registry.counter(GOOGLE_TOKEN_REFRESH_TOTAL, "Google 토큰 자동 갱신 시도 수")
+token_refresh_failure_counter = metrics_registry.counter(
+    GOOGLE_TOKEN_REFRESH_FAILURES_TOTAL, "실패한 Google 토큰 자동 갱신 수"
+)
+service_build_counter = metrics_registry.counter(GOOGLE_SERVICE_BUILDS_TOTAL, "생성한 Google 서비스 객체 수")
+drive_api_calls_counter = metrics_registry.counter(DRIVE_API_CALLS_TOTAL, "Drive API 호출 수")
+drive_api_errors_counter = metrics_registry.counter(DRIVE_API_ERRORS_TOTAL, "실패한 Drive API 호출 수")
+
+
 class GoogleAuthActionRequired(Exception):
     """사용자 전면 작업이 필요한 인증 상태를 나타낸다."""
 
@@ -221,6 +251,7 @@ def authenticate(log_func, *, interactive_allowed=False):
         if creds and creds.expired and creds.refresh_token:
             log_func("백엔드: 인증 정보(토큰) 만료됨. 자동 갱신 시도...")
             auth_logger.info("토큰 만료됨. 갱신 시도.")
+            token_refresh_counter.inc()
             try:
                 creds.refresh(Request())
                 log_func("백엔드: 인증 정보(토큰) 갱신 성공.")
@@ -228,6 +259,7 @@ def authenticate(log_func, *, interactive_allowed=False):
                 _save_token(creds, token_path, log_func, auth_logger)
                 return creds
             except Exception as exc:
+                token_refresh_failure_counter.inc()
                 quarantined_path = quarantine_token_file(log_func, reason_code="refresh_failed")
                 if interactive_allowed:
                     return run_interactive_auth(log_func)
@@ -258,6 +290,11 @@ def authenticate(log_func, *, interactive_allowed=False):
     )
 
 
+def build_authorized_http_factory(creds):
+    """다른 스레드에서 쓸 새 인증 HTTP 연결을 만드는 함수를 돌려준다. httplib2 연결은 스레드 사이에 나눠 쓸 수 없다."""
+    return lambda: AuthorizedHttp(creds, http=httplib2.Http())
+
+
 def get_google_services(log_func, *, require_drive=True, interactive_allowed=False):
     """인증 후 Google 서비스 객체를 생성한다."""
     auth_logger = setup_google_auth_logging()
@@ -273,9 +310,12 @@ def get_google_services(log_func, *, require_drive=True, interactive_allowed=Fal
     try:
         log_func("백엔드: Google Docs 서비스 객체 생성 시도...")
         services["docs"] = build("docs", "v1", credentials=creds)
+        services["http_factory"] = build_authorized_http_factory(creds)
+        service_build_counter.inc()
         if require_drive:
             log_func("백엔드: Google Drive 서비스 객체 생성 시도...")
             services["drive"] = build("drive", "v3", credentials=creds)
+            service_build_counter.inc()
         log_func("백엔드: 필요한 Google 서비스 객체 생성 완료.")
         auth_logger.info(f"Google 서비스 객체 생성 완료 - drive 포함={require_drive}")
         return services
@@ -305,6 +345,7 @@ def create_google_document(log_func, title, services=None):
         "mimeType": "application/vnd.google-apps.document",
     }
 
+    drive_api_calls_counter.inc()
     try:
         created_document = google_services["drive"].files().create(
             body=request_body,
@@ -314,6 +355,7 @@ def create_google_document(log_func, title, services=None):
         auth_logger.info(f"새 Google Docs 문서 생성 완료: {created_document}")
         return created_document
     except HttpError as error:
+        drive_api_errors_counter.inc()
         log_func(f"오류: 새 Google Docs 문서 생성 중 API 오류 발생 - {error}")
         auth_logger.error(f"새 Google Docs 문서 생성 API 오류: {error}")
         return None
@@ -333,6 +375,7 @@ def list_accessible_google_documents(log_func, services=None, page_size=20):
         auth_logger.error("문서 목록 조회 실패 - Drive 서비스 없음")
         return None
 
+    drive_api_calls_counter.inc()
     try:
         response = google_services["drive"].files().list(
             q="mimeType='application/vnd.google-apps.document' and trashed=false",
@@ -346,6 +389,7 @@ def list_accessible_google_documents(log_func, services=None, page_size=20):
         auth_logger.info(f"접근 가능한 Google Docs 문서 조회 완료: {len(documents)}개")
         return documents
     except HttpError as error:
+        drive_api_errors_counter.inc()
         log_func(f"오류: Google Docs 문서 목록 조회 중 API 오류 발생 - {error}")
         auth_logger.error(f"Google Docs 문서 목록 조회 API 오류: {error}")
         return None
@@ -0,0 +1,204 @@
+import os
+import threading
+import time
+from collections import deque
+
+
+FILE_HANDLER_READABLE = 2  # tkinter.READABLE
+ACTIVE_POLL_INTERVAL_MS = 50
+IDLE_POLL_INTERVAL_MS = 500
+CONTINUE_DRAIN_DELAY_MS = 1
+WAKEUP_RATE_WINDOW_SECONDS = 60.0
+WAKEUP_PIPE_READ_SIZE = 4096
+
+
+class WakeupRateMeter:
+    """최근 1분 동안 GUI 스레드가 깨어난 횟수를 센다."""
+
+    def __init__(self, window_seconds=WAKEUP_RATE_WINDOW_SECONDS, clock=time.monotonic):
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.timestamps = deque()
+        self.total_count = 0
+
+    def record(self):
+        current_time = self.clock()
+        self.timestamps.append(current_time)
+        self.total_count += 1
+        self._expire(current_time)
+
+    def _expire(self, current_time):
+        cutoff_time = current_time - self.window_seconds
+        while self.timestamps and self.timestamps[0] < cutoff_time:
+            self.timestamps.popleft()
+
+    def per_minute(self):
+        self._expire(self.clock())
+        return len(self.timestamps) * (60.0 / self.window_seconds)
+
+
+class GuiWakeupDispatcher:
+    """백그라운드 스레드가 일을 넣었을 때만 GUI 스레드를 깨워 큐를 비운다.
+
+    notify()는 어느 스레드에서든 Tk를 건드리지 않고 곧바로 반환한다. 대기 플래그를 세우고
+    self-pipe에 1바이트를 써 두면, Tk가 createfilehandler로 지켜보던 파이프가 읽을 수 있게
+    되어 GUI 스레드에서 drain 함수들이 호출된다. 파일 핸들러를 쓸 수 없는 Tk(Windows)에서는
+    대기 플래그만 확인하는 느린 주기 확인으로 대신하며, 일이 없을수록 간격을 늘린다.
+
+    drain 함수는 GUI 스레드에서 호출되며, 한 번에 다 비우지 못했으면 True를 돌려준다.
+    """
+
+    def __init__(
+        self,
+        root,
+        drain_funcs,
+        active_poll_interval_ms=ACTIVE_POLL_INTERVAL_MS,
+        idle_poll_interval_ms=IDLE_POLL_INTERVAL_MS,
+        clock=time.monotonic,
+    ):
+        self.root = root
+        self.drain_funcs = list(drain_funcs)
+        self.active_poll_interval_ms = active_poll_interval_ms
+        self.idle_poll_interval_ms = idle_poll_interval_ms
+        self.poll_interval_ms = active_poll_interval_ms
+        self.lock = threading.Lock()
+        self.wakeup_pending = False
+        self.wakeup_reader = None
+        self.wakeup_writer = None
+        self.poll_after_id = None
+        self.continue_after_id = None
+        self.started = False
+        self.meter = WakeupRateMeter(clock=clock)
+        self.pipe_wakeup_count = 0
+        self.poll_wakeup_count = 0
+        self.coalesced_count = 0
+
+    @property
+    def uses_file_handler(self):
+        return self.wakeup_reader is not None
+
+    def start(self):
+        """self-pipe를 Tk 파일 핸들러에 연결하고, 시작 전에 쌓인 일을 한 번 처리하도록 예약한다."""
+        self.started = True
+        if not self._open_wakeup_pipe():
+            self._schedule_poll()
+        self.root.after(0, self.dispatch)
+
+    def _open_wakeup_pipe(self):
+        create_file_handler = getattr(getattr(self.root, "tk", None), "createfilehandler", None)
+        if create_file_handler is None:
+            return False
+        reader, writer = os.pipe()
+        try:
+            os.set_blocking(reader, False)
+            os.set_blocking(writer, False)
+            create_file_handler(reader, FILE_HANDLER_READABLE, self._on_pipe_readable)
+        except Exception:
+            os.close(reader)
+            os.close(writer)
+            return False
+        self.wakeup_reader, self.wakeup_writer = reader, writer
+        return True
+
+    def stop(self):
+        """파일 핸들러와 예약된 확인을 정리한다. 이후 notify()는 플래그만 세운다."""
+        self.started = False
+        reader, writer = self.wakeup_reader, self.wakeup_writer
+        self.wakeup_reader = self.wakeup_writer = None
+        if reader is not None:
+            try:
+                self.root.tk.deletefilehandler(reader)
+            except Exception:
+                pass
+            for fd in (reader, writer):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        for after_id in (self.poll_after_id, self.continue_after_id):
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except Exception:
+                    pass
+        self.poll_after_id = self.continue_after_id = None
+
+    def notify(self):
+        """어느 스레드에서든 호출할 수 있다. 처리할 일이 생겼음을 알리고 바로 반환한다."""
+        with self.lock:
+            if self.wakeup_pending:
+                self.coalesced_count += 1
+                return
+            self.wakeup_pending = True
+            writer = self.wakeup_writer
+
+        if writer is not None:
+            try:
+                os.write(writer, b"\0")
+            except OSError:
+                # 파이프가 가득 찼으면 이미 깨우기가 대기 중이고, 닫혔으면 종료 중이다.
+                pass
+
+    def _on_pipe_readable(self, _fd=None, _mask=None):
+        reader = self.wakeup_reader
+        if reader is not None:
+            try:
+                while os.read(reader, WAKEUP_PIPE_READ_SIZE):
+                    pass
+            except OSError:
+                pass
+        self.pipe_wakeup_count += 1
+        self.dispatch()
+
+    def _schedule_poll(self):
+        if not self.started or self.poll_after_id is not None:
+            return
+        try:
+            self.poll_after_id = self.root.after(self.poll_interval_ms, self._on_poll)
+        except Exception:
+            self.poll_after_id = None
+
+    def _on_poll(self):
+        self.poll_after_id = None
+        with self.lock:
+            has_pending = self.wakeup_pending
+        if has_pending:
+            self.poll_wakeup_count += 1
+            self.poll_interval_ms = self.active_poll_interval_ms
+            self.dispatch()
+        else:
+            # 일이 없을수록 확인 간격을 늘려 유휴 중 깨어나는 횟수를 줄인다.
+            self.poll_interval_ms = min(self.poll_interval_ms * 2, self.idle_poll_interval_ms)
+        self._schedule_poll()
+
+    def dispatch(self):
+        """등록된 큐를 비운다. 남은 일이 있으면 이벤트 루프에 양보한 뒤 이어서 비운다."""
+        with self.lock:
+            # 비우는 도중 들어온 일은 다시 깨우도록 먼저 풀어둔다.
+            self.wakeup_pending = False
+        self.continue_after_id = None
+        self.meter.record()
+
+        has_more_work = False
+        for drain_func in self.drain_funcs:
+            try:
+                has_more_work = bool(drain_func()) or has_more_work
+            except Exception:
+                pass
+
+        if has_more_work and self.started and self.continue_after_id is None:
+            try:
+                self.continue_after_id = self.root.after(CONTINUE_DRAIN_DELAY_MS, self.dispatch)
+            except Exception:
+                self.continue_after_id = None
+
+    def get_stats(self):
+        """깨우기 통계를 반환한다."""
+        return {
+            "wakeups_per_minute": self.meter.per_minute(),
+            "total_wakeups": self.meter.total_count,
+            "pipe_wakeups": self.pipe_wakeup_count,
+            "poll_wakeups": self.poll_wakeup_count,
+            "coalesced_notifications": self.coalesced_count,
+            "uses_file_handler": self.uses_file_handler,
+        }
@@ -0,0 +1,310 @@
+"""Google Docs에 기록한 줄을 로컬 SQLite에 남겨 두고 전체 텍스트로 검색한다.
+
+감시 엔진은 기록이 반영될 때마다 record()로 큐에 넣기만 하고, 별도 작성 스레드가 여러 기록을 한
+트랜잭션으로 묶어 쓴다. 줄 본문은 FTS5(trigram) 표에 두어 한글 단어 중간 글자로도 찾을 수 있다.
+FTS5가 없는 SQLite에서는 일반 표에 두고 instr로 찾는다.
+
+검색(search_history)과 정리(compact_history_database)는 매번 따로 연결을 열므로 GUI나 다른
+프로세스(isolate_backend_process)에서 불러도 된다.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+
+HISTORY_INDEX_FILE_NAME = "history_index.sqlite3"
+DEFAULT_RETENTION_DAYS = 365  # 0이면 기록 색인을 끈다.
+DEFAULT_MAX_LINES = 5_000_000
+WRITE_BATCH_MAX_RECORDS = 200
+WRITE_FLUSH_INTERVAL_SECONDS = 1.0
+COMPACT_INTERVAL_SECONDS = 6 * 60 * 60
+SEARCH_RESULT_LIMIT = 500
+FTS_MIN_QUERY_CHARS = 3  # trigram 색인은 세 글자 이상만 찾을 수 있다.
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+
+
+def normalize_retention_days(value):
+    """보관 일수를 0 이상 정수로 맞춘다. 잘못된 값은 기본값으로 바꾼다."""
+    try:
+        return max(0, int(str(value).strip()))
+    except (TypeError, ValueError):
+        return DEFAULT_RETENTION_DAYS
+
+
+def normalize_max_lines(value):
+    """보관할 최대 줄 수를 1 이상 정수로 맞춘다. 잘못된 값은 기본값으로 바꾼다."""
+    try:
+        max_lines = int(str(value).strip())
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_LINES
+    return max_lines if max_lines > 0 else DEFAULT_MAX_LINES
+
+
+def connect_history_database(path):
+    """기록 색인 DB에 연결하고 표가 없으면 만든다. (connection, FTS5 사용 여부)를 반환한다."""
+    target_dir = os.path.dirname(path)
+    if target_dir:
+        os.makedirs(target_dir, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+    # 새 DB에서만 적용된다. 정리 뒤 빈 페이지를 incremental_vacuum으로 돌려준다.
+    connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "id INTEGER PRIMARY KEY, recorded_at REAL NOT NULL, docs_id TEXT, file_title TEXT, file_path TEXT, "
+            "start_offset INTEGER, end_offset INTEGER, line_count INTEGER, last_line_rowid INTEGER)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS records_recorded_at ON records(recorded_at)")
+        use_fts = _ensure_lines_table(connection)
+    return connection, use_fts
+
+
+def _ensure_lines_table(connection):
+    existing = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'lines'").fetchone()
+    if existing is not None:
+        return "VIRTUAL TABLE" in existing[0].upper()
+    try:
+        connection.execute(
+            "CREATE VIRTUAL TABLE lines USING fts5(line_text, record_id UNINDEXED, tokenize='trigram')"
+        )
+        return True
+    except sqlite3.OperationalError:
+        connection.execute("CREATE TABLE lines (line_text TEXT, record_id INTEGER)")
+        return False
+
+
+class HistorySearchMatch:
+    """검색 결과 한 줄과 그 줄을 기록한 Docs 기록 정보."""
+
+    __slots__ = (
+        "line_rowid", "line_text", "recorded_at", "docs_id", "file_title", "file_path", "start_offset", "end_offset",
+    )
+
+    def __init__(self, line_rowid, line_text, recorded_at, docs_id, file_title, file_path, start_offset, end_offset):
+        self.line_rowid = line_rowid
+        self.line_text = line_text
+        self.recorded_at = recorded_at
+        self.docs_id = docs_id
+        self.file_title = file_title
+        self.file_path = file_path
+        self.start_offset = start_offset
+        self.end_offset = end_offset
+
+
+def format_history_search_match(search_match):
+    """검색 결과 한 건을 '기록 시각  파일 [바이트 범위]  줄' 한 줄로 만든다."""
+    recorded_time_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(search_match.recorded_at))
+    byte_range_text = ""
+    if search_match.start_offset is not None and search_match.end_offset is not None:
+        byte_range_text = f" [{search_match.start_offset:,}-{search_match.end_offset:,}B]"
+    return f"{recorded_time_text}  {search_match.file_title}{byte_range_text}  {search_match.line_text}"
+
+
+def search_history(path, query, limit=SEARCH_RESULT_LIMIT):
+    """검색어가 들어 있는 줄을 최근 기록부터 최대 limit건 반환한다. (결과 목록, 걸린 초)"""
+    started_at = time.perf_counter()
+    query = query.strip()
+    if not query or not os.path.exists(path):
+        return [], time.perf_counter() - started_at
+    connection, use_fts = connect_history_database(path)
+    try:
+        select_sql = (
+            "SELECT lines.rowid, lines.line_text, records.recorded_at, records.docs_id, records.file_title, "
+            "records.file_path, records.start_offset, records.end_offset "
+            "FROM lines JOIN records ON records.id = lines.record_id "
+        )
+        if use_fts and len(query) >= FTS_MIN_QUERY_CHARS:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = connection.execute(
+                select_sql + "WHERE lines MATCH ? ORDER BY lines.rowid DESC LIMIT ?", (phrase, limit)
+            ).fetchall()
+        else:
+            # 짧은 검색어는 색인을 쓸 수 없어 최근 줄부터 훑다가 limit건을 채우면 멈춘다.
+            rows = connection.execute(
+                select_sql + "WHERE instr(lines.line_text, ?) > 0 ORDER BY lines.rowid DESC LIMIT ?", (query, limit)
+            ).fetchall()
+    finally:
+        connection.close()
+    return [HistorySearchMatch(*row) for row in rows], time.perf_counter() - started_at
+
+
+def compact_history_database(path, retention_days=DEFAULT_RETENTION_DAYS, max_lines=DEFAULT_MAX_LINES, now=None):
+    """보관 기간이 지났거나 최대 줄 수를 넘는 오래된 기록을 지우고 색인을 다시 합친다. 지운 줄 수를 반환한다.
+
+    기록은 시간 순서로 들어오므로 줄 rowid도 시간 순서다. 기록마다 마지막 줄 rowid를 적어 두고
+    그 값까지의 줄을 rowid 범위로 한 번에 지운다.
+    """
+    if not os.path.exists(path):
+        return 0
+    now = time.time() if now is None else now
+    connection, use_fts = connect_history_database(path)
+    try:
+        with connection:
+            cutoff_rowid = 0
+            if retention_days:
+                expired = connection.execute(
+                    "SELECT max(last_line_rowid) FROM records WHERE recorded_at < ?",
+                    (now - retention_days * 86400,),
+                ).fetchone()[0]
+                cutoff_rowid = max(cutoff_rowid, expired or 0)
+            overflow = connection.execute(
+                "SELECT rowid FROM lines ORDER BY rowid DESC LIMIT 1 OFFSET ?", (max_lines,)
+            ).fetchone()
+            if overflow is not None:
+                cutoff_rowid = max(cutoff_rowid, overflow[0])
+            if not cutoff_rowid:
+                return 0
+            removed_count = connection.execute("DELETE FROM lines WHERE rowid <= ?", (cutoff_rowid,)).rowcount
+            connection.execute("DELETE FROM records WHERE last_line_rowid <= ?", (cutoff_rowid,))
+            if use_fts:
+                connection.execute("INSERT INTO lines(lines) VALUES('optimize')")
+        connection.execute("PRAGMA incremental_vacuum")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed_count
+    finally:
+        connection.close()
+
+
+class HistoryIndex:
+    """감시 엔진이 반영한 기록을 받아 작성 스레드에서 묶어 쓴다. open() 전이나 close() 뒤에는 기록을 버린다."""
+
+    def __init__(self):
+        self.path = None
+        self.retention_days = DEFAULT_RETENTION_DAYS
+        self.max_lines = DEFAULT_MAX_LINES
+        self.record_queue = queue.Queue()
+        self.writer_thread = None
+        self.last_error = None
+
+    def open(self, path, retention_days=DEFAULT_RETENTION_DAYS, max_lines=DEFAULT_MAX_LINES):
+        """작성 스레드를 시작한다. retention_days가 0이면 켜지 않는다."""
+        self.close()
+        self.retention_days = normalize_retention_days(retention_days)
+        self.max_lines = normalize_max_lines(max_lines)
+        if not path or not self.retention_days:
+            return False
+        self.path = path
+        self.record_queue = queue.Queue()
+        self.writer_thread = threading.Thread(
+            target=self._write_loop, args=(path, self.record_queue), name="HistoryIndexWriter", daemon=True
+        )
+        self.writer_thread.start()
+        return True
+
+    def is_open(self):
+        return self.writer_thread is not None
+
+    def record(self, docs_id, filepath, lines, start_offset=None, end_offset=None, recorded_at=None):
+        """Docs에 반영된 기록 하나를 쓰기 큐에 넣는다. 감시 스레드를 기다리게 하지 않는다."""
+        if self.writer_thread is None or not lines:
+            return
+        self.record_queue.put((
+            time.time() if recorded_at is None else recorded_at,
+            docs_id,
+            os.path.basename(filepath),
+            filepath,
+            start_offset,
+            end_offset,
+            list(lines),
+        ))
+
+    def flush(self, timeout=5.0):
+        """큐에 쌓인 기록을 다 쓸 때까지 기다린다."""
+        if self.writer_thread is None:
+            return True
+        done_event = threading.Event()
+        self.record_queue.put(done_event)
+        return done_event.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """남은 기록을 쓰고 작성 스레드를 멈춘다."""
+        writer_thread = self.writer_thread
+        if writer_thread is None:
+            return
+        self.record_queue.put(None)
+        writer_thread.join(timeout)
+        self.writer_thread = None
+
+    def _write_loop(self, path, record_queue):
+        try:
+            connection, _use_fts = connect_history_database(path)
+        except (OSError, sqlite3.Error) as error:
+            self.last_error = error
+            self._discard_queue(record_queue)
+            return
+        next_compact_at = time.monotonic()
+        try:
+            while True:
+                if time.monotonic() >= next_compact_at:
+                    self._compact(path)
+                    next_compact_at = time.monotonic() + COMPACT_INTERVAL_SECONDS
+                try:
+                    item = record_queue.get(timeout=WRITE_FLUSH_INTERVAL_SECONDS)
+                except queue.Empty:
+                    continue
+                batch, waiters, stop = [], [], False
+                while True:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+                    if stop or len(batch) >= WRITE_BATCH_MAX_RECORDS:
+                        break
+                    try:
+                        item = record_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    try:
+                        write_history_batch(connection, batch)
+                    except sqlite3.Error as error:
+                        self.last_error = error
+                for waiter in waiters:
+                    waiter.set()
+                if stop:
+                    return
+        finally:
+            connection.close()
+
+    def _compact(self, path):
+        try:
+            compact_history_database(path, self.retention_days, self.max_lines)
+        except sqlite3.Error as error:
+            self.last_error = error
+
+    @staticmethod
+    def _discard_queue(record_queue):
+        while True:
+            item = record_queue.get()
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+def write_history_batch(connection, batch):
+    """기록 여러 개를 한 트랜잭션으로 쓴다."""
+    with connection:
+        for recorded_at, docs_id, file_title, file_path, start_offset, end_offset, lines in batch:
+            record_id = connection.execute(
+                "INSERT INTO records (recorded_at, docs_id, file_title, file_path, start_offset, end_offset, line_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (recorded_at, docs_id, file_title, file_path, start_offset, end_offset, len(lines)),
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO lines (line_text, record_id) VALUES (?, ?)", ((line, record_id) for line in lines)
+            )
+            connection.execute(
+                "UPDATE records SET last_line_rowid = (SELECT rowid FROM lines ORDER BY rowid DESC LIMIT 1) WHERE id = ?",
+                (record_id,),
+            )
+
+
+history_index = HistoryIndex()
@@ -0,0 +1,214 @@
+import logging
+import math
+import random
+import threading
+import time
+from array import array
+
+from .logging_pipeline import LATENCY_LOGGER_NAME
+
+
+DEFAULT_LATENCY_LOG_SAMPLE_RATE = 0.05
+
+# 추적 지점 순서. 각 구간 시간은 바로 앞에 찍힌 지점부터 잰다.
+TRACE_STAGES = ("detected", "dequeued", "settled", "read", "deduped", "written")
+STAGE_LABELS = {
+    "dequeued": "큐 대기",
+    "settled": "재처리 지연",
+    "read": "읽기/디코딩",
+    "deduped": "중복 제거",
+    "written": "Docs 기록",
+    "total": "전체",
+}
+SUMMARY_STAGES = ("dequeued", "settled", "read", "deduped", "written", "total")
+
+# 0.1ms ~ 약 12분을 1.25배 간격 버킷으로 나눈다. (버킷 수가 고정이라 메모리도 고정)
+HISTOGRAM_MIN_SECONDS = 0.0001
+HISTOGRAM_GROWTH = 1.25
+HISTOGRAM_BUCKET_COUNT = 72
+
+
+class TraceContext:
+    """큐 항목 하나가 감지부터 Docs 기록까지 지나간 지점별 monotonic 시각."""
+
+    __slots__ = ("filepath", "stamps", "clock")
+
+    def __init__(self, filepath, clock=time.monotonic):
+        self.filepath = filepath
+        self.clock = clock
+        self.stamps = {}
+
+    @classmethod
+    def start(cls, filepath, stage="detected", clock=time.monotonic):
+        trace = cls(filepath, clock=clock)
+        trace.mark(stage)
+        return trace
+
+    def mark(self, stage):
+        """지점 시각을 기록한다. 이미 찍힌 지점은 처음 값을 유지한다."""
+        if stage not in self.stamps:
+            self.stamps[stage] = self.clock()
+
+    def stage_durations(self):
+        """찍힌 지점 사이의 구간 시간(초)과 전체 시간을 반환한다."""
+        durations = {}
+        previous_time = None
+        for stage in TRACE_STAGES:
+            stage_time = self.stamps.get(stage)
+            if stage_time is None:
+                continue
+            if previous_time is not None:
+                durations[stage] = max(0.0, stage_time - previous_time)
+            previous_time = stage_time
+        if len(self.stamps) >= 2:
+            durations["total"] = max(self.stamps.values()) - min(self.stamps.values())
+        return durations
+
+
+class LatencyHistogram:
+    """로그 스케일 버킷에 개수만 세는 고정 크기 히스토그램."""
+
+    __slots__ = ("counts", "total_count", "max_seconds")
+
+    def __init__(self):
+        self.counts = array('Q', [0] * HISTOGRAM_BUCKET_COUNT)
+        self.total_count = 0
+        self.max_seconds = 0.0
+
+    @staticmethod
+    def bucket_index(seconds):
+        if seconds <= HISTOGRAM_MIN_SECONDS:
+            return 0
+        index = int(math.log(seconds / HISTOGRAM_MIN_SECONDS, HISTOGRAM_GROWTH)) + 1
+        return min(index, HISTOGRAM_BUCKET_COUNT - 1)
+
+    @staticmethod
+    def bucket_upper_bound(index):
+        return HISTOGRAM_MIN_SECONDS * (HISTOGRAM_GROWTH ** index)
+
+    def add(self, seconds):
+        self.counts[self.bucket_index(seconds)] += 1
+        self.total_count += 1
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def percentile(self, fraction):
+        """분위수에 해당하는 버킷 상한(초)을 반환한다. 실제 최댓값보다 크게 말하지 않는다."""
+        if not self.total_count:
+            return None
+        rank = max(1, math.ceil(self.total_count * fraction))
+        seen_count = 0
+        for index, count in enumerate(self.counts):
+            seen_count += count
+            if seen_count >= rank:
+                if index == HISTOGRAM_BUCKET_COUNT - 1:
+                    # 마지막 버킷은 상한이 없으므로 관측한 최댓값으로 답한다.
+                    return self.max_seconds
+                return min(self.bucket_upper_bound(index), self.max_seconds)
+        return self.max_seconds
+
+
+class LatencyTracker:
+    """구간별 히스토그램을 모아 p50/p95/p99를 제공하고 일부 추적을 로그로 남긴다."""
+
+    def __init__(self, sample_rate=DEFAULT_LATENCY_LOG_SAMPLE_RATE, random_func=random.random):
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.sample_rate = normalize_latency_sample_rate(sample_rate)
+        self.random_func = random_func
+
+    def set_sample_rate(self, sample_rate):
+        self.sample_rate = normalize_latency_sample_rate(sample_rate)
+
+    def record(self, trace, outcome="written"):
+        """완료된 추적의 구간 시간을 히스토그램에 더한다."""
+        durations = trace.stage_durations()
+        if not durations:
+            return durations
+        with self.lock:
+            for stage, seconds in durations.items():
+                histogram = self.histograms.get(stage)
+                if histogram is None:
+                    histogram = self.histograms[stage] = LatencyHistogram()
+                histogram.add(seconds)
+        if self.sample_rate and self.random_func() < self.sample_rate:
+            log_trace(trace, durations, outcome)
+        return durations
+
+    def snapshot(self):
+        """{구간: {"count", "p50", "p95", "p99"}} 형태의 요약을 반환한다."""
+        with self.lock:
+            return {
+                stage: {
+                    "count": histogram.total_count,
+                    "p50": histogram.percentile(0.50),
+                    "p95": histogram.percentile(0.95),
+                    "p99": histogram.percentile(0.99),
+                }
+                for stage, histogram in self.histograms.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {}
+
+
+def get_latency_logger():
+    """지연 추적 로거. 백엔드 로그 파일에 기록되며, 레벨을 따로 정하지 않았으면 INFO로 둔다."""
+    latency_logger = logging.getLogger(LATENCY_LOGGER_NAME)
+    if latency_logger.level == logging.NOTSET:
+        latency_logger.setLevel(logging.INFO)
+    return latency_logger
+
+
+def log_trace(trace, durations, outcome):
+    parts = [f"{stage}={durations[stage] * 1000:.1f}ms" for stage in SUMMARY_STAGES if stage in durations]
+    get_latency_logger().info("지연 추적 (%s) %s: %s", outcome, trace.filepath, " ".join(parts))
+
+
+def normalize_latency_sample_rate(value):
+    """지연 추적 로그 표본 비율을 0~1 사이 숫자로 정리한다."""
+    try:
+        sample_rate = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_LATENCY_LOG_SAMPLE_RATE
+    if sample_rate != sample_rate:
+        return DEFAULT_LATENCY_LOG_SAMPLE_RATE
+    return min(max(sample_rate, 0.0), 1.0)
+
+
+def format_latency_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.1f}s"
+
+
+def format_latency_summary(snapshot):
+    """상태 패널에 보일 한 줄 요약을 만든다."""
+    total = snapshot.get("total")
+    if not total or not total["count"]:
+        return "처리 지연: 측정 전"
+    return (
+        f"처리 지연 p50 {format_latency_seconds(total['p50'])} · "
+        f"p95 {format_latency_seconds(total['p95'])} · "
+        f"p99 {format_latency_seconds(total['p99'])} ({total['count']}건)"
+    )
+
+
+def format_latency_report(snapshot):
+    """구간별 p50/p95/p99를 여러 줄 텍스트로 만든다."""
+    lines = []
+    for stage in SUMMARY_STAGES:
+        stage_summary = snapshot.get(stage)
+        if not stage_summary:
+            continue
+        lines.append(
+            f"{STAGE_LABELS[stage]}: p50 {format_latency_seconds(stage_summary['p50'])} · "
+            f"p95 {format_latency_seconds(stage_summary['p95'])} · "
+            f"p99 {format_latency_seconds(stage_summary['p99'])} ({stage_summary['count']}건)"
+        )
+    return "\n".join(lines) or "아직 처리 완료된 파일이 없습니다."
+
+
+latency_tracker = LatencyTracker()
@@ -0,0 +1,267 @@
+import queue
+import sys
+import threading
+from collections import deque
+
+
+DEFAULT_LOG_DISPLAY_LINES = 1000
+DEFAULT_LOG_PENDING_LIMIT = 2000
+DEFAULT_LOG_QUEUE_MAX_SIZE = 20000
+LOG_QUEUE_EVICT_FRACTION = 10
+LOG_FRAME_INTERVAL_MS = 16
+REPEAT_MARKER = "×"
+# GUI 상태 표시와 실패 알림이 기대는 로그 문구. 큐가 넘쳐도 이 줄들은 버리지 않는다.
+STATUS_LOG_MARKERS = (
+    "백엔드:",
+    "처리 시작:",
+    "처리 완료:",
+    "Google Docs",
+    "오류",
+    "감시 실패",
+    "인증 정보(토큰) 갱신 실패",
+)
+
+
+def is_status_log_message(message):
+    """GUI 상태나 알림을 바꾸는 로그인지 확인한다."""
+    message = str(message)
+    return any(marker in message for marker in STATUS_LOG_MARKERS)
+
+
+class LogEntry:
+    """화면 로그 한 줄과 연속 반복 횟수를 담는다."""
+
+    __slots__ = ("message", "count")
+
+    def __init__(self, message, count=1):
+        self.message = message
+        self.count = count
+
+    def render(self):
+        """반복 횟수를 포함한 표시 문자열을 만든다."""
+        if self.count <= 1:
+            return self.message
+        return f"{self.message} ({REPEAT_MARKER}{self.count})"
+
+
+class LogFrame:
+    """한 프레임 동안 위젯에 반영할 변경 묶음."""
+
+    __slots__ = ("updated_last_line", "new_lines")
+
+    def __init__(self, updated_last_line=None, new_lines=None):
+        self.updated_last_line = updated_last_line
+        self.new_lines = new_lines or []
+
+    def is_empty(self):
+        return self.updated_last_line is None and not self.new_lines
+
+
+class LogRenderBuffer:
+    """GUI 로그를 제한된 링 버퍼에 모았다가 프레임 단위로 내보낸다.
+
+    같은 메시지가 연속으로 들어오면 한 줄로 접고 "(×37)"처럼 횟수만 갱신한다.
+    아직 그리지 않은 줄이 한도를 넘으면 가장 오래된 줄부터 버리고 개수를 센다.
+    """
+
+    def __init__(self, max_lines=DEFAULT_LOG_DISPLAY_LINES, max_pending=DEFAULT_LOG_PENDING_LIMIT):
+        self.max_lines = max(1, int(max_lines))
+        self.max_pending = max(1, int(max_pending))
+        self.history = deque(maxlen=self.max_lines)
+        self.pending = deque()
+        self.last_rendered_count = 0
+        self.dropped_count = 0
+        self.collapsed_count = 0
+        self.reported_dropped_count = 0
+
+    def push(self, message):
+        """메시지를 버퍼에 넣는다. 반복으로 접혔으면 False를 반환한다."""
+        message = str(message)
+        if self.pending:
+            tail_entry = self.pending[-1]
+        elif self.history:
+            tail_entry = self.history[-1]
+        else:
+            tail_entry = None
+
+        if tail_entry is not None and tail_entry.message == message:
+            tail_entry.count += 1
+            self.collapsed_count += 1
+            return False
+
+        if len(self.pending) >= self.max_pending:
+            self.pending.popleft()
+            self.dropped_count += 1
+        self.pending.append(LogEntry(message))
+        return True
+
+    def has_pending(self):
+        """다음 프레임에 그릴 변경이 남아 있는지 확인한다."""
+        if self.pending or self.dropped_count != self.reported_dropped_count:
+            return True
+        return bool(self.history) and self.history[-1].count != self.last_rendered_count
+
+    def take_frame(self):
+        """마지막 프레임 이후의 변경을 꺼내고 버퍼를 렌더 완료 상태로 표시한다."""
+        updated_last_line = None
+        if self.history and self.history[-1].count != self.last_rendered_count:
+            updated_last_line = self.history[-1].render()
+
+        new_entries = list(self.pending)
+        self.pending.clear()
+        if len(new_entries) > self.max_lines:
+            self.dropped_count += len(new_entries) - self.max_lines
+            new_entries = new_entries[-self.max_lines:]
+
+        new_lines = []
+        newly_dropped = self.dropped_count - self.reported_dropped_count
+        if newly_dropped > 0:
+            notice_entry = LogEntry(f"--- 로그가 너무 빠르게 쌓여 {newly_dropped}줄을 화면 표시에서 생략했습니다 ---")
+            self.history.append(notice_entry)
+            new_lines.append(notice_entry.render())
+            self.reported_dropped_count = self.dropped_count
+
+        for entry in new_entries:
+            self.history.append(entry)
+            new_lines.append(entry.render())
+
+        self.last_rendered_count = self.history[-1].count if self.history else 0
+        return LogFrame(updated_last_line, new_lines)
+
+    def record_dropped(self, count):
+        """화면에 오기 전에 버려진 줄 수를 더해 다음 프레임의 생략 안내에 포함한다."""
+        if count > 0:
+            self.dropped_count += count
+
+    def snapshot_lines(self):
+        """이미 렌더링된 표시 줄을 반환한다. (새 위젯 초기화용, 호출 전 프레임을 먼저 비워야 한다)"""
+        return [entry.render() for entry in self.history]
+
+    def clear(self):
+        """보관 중인 줄을 모두 비운다. 누적 카운터는 유지한다."""
+        self.history.clear()
+        self.pending.clear()
+        self.last_rendered_count = 0
+        self.reported_dropped_count = self.dropped_count
+
+    def estimate_bytes(self):
+        """보관 중인 줄의 대략적인 크기. 화면 위젯에도 같은 줄이 있으므로 두 번 센다."""
+        history_bytes = sum(sys.getsizeof(entry.message) for entry in self.history)
+        pending_bytes = sum(sys.getsizeof(entry.message) for entry in self.pending)
+        return 2 * history_bytes + pending_bytes
+
+    def trim_history(self, keep_lines):
+        """이미 그린 줄 중 최근 keep_lines 줄만 남기고 지운 줄 수를 반환한다."""
+        removed_lines = 0
+        while len(self.history) > max(1, keep_lines):
+            self.history.popleft()
+            removed_lines += 1
+        return removed_lines
+
+    def get_stats(self):
+        """표시 버퍼 상태 요약을 반환한다."""
+        return {
+            "history_lines": len(self.history),
+            "pending_lines": len(self.pending),
+            "dropped_count": self.dropped_count,
+            "collapsed_count": self.collapsed_count,
+        }
+
+
+class DropOldestLogQueue:
+    """백엔드 로그를 GUI로 넘기는 큐. 가득 차면 오래된 일반 로그부터 버린다.
+
+    한 번에 한도의 1/10만큼 앞쪽 일반 로그를 버리되 상태/오류 줄은 남겨 순서를 유지한다.
+    남길 줄만 가득 찬 경우에는 버리지 않고 한도를 넘겨 보관한다.
+    """
+
+    def __init__(self, maxsize=DEFAULT_LOG_QUEUE_MAX_SIZE, keep_func=is_status_log_message):
+        self.maxsize = max(1, int(maxsize))
+        self.keep_func = keep_func
+        self.items = deque()
+        self.lock = threading.Lock()
+        self.dropped_count = 0
+
+    def put_nowait(self, message):
+        with self.lock:
+            if len(self.items) >= self.maxsize:
+                self._evict_oldest()
+            self.items.append(message)
+
+    put = put_nowait
+
+    def _evict_oldest(self):
+        target_count = max(1, self.maxsize // LOG_QUEUE_EVICT_FRACTION)
+        kept = []
+        dropped = 0
+        while self.items and dropped < target_count:
+            message = self.items.popleft()
+            if self.keep_func(message):
+                kept.append(message)
+            else:
+                dropped += 1
+        self.items.extendleft(reversed(kept))
+        self.dropped_count += dropped
+
+    def get_nowait(self):
+        with self.lock:
+            if not self.items:
+                raise queue.Empty
+            return self.items.popleft()
+
+    def empty(self):
+        with self.lock:
+            return not self.items
+
+    def qsize(self):
+        with self.lock:
+            return len(self.items)
+
+
+def group_lines_by_tag(lines, tag_func):
+    """연속으로 같은 태그를 쓰는 줄을 묶어 (텍스트, 태그) 목록으로 만든다."""
+    groups = []
+    current_tag = None
+    current_lines = []
+    for line in lines:
+        tag_name = tag_func(line)
+        if current_lines and tag_name != current_tag:
+            groups.append(("\n".join(current_lines) + "\n", current_tag))
+            current_lines = []
+        current_tag = tag_name
+        current_lines.append(line)
+    if current_lines:
+        groups.append(("\n".join(current_lines) + "\n", current_tag))
+    return groups
+
+
+def apply_log_frame(target_widget, frame, tag_func, max_lines=DEFAULT_LOG_DISPLAY_LINES, end_index="end"):
+    """프레임 변경을 텍스트 위젯에 한 번에 반영하고 초과 줄을 잘라낸다."""
+    if frame.is_empty():
+        return 0
+
+    target_widget.configure(state='normal')
+    try:
+        if frame.updated_last_line is not None:
+            # Tk Text는 항상 마지막에 빈 줄이 있으므로 실제 마지막 로그 줄은 end-2l이다.
+            target_widget.delete("end-2l", "end-1l")
+            target_widget.insert(end_index, frame.updated_last_line + "\n", tag_func(frame.updated_last_line))
+
+        for text_block, tag_name in group_lines_by_tag(frame.new_lines, tag_func):
+            target_widget.insert(end_index, text_block, tag_name)
+
+        removed_lines = trim_text_widget_lines(target_widget, max_lines)
+    finally:
+        target_widget.configure(state='disabled')
+    target_widget.see(end_index)
+    return removed_lines
+
+
+def trim_text_widget_lines(target_widget, max_lines):
+    """텍스트 위젯이 max_lines 줄을 넘으면 앞쪽 줄을 한 번에 삭제한다."""
+    current_line_count = int(str(target_widget.index("end-1c")).split('.')[0]) - 1
+    lines_to_remove = current_line_count - max_lines
+    if lines_to_remove <= 0:
+        return 0
+    target_widget.delete("1.0", f"{lines_to_remove + 1}.0")
+    return lines_to_remove
@@ -0,0 +1,381 @@
+import bisect
+import glob
+import gzip
+import mmap
+import os
+import re
+import shutil
+import threading
+from array import array
+
+
+LOG_FILE_PATTERN = "messenger_docs_*.log"
+LOG_ARCHIVE_SUFFIX = ".gz"
+LOG_ARCHIVE_CACHE_DIRNAME = ".viewer_cache"
+LOG_FILE_ENCODING = "utf-8"
+DEFAULT_VIEW_WINDOW_LINES = 200
+SEARCH_RESULT_BATCH_SIZE = 50
+SEARCH_RESULT_LIMIT = 5000
+SEARCH_DECODE_WINDOW_LINES = 2000
+
+
+class LogFileIndex:
+    """로그 파일 하나를 mmap으로 열어 줄 시작 위치를 색인한다.
+
+    파일은 뒤에만 추가된다고 가정하고, refresh()는 마지막으로 색인한 위치 이후만 읽는다.
+    마지막 줄이 개행으로 끝나지 않았으면 아직 쓰는 중으로 보고 색인에서 제외한다.
+    """
+
+    def __init__(self, path, data_path=None):
+        self.path = path
+        self.data_path = data_path or path
+        self.line_offsets = array('Q')
+        self.indexed_size = 0
+        self.file_identity = None
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        """새로 추가된 부분의 줄 위치를 색인하고 추가된 줄 수를 반환한다."""
+        try:
+            file_stat = os.stat(self.data_path)
+        except OSError:
+            return 0
+        file_size = file_stat.st_size
+
+        with self.lock:
+            if file_size < self.indexed_size or file_stat.st_ino != self.file_identity:
+                # 파일이 잘렸거나 크기 한도로 넘겨져 새로 만들어졌으면 처음부터 다시 색인한다.
+                self.line_offsets = array('Q')
+                self.indexed_size = 0
+                self.file_identity = file_stat.st_ino
+            if file_size == self.indexed_size or file_size == 0:
+                return 0
+
+            added_count = 0
+            with open(self.data_path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                position = self.indexed_size
+                while True:
+                    newline_position = mapped.find(b"\n", position, file_size)
+                    if newline_position < 0:
+                        break
+                    self.line_offsets.append(position)
+                    position = newline_position + 1
+                    added_count += 1
+                self.indexed_size = position
+            return added_count
+
+    def line_count(self):
+        return len(self.line_offsets)
+
+    def read_lines(self, start_line, count):
+        """start_line(0부터)부터 count줄을 디코딩해 반환한다."""
+        with self.lock:
+            end_line = min(len(self.line_offsets), start_line + count)
+            if start_line >= end_line:
+                return []
+            start_offset = self.line_offsets[start_line]
+            end_offset = self.line_offsets[end_line] if end_line < len(self.line_offsets) else self.indexed_size
+            offsets = self.line_offsets[start_line:end_line]
+
+        with open(self.data_path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            chunk = mapped[start_offset:end_offset]
+
+        lines = []
+        for index, line_start in enumerate(offsets):
+            relative_start = line_start - start_offset
+            relative_end = (offsets[index + 1] - start_offset) if index + 1 < len(offsets) else len(chunk)
+            lines.append(decode_log_line(chunk[relative_start:relative_end]))
+        return lines
+
+    def line_number_for_offset(self, byte_offset):
+        """바이트 위치가 속한 줄 번호(0부터)를 반환한다."""
+        with self.lock:
+            return max(0, bisect.bisect_right(self.line_offsets, byte_offset) - 1)
+
+
+def decode_log_line(raw_line):
+    """로그 한 줄 바이트를 줄바꿈 없이 문자열로 만든다."""
+    return raw_line.rstrip(b"\r\n").decode(LOG_FILE_ENCODING, errors="replace")
+
+
+class ArchivedLogFileIndex(LogFileIndex):
+    """gzip으로 보관된 로그를 캐시 폴더에 한 번 풀어 두고 일반 로그처럼 색인한다.
+
+    보관 파일은 다시 바뀌지 않으므로 캐시가 보관 파일보다 새로우면 다시 풀지 않는다.
+    """
+
+    def __init__(self, path, cache_dir):
+        archive_name = os.path.basename(path)[:-len(LOG_ARCHIVE_SUFFIX)]
+        super().__init__(path, os.path.join(cache_dir, archive_name))
+        self.cache_dir = cache_dir
+
+    def refresh(self):
+        if self.indexed_size == 0 and not self.ensure_cache():
+            return 0
+        return super().refresh()
+
+    def ensure_cache(self):
+        """압축을 푼 캐시 파일을 준비한다. 실패하면 False를 반환한다."""
+        try:
+            if os.path.getmtime(self.data_path) >= os.path.getmtime(self.path):
+                return True
+        except OSError:
+            pass
+        temp_path = self.data_path + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with gzip.open(self.path, "rb") as archive_file, open(temp_path, "wb") as cache_file:
+                shutil.copyfileobj(archive_file, cache_file)
+            os.replace(temp_path, self.data_path)
+            return True
+        except (OSError, EOFError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+
+
+def log_file_sort_key(path):
+    """일자별 로그와 보관 조각을 시간 순서로 정렬하는 키를 만든다.
+
+    같은 날짜에서는 크기 때문에 넘긴 조각(.001, .002 ...)이 먼저이고,
+    그날의 마지막 파일(현재 .log 또는 날짜가 지나 압축된 .log.gz)이 뒤에 온다.
+    """
+    filename = os.path.basename(path)
+    if filename.endswith(LOG_ARCHIVE_SUFFIX):
+        filename = filename[:-len(LOG_ARCHIVE_SUFFIX)]
+    stem = filename[:-len(".log")] if filename.endswith(".log") else filename
+    date_part, _separator, part_number = stem.partition(".")
+    if part_number.isdigit():
+        return date_part, int(part_number), filename
+    return date_part, float("inf"), filename
+
+
+def list_log_files(log_dir, pattern=LOG_FILE_PATTERN):
+    """로그 폴더의 일자별 로그 파일과 gzip 보관 파일을 오래된 순서로 반환한다."""
+    paths = glob.glob(os.path.join(log_dir, pattern)) + glob.glob(os.path.join(log_dir, pattern + LOG_ARCHIVE_SUFFIX))
+    return sorted(paths, key=log_file_sort_key)
+
+
+def prune_archive_cache(cache_dir, archive_paths):
+    """보관 파일이 지워진(보관 기간 만료 등) 캐시 파일을 정리한다."""
+    try:
+        cached_names = os.listdir(cache_dir)
+    except OSError:
+        return
+    live_names = {os.path.basename(path)[:-len(LOG_ARCHIVE_SUFFIX)] for path in archive_paths}
+    for cached_name in cached_names:
+        if cached_name not in live_names:
+            try:
+                os.remove(os.path.join(cache_dir, cached_name))
+            except OSError:
+                pass
+
+
+class LogHistory:
+    """여러 로그 파일을 하나의 연속된 줄 목록처럼 다룬다."""
+
+    def __init__(self, log_dir, pattern=LOG_FILE_PATTERN, cache_dir=None):
+        self.log_dir = log_dir
+        self.pattern = pattern
+        self.cache_dir = cache_dir or os.path.join(log_dir, LOG_ARCHIVE_CACHE_DIRNAME)
+        self.file_indexes = []
+        self.lock = threading.Lock()
+
+    def build_file_index(self, path):
+        if path.endswith(LOG_ARCHIVE_SUFFIX):
+            return ArchivedLogFileIndex(path, self.cache_dir)
+        return LogFileIndex(path)
+
+    def refresh(self):
+        """새 파일과 추가된 줄을 색인하고 새로 생긴 줄 수를 반환한다."""
+        known_paths = {file_index.path: file_index for file_index in self.file_indexes}
+        log_paths = list_log_files(self.log_dir, self.pattern)
+        prune_archive_cache(self.cache_dir, [path for path in log_paths if path.endswith(LOG_ARCHIVE_SUFFIX)])
+        file_indexes = [known_paths.get(path) or self.build_file_index(path) for path in log_paths]
+        added_count = sum(file_index.refresh() for file_index in file_indexes)
+        with self.lock:
+            self.file_indexes = file_indexes
+        return added_count
+
+    def refresh_in_background(self, on_done=None):
+        """전체 색인을 백그라운드 스레드에서 만들고 끝나면 on_done(추가 줄 수)을 호출한다."""
+        def worker():
+            added_count = self.refresh()
+            if on_done:
+                on_done(added_count)
+
+        thread = threading.Thread(target=worker, name="LogHistoryIndexer", daemon=True)
+        thread.start()
+        return thread
+
+    def line_count(self):
+        with self.lock:
+            return sum(file_index.line_count() for file_index in self.file_indexes)
+
+    def get_lines(self, start_line, count):
+        """전체 기록 기준 start_line부터 count줄을 여러 파일에 걸쳐 읽는다."""
+        with self.lock:
+            file_indexes = list(self.file_indexes)
+
+        lines = []
+        file_start = 0
+        for file_index in file_indexes:
+            file_line_count = file_index.line_count()
+            file_end = file_start + file_line_count
+            if start_line < file_end and len(lines) < count:
+                local_start = max(0, start_line - file_start)
+                lines.extend(file_index.read_lines(local_start, count - len(lines)))
+                start_line = file_end
+            file_start = file_end
+            if len(lines) >= count:
+                break
+        return lines
+
+    def snapshot_files(self):
+        """검색용으로 (파일 색인, 전체 기록 기준 시작 줄) 목록을 반환한다."""
+        with self.lock:
+            file_indexes = list(self.file_indexes)
+        snapshot = []
+        file_start = 0
+        for file_index in file_indexes:
+            snapshot.append((file_index, file_start))
+            file_start += file_index.line_count()
+        return snapshot
+
+
+class LogViewport:
+    """전체 기록 중 화면에 보이는 구간만 관리한다."""
+
+    def __init__(self, history, window_lines=DEFAULT_VIEW_WINDOW_LINES):
+        self.history = history
+        self.window_lines = max(1, int(window_lines))
+        self.first_line = 0
+        self.follow_tail = True
+
+    def max_first_line(self):
+        return max(0, self.history.line_count() - self.window_lines)
+
+    def scroll_to(self, first_line):
+        """보이는 구간의 첫 줄을 옮긴다. 끝에 닿으면 꼬리 따라가기를 다시 켠다."""
+        max_first_line = self.max_first_line()
+        self.first_line = min(max(0, int(first_line)), max_first_line)
+        self.follow_tail = self.first_line >= max_first_line
+        return self.first_line
+
+    def scroll_by(self, line_delta):
+        return self.scroll_to(self.first_line + line_delta)
+
+    def center_on(self, line_number):
+        """지정한 줄이 보이는 구간 가운데 오도록 옮긴다."""
+        return self.scroll_to(line_number - self.window_lines // 2)
+
+    def visible_lines(self):
+        """꼬리 따라가기 중이면 끝으로 옮긴 뒤 보이는 구간의 줄을 반환한다."""
+        if self.follow_tail:
+            self.first_line = self.max_first_line()
+        return self.history.get_lines(self.first_line, self.window_lines)
+
+
+class LogSearchMatch:
+    """검색 결과 한 건."""
+
+    __slots__ = ("line_number", "path", "text")
+
+    def __init__(self, line_number, path, text):
+        self.line_number = line_number
+        self.path = path
+        self.text = text
+
+
+def compile_log_search_pattern(query, use_regex=False, case_sensitive=False):
+    """검색어를 컴파일한다. 잘못된 정규식이면 re.error를 그대로 올린다.
+
+    일반 검색어는 mmap 위에서 바로 찾도록 바이트 패턴으로, 정규식은 한글 문자 단위로
+    해석되도록 문자열 패턴으로 만든다.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if use_regex:
+        return re.compile(query, flags)
+    return re.compile(re.escape(query.encode(LOG_FILE_ENCODING)), flags)
+
+
+def iter_literal_line_matches(file_index, pattern, cancel_event=None):
+    """바이트 패턴으로 파일을 한 번만 훑고 일치한 줄만 디코딩해 (줄 번호, 내용)을 돌려준다."""
+    with file_index.lock:
+        searchable_size = file_index.indexed_size
+    if searchable_size == 0:
+        return
+
+    with open(file_index.data_path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        position = 0
+        while position < searchable_size:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            match = pattern.search(mapped, position, searchable_size)
+            if match is None:
+                break
+
+            line_start = mapped.rfind(b"\n", 0, match.start()) + 1
+            line_end = mapped.find(b"\n", match.start(), searchable_size)
+            line_end = searchable_size if line_end < 0 else line_end + 1
+            # 한 줄에 여러 번 나와도 결과는 한 번만 낸다. (일반 검색어에는 개행이 없다)
+            position = line_end
+            yield file_index.line_number_for_offset(match.start()), decode_log_line(mapped[line_start:line_end])
+
+
+def iter_regex_line_matches(file_index, pattern, cancel_event=None, window_lines=SEARCH_DECODE_WINDOW_LINES):
+    """색인된 줄을 구간 단위로 디코딩해 줄마다 문자열 정규식을 적용한다. (여러 줄에 걸친 일치 없음)"""
+    total_lines = file_index.line_count()
+    for window_start in range(0, total_lines, window_lines):
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        for offset, line in enumerate(file_index.read_lines(window_start, window_lines)):
+            if pattern.search(line):
+                yield window_start + offset, line
+
+
+def iter_log_search_matches(history, query, use_regex=False, case_sensitive=False, cancel_event=None, limit=SEARCH_RESULT_LIMIT):
+    """전체 기록에서 검색어가 있는 줄을 오래된 순서로 하나씩 돌려준다."""
+    pattern = compile_log_search_pattern(query, use_regex, case_sensitive)
+    line_matcher = iter_regex_line_matches if use_regex else iter_literal_line_matches
+    found_count = 0
+    for file_index, file_start_line in history.snapshot_files():
+        for local_line_number, line_text in line_matcher(file_index, pattern, cancel_event):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            yield LogSearchMatch(file_start_line + local_line_number, file_index.path, line_text)
+            found_count += 1
+            if limit and found_count >= limit:
+                return
+
+
+def start_log_search(history, query, on_batch, on_done, use_regex=False, case_sensitive=False, batch_size=SEARCH_RESULT_BATCH_SIZE):
+    """백그라운드에서 검색해 결과를 묶음으로 전달한다. 취소용 Event를 반환한다.
+
+    on_batch(list[LogSearchMatch])와 on_done(총 건수, 오류 메시지 또는 None)은
+    검색 스레드에서 호출되므로 GUI 쪽에서 큐 등을 통해 메인 스레드로 넘겨야 한다.
+    """
+    cancel_event = threading.Event()
+
+    def worker():
+        total_count = 0
+        batch = []
+        try:
+            for search_match in iter_log_search_matches(history, query, use_regex, case_sensitive, cancel_event):
+                batch.append(search_match)
+                total_count += 1
+                if len(batch) >= batch_size:
+                    on_batch(batch)
+                    batch = []
+            if batch and not cancel_event.is_set():
+                on_batch(batch)
+            on_done(total_count, None)
+        except re.error as e:
+            on_done(total_count, f"정규식 오류: {e}")
+        except Exception as e:
+            on_done(total_count, str(e))
+
+    threading.Thread(target=worker, name="LogSearchWorker", daemon=True).start()
+    return cancel_event
@@ -0,0 +1,299 @@
+import atexit
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime
+
+
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_RETENTION_DAYS = 30
+LOG_RETENTION_TOTAL_BYTES = 200 * 1024 * 1024
+LOG_ARCHIVE_SUFFIX = ".log.gz"
+
+APP_LOGGER_NAME = "MessengerDocsApp"
+BACKEND_LOGGER_NAME = "backend_processor"
+LATENCY_LOGGER_NAME = "backend_processor.latency"
+
+# 백엔드 로거의 INFO 기록은 대부분 화면 로그(log_func)와 같은 내용이므로 기본은 경고 이상만 남긴다.
+# 문제를 조사할 때는 설정의 log_levels로 서브시스템별 레벨을 낮춘다.
+DEFAULT_LOG_LEVELS = {
+    APP_LOGGER_NAME: "INFO",
+    BACKEND_LOGGER_NAME: "WARNING",
+    # 표본 추출한 지연 추적만 남기므로 백엔드 기본 레벨과 달리 INFO로 둔다.
+    LATENCY_LOGGER_NAME: "INFO",
+}
+
+LOG_TARGETS = {
+    APP_LOGGER_NAME: ("messenger_docs", "%(asctime)s - %(levelname)s - %(message)s", None),
+    BACKEND_LOGGER_NAME: (
+        "backend_log",
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "%Y-%m-%d %H:%M:%S",
+    ),
+}
+
+_pipeline_lock = threading.Lock()
+_active_pipeline = None
+
+
+class DailySizeRotatingFileHandler(logging.Handler):
+    """날짜가 바뀌거나 크기 한도를 넘으면 파일을 넘기고 지난 파일은 gzip으로 보관한다.
+
+    현재 파일 이름은 항상 {prefix}_{YYYYMMDD}.log이다. 크기 때문에 넘긴 조각은
+    {prefix}_{YYYYMMDD}.{NNN}.log.gz, 날짜가 지나 넘긴 파일은 {prefix}_{YYYYMMDD}.log.gz가 된다.
+    """
+
+    def __init__(
+        self,
+        log_dir,
+        prefix,
+        max_bytes=LOG_FILE_MAX_BYTES,
+        retention_days=LOG_RETENTION_DAYS,
+        retention_total_bytes=LOG_RETENTION_TOTAL_BYTES,
+        encoding="utf-8",
+        clock=datetime.now,
+    ):
+        super().__init__()
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.retention_days = retention_days
+        self.retention_total_bytes = retention_total_bytes
+        self.encoding = encoding
+        self.clock = clock
+        self.stream = None
+        self.current_date = None
+        os.makedirs(log_dir, exist_ok=True)
+        self.archive_stale_logs()
+        self.enforce_retention()
+
+    def build_log_path(self, date_text):
+        return os.path.join(self.log_dir, f"{self.prefix}_{date_text}.log")
+
+    def open_stream(self, date_text):
+        self.current_date = date_text
+        self.stream = open(self.build_log_path(date_text), "a", encoding=self.encoding)
+
+    def close_stream(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def emit(self, record):
+        try:
+            message = self.format(record) + "\n"
+            date_text = self.clock().strftime("%Y%m%d")
+            if self.stream is None:
+                self.open_stream(date_text)
+            elif date_text != self.current_date:
+                self.rollover_day(date_text)
+            elif self.max_bytes and self.stream.tell() > 0 and self.stream.tell() + len(message.encode(self.encoding)) > self.max_bytes:
+                self.rollover_size()
+            self.stream.write(message)
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def rollover_day(self, date_text):
+        """지난 날짜 파일을 닫아 압축하고 새 날짜 파일을 연다."""
+        previous_path = self.build_log_path(self.current_date)
+        self.close_stream()
+        compress_log_file(previous_path, previous_path + ".gz")
+        self.enforce_retention()
+        self.open_stream(date_text)
+
+    def rollover_size(self):
+        """크기 한도를 넘은 현재 파일을 번호 붙은 조각으로 압축하고 같은 이름으로 새로 연다."""
+        current_path = self.build_log_path(self.current_date)
+        self.close_stream()
+        compress_log_file(current_path, self.next_part_archive_path(self.current_date))
+        self.enforce_retention()
+        self.open_stream(self.current_date)
+
+    def next_part_archive_path(self, date_text):
+        part_number = 1
+        while True:
+            archive_path = os.path.join(self.log_dir, f"{self.prefix}_{date_text}.{part_number:03d}{LOG_ARCHIVE_SUFFIX}")
+            if not os.path.exists(archive_path):
+                return archive_path
+            part_number += 1
+
+    def archive_stale_logs(self):
+        """이전 실행이 남긴 지난 날짜의 압축 안 된 로그를 보관 파일로 옮긴다."""
+        today_path = self.build_log_path(self.clock().strftime("%Y%m%d"))
+        file_prefix = f"{self.prefix}_"
+        for filename in os.listdir(self.log_dir):
+            path = os.path.join(self.log_dir, filename)
+            if filename.startswith(file_prefix) and filename.endswith(".log") and path != today_path:
+                compress_log_file(path, path + ".gz")
+
+    def list_archives(self):
+        """이 핸들러가 만든 보관 파일을 오래된 순서로 (경로, 수정 시각, 크기) 목록으로 반환한다."""
+        file_prefix = f"{self.prefix}_"
+        archives = []
+        for filename in os.listdir(self.log_dir):
+            if not (filename.startswith(file_prefix) and filename.endswith(LOG_ARCHIVE_SUFFIX)):
+                continue
+            path = os.path.join(self.log_dir, filename)
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                continue
+            archives.append((path, file_stat.st_mtime, file_stat.st_size))
+        archives.sort(key=lambda archive: (archive[1], archive[0]))
+        return archives
+
+    def enforce_retention(self):
+        """보관 기간이 지났거나 전체 용량 한도를 넘는 오래된 보관 파일을 지운다."""
+        archives = self.list_archives()
+        cutoff_time = time.time() - self.retention_days * 86400 if self.retention_days else None
+        total_bytes = sum(archive[2] for archive in archives)
+        removed_paths = []
+        for path, modified_time, file_size in archives:
+            expired = cutoff_time is not None and modified_time < cutoff_time
+            over_budget = bool(self.retention_total_bytes) and total_bytes > self.retention_total_bytes
+            if not (expired or over_budget):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_bytes -= file_size
+            removed_paths.append(path)
+        return removed_paths
+
+    def close(self):
+        self.acquire()
+        try:
+            self.close_stream()
+        finally:
+            self.release()
+        super().close()
+
+
+def compress_log_file(source_path, archive_path):
+    """로그 파일을 gzip으로 압축하고 원본을 지운다. 실패하면 원본을 그대로 둔다."""
+    if not os.path.exists(source_path):
+        return False
+    try:
+        with open(source_path, "rb") as source_file, gzip.open(archive_path, "wb") as archive_file:
+            shutil.copyfileobj(source_file, archive_file)
+        os.remove(source_path)
+        return True
+    except OSError:
+        return False
+
+
+def normalize_log_levels(levels):
+    """서브시스템별 로그 레벨 설정에서 올바른 항목만 남겨 대문자 레벨 이름으로 반환한다."""
+    normalized_levels = {}
+    if not isinstance(levels, dict):
+        return normalized_levels
+    for logger_name, level_name in levels.items():
+        if not isinstance(logger_name, str) or not logger_name.strip():
+            continue
+        level_text = str(level_name).strip().upper()
+        if isinstance(logging.getLevelName(level_text), int):
+            normalized_levels[logger_name.strip()] = level_text
+    return normalized_levels
+
+
+def apply_log_levels(levels=None):
+    """기본 레벨에 사용자 설정을 덮어써 각 서브시스템 로거에 적용한다."""
+    effective_levels = dict(DEFAULT_LOG_LEVELS)
+    effective_levels.update(normalize_log_levels(levels))
+    for logger_name, level_name in effective_levels.items():
+        logging.getLogger(logger_name).setLevel(level_name)
+    return effective_levels
+
+
+class LoggingPipeline:
+    """로거에는 QueueHandler만 붙이고 파일 쓰기는 QueueListener 스레드에서 처리한다."""
+
+    def __init__(self, log_dir, handler_factory=DailySizeRotatingFileHandler):
+        self.log_dir = log_dir
+        self.handler_factory = handler_factory
+        self.log_queue = queue.SimpleQueue()
+        self.file_handlers = {}
+        self.listener = None
+
+    def attach(self, logger_name):
+        """로거를 파이프라인에 연결한다. 이미 연결돼 있으면 아무 것도 하지 않는다."""
+        if logger_name in self.file_handlers:
+            return logging.getLogger(logger_name)
+
+        prefix, log_format, date_format = LOG_TARGETS[logger_name]
+        file_handler = self.handler_factory(self.log_dir, prefix)
+        file_handler.setFormatter(logging.Formatter(log_format, datefmt=date_format))
+        file_handler.addFilter(logging.Filter(logger_name))
+
+        target_logger = logging.getLogger(logger_name)
+        for existing_handler in target_logger.handlers[:]:
+            target_logger.removeHandler(existing_handler)
+            existing_handler.close()
+        target_logger.addHandler(logging.handlers.QueueHandler(self.log_queue))
+        target_logger.propagate = False
+
+        self.file_handlers[logger_name] = file_handler
+        self.restart_listener()
+        return target_logger
+
+    def restart_listener(self):
+        if self.listener is not None:
+            self.listener.stop()
+        self.listener = logging.handlers.QueueListener(
+            self.log_queue,
+            *self.file_handlers.values(),
+            respect_handler_level=True,
+        )
+        self.listener.start()
+
+    def stop(self):
+        """남은 기록을 모두 파일에 쓰고 리스너와 핸들러를 닫는다."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        for file_handler in self.file_handlers.values():
+            file_handler.close()
+
+
+def get_logging_pipeline(log_dir):
+    """프로세스 전체에서 하나의 로깅 파이프라인을 만들어 재사용한다."""
+    global _active_pipeline
+
+    with _pipeline_lock:
+        if _active_pipeline is None:
+            _active_pipeline = LoggingPipeline(log_dir)
+            atexit.register(shutdown_logging_pipeline)
+        return _active_pipeline
+
+
+def configure_logger(logger_name, log_dir, levels=None):
+    """로거를 비동기 파일 파이프라인에 연결하고 서브시스템 레벨을 적용한다.
+
+    levels를 주지 않으면 이미 적용된 레벨은 건드리지 않고, 아직 없을 때만 기본값을 쓴다.
+    """
+    pipeline = get_logging_pipeline(log_dir)
+    with _pipeline_lock:
+        target_logger = pipeline.attach(logger_name)
+    if levels is not None:
+        apply_log_levels(levels)
+    elif target_logger.level == logging.NOTSET:
+        target_logger.setLevel(DEFAULT_LOG_LEVELS.get(logger_name, "INFO"))
+    return target_logger
+
+
+def shutdown_logging_pipeline():
+    """앱 종료 시 대기 중인 로그를 파일로 내보내고 파이프라인을 정리한다."""
+    global _active_pipeline
+
+    with _pipeline_lock:
+        pipeline = _active_pipeline
+        _active_pipeline = None
+    if pipeline is not None:
+        pipeline.stop()
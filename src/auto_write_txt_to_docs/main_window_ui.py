@@ -153,7 +153,7 @@ def _build_status_panel(ctk, parent, state_vars, callbacks, font_family):
         ).pack(fill="x", padx=12, pady=(0, 10))
 
     metrics_frame = ctk.CTkFrame(status_card, fg_color="transparent")
-    metrics_frame.pack(fill="x", padx=16, pady=(0, 14))
+    metrics_frame.pack(fill="x", padx=16, pady=(0, 6))
 
     left_metrics = ctk.CTkFrame(metrics_frame, fg_color="transparent")
     left_metrics.pack(side="left", fill="x", expand=True)
@@ -183,6 +183,18 @@ def _build_status_panel(ctk, parent, state_vars, callbacks, font_family):
         "현재 앱 메모리 사용량을 점검하고 가능한 정리 작업을 실행합니다.",
     )
 
+    latency_label = ctk.CTkLabel(
+        left_metrics,
+        textvariable=state_vars["latency_summary"],
+        font=_font(ctk, 12, family=font_family),
+        text_color=("gray35", "gray75"),
+    )
+    latency_label.pack(side="left", padx=(14, 0))
+    _attach_tooltip(
+        latency_label,
+        "파일 변경 감지부터 Google Docs 기록 완료까지 걸린 시간입니다. 구간별 통계는 진단 메뉴에서 볼 수 있습니다.",
+    )
+
     right_metrics = ctk.CTkFrame(metrics_frame, fg_color="transparent")
     right_metrics.pack(side="right")
 
@@ -206,10 +218,25 @@ def _build_status_panel(ctk, parent, state_vars, callbacks, font_family):
     )
     docs_info_label.pack(anchor="e", pady=(4, 0))
 
+    metrics_summary_label = ctk.CTkLabel(
+        status_card,
+        textvariable=state_vars["metrics_summary"],
+        font=_font(ctk, 11, family=font_family),
+        text_color=("gray40", "gray70"),
+        anchor="w",
+    )
+    metrics_summary_label.pack(fill="x", padx=16, pady=(0, 14))
+    _attach_tooltip(
+        metrics_summary_label,
+        "최근 1분 기준 Docs 기록 줄 수, Docs API 평균 응답 시간, 처리 대기 파일 수, 중복 캐시 적중률입니다.",
+    )
+
     return {
         "status_label": status_label,
         "memory_label": memory_label,
         "memory_optimize_button": memory_optimize_button,
+        "latency_label": latency_label,
+        "metrics_summary_label": metrics_summary_label,
         "folder_info_var": folder_info_var,
         "folder_info_label": folder_info_label,
         "docs_info_var": docs_info_var,
@@ -0,0 +1,194 @@
+"""백엔드 캐시와 GUI 버퍼가 나눠 쓰는 메모리 예산.
+
+자료구조마다 대략적인 크기(바이트)를 돌려주는 함수와 넘친 만큼 비우는 함수를 등록한다.
+관리자는 전체 예산을 비율대로 나누고, 자기 몫을 넘은 자료구조만 정리한다.
+자료구조를 고치는 스레드가 따로 있으므로 group으로 나눠 그 스레드에서 enforce()를 부른다.
+"""
+
+import itertools
+import sys
+import threading
+import time
+
+
+BYTES_PER_MB = 1024 * 1024
+DEFAULT_MEMORY_BUDGET_MB = 64
+MIN_MEMORY_BUDGET_MB = 8
+MAX_MEMORY_BUDGET_MB = 4096
+SIZE_SAMPLE_COUNT = 32
+MEMORY_BUDGET_ENFORCE_INTERVAL_SECONDS = 5.0
+
+
+def normalize_memory_budget_mb(value):
+    """메모리 예산(MB)을 허용 범위의 정수로 정리한다."""
+    try:
+        budget_mb = int(str(value).strip())
+    except (TypeError, ValueError):
+        return DEFAULT_MEMORY_BUDGET_MB
+    return min(max(budget_mb, MIN_MEMORY_BUDGET_MB), MAX_MEMORY_BUDGET_MB)
+
+
+def estimate_items_bytes(items, item_count, sample_count=SIZE_SAMPLE_COUNT):
+    """앞쪽 항목 몇 개의 평균 크기로 전체 항목 크기를 어림한다."""
+    if item_count <= 0:
+        return 0
+    samples = [sys.getsizeof(item) for item in itertools.islice(items, sample_count)]
+    if not samples:
+        return 0
+    return int(sum(samples) / len(samples) * item_count)
+
+
+def estimate_container_bytes(container, sample_count=SIZE_SAMPLE_COUNT):
+    """set/dict/list 자체 크기와 안에 든 키(값은 제외)의 어림 크기를 더한다."""
+    return sys.getsizeof(container) + estimate_items_bytes(iter(container), len(container), sample_count)
+
+
+def format_megabytes(byte_count):
+    return f"{byte_count / BYTES_PER_MB:.1f}"
+
+
+class MemoryConsumer:
+    __slots__ = ("name", "label", "share", "size_func", "evict_func", "group")
+
+    def __init__(self, name, label, share, size_func, evict_func, group):
+        self.name = name
+        self.label = label
+        self.share = share
+        self.size_func = size_func
+        self.evict_func = evict_func
+        self.group = group
+
+
+class MemoryBudgetManager:
+    """등록 순서가 곧 정리 우선순위다. 몫을 넘은 만큼만 evict_func(넘친 바이트)로 비운다."""
+
+    def __init__(self, budget_mb=DEFAULT_MEMORY_BUDGET_MB, clock=time.monotonic):
+        self.lock = threading.Lock()
+        self.clock = clock
+        self.budget_bytes = normalize_memory_budget_mb(budget_mb) * BYTES_PER_MB
+        self.consumers = {}
+        self.last_sizes = {}
+        self.last_enforced_at = {}
+        self.eviction_count = 0
+        self.last_eviction = None
+
+    def set_budget_mb(self, budget_mb):
+        self.budget_bytes = normalize_memory_budget_mb(budget_mb) * BYTES_PER_MB
+        return self.budget_bytes
+
+    def register(self, name, label, share, size_func, evict_func, group="backend"):
+        """같은 이름으로 다시 등록하면 이전 항목을 바꾼다. (GUI를 다시 만들 때 등)"""
+        with self.lock:
+            self.consumers[name] = MemoryConsumer(name, label, float(share), size_func, evict_func, group)
+
+    def unregister(self, name):
+        with self.lock:
+            self.consumers.pop(name, None)
+            self.last_sizes.pop(name, None)
+
+    def limit_bytes(self, consumer):
+        return int(self.budget_bytes * consumer.share)
+
+    def enforce(self, group=None):
+        """group의 자료구조 크기를 재고 몫을 넘은 것을 정리한다. 정리 기록 목록을 반환한다."""
+        with self.lock:
+            consumers = [consumer for consumer in self.consumers.values() if group is None or consumer.group == group]
+        evictions = []
+        for consumer in consumers:
+            try:
+                size_bytes = consumer.size_func()
+            except Exception:
+                continue
+            limit_bytes = self.limit_bytes(consumer)
+            if size_bytes > limit_bytes:
+                try:
+                    evict_summary = consumer.evict_func(size_bytes - limit_bytes) or ""
+                except Exception as error:
+                    evict_summary = f"정리 실패: {error}"
+                try:
+                    size_after = consumer.size_func()
+                except Exception:
+                    size_after = size_bytes
+                evictions.append({
+                    "name": consumer.name,
+                    "label": consumer.label,
+                    "before_bytes": size_bytes,
+                    "after_bytes": size_after,
+                    "limit_bytes": limit_bytes,
+                    "summary": evict_summary,
+                    "wall_time": time.time(),
+                })
+                size_bytes = size_after
+            with self.lock:
+                self.last_sizes[consumer.name] = size_bytes
+        with self.lock:
+            self.last_enforced_at[group] = self.clock()
+            if evictions:
+                self.eviction_count += len(evictions)
+                self.last_eviction = evictions[-1]
+        return evictions
+
+    def maybe_enforce(self, group, min_interval_seconds=MEMORY_BUDGET_ENFORCE_INTERVAL_SECONDS):
+        """마지막 확인 후 min_interval_seconds가 지났을 때만 enforce()한다. (처리 루프용)"""
+        last_enforced_at = self.last_enforced_at.get(group)
+        if last_enforced_at is not None and self.clock() - last_enforced_at < min_interval_seconds:
+            return []
+        return self.enforce(group)
+
+    def snapshot(self):
+        """마지막으로 잰 크기와 몫, 정리 기록을 반환한다. (상태 패널/진단용)"""
+        with self.lock:
+            consumers = {
+                name: {
+                    "label": consumer.label,
+                    "bytes": self.last_sizes.get(name),
+                    "limit_bytes": self.limit_bytes(consumer),
+                }
+                for name, consumer in self.consumers.items()
+            }
+            return {
+                "budget_bytes": self.budget_bytes,
+                "used_bytes": sum(entry["bytes"] or 0 for entry in consumers.values()),
+                "consumers": consumers,
+                "eviction_count": self.eviction_count,
+                "last_eviction": dict(self.last_eviction) if self.last_eviction else None,
+            }
+
+
+def format_memory_budget_status(snapshot):
+    """상태 패널에 보일 한 줄 요약을 만든다."""
+    status = (
+        f"캐시 예산 {format_megabytes(snapshot['used_bytes'])}/"
+        f"{format_megabytes(snapshot['budget_bytes'])} MB"
+    )
+    last_eviction = snapshot.get("last_eviction")
+    if last_eviction:
+        freed_bytes = max(0, last_eviction["before_bytes"] - last_eviction["after_bytes"])
+        status += f" · 최근 정리: {last_eviction['label']} {format_megabytes(freed_bytes)} MB"
+        if last_eviction.get("summary"):
+            status += f" ({last_eviction['summary']})"
+    return status
+
+
+def format_memory_eviction(eviction):
+    """정리 기록 하나를 로그 한 줄로 만든다."""
+    message = (
+        f"{eviction['label']} {format_megabytes(eviction['before_bytes'])} → "
+        f"{format_megabytes(eviction['after_bytes'])} MB (몫 {format_megabytes(eviction['limit_bytes'])} MB)"
+    )
+    if eviction.get("summary"):
+        message += f" - {eviction['summary']}"
+    return message
+
+
+def format_memory_budget_report(snapshot):
+    """자료구조별 크기와 몫을 여러 줄 텍스트로 만든다."""
+    lines = [format_memory_budget_status(snapshot), ""]
+    for entry in snapshot["consumers"].values():
+        size_text = "측정 전" if entry["bytes"] is None else f"{format_megabytes(entry['bytes'])} MB"
+        lines.append(f"{entry['label']}: {size_text} / 몫 {format_megabytes(entry['limit_bytes'])} MB")
+    lines.append(f"누적 정리 횟수: {snapshot['eviction_count']}")
+    return "\n".join(lines)
+
+
+memory_budget = MemoryBudgetManager()
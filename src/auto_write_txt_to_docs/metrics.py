@@ -0,0 +1,324 @@
+import bisect
+import os
+import threading
+import time
+from collections import deque
+
+
+METRICS_TEXTFILE_NAME = "auto_write_txt_to_docs.prom"
+METRICS_EXPORT_INTERVAL_SECONDS = 15.0
+METRICS_SUMMARY_WINDOW_SECONDS = 60.0
+DEFAULT_HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Counter:
+    """스레드마다 자기 칸에만 더하는 카운터. 증가에는 잠금이 없고 읽을 때 칸을 합한다."""
+
+    metric_type = "counter"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self.cells = {}
+
+    def inc(self, amount=1):
+        thread_id = threading.get_ident()
+        # 같은 스레드만 자기 칸을 고치므로 읽고 쓰는 사이에 값이 사라지지 않는다.
+        self.cells[thread_id] = self.cells.get(thread_id, 0) + amount
+
+    def set_remote(self, source, total):
+        """다른 프로세스가 센 누적값을 source 칸에 그대로 둔다. (문자열 키라 스레드 칸과 섞이지 않는다)"""
+        self.cells[source] = total
+
+    def get(self):
+        return sum(list(self.cells.values()))
+
+    def samples(self):
+        return [(self.name, self.get())]
+
+
+class Gauge:
+    """현재 값을 담는 게이지. 함수를 주면 읽을 때마다 그 값을 계산한다."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name, help_text, value_func=None):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0
+        self.value_func = value_func
+        self.remote_value = None
+
+    def set(self, value):
+        self.value = value
+
+    def set_remote(self, value):
+        """다른 프로세스에서 잰 값을 대신 보여준다. None이면 이 프로세스 값으로 돌아간다."""
+        self.remote_value = value
+
+    def set_function(self, value_func):
+        self.value_func = value_func
+
+    def get(self):
+        if self.remote_value is not None:
+            return self.remote_value
+        if self.value_func is not None:
+            try:
+                return self.value_func()
+            except Exception:
+                return 0
+        return self.value
+
+    def samples(self):
+        return [(self.name, self.get())]
+
+
+class Histogram:
+    """Prometheus 누적 버킷 형식으로 내보낼 수 있는 고정 버킷 히스토그램."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name, help_text, buckets=DEFAULT_HISTOGRAM_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.total_sum = 0.0
+        self.total_count = 0
+        self.window_max = 0.0
+        self.remote_parts = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.bucket_counts[index] += 1
+            self.total_sum += value
+            self.total_count += 1
+            self.window_max = max(self.window_max, value)
+
+    def pop_window_max(self):
+        """마지막으로 꺼낸 뒤 관측한 최댓값을 반환하고 초기화한다. (시계열 기록용)"""
+        with self.lock:
+            window_max, self.window_max = self.window_max, 0.0
+        return window_max
+
+    def set_remote(self, source, bucket_counts, total_sum, total_count):
+        """다른 프로세스가 모은 버킷 개수와 합계를 source 몫으로 더해 보여준다."""
+        with self.lock:
+            self.remote_parts[source] = (list(bucket_counts), total_sum, total_count)
+
+    def _merged_locked(self):
+        bucket_counts = list(self.bucket_counts)
+        total_sum, total_count = self.total_sum, self.total_count
+        for remote_counts, remote_sum, remote_count in self.remote_parts.values():
+            for index, count in enumerate(remote_counts[:len(bucket_counts)]):
+                bucket_counts[index] += count
+            total_sum += remote_sum
+            total_count += remote_count
+        return bucket_counts, total_sum, total_count
+
+    def get(self):
+        with self.lock:
+            _bucket_counts, total_sum, total_count = self._merged_locked()
+        return total_count, total_sum
+
+    def samples(self):
+        with self.lock:
+            bucket_counts, total_sum, total_count = self._merged_locked()
+        samples = []
+        cumulative_count = 0
+        for upper_bound, count in zip(self.buckets, bucket_counts):
+            cumulative_count += count
+            samples.append((f'{self.name}_bucket{{le="{upper_bound:g}"}}', cumulative_count))
+        samples.append((f'{self.name}_bucket{{le="+Inf"}}', total_count))
+        samples.append((f"{self.name}_sum", total_sum))
+        samples.append((f"{self.name}_count", total_count))
+        return samples
+
+
+class MetricsRegistry:
+    """이름으로 지표를 만들고 찾는다. 같은 이름을 다시 요청하면 기존 지표를 돌려준다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+
+    def _get_or_create(self, metric_class, name, help_text, *args):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = metric_class(name, help_text, *args)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"지표 '{name}'은(는) 이미 {metric.metric_type}로 등록되어 있습니다.")
+            return metric
+
+    def counter(self, name, help_text=""):
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name, help_text="", value_func=None):
+        gauge = self._get_or_create(Gauge, name, help_text)
+        if value_func is not None:
+            gauge.set_function(value_func)
+        return gauge
+
+    def histogram(self, name, help_text="", buckets=DEFAULT_HISTOGRAM_BUCKETS):
+        return self._get_or_create(Histogram, name, help_text, buckets)
+
+    def get_value(self, name, default=0):
+        metric = self.metrics.get(name)
+        return metric.get() if metric is not None else default
+
+    def render_prometheus_text(self):
+        """Prometheus 텍스트 노출 형식 문자열을 만든다."""
+        with self.lock:
+            metrics = sorted(self.metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            if metric.help_text:
+                lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for sample_name, sample_value in metric.samples():
+                lines.append(f"{sample_name} {format_sample_value(sample_value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """node exporter가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체한다."""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(self.render_prometheus_text())
+        os.replace(temp_path, path)
+
+
+def format_sample_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class MetricsTextfileExporter:
+    """일정 간격으로 지표를 textfile collector용 파일에 내보내는 데몬 스레드."""
+
+    def __init__(self, registry, path, interval_seconds=METRICS_EXPORT_INTERVAL_SECONDS):
+        self.registry = registry
+        self.path = path
+        self.interval_seconds = interval_seconds
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_error = None
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="MetricsTextfileExporter", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval_seconds):
+            self.export_now()
+
+    def export_now(self):
+        try:
+            self.registry.write_textfile(self.path)
+            self.last_error = None
+            return True
+        except OSError as error:
+            self.last_error = error
+            return False
+
+    def stop(self, timeout=2.0):
+        """스레드를 멈추고 마지막 값을 한 번 더 내보낸다."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=timeout)
+            self.thread = None
+        self.export_now()
+
+
+class MetricsSummaryView:
+    """상태 패널용으로 최근 1분 동안의 처리량, API 지연, 큐 깊이, 캐시 적중률을 계산한다."""
+
+    def __init__(self, registry, window_seconds=METRICS_SUMMARY_WINDOW_SECONDS, clock=time.monotonic):
+        self.registry = registry
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.samples = deque()
+
+    def _read_totals(self):
+        api_count, api_sum = self.registry.get_value(DOCS_API_LATENCY, (0, 0.0))
+        return {
+            "lines_written": self.registry.get_value(LINES_WRITTEN_TOTAL),
+            "api_count": api_count,
+            "api_sum": api_sum,
+            # 읽은 줄은 모두 중복 캐시를 조회하므로, 중복으로 걸러진 줄이 곧 캐시 적중이다.
+            "cache_lookups": self.registry.get_value(LINES_READ_TOTAL),
+            "cache_hits": self.registry.get_value(LINES_DEDUPED_TOTAL),
+        }
+
+    def refresh(self):
+        current_time = self.clock()
+        totals = self._read_totals()
+        self.samples.append((current_time, totals))
+        while len(self.samples) > 1 and self.samples[1][0] <= current_time - self.window_seconds:
+            self.samples.popleft()
+
+        oldest_time, oldest_totals = self.samples[0]
+        elapsed_seconds = current_time - oldest_time
+        delta = {key: totals[key] - oldest_totals[key] for key in totals}
+        if elapsed_seconds <= 0:
+            # 첫 표본이면 누적값으로 보여준다.
+            delta, elapsed_seconds = totals, 0
+        return {
+            "lines_per_minute": delta["lines_written"] * 60.0 / elapsed_seconds if elapsed_seconds else None,
+            "api_latency_seconds": delta["api_sum"] / delta["api_count"] if delta["api_count"] else None,
+            "queue_depth": self.registry.get_value(FILE_QUEUE_DEPTH),
+            "cache_hit_ratio": delta["cache_hits"] / delta["cache_lookups"] if delta["cache_lookups"] else None,
+        }
+
+
+def format_metrics_summary(summary):
+    """상태 패널에 보일 지표 한 줄을 만든다."""
+    lines_per_minute = summary.get("lines_per_minute")
+    api_latency_seconds = summary.get("api_latency_seconds")
+    cache_hit_ratio = summary.get("cache_hit_ratio")
+    parts = [
+        f"처리량 {lines_per_minute:.0f}줄/분" if lines_per_minute is not None else "처리량 -",
+        f"API {api_latency_seconds * 1000:.0f}ms" if api_latency_seconds is not None else "API -",
+        f"큐 {summary.get('queue_depth', 0)}",
+        f"캐시 적중 {cache_hit_ratio * 100:.0f}%" if cache_hit_ratio is not None else "캐시 적중 -",
+    ]
+    return " · ".join(parts)
+
+
+def get_metrics_textfile_path(log_dir):
+    return os.path.join(log_dir, METRICS_TEXTFILE_NAME)
+
+
+# --- 여러 모듈이 함께 쓰는 지표 이름 ---
+FILES_PROCESSED_TOTAL = "auto_write_files_processed_total"
+BYTES_READ_TOTAL = "auto_write_bytes_read_total"
+LINES_READ_TOTAL = "auto_write_lines_read_total"
+LINES_WRITTEN_TOTAL = "auto_write_lines_written_total"
+LINES_DEDUPED_TOTAL = "auto_write_lines_deduped_total"
+LINE_CACHE_SIZE = "auto_write_line_cache_size"
+FILE_QUEUE_DEPTH = "auto_write_file_queue_depth"
+RETRIES_TOTAL = "auto_write_docs_retries_total"
+DOCS_API_CALLS_TOTAL = "auto_write_docs_api_calls_total"
+DOCS_API_ERRORS_TOTAL = "auto_write_docs_api_errors_total"
+DOCS_API_LATENCY = "auto_write_docs_api_latency_seconds"
+DOCS_AMBIGUOUS_WRITES_TOTAL = "auto_write_docs_ambiguous_writes_total"
+DOCS_RESENDS_AVOIDED_TOTAL = "auto_write_docs_resends_avoided_total"
+GOOGLE_TOKEN_REFRESH_TOTAL = "auto_write_google_token_refresh_total"
+GOOGLE_TOKEN_REFRESH_FAILURES_TOTAL = "auto_write_google_token_refresh_failures_total"
+GOOGLE_SERVICE_BUILDS_TOTAL = "auto_write_google_service_builds_total"
+DRIVE_API_CALLS_TOTAL = "auto_write_drive_api_calls_total"
+DRIVE_API_ERRORS_TOTAL = "auto_write_drive_api_errors_total"
+PROCESS_MEMORY_RSS_BYTES = "auto_write_process_memory_rss_bytes"
+GUI_WAKEUPS_TOTAL = "auto_write_gui_wakeups_total"
+LOG_QUEUE_DROPPED_TOTAL = "auto_write_log_queue_dropped_total"
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,133 @@
+"""저장된 앱 설정을 감시 엔진(run_monitoring) 설정으로 바꾼다.
+
+GUI와 헤드리스 데몬이 함께 쓰므로 Tk 관련 모듈을 가져오지 않는다.
+"""
+
+import re
+from urllib.parse import urlparse
+
+
+GOOGLE_DOC_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{20,}$")
+# 화면에 입력 칸이 없는 고급 설정 중 감시 엔진이 직접 읽는 키
+ENGINE_ADVANCED_CONFIG_KEYS = (
+    "latency_log_sample_rate", "memory_budget_mb", "monitoring_engine", "catchup_pool_threshold_mb",
+    "warm_dedupe_from_document", "history_retention_days", "history_max_lines", "dedupe_scope", "dedupe_ttl_seconds",
+    "long_term_dedupe", "long_term_dedupe_false_positive_rate", "long_term_dedupe_generation_days",
+    "long_term_dedupe_generations",
+)
+# "thread"는 큐 하나를 스레드 하나가 처리하는 기본 엔진, "asyncio"는 async_engine의 단계별 엔진
+MONITORING_ENGINES = ("thread", "asyncio")
+DEFAULT_MONITORING_ENGINE = "thread"
+# 감시 폴더 → 대상 문서 경로의 중복 제거 범위. "off"는 지문 계산부터 건너뛰고, "file"은 파일별 해시만,
+# "document"는 대상 문서별 라인 캐시와 파일별 해시를, "global"은 문서와 상관없이 하나인 라인 캐시와 파일별 해시를 쓴다.
+DEDUPE_SCOPES = ("off", "file", "document", "global")
+DEFAULT_DEDUPE_SCOPE = "global"
+
+
+class MonitoringConfigError(ValueError):
+    """설정만으로는 감시를 시작할 수 없을 때 사용자에게 보여줄 메시지를 담는다."""
+
+
+def normalize_monitoring_engine(value):
+    """알 수 없는 엔진 이름은 기본 엔진으로 바꾼다."""
+    engine_name = str(value or "").strip().lower()
+    return engine_name if engine_name in MONITORING_ENGINES else DEFAULT_MONITORING_ENGINE
+
+
+def normalize_dedupe_scope(value):
+    """알 수 없는 중복 제거 범위는 기본값(global)으로 바꾼다."""
+    scope = str(value or "").strip().lower()
+    return scope if scope in DEDUPE_SCOPES else DEFAULT_DEDUPE_SCOPE
+
+
+def normalize_dedupe_ttl_seconds(value):
+    """라인 캐시 TTL(초)을 0 이상 정수로 맞춘다. 0이면 만료하지 않는다."""
+    try:
+        return max(0, int(str(value).strip()))
+    except (TypeError, ValueError):
+        return 0
+
+
+# --- Helper Function: URL에서 ID 추출 ---
+def extract_google_id_from_url(url_or_id):
+    """엄격한 규칙으로 Google Docs URL 또는 문서 ID를 파싱한다."""
+    if not url_or_id or not isinstance(url_or_id, str):
+        return None
+
+    candidate = url_or_id.strip()
+    if not candidate:
+        return None
+
+    if GOOGLE_DOC_ID_PATTERN.fullmatch(candidate):
+        return candidate
+
+    normalized_candidate = candidate
+    if "://" not in normalized_candidate and normalized_candidate.lower().startswith("docs.google.com/"):
+        normalized_candidate = f"https://{normalized_candidate}"
+
+    try:
+        parsed = urlparse(normalized_candidate)
+    except ValueError:
+        return None
+
+    if parsed.scheme and parsed.scheme not in ("http", "https"):
+        return None
+
+    if parsed.netloc.lower() not in {"docs.google.com", "www.docs.google.com"}:
+        return None
+
+    path_parts = [part for part in parsed.path.split("/") if part]
+    if len(path_parts) < 3 or path_parts[0] != "document" or path_parts[1] != "d":
+        return None
+
+    docs_id = path_parts[2].strip()
+    if not GOOGLE_DOC_ID_PATTERN.fullmatch(docs_id):
+        return None
+
+    return docs_id
+
+
+def validate_regex_pattern_input(use_regex_filter, regex_pattern):
+    """정규식 필터 설정의 유효성을 검사하고 오류 메시지를 반환한다."""
+    if not use_regex_filter:
+        return None
+
+    normalized_pattern = (regex_pattern or "").strip()
+    if not normalized_pattern:
+        return "정규식 필터를 사용할 때는 패턴을 입력해주세요."
+
+    try:
+        re.compile(normalized_pattern)
+    except re.error as error:
+        return f"정규식 패턴이 올바르지 않습니다: {error}"
+
+    return None
+
+
+def build_monitoring_config(config_data):
+    """정규화된 앱 설정에서 run_monitoring에 넘길 설정을 만든다. 시작할 수 없으면 MonitoringConfigError."""
+    watch_folder = str(config_data.get("watch_folder") or "").strip()
+    if not watch_folder:
+        raise MonitoringConfigError("감시 폴더(watch_folder)가 설정되어 있지 않습니다.")
+
+    docs_id = extract_google_id_from_url(config_data.get("docs_input"))
+    if not docs_id:
+        raise MonitoringConfigError("유효한 Google Docs URL 또는 ID(docs_input)가 설정되어 있지 않습니다.")
+
+    use_regex_filter = bool(config_data.get("use_regex_filter"))
+    regex_error = validate_regex_pattern_input(use_regex_filter, config_data.get("regex_pattern"))
+    if regex_error:
+        raise MonitoringConfigError(regex_error)
+
+    monitoring_config = {
+        "watch_folder": watch_folder,
+        "docs_id": docs_id,
+        "file_extensions": config_data.get("file_extensions", ".txt"),
+        "use_regex_filter": use_regex_filter,
+        "regex_pattern": config_data.get("regex_pattern", "") if use_regex_filter else "",
+        "max_cache_size": config_data.get("max_cache_size"),
+    }
+    for advanced_key in ENGINE_ADVANCED_CONFIG_KEYS:
+        if advanced_key in config_data:
+            monitoring_config[advanced_key] = config_data[advanced_key]
+    return monitoring_config
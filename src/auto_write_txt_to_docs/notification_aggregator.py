@@ -0,0 +1,117 @@
+import time
+
+
+DEFAULT_NOTIFICATION_WINDOW_SECONDS = 3.0
+MAX_NOTIFICATION_WINDOW_SECONDS = 60.0
+SOUND_MIN_INTERVAL_SECONDS = 1.5
+
+
+class NotificationSummary:
+    """묶음 창 동안 모인 작업 결과 개수."""
+
+    def __init__(self):
+        self.event_counts = {}
+        self.line_count = 0
+
+    def add(self, event_type, line_count=None):
+        self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
+        if event_type == "success":
+            try:
+                self.line_count += max(0, int(line_count or 0))
+            except (TypeError, ValueError):
+                pass
+
+    @property
+    def total_count(self):
+        return sum(self.event_counts.values())
+
+    @property
+    def duplicate_count(self):
+        return self.event_counts.get("duplicate_recorded", 0) + self.event_counts.get("duplicate_skipped", 0)
+
+    @property
+    def failure_count(self):
+        return self.event_counts.get("failure", 0)
+
+    @property
+    def event_type(self):
+        """요약 알림에 쓸 대표 이벤트 유형. 실패가 하나라도 있으면 실패로 본다."""
+        if self.failure_count:
+            return "failure"
+        if self.event_counts.get("success"):
+            return "success"
+        return "duplicate_recorded"
+
+    def describe(self):
+        """'38개 파일, 412줄 추가, 중복 2건' 형태의 요약 문장을 만든다."""
+        parts = [f"{self.total_count}개 파일"]
+        if self.line_count:
+            parts.append(f"{self.line_count}줄 추가")
+        if self.duplicate_count:
+            parts.append(f"중복 {self.duplicate_count}건")
+        if self.failure_count:
+            parts.append(f"실패 {self.failure_count}건")
+        return ", ".join(parts)
+
+
+class NotificationAggregator:
+    """첫 알림은 바로 보내고, 묶음 창 안에 이어지는 알림은 모았다가 요약 하나로 보낸다.
+
+    admit()이 True를 돌려준 이벤트는 호출 측이 즉시 알리고, 창이 열렸으면
+    window_seconds 뒤에 flush()를 호출해야 한다. flush()가 요약을 돌려주면 창을
+    한 번 더 유지하고, 모인 것이 없으면 창을 닫는다.
+    """
+
+    def __init__(self, window_seconds=DEFAULT_NOTIFICATION_WINDOW_SECONDS):
+        self.window_seconds = normalize_notification_window_seconds(window_seconds)
+        self.window_open = False
+        self.pending = NotificationSummary()
+
+    def set_window_seconds(self, window_seconds):
+        self.window_seconds = normalize_notification_window_seconds(window_seconds)
+
+    def admit(self, event_type, line_count=None):
+        """이벤트를 바로 알려야 하면 True, 요약에 합쳐졌으면 False를 반환한다."""
+        if self.window_seconds <= 0:
+            return True
+        if not self.window_open:
+            self.window_open = True
+            return True
+        self.pending.add(event_type, line_count)
+        return False
+
+    def flush(self):
+        """모인 이벤트 요약을 꺼낸다. 없으면 창을 닫고 None을 반환한다."""
+        if not self.pending.total_count:
+            self.window_open = False
+            return None
+        summary = self.pending
+        self.pending = NotificationSummary()
+        return summary
+
+
+class SoundRateLimiter:
+    """효과음이 짧은 간격으로 연달아 울리지 않도록 제한한다."""
+
+    def __init__(self, min_interval_seconds=SOUND_MIN_INTERVAL_SECONDS, clock=time.monotonic):
+        self.min_interval_seconds = min_interval_seconds
+        self.clock = clock
+        self.last_played_time = None
+
+    def allow(self):
+        current_time = self.clock()
+        if self.last_played_time is not None and current_time - self.last_played_time < self.min_interval_seconds:
+            return False
+        self.last_played_time = current_time
+        return True
+
+
+def normalize_notification_window_seconds(value):
+    """알림 묶음 창 길이를 0~60초 범위의 숫자로 정리한다. (0이면 묶지 않음)"""
+    try:
+        window_seconds = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_NOTIFICATION_WINDOW_SECONDS
+    if window_seconds != window_seconds or window_seconds < 0:
+        return DEFAULT_NOTIFICATION_WINDOW_SECONDS
+    return min(window_seconds, MAX_NOTIFICATION_WINDOW_SECONDS)
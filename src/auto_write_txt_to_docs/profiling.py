@@ -0,0 +1,225 @@
+"""현장에서 도구 없이 성능 프로파일을 남기는 기능.
+
+- 샘플링: ``sys._current_frames()``로 모든 스레드의 호출 스택을 주기적으로 모아
+  flamegraph.pl / speedscope에서 읽는 collapsed-stack 텍스트로 저장한다.
+- cProfile: 감시 스레드 안에서 cProfile을 켜고 끈 뒤 pstats 파일과 요약 텍스트를 저장한다.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+
+DEFAULT_PROFILE_SECONDS = 30.0
+SAMPLING_INTERVAL_SECONDS = 0.005
+THREAD_PROFILE_FINISH_TIMEOUT_SECONDS = 30.0
+PSTATS_SUMMARY_LINES = 40
+
+_capture_lock = threading.Lock()
+
+
+class ProfilingError(RuntimeError):
+    """프로파일을 캡처할 수 없을 때 사용자에게 보여줄 메시지를 담는다."""
+
+
+def build_profile_path(log_dir, kind, suffix, now=None):
+    timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
+    return os.path.join(log_dir, f"profile_{kind}_{timestamp}{suffix}")
+
+
+def describe_frame(frame):
+    code = frame.f_code
+    # collapsed-stack 형식은 ';'로 프레임을 나누므로 이름에서 지운다.
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+
+def collapse_stack(frame):
+    """가장 바깥 호출부터 안쪽 순서로 프레임 이름을 모은다."""
+    names = []
+    while frame is not None:
+        names.append(describe_frame(frame))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+class SamplingProfiler:
+    """모든 스레드의 스택을 일정 간격으로 찍어 같은 스택끼리 센다."""
+
+    def __init__(self, interval_seconds=SAMPLING_INTERVAL_SECONDS, current_frames=sys._current_frames):
+        self.interval_seconds = interval_seconds
+        self.current_frames = current_frames
+        self.stack_counts = Counter()
+        self.sample_count = 0
+
+    def take_sample(self, skip_thread_ids=()):
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in self.current_frames().items():
+            if thread_id in skip_thread_ids:
+                continue
+            thread_name = thread_names.get(thread_id, f"thread-{thread_id}").replace(";", ",").replace(" ", "_")
+            self.stack_counts[";".join([thread_name] + collapse_stack(frame))] += 1
+        self.sample_count += 1
+
+    def run(self, duration_seconds, stop_event=None, clock=time.monotonic):
+        """duration_seconds 동안 현재 스레드를 뺀 모든 스레드를 샘플링한다."""
+        own_thread_id = threading.get_ident()
+        deadline = clock() + duration_seconds
+        while clock() < deadline:
+            if stop_event is not None and stop_event.is_set():
+                break
+            self.take_sample(skip_thread_ids=(own_thread_id,))
+            time.sleep(self.interval_seconds)
+
+    def render_collapsed(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.stack_counts.most_common())
+
+    def write_collapsed(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as output_file:
+            output_file.write(self.render_collapsed())
+        return path
+
+
+def capture_sampling_profile(log_dir, duration_seconds=DEFAULT_PROFILE_SECONDS, stop_event=None):
+    """모든 스레드를 샘플링해 collapsed-stack 파일을 저장하고 경로를 반환한다. (호출 스레드를 막는다)"""
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfilingError("이미 다른 성능 프로파일을 캡처하고 있습니다.")
+    try:
+        profiler = SamplingProfiler()
+        profiler.run(duration_seconds, stop_event=stop_event)
+        return profiler.write_collapsed(build_profile_path(log_dir, "sampling", ".collapsed.txt"))
+    finally:
+        _capture_lock.release()
+
+
+class ThreadProfileHook:
+    """다른 스레드(감시 루프)에서 cProfile을 켜고 끄도록 요청을 전달한다.
+
+    cProfile은 자신을 켠 스레드만 기록하므로, 대상 스레드가 루프마다 step()을 불러
+    요청을 받아 직접 켜고 끈다. 잠든 루프는 attach 때 받은 wake_func로 깨운다.
+    """
+
+    def __init__(self, clock=time.monotonic, profile_factory=cProfile.Profile):
+        self.clock = clock
+        self.profile_factory = profile_factory
+        self.lock = threading.Lock()
+        self.attached = False
+        self.wake_func = None
+        self.pending_request = None
+        self.active_request = None
+
+    def attach(self, wake_func=None):
+        with self.lock:
+            self.attached = True
+            self.wake_func = wake_func
+
+    def detach(self):
+        """대상 스레드가 끝날 때 호출한다. 진행 중인 프로파일은 그 시점까지 저장한다."""
+        with self.lock:
+            self.attached = False
+            self.wake_func = None
+            pending_request, self.pending_request = self.pending_request, None
+        if self.active_request is not None:
+            self._finish_active()
+        if pending_request is not None:
+            pending_request["error"] = "감시가 종료되어 프로파일을 시작하지 못했습니다."
+            pending_request["done"].set()
+
+    def _wake(self):
+        wake_func = self.wake_func
+        if wake_func is not None:
+            try:
+                wake_func()
+            except Exception:
+                pass
+
+    def request(self, duration_seconds, output_path):
+        with self.lock:
+            if not self.attached:
+                raise ProfilingError("감시가 실행 중일 때만 감시 스레드 cProfile을 캡처할 수 있습니다.")
+            if self.pending_request is not None or self.active_request is not None:
+                raise ProfilingError("이미 감시 스레드 프로파일을 캡처하고 있습니다.")
+            profile_request = {
+                "duration_seconds": duration_seconds,
+                "output_path": output_path,
+                "done": threading.Event(),
+                "error": None,
+            }
+            self.pending_request = profile_request
+        self._wake()
+        return profile_request
+
+    def step(self):
+        """대상 스레드의 루프에서 매번 호출한다. 요청이 있으면 켜고, 시간이 지났으면 끈다."""
+        if self.pending_request is None and self.active_request is None:
+            return
+        if self.active_request is not None:
+            if self.clock() >= self.active_request["deadline"]:
+                self._finish_active()
+            return
+        with self.lock:
+            profile_request, self.pending_request = self.pending_request, None
+        if profile_request is None:
+            return
+        profile_request["deadline"] = self.clock() + profile_request["duration_seconds"]
+        profile_request["profile"] = self.profile_factory()
+        self.active_request = profile_request
+        profile_request["profile"].enable()
+
+    def _finish_active(self):
+        profile_request, self.active_request = self.active_request, None
+        profile = profile_request["profile"]
+        profile.disable()
+        try:
+            write_pstats_files(profile, profile_request["output_path"])
+        except OSError as error:
+            profile_request["error"] = f"프로파일 파일을 저장하지 못했습니다: {error}"
+        profile_request["done"].set()
+
+    def capture(self, output_path, duration_seconds=DEFAULT_PROFILE_SECONDS,
+                finish_timeout_seconds=THREAD_PROFILE_FINISH_TIMEOUT_SECONDS):
+        """요청 후 duration 동안 기다렸다가 대상 스레드를 깨워 저장을 마치게 한다. (호출 스레드를 막는다)"""
+        profile_request = self.request(duration_seconds, output_path)
+        done = profile_request["done"]
+        if not done.wait(duration_seconds):
+            self._wake()
+            if not done.wait(finish_timeout_seconds):
+                raise ProfilingError("감시 스레드가 바빠 제한 시간 안에 프로파일 저장을 마치지 못했습니다.")
+        if profile_request["error"]:
+            raise ProfilingError(profile_request["error"])
+        return output_path
+
+
+def write_pstats_files(profile, pstats_path):
+    """pstats 원본과 누적 시간 순 상위 함수 요약(.txt)을 함께 저장한다."""
+    os.makedirs(os.path.dirname(os.path.abspath(pstats_path)), exist_ok=True)
+    profile.dump_stats(pstats_path)
+    summary_stream = io.StringIO()
+    try:
+        stats = pstats.Stats(profile, stream=summary_stream)
+        stats.sort_stats("cumulative").print_stats(PSTATS_SUMMARY_LINES)
+    except TypeError:
+        # 한 번도 호출이 기록되지 않은 프로파일은 통계를 만들 수 없다.
+        summary_stream.write("기록된 호출이 없습니다.\n")
+    with open(f"{pstats_path}.txt", "w", encoding="utf-8") as summary_file:
+        summary_file.write(summary_stream.getvalue())
+
+
+def capture_thread_cprofile(hook, log_dir, duration_seconds=DEFAULT_PROFILE_SECONDS):
+    """대상 스레드의 cProfile을 저장하고 pstats 경로를 반환한다. (호출 스레드를 막는다)"""
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfilingError("이미 다른 성능 프로파일을 캡처하고 있습니다.")
+    try:
+        return hook.capture(build_profile_path(log_dir, "cprofile", ".pstats"), duration_seconds=duration_seconds)
+    finally:
+        _capture_lock.release()
+
+
+monitoring_profile_hook = ThreadProfileHook()
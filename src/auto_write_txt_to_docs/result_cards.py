@@ -0,0 +1,190 @@
+RESULT_CARD_ACCENTS = {
+    "성공": ("#DCFCE7", "#14532D"),
+    "중복 기록": ("#FEF3C7", "#92400E"),
+}
+DEFAULT_RESULT_CARD_ACCENT = ("#E0E7FF", "#1E3A8A")
+RESULT_CARD_EMPTY_TEXT = "아직 표시할 최근 추출 결과가 없습니다."
+RESULT_PREVIEW_MAX_LINES = 28
+
+
+def _resolve_ctk(ctk_module=None):
+    """카드 생성에 사용할 customtkinter 모듈을 반환한다."""
+    if ctk_module is not None:
+        return ctk_module
+
+    import customtkinter as ctk
+
+    return ctk
+
+
+class ResultCardSlot:
+    """재사용하는 결과 카드 한 장의 위젯 묶음과 마지막으로 그린 내용."""
+
+    __slots__ = ("frame", "title_label", "meta_label", "badge", "preview_label", "rendered_key", "visible")
+
+    def __init__(self, frame, title_label, meta_label, badge, preview_label):
+        self.frame = frame
+        self.title_label = title_label
+        self.meta_label = meta_label
+        self.badge = badge
+        self.preview_label = preview_label
+        self.rendered_key = None
+        self.visible = False
+
+
+class ResultCardPool:
+    """최근 결과 카드를 고정 개수의 위젯으로 만들어 두고 내용만 바꿔 끼운다.
+
+    카드 위젯과 폰트는 처음 필요할 때 한 번만 만들고, 이후에는 바뀐 카드의
+    라벨 텍스트와 배지 색만 configure로 갱신한다.
+    """
+
+    def __init__(self, parent, font_factory, limit, ctk_module=None):
+        self.parent = parent
+        self.font_factory = font_factory
+        self.limit = limit
+        self.ctk = _resolve_ctk(ctk_module)
+        self.slots = []
+        self.fonts = None
+        self.empty_label = None
+        self.empty_visible = False
+
+    def get_fonts(self):
+        if self.fonts is None:
+            self.fonts = {
+                "title": self.font_factory(13, "bold"),
+                "meta": self.font_factory(11),
+                "badge": self.font_factory(11, "bold"),
+                "preview": self.font_factory(12),
+            }
+        return self.fonts
+
+    def create_slot(self):
+        """카드 한 장의 위젯을 만든다. (풀을 채울 때만 호출)"""
+        ctk = self.ctk
+        fonts = self.get_fonts()
+        card_frame = ctk.CTkFrame(self.parent, corner_radius=12, fg_color=("gray97", "gray18"))
+
+        header_row = ctk.CTkFrame(card_frame, fg_color="transparent")
+        header_row.pack(fill="x", padx=14, pady=(14, 8))
+
+        title_frame = ctk.CTkFrame(header_row, fg_color="transparent")
+        title_frame.pack(side="left", fill="x", expand=True)
+        title_label = ctk.CTkLabel(title_frame, text="", font=fonts["title"], anchor="w")
+        title_label.pack(anchor="w")
+        meta_label = ctk.CTkLabel(
+            title_frame,
+            text="",
+            font=fonts["meta"],
+            text_color=("gray45", "gray70"),
+            anchor="w",
+        )
+        meta_label.pack(anchor="w", pady=(4, 0))
+
+        badge = ctk.CTkLabel(
+            header_row,
+            text="",
+            font=fonts["badge"],
+            corner_radius=999,
+            fg_color=DEFAULT_RESULT_CARD_ACCENT[0],
+            text_color=DEFAULT_RESULT_CARD_ACCENT[1],
+            padx=10,
+            pady=4,
+        )
+        badge.pack(side="right", padx=(10, 0))
+
+        preview_label = ctk.CTkLabel(
+            card_frame,
+            text="",
+            font=fonts["preview"],
+            justify="left",
+            anchor="w",
+            wraplength=760,
+        )
+        preview_label.pack(fill="x", padx=14, pady=(0, 14))
+        return ResultCardSlot(card_frame, title_label, meta_label, badge, preview_label)
+
+    def set_empty_visible(self, visible):
+        if visible == self.empty_visible:
+            return
+        if visible:
+            if self.empty_label is None:
+                self.empty_label = self.ctk.CTkLabel(
+                    self.parent,
+                    text=RESULT_CARD_EMPTY_TEXT,
+                    font=self.get_fonts()["preview"],
+                    text_color=("gray45", "gray68"),
+                    anchor="w",
+                    justify="left",
+                )
+            self.empty_label.pack(fill="x", padx=4, pady=(4, 0))
+        elif self.empty_label is not None:
+            self.empty_label.pack_forget()
+        self.empty_visible = visible
+
+    def update_slot(self, slot, card):
+        """카드 내용이 바뀐 라벨만 갱신한다."""
+        card_key = (
+            card["file_title"],
+            card["extracted_time"],
+            card["line_count"],
+            card["result_type"],
+            card["preview_text"],
+        )
+        if slot.rendered_key == card_key:
+            return False
+
+        previous_key = slot.rendered_key or (None,) * 5
+        if previous_key[0] != card_key[0]:
+            slot.title_label.configure(text=card["file_title"])
+        if previous_key[1:3] != card_key[1:3]:
+            slot.meta_label.configure(text=f"{card['extracted_time']} · {card['line_count']}줄")
+        if previous_key[3] != card_key[3]:
+            accent_fg, accent_text = RESULT_CARD_ACCENTS.get(card["result_type"], DEFAULT_RESULT_CARD_ACCENT)
+            slot.badge.configure(text=card["result_type"], fg_color=accent_fg, text_color=accent_text)
+        if previous_key[4] != card_key[4]:
+            slot.preview_label.configure(text=card["preview_text"])
+        slot.rendered_key = card_key
+        return True
+
+    def render(self, cards):
+        """카드 목록을 풀의 위젯에 순서대로 반영하고 남는 카드는 숨긴다."""
+        cards = list(cards)[:self.limit]
+        self.set_empty_visible(not cards)
+
+        for index, card in enumerate(cards):
+            if index >= len(self.slots):
+                self.slots.append(self.create_slot())
+            slot = self.slots[index]
+            self.update_slot(slot, card)
+            if not slot.visible:
+                slot.frame.pack(fill="x", pady=(0, 10))
+                slot.visible = True
+
+        for slot in self.slots[len(cards):]:
+            if slot.visible:
+                slot.frame.pack_forget()
+                slot.visible = False
+
+    def destroy(self):
+        for slot in self.slots:
+            slot.frame.destroy()
+        if self.empty_label is not None:
+            self.empty_label.destroy()
+        self.slots = []
+        self.empty_label = None
+        self.empty_visible = False
+
+
+def prepend_preview_block(target_widget, preview_block, max_lines=RESULT_PREVIEW_MAX_LINES):
+    """미리보기 위젯 맨 앞에 새 블록만 넣고 max_lines를 넘는 뒤쪽 줄을 잘라낸다."""
+    target_widget.configure(state='normal')
+    try:
+        target_widget.insert("1.0", preview_block)
+        # Tk Text의 end-1c는 마지막 빈 줄 앞이므로 그 줄 번호가 곧 내용 줄 수 + 1이다.
+        content_line_count = int(str(target_widget.index("end-1c")).split('.')[0]) - 1
+        if content_line_count > max_lines:
+            target_widget.delete(f"{max_lines + 1}.0", "end")
+    finally:
+        target_widget.configure(state='disabled')
+    target_widget.see("1.0")
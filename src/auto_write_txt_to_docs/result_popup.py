@@ -1,4 +1,5 @@
 import ctypes
+import time
 from ctypes import wintypes
 
 
@@ -9,6 +10,7 @@ POPUP_RIGHT_SAFE_INSET = 0
 POPUP_MIN_HEIGHT = 96
 SUCCESS_POPUP_DURATION_MS = 4000
 FAILURE_POPUP_DURATION_MS = 6000
+POPUP_UPDATE_MIN_INTERVAL_MS = 400
 MONITOR_DEFAULTTONEAREST = 2
 SPI_GETWORKAREA = 0x0030
 
@@ -62,7 +64,7 @@ class ResultPopupPresenter:
         },
     }
 
-    def __init__(self, root, ctk_module=None, logger=None):
+    def __init__(self, root, ctk_module=None, logger=None, clock=time.monotonic):
         self.root = root
         self.ctk = ctk_module
         if self.ctk is None:
@@ -70,27 +72,106 @@ class ResultPopupPresenter:
 
             self.ctk = ctk
         self.logger = logger
+        self.clock = clock
         self.popup_window = None
+        self.popup_widgets = {}
+        self.popup_visible = False
         self.close_after_id = None
+        self.pending_payload = None
+        self.pending_after_id = None
+        self.last_render_time = None
         self.last_payload = None
 
     def show(self, title, message, level):
-        """현재 팝업을 최신 이벤트로 교체해 표시한다."""
+        """표시 중인 팝업 내용을 최신 이벤트로 바꾼다. 창은 한 번 만들어 계속 재사용한다.
+
+        직전 갱신 후 POPUP_UPDATE_MIN_INTERVAL_MS가 지나지 않았으면 최신 내용만 보관했다가
+        간격이 지난 뒤 한 번에 반영한다.
+        """
         if not self.root or not self._root_exists():
             return False
 
-        normalized_level = self._normalize_level(level)
-        normalized_title = self._normalize_title(title)
         normalized_message = self._normalize_message(message)
         if not normalized_message:
             return False
 
-        self.close()
+        payload = {
+            "title": self._normalize_title(title),
+            "message": normalized_message,
+            "level": self._normalize_level(level),
+        }
+
+        elapsed_ms = None
+        if self.last_render_time is not None:
+            elapsed_ms = (self.clock() - self.last_render_time) * 1000
+        if self.popup_visible and elapsed_ms is not None and elapsed_ms < POPUP_UPDATE_MIN_INTERVAL_MS:
+            self.pending_payload = payload
+            if self.pending_after_id is None:
+                self.pending_after_id = self.root.after(
+                    max(1, int(POPUP_UPDATE_MIN_INTERVAL_MS - elapsed_ms)),
+                    self._render_pending_payload,
+                )
+            return True
+
+        self._render_payload(payload)
+        return True
+
+    def _render_pending_payload(self):
+        """대기 중인 최신 내용을 팝업에 반영한다."""
+        self.pending_after_id = None
+        payload = self.pending_payload
+        self.pending_payload = None
+        if payload is not None and self._root_exists():
+            self._render_payload(payload)
+
+    def _render_payload(self, payload):
+        """재사용 팝업의 텍스트와 색만 바꾸고 자동 닫힘 타이머를 다시 건다."""
+        self._cancel_close_timer()
+        popup_window = self._ensure_popup_window()
+        widgets = self.popup_widgets
+        style = self.LEVEL_STYLE[payload["level"]]
+
+        popup_window.title(payload["title"])
+        widgets["container"].configure(fg_color=style["background"], border_color=style["border"])
+        widgets["accent_bar"].configure(fg_color=style["accent"])
+        widgets["title_label"].configure(text=payload["title"], text_color=style["title"])
+        widgets["close_button"].configure(
+            fg_color=style["accent"],
+            hover_color=style["border"],
+            border_color=style["border"],
+        )
+        widgets["message_label"].configure(text=payload["message"], text_color=style["message"])
+
+        try:
+            popup_window.deiconify()
+            popup_window.lift()
+            popup_window.update_idletasks()
+        except Exception:
+            pass
+
+        self._place_popup(popup_window)
+        try:
+            popup_window.after(0, lambda: self._refresh_popup_geometry(popup_window))
+        except Exception:
+            pass
+
+        self.popup_visible = True
+        self.last_render_time = self.clock()
+        self.last_payload = payload
+        self.close_after_id = self.root.after(
+            self._resolve_duration_ms(payload["level"]),
+            self.close,
+        )
+
+    def _ensure_popup_window(self):
+        """팝업 창과 위젯을 처음 한 번만 만든다."""
+        if self.popup_window is not None and self._window_exists(self.popup_window):
+            return self.popup_window
+
         popup_window = self.ctk.CTkToplevel(self.root)
-        popup_window.title(normalized_title)
         self._configure_window(popup_window)
 
-        style = self.LEVEL_STYLE[normalized_level]
+        style = self.LEVEL_STYLE["success"]
         container = self.ctk.CTkFrame(
             popup_window,
             corner_radius=14,
@@ -114,16 +195,17 @@ class ResultPopupPresenter:
         header_frame = self.ctk.CTkFrame(content_frame, fg_color="transparent")
         header_frame.pack(fill="x")
 
-        self.ctk.CTkLabel(
+        title_label = self.ctk.CTkLabel(
             header_frame,
-            text=normalized_title,
+            text="",
             anchor="w",
             justify="left",
             text_color=style["title"],
             font=self._build_font(size=13, weight="bold"),
-        ).pack(side="left", fill="x", expand=True)
+        )
+        title_label.pack(side="left", fill="x", expand=True)
 
-        self.ctk.CTkButton(
+        close_button = self.ctk.CTkButton(
             header_frame,
             text="닫기",
             width=38,
@@ -136,45 +218,31 @@ class ResultPopupPresenter:
             border_width=1,
             border_color=style["border"],
             font=self._build_font(size=10, weight="bold"),
-        ).pack(side="right", padx=(6, 0))
+        )
+        close_button.pack(side="right", padx=(6, 0))
 
-        self.ctk.CTkLabel(
+        message_label = self.ctk.CTkLabel(
             content_frame,
-            text=normalized_message,
+            text="",
             anchor="w",
             justify="left",
             wraplength=DEFAULT_POPUP_WIDTH - 84,
             text_color=style["message"],
             font=self._build_font(size=11),
-        ).pack(fill="x", pady=(6, 0))
-
-        try:
-            popup_window.deiconify()
-            popup_window.lift()
-            popup_window.update_idletasks()
-        except Exception:
-            pass
-
-        self._place_popup(popup_window)
-        try:
-            popup_window.after(0, lambda: self._refresh_popup_geometry(popup_window))
-        except Exception:
-            pass
+        )
+        message_label.pack(fill="x", pady=(6, 0))
 
         self.popup_window = popup_window
-        self.last_payload = {
-            "title": normalized_title,
-            "message": normalized_message,
-            "level": normalized_level,
+        self.popup_widgets = {
+            "container": container,
+            "accent_bar": accent_bar,
+            "title_label": title_label,
+            "close_button": close_button,
+            "message_label": message_label,
         }
-        self.close_after_id = self.root.after(
-            self._resolve_duration_ms(normalized_level),
-            self.close,
-        )
-        return True
+        return popup_window
 
-    def close(self):
-        """표시 중인 팝업과 자동 닫힘 타이머를 정리한다."""
+    def _cancel_close_timer(self):
         if self.close_after_id and self._root_exists():
             try:
                 self.root.after_cancel(self.close_after_id)
@@ -182,8 +250,31 @@ class ResultPopupPresenter:
                 pass
         self.close_after_id = None
 
+    def close(self):
+        """팝업을 숨기고 타이머를 정리한다. 창은 다음 알림에 다시 쓴다."""
+        self._cancel_close_timer()
+        if self.pending_after_id and self._root_exists():
+            try:
+                self.root.after_cancel(self.pending_after_id)
+            except Exception:
+                pass
+        self.pending_after_id = None
+        self.pending_payload = None
+        self.popup_visible = False
+
+        popup_window = self.popup_window
+        if popup_window is not None and self._window_exists(popup_window):
+            try:
+                popup_window.withdraw()
+            except Exception:
+                pass
+
+    def destroy(self):
+        """앱 종료 시 재사용 팝업 창까지 완전히 없앤다."""
+        self.close()
         popup_window = self.popup_window
         self.popup_window = None
+        self.popup_widgets = {}
         if popup_window is not None and self._window_exists(popup_window):
             try:
                 popup_window.destroy()
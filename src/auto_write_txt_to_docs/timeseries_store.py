@@ -0,0 +1,318 @@
+"""분 단위 처리량/오류 시계열을 고정 크기 링 파일에 저장한다.
+
+파일은 헤더 뒤에 분마다 한 칸씩 고정 크기 슬롯이 이어진 구조다. 슬롯 위치는
+``분 번호 % 슬롯 수``로 정해지므로 파일 크기가 늘지 않고, 오래된 분은 같은 칸에 덮어쓴다.
+
+CSV 내보내기: python -m src.auto_write_txt_to_docs.timeseries_store --hours 24 -o out.csv
+"""
+
+import argparse
+import csv
+import os
+import struct
+import sys
+import threading
+import time
+
+from .metrics import (
+    BYTES_READ_TOTAL,
+    DOCS_API_CALLS_TOTAL,
+    DOCS_API_ERRORS_TOTAL,
+    DOCS_API_LATENCY,
+    FILE_QUEUE_DEPTH,
+    LINES_DEDUPED_TOTAL,
+    LINES_WRITTEN_TOTAL,
+    RETRIES_TOTAL,
+    metrics_registry,
+)
+from .path_utils import LOG_DIR_STR
+
+
+TIMESERIES_FILE_NAME = "throughput_timeseries.bin"
+TIMESERIES_MAGIC = b"AWTS"
+TIMESERIES_VERSION = 1
+DEFAULT_SLOT_COUNT = 7 * 24 * 60  # 7일
+SAMPLE_INTERVAL_SECONDS = 10.0
+
+HEADER_STRUCT = struct.Struct("<4sII")
+SERIES_FIELDS = (
+    "lines_written",
+    "bytes_read",
+    "docs_calls",
+    "docs_errors",
+    "api_latency_sum_ms",
+    "api_latency_max_ms",
+    "retries",
+    "duplicates",
+    "queue_depth_max",
+)
+# 분 번호(0이면 빈 칸) + 필드별 값
+SLOT_STRUCT = struct.Struct("<q" + "Q" * len(SERIES_FIELDS))
+MAX_FIELDS = ("api_latency_max_ms", "queue_depth_max")
+
+# 카운터 지표 -> 시계열 필드
+COUNTER_FIELDS = {
+    LINES_WRITTEN_TOTAL: "lines_written",
+    BYTES_READ_TOTAL: "bytes_read",
+    DOCS_API_CALLS_TOTAL: "docs_calls",
+    DOCS_API_ERRORS_TOTAL: "docs_errors",
+    RETRIES_TOTAL: "retries",
+    LINES_DEDUPED_TOTAL: "duplicates",
+}
+
+SPARKLINE_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def get_default_timeseries_path(log_dir=LOG_DIR_STR):
+    return os.path.join(log_dir, TIMESERIES_FILE_NAME)
+
+
+def empty_bucket():
+    return dict.fromkeys(SERIES_FIELDS, 0)
+
+
+def merge_bucket(target, source):
+    for field in SERIES_FIELDS:
+        if field in MAX_FIELDS:
+            target[field] = max(target[field], source[field])
+        else:
+            target[field] += source[field]
+    return target
+
+
+class TimeSeriesStore:
+    """분 단위 버킷을 링 파일에 읽고 쓴다. 쓰기는 한 스레드(기록기)에서만 한다."""
+
+    def __init__(self, path, slot_count=DEFAULT_SLOT_COUNT):
+        self.path = path
+        self.slot_count = slot_count
+
+    def _slot_offset(self, minute):
+        return HEADER_STRUCT.size + (minute % self.slot_count) * SLOT_STRUCT.size
+
+    def open_for_write(self):
+        """파일이 없거나 구조가 다르면 새로 만든다."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)) or ".", exist_ok=True)
+        expected_size = HEADER_STRUCT.size + self.slot_count * SLOT_STRUCT.size
+        try:
+            store_file = open(self.path, "r+b")
+        except FileNotFoundError:
+            store_file = None
+        if store_file is not None:
+            header = store_file.read(HEADER_STRUCT.size)
+            if len(header) == HEADER_STRUCT.size and os.fstat(store_file.fileno()).st_size == expected_size:
+                magic, version, slot_count = HEADER_STRUCT.unpack(header)
+                if (magic, version, slot_count) == (TIMESERIES_MAGIC, TIMESERIES_VERSION, self.slot_count):
+                    return store_file
+            store_file.close()
+
+        store_file = open(self.path, "w+b")
+        store_file.write(HEADER_STRUCT.pack(TIMESERIES_MAGIC, TIMESERIES_VERSION, self.slot_count))
+        store_file.truncate(expected_size)
+        store_file.flush()
+        return store_file
+
+    def add_to_bucket(self, minute, values, store_file=None):
+        """해당 분 버킷에 값을 더한다. 칸에 다른(오래된) 분이 있으면 덮어쓴다."""
+        owns_file = store_file is None
+        if owns_file:
+            store_file = self.open_for_write()
+        try:
+            offset = self._slot_offset(minute)
+            store_file.seek(offset)
+            bucket = self._unpack_slot(store_file.read(SLOT_STRUCT.size), minute) or empty_bucket()
+            merge_bucket(bucket, values)
+            store_file.seek(offset)
+            store_file.write(SLOT_STRUCT.pack(minute, *(int(bucket[field]) for field in SERIES_FIELDS)))
+            store_file.flush()
+        finally:
+            if owns_file:
+                store_file.close()
+
+    @staticmethod
+    def _unpack_slot(raw_slot, expected_minute=None):
+        if len(raw_slot) != SLOT_STRUCT.size:
+            return None
+        minute, *values = SLOT_STRUCT.unpack(raw_slot)
+        if minute <= 0 or (expected_minute is not None and minute != expected_minute):
+            return None
+        return dict(zip(SERIES_FIELDS, values))
+
+    def read_range(self, start_minute, end_minute):
+        """[start_minute, end_minute] 구간의 (분 번호, 버킷) 목록. 기록 없는 분은 빈 버킷이다."""
+        start_minute = max(start_minute, end_minute - self.slot_count + 1)
+        try:
+            with open(self.path, "rb") as store_file:
+                data = store_file.read()
+        except FileNotFoundError:
+            data = b""
+        header_ok = (
+            len(data) >= HEADER_STRUCT.size
+            and HEADER_STRUCT.unpack_from(data) == (TIMESERIES_MAGIC, TIMESERIES_VERSION, self.slot_count)
+        )
+        rows = []
+        for minute in range(start_minute, end_minute + 1):
+            bucket = None
+            if header_ok:
+                offset = self._slot_offset(minute)
+                bucket = self._unpack_slot(data[offset:offset + SLOT_STRUCT.size], minute)
+            rows.append((minute, bucket or empty_bucket()))
+        return rows
+
+    def read_recent(self, minutes, current_time=None):
+        end_minute = int((time.time() if current_time is None else current_time) // 60)
+        return self.read_range(end_minute - minutes + 1, end_minute)
+
+
+class TimeSeriesRecorder:
+    """지표 레지스트리의 카운터 증가분을 주기적으로 읽어 현재 분 버킷에 더한다."""
+
+    def __init__(
+        self,
+        store,
+        registry=metrics_registry,
+        sample_interval_seconds=SAMPLE_INTERVAL_SECONDS,
+        clock=time.time,
+    ):
+        self.store = store
+        self.registry = registry
+        self.sample_interval_seconds = sample_interval_seconds
+        self.clock = clock
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_totals = self._read_totals()
+        self.last_error = None
+
+    def _read_totals(self):
+        totals = {name: self.registry.get_value(name) for name in COUNTER_FIELDS}
+        totals[DOCS_API_LATENCY] = self.registry.get_value(DOCS_API_LATENCY, (0, 0.0))[1]
+        return totals
+
+    def sample(self, store_file=None):
+        """지난 표본 이후 증가분을 현재 분 버킷에 기록한다."""
+        totals = self._read_totals()
+        values = empty_bucket()
+        for name, field in COUNTER_FIELDS.items():
+            values[field] = max(0, totals[name] - self.last_totals[name])
+        values["api_latency_sum_ms"] = max(0, round((totals[DOCS_API_LATENCY] - self.last_totals[DOCS_API_LATENCY]) * 1000))
+        latency_histogram = self.registry.metrics.get(DOCS_API_LATENCY)
+        if latency_histogram is not None:
+            values["api_latency_max_ms"] = round(latency_histogram.pop_window_max() * 1000)
+        values["queue_depth_max"] = int(self.registry.get_value(FILE_QUEUE_DEPTH) or 0)
+        self.last_totals = totals
+        self.store.add_to_bucket(int(self.clock() // 60), values, store_file=store_file)
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="TimeSeriesRecorder", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            store_file = self.store.open_for_write()
+        except OSError as error:
+            self.last_error = error
+            return
+        with store_file:
+            while not self.stop_event.wait(self.sample_interval_seconds):
+                self._sample_safely(store_file)
+            self._sample_safely(store_file)
+
+    def _sample_safely(self, store_file):
+        try:
+            self.sample(store_file)
+        except (OSError, struct.error) as error:
+            self.last_error = error
+
+    def stop(self, timeout=2.0):
+        """기록 스레드를 멈춘다. 스레드는 끝나기 전에 남은 증가분을 한 번 더 기록한다."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=timeout)
+            self.thread = None
+
+
+def aggregate_rows(rows, point_count):
+    """분 버킷들을 point_count개 구간으로 합친다."""
+    if not rows:
+        return []
+    group_size = max(1, -(-len(rows) // point_count))
+    points = []
+    for start_index in range(0, len(rows), group_size):
+        bucket = empty_bucket()
+        for _minute, row_bucket in rows[start_index:start_index + group_size]:
+            merge_bucket(bucket, row_bucket)
+        points.append(bucket)
+    return points
+
+
+def build_sparkline(values):
+    """값 목록을 유니코드 블록 문자 한 줄로 그린다."""
+    if not values:
+        return ""
+    max_value = max(values)
+    if max_value <= 0:
+        return SPARKLINE_CHARS[0] * len(values)
+    last_index = len(SPARKLINE_CHARS) - 1
+    return "".join(SPARKLINE_CHARS[min(last_index, round(value / max_value * last_index))] for value in values)
+
+
+def format_sparkline_report(store, hours, point_count=48, current_time=None):
+    """기간별 주요 시계열을 스파크라인 텍스트로 만든다."""
+    points = aggregate_rows(store.read_recent(hours * 60, current_time=current_time), point_count)
+    series = (
+        ("기록 줄", [point["lines_written"] for point in points]),
+        ("Docs 호출", [point["docs_calls"] for point in points]),
+        ("API 오류", [point["docs_errors"] for point in points]),
+        ("재시도", [point["retries"] for point in points]),
+        ("중복", [point["duplicates"] for point in points]),
+        (
+            "API 평균(ms)",
+            [point["api_latency_sum_ms"] // point["docs_calls"] if point["docs_calls"] else 0 for point in points],
+        ),
+        ("큐 최대", [point["queue_depth_max"] for point in points]),
+    )
+    lines = []
+    for label, values in series:
+        lines.append(f"{label} (합계 {sum(values)}, 최대 {max(values, default=0)})")
+        lines.append(build_sparkline(values))
+    return "\n".join(lines)
+
+
+def export_csv(store, output_file, start_minute, end_minute, include_empty=False):
+    """구간의 분 버킷을 CSV로 쓴다. 반환값은 쓴 행 수."""
+    writer = csv.writer(output_file)
+    writer.writerow(("minute_utc",) + SERIES_FIELDS)
+    row_count = 0
+    for minute, bucket in store.read_range(start_minute, end_minute):
+        if not include_empty and not any(bucket.values()):
+            continue
+        minute_text = time.strftime("%Y-%m-%dT%H:%M:00Z", time.gmtime(minute * 60))
+        writer.writerow((minute_text,) + tuple(bucket[field] for field in SERIES_FIELDS))
+        row_count += 1
+    return row_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="분 단위 처리량 시계열을 CSV로 내보낸다.")
+    parser.add_argument("--path", default=get_default_timeseries_path(), help="시계열 파일 경로")
+    parser.add_argument("--hours", type=float, default=24.0, help="최근 몇 시간을 내보낼지 (기본 24)")
+    parser.add_argument("--include-empty", action="store_true", help="기록이 없는 분도 포함")
+    parser.add_argument("-o", "--output", help="CSV 파일 경로 (생략하면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    store = TimeSeriesStore(args.path)
+    end_minute = int(time.time() // 60)
+    start_minute = end_minute - max(1, int(args.hours * 60)) + 1
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as output_file:
+            export_csv(store, output_file, start_minute, end_minute, include_empty=args.include_empty)
+    else:
+        export_csv(store, sys.stdout, start_minute, end_minute, include_empty=args.include_empty)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Google Docs 기록용 선행 기록(write-ahead journal).
+
+batchUpdate를 보내기 전에 보낼 문자열, 그 다이제스트, 처리 위치 범위, 마지막으로 알던 문서
+revisionId/끝 위치를 적어 두고, 응답을 받으면 완료로 적는다. 응답을 받지 못한 기록(시간 초과,
+보낸 직후 비정상 종료)은 다시 보내기 전에 문서를 확인해 이미 반영됐는지 가린다.
+(backend_processor.verify_journal_entry)
+
+파일은 JSON 줄을 덧붙이기만 하고, 열 때와 미완료 기록이 없어질 때 필요한 줄만 남겨 다시 쓴다.
+경로 없이 만들면 메모리에만 둔다. (테스트와 세션 밖 process_file 호출)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+WRITE_JOURNAL_FILE_NAME = "docs_write_journal.jsonl"
+
+
+def digest_text(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def count_utf16_units(text):
+    """Docs 인덱스는 UTF-16 코드 단위로 센다."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+class WriteJournal:
+    """미완료 기록과 문서별 마지막 revisionId/끝 위치를 보관한다. 여러 엔진 스레드에서 불러도 된다."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.documents = {}
+        self.next_entry_id = 1
+
+    def open(self, path, log_func=None):
+        """저널 파일을 읽어 미완료 기록과 문서 상태를 되살리고, 남길 줄만으로 파일을 다시 쓴다."""
+        with self.lock:
+            self.path = path
+            self.pending = {}
+            self.documents = {}
+            self.next_entry_id = 1
+            if path and os.path.exists(path):
+                self._replay_locked(log_func)
+            self._rewrite_locked()
+            pending_count = len(self.pending)
+        if pending_count and log_func:
+            log_func(f"백엔드: 응답을 받지 못한 Docs 기록 {pending_count}건은 다음 기록 전에 반영 여부를 확인합니다.")
+
+    def _replay_locked(self, log_func):
+        with open(self.path, 'r', encoding='utf-8') as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 쓰는 도중 끊긴 마지막 줄은 보내기 전이었으므로 버려도 된다.
+                    if log_func:
+                        log_func("경고: Docs 기록 저널의 깨진 줄을 건너뜁니다.")
+                    continue
+                operation = record.get('op')
+                if operation == 'begin':
+                    entry = record.get('entry') or {}
+                    if entry.get('text') is not None and digest_text(entry['text']) == entry.get('digest'):
+                        self.pending[entry['id']] = entry
+                        self.next_entry_id = max(self.next_entry_id, int(entry['id']) + 1)
+                elif operation == 'end':
+                    self.pending.pop(record.get('id'), None)
+                elif operation == 'document':
+                    self.documents[record.get('docs_id')] = {
+                        'revision_id': record.get('revision_id'),
+                        'end_index': record.get('end_index'),
+                    }
+
+    def _rewrite_locked(self):
+        if not self.path:
+            return
+        records = [
+            {'op': 'document', 'docs_id': docs_id, **state} for docs_id, state in self.documents.items()
+        ] + [{'op': 'begin', 'entry': entry} for entry in self.pending.values()]
+        target_dir = os.path.dirname(self.path)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as journal_file:
+            for record in records:
+                journal_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temp_path, self.path)
+
+    def _append_locked(self, record):
+        if not self.path:
+            return
+        with open(self.path, 'a', encoding='utf-8') as journal_file:
+            journal_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    def begin(self, docs_id, filepath, text, start_offset=None, end_offset=None):
+        """보내기 직전에 부른다. 디스크에 적힌 뒤에 반환한다."""
+        with self.lock:
+            document_state = self.documents.get(docs_id) or {}
+            entry = {
+                'id': self.next_entry_id,
+                'docs_id': docs_id,
+                'filepath': filepath,
+                'digest': digest_text(text),
+                'text': text,
+                'text_units': count_utf16_units(text),
+                'start_offset': start_offset,
+                'end_offset': end_offset,
+                'base_revision_id': document_state.get('revision_id'),
+                'base_end_index': document_state.get('end_index'),
+                'created_at': time.time(),
+            }
+            self.next_entry_id += 1
+            self.pending[entry['id']] = entry
+            self._append_locked({'op': 'begin', 'entry': entry})
+            return entry
+
+    def complete(self, entry, revision_id=None):
+        """반영된 기록을 닫는다. revision_id는 batchUpdate 응답의 writeControl.requiredRevisionId다.
+
+        revision_id를 주면 문서 끝 위치도 이 기록 길이만큼 옮겨 둔다. (그 사이 다른 변경이 없었을 때만)
+        """
+        with self.lock:
+            self.pending.pop(entry['id'], None)
+            if revision_id is not None:
+                document_state = self.documents.get(entry['docs_id']) or {}
+                end_index = None
+                if (
+                    document_state.get('end_index') is not None
+                    and document_state.get('revision_id') == entry['base_revision_id']
+                ):
+                    end_index = document_state['end_index'] + entry['text_units']
+                self.documents[entry['docs_id']] = {'revision_id': revision_id, 'end_index': end_index}
+            if not self.pending:
+                # 남길 미완료 기록이 없으면 덧붙이는 대신 문서 상태만으로 다시 쓴다.
+                self._rewrite_locked()
+                return
+            if revision_id is not None:
+                self._append_locked({'op': 'document', 'docs_id': entry['docs_id'], **self.documents[entry['docs_id']]})
+            self._append_locked({'op': 'end', 'id': entry['id'], 'applied': True})
+
+    def discard(self, entry):
+        """반영되지 않은 것이 확실한 기록을 지운다. 다시 보내면 새 기록으로 적는다."""
+        with self.lock:
+            if self.pending.pop(entry['id'], None) is None:
+                return
+            if not self.pending:
+                self._rewrite_locked()
+                return
+            self._append_locked({'op': 'end', 'id': entry['id'], 'applied': False})
+
+    def remember_document_state(self, docs_id, revision_id, end_index):
+        """documents().get으로 확인한 현재 문서 상태를 기준으로 삼는다."""
+        with self.lock:
+            self.documents[docs_id] = {'revision_id': revision_id, 'end_index': end_index}
+            self._append_locked({'op': 'document', 'docs_id': docs_id, **self.documents[docs_id]})
+
+    def pending_for(self, filepath):
+        with self.lock:
+            return [entry for entry in self.pending.values() if entry['filepath'] == filepath]
+
+    def has_pending(self):
+        return bool(self.pending)
+
+
+write_journal = WriteJournal()
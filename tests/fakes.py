@@ -0,0 +1,11 @@
+"""여러 테스트가 함께 쓰는 가짜 객체."""
+
+
+class FakeClock:
+    """clock 인자로 넘기는 가짜 시계. 부르면 now를 돌려주므로 테스트가 now를 직접 바꿔 시간을 흘린다."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
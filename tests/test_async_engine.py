@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import os
+import queue
+import re
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.auto_write_txt_to_docs import async_engine, backend_processor
+from src.auto_write_txt_to_docs.async_engine import (
+    AsyncMonitoringEngine,
+    merge_file_events,
+    run_monitoring_async,
+    select_monitoring_engine,
+)
+
+EXTRACTED_TIME_PATTERN = re.compile(r"# 추출된 시간: .*\n")
+
+
+class FakeDocsService:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def documents(self):
+        return self
+
+    def batchUpdate(self, documentId, body):
+        with self.lock:
+            self.calls.append((documentId, body))
+        return self
+
+    def execute(self):
+        with self.lock:
+            if self.failures > 0:
+                self.failures -= 1
+                raise RuntimeError("테스트용 Docs 실패")
+        return {}
+
+    def inserted_texts(self):
+        """추출 시각 줄을 뺀 삽입 문자열 목록 (두 엔진 출력 비교용)"""
+        texts = []
+        for _document_id, body in self.calls:
+            for request in body["requests"]:
+                if "insertText" in request:
+                    texts.append(EXTRACTED_TIME_PATTERN.sub("", request["insertText"]["text"]))
+        return texts
+
+
+def reset_backend_state():
+    backend_processor.processed_file_states.clear()
+    backend_processor.file_encodings.clear()
+    backend_processor.added_lines_cache.clear()
+    backend_processor.file_queue = queue.Queue()
+    backend_processor.settle_deadlines.clear()
+    backend_processor.settle_deadline_paths.clear()
+    backend_processor.settle_deadline_traces.clear()
+    backend_processor.processed_state_dirty = False
+    backend_processor.processed_state_save_timer = None
+
+
+class AsyncMonitoringEngineTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        reset_backend_state()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        patches = {
+            "PROCESSED_STATE_FILE": os.path.join(self.temp_dir.name, "processed_state.json"),
+            "LINE_CACHE_FILE": os.path.join(self.temp_dir.name, "added_lines_cache.json"),
+            "TIMESERIES_FILE": os.path.join(self.temp_dir.name, "timeseries.bin"),
+            "WRITE_JOURNAL_FILE": os.path.join(self.temp_dir.name, "docs_write_journal.jsonl"),
+            "HISTORY_INDEX_FILE": os.path.join(self.temp_dir.name, "history_index.sqlite3"),
+        }
+        for name, value in patches.items():
+            patcher = patch.object(backend_processor, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(reset_backend_state)
+        self.addCleanup(backend_processor.write_journal.open, None)
+        self.addCleanup(backend_processor.history_index.close)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.config = {"docs_id": "doc-1", "watch_folder": self.temp_dir.name}
+
+    def create_named_file(self, filename, content):
+        filepath = os.path.join(self.temp_dir.name, filename)
+        with open(filepath, "w", encoding="utf-8", newline="") as target_file:
+            target_file.write(content)
+        return filepath
+
+    def run_engine(self, docs_service, submissions, read_concurrency=2):
+        """감시자 없이 엔진을 돌려 submissions를 넣고, 모두 처리되면 멈춘다."""
+        engine = AsyncMonitoringEngine(
+            self.config, lambda _message: None, {"docs": docs_service}, read_concurrency=read_concurrency
+        )
+        stop_event = threading.Event()
+
+        async def scenario():
+            run_task = asyncio.create_task(engine.run(stop_event, observer_factory=None))
+            await asyncio.sleep(0)
+            for submission in submissions:
+                engine.submit(*submission)
+            await asyncio.wait_for(engine.wait_until_idle(), 5.0)
+            stop_event.set()
+            return await run_task
+
+        self.assertTrue(asyncio.run(scenario()))
+        return engine
+
+    def test_async_engine_writes_same_docs_output_as_threaded_engine(self):
+        paths = [
+            self.create_named_file("a.txt", "첫 줄\n둘째 줄\n"),
+            self.create_named_file("b.txt", "둘째 줄\n셋째 줄\n"),
+            self.create_named_file("c.txt", "첫 줄\n"),
+            self.create_named_file("d.txt", "넷째 줄\n"),
+        ]
+        threaded_docs = FakeDocsService()
+        for filepath in paths:
+            backend_processor.process_file(filepath, self.config, {"docs": threaded_docs}, lambda _message: None)
+
+        reset_backend_state()
+        async_docs = FakeDocsService()
+        self.run_engine(async_docs, [(filepath, None, None) for filepath in paths], read_concurrency=3)
+
+        self.assertEqual(len(threaded_docs.calls), 4)
+        self.assertEqual(async_docs.inserted_texts(), threaded_docs.inserted_texts())
+
+    def test_repeated_events_for_same_file_are_coalesced(self):
+        filepath = self.create_named_file("chat.txt", "한 줄\n")
+        docs_service = FakeDocsService()
+
+        self.run_engine(docs_service, [(filepath, "modified", None), (filepath, "modified", None)])
+
+        self.assertEqual(len(docs_service.calls), 1)
+        self.assertEqual(
+            backend_processor.processed_file_states[filepath]["last_byte_offset"], os.path.getsize(filepath)
+        )
+
+    def test_failed_write_is_retried_through_event_loop_timer(self):
+        filepath = self.create_named_file("retry.txt", "재시도할 줄\n")
+        docs_service = FakeDocsService(failures=1)
+
+        with patch.object(backend_processor, "RETRY_DELAY", 0.05), patch.object(
+            backend_processor, "PROCESSING_DELAY", 0.05
+        ):
+            engine = AsyncMonitoringEngine(self.config, lambda _message: None, {"docs": docs_service})
+            stop_event = threading.Event()
+
+            async def scenario():
+                run_task = asyncio.create_task(engine.run(stop_event, observer_factory=None))
+                await asyncio.sleep(0)
+                engine.submit(filepath)
+                for _ in range(100):
+                    if backend_processor.processed_file_states.get(filepath, {}).get("last_byte_offset"):
+                        break
+                    await asyncio.sleep(0.02)
+                stop_event.set()
+                await run_task
+
+            asyncio.run(scenario())
+
+        self.assertEqual(len(docs_service.calls), 2)
+        self.assertEqual(
+            backend_processor.processed_file_states[filepath]["last_byte_offset"], os.path.getsize(filepath)
+        )
+        self.assertIs(backend_processor.engine_scheduler.__class__, backend_processor.ThreadEngineScheduler)
+
+    def test_monitoring_stop_event_wakes_loop_without_polling(self):
+        engine = AsyncMonitoringEngine(self.config, lambda _message: None, {"docs": FakeDocsService()})
+        stop_event = backend_processor.MonitoringStopEvent()
+        wake_funcs = []
+
+        async def scenario():
+            run_task = asyncio.create_task(engine.run(stop_event, observer_factory=None))
+            await asyncio.sleep(0.05)
+            wake_funcs.append(async_engine.monitoring_profile_hook.wake_func)
+            threading.Thread(target=stop_event.set).start()
+            return await asyncio.wait_for(run_task, 2.0)
+
+        # 폴링 간격을 길게 잡아도 set() 하자마자 멈춰야 한다.
+        with patch.object(async_engine, "STOP_POLL_SECONDS", 60.0):
+            self.assertTrue(asyncio.run(scenario()))
+
+        self.assertEqual(wake_funcs, [engine.wake_control_loop])
+        self.assertEqual(stop_event.wake_callbacks, [])
+
+    def test_merge_file_events_keeps_created_and_first_trace(self):
+        first_trace = object()
+        self.assertEqual(merge_file_events(None, ("modified", None)), ("modified", None))
+        self.assertEqual(
+            merge_file_events(("created", first_trace), ("modified", object())),
+            ("created", first_trace),
+        )
+        self.assertEqual(merge_file_events((None, None), ("modified", first_trace)), ("modified", first_trace))
+
+    def test_select_monitoring_engine_follows_config(self):
+        self.assertIs(select_monitoring_engine({"monitoring_engine": "asyncio"}), run_monitoring_async)
+        self.assertIs(select_monitoring_engine({"monitoring_engine": "thread"}), backend_processor.run_monitoring)
+        self.assertIs(select_monitoring_engine({}), backend_processor.run_monitoring)
+
+    def test_run_monitoring_async_saves_state_on_stop(self):
+        filepath = self.create_named_file("saved.txt", "저장할 줄\n")
+        docs_service = FakeDocsService()
+        stop_event = threading.Event()
+
+        class FakeObserver:
+            def schedule(self, handler, _path, recursive=False):
+                self.handler = handler
+
+            def start(self):
+                # watchdog 스레드에서 이벤트가 들어오는 것처럼 다른 스레드에서 넘긴다.
+                event = type("Event", (), {"is_directory": False, "src_path": filepath, "event_type": "modified"})
+                threading.Thread(target=self.handler.process, args=(event,), daemon=True).start()
+
+            def stop(self):
+                return None
+
+            def join(self, _timeout=None):
+                return None
+
+        def stop_after_write():
+            for _ in range(100):
+                if docs_service.calls:
+                    break
+                threading.Event().wait(0.02)
+            stop_event.set()
+
+        threading.Thread(target=stop_after_write, daemon=True).start()
+        with patch.object(backend_processor, "setup_backend_logging", lambda: logging.getLogger("test_async_engine")):
+            run_monitoring_async(
+                self.config,
+                lambda _message: None,
+                stop_event,
+                preloaded_services={"docs": docs_service},
+                observer_factory=FakeObserver,
+            )
+
+        self.assertEqual(len(docs_service.calls), 1)
+        self.assertTrue(os.path.exists(backend_processor.PROCESSED_STATE_FILE))
+        self.assertEqual(async_engine.metrics_registry.gauge(async_engine.FILE_QUEUE_DEPTH).get(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.auto_write_txt_to_docs.backend_process import (
+    API_LATENCY_BUCKET_SLOTS,
+    BackendProcessSupervisor,
+    SharedStatusBlock,
+    backend_child_main,
+    collect_status_values,
+    decode_status_values,
+)
+from src.auto_write_txt_to_docs.latency_tracing import LatencyTracker, TraceContext
+from src.auto_write_txt_to_docs.metrics import (
+    DOCS_API_LATENCY,
+    FILE_QUEUE_DEPTH,
+    LINES_WRITTEN_TOTAL,
+    MetricsRegistry,
+    metrics_registry,
+)
+
+
+WAIT_SECONDS = 30.0
+
+
+def fake_engine(config, log_func, stop_event, extracted_result_callback=None):
+    metrics_registry.counter(LINES_WRITTEN_TOTAL).inc(config.get("lines", 3))
+    log_func("가짜 엔진 시작")
+    extracted_result_callback({"filename": "a.txt", "lines": ["첫 줄"]})
+    crash_marker = config.get("crash_marker")
+    if crash_marker and not os.path.exists(crash_marker):
+        Path(crash_marker).touch()
+        time.sleep(0.3)  # 상태 블록에 한 번은 실리도록 기다렸다가 죽는다.
+        os._exit(3)
+    if config.get("exit_immediately"):
+        return
+    if config.get("ignore_stop"):
+        time.sleep(WAIT_SECONDS)
+        return
+    stop_event.wait(WAIT_SECONDS)
+    log_func("가짜 엔진 정리 완료")
+
+
+def fake_child_main(config, event_queue, stop_flag, status_array):
+    backend_child_main(config, event_queue, stop_flag, status_array, publish_interval=0.05, run_func=fake_engine)
+
+
+def wait_until(predicate, timeout_seconds=WAIT_SECONDS):
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class SharedStatusBlockTests(unittest.TestCase):
+    def test_publish_and_read_round_trip_counters_gauges_and_latency(self):
+        registry = MetricsRegistry()
+        registry.counter(LINES_WRITTEN_TOTAL).inc(7)
+        registry.gauge(FILE_QUEUE_DEPTH).set(4)
+        registry.histogram(DOCS_API_LATENCY).observe(0.2)
+        tracker = LatencyTracker(sample_rate=0)
+        clock_values = iter([0.0, 0.5, 0.5])
+        trace = TraceContext("a.txt", clock=lambda: next(clock_values))
+        trace.mark("dequeued")
+        trace.mark("written")
+        tracker.record(trace)
+
+        block = SharedStatusBlock()
+        block.publish(collect_status_values(registry, tracker, pid=1234, rss_bytes=2048, now=lambda: 10.0))
+        status = decode_status_values(block.read_values())
+
+        self.assertEqual(status["pid"], 1234)
+        self.assertEqual(status["heartbeat_ms"], 10000)
+        self.assertEqual(status["rss_bytes"], 2048)
+        self.assertEqual(status["counters"][LINES_WRITTEN_TOTAL], 7)
+        self.assertEqual(status["gauges"][FILE_QUEUE_DEPTH], 4)
+        self.assertEqual(status["api_latency"]["count"], 1)
+        self.assertAlmostEqual(status["api_latency"]["sum"], 0.2)
+        self.assertEqual(len(status["api_latency"]["bucket_counts"]), API_LATENCY_BUCKET_SLOTS)
+        self.assertEqual(status["latency"]["total"]["count"], 1)
+        self.assertIsNotNone(status["latency"]["total"]["p50"])
+
+    def test_read_rejects_values_while_writer_is_mid_update(self):
+        block = SharedStatusBlock()
+        block.array[0] = 1  # 쓰는 중(홀수 순번)에 멈춘 상태
+        self.assertIsNone(block.read_values())
+
+
+class RegistryMirrorTests(unittest.TestCase):
+    def test_remote_values_add_to_local_metrics(self):
+        registry = MetricsRegistry()
+        counter = registry.counter(LINES_WRITTEN_TOTAL)
+        counter.inc(2)
+        counter.set_remote("backend_process", 5)
+        counter.set_remote("backend_process", 6)
+        gauge = registry.gauge(FILE_QUEUE_DEPTH, value_func=lambda: 1)
+        gauge.set_remote(9)
+        histogram = registry.histogram(DOCS_API_LATENCY)
+        histogram.observe(0.1)
+        histogram.set_remote("backend_process", [0] * 13 + [2], 120.0, 2)
+
+        self.assertEqual(counter.get(), 8)
+        self.assertEqual(gauge.get(), 9)
+        gauge.set_remote(None)
+        self.assertEqual(gauge.get(), 1)
+        self.assertEqual(histogram.get(), (3, 120.1))
+        self.assertIn('auto_write_docs_api_latency_seconds_bucket{le="+Inf"} 3', registry.render_prometheus_text())
+
+
+class BackendProcessSupervisorTests(unittest.TestCase):
+    def setUp(self):
+        self.logs = queue.Queue()
+        self.results = queue.Queue()
+        self.exit_codes = queue.Queue()
+        self.registry = MetricsRegistry()
+
+    def make_supervisor(self, config, **kwargs):
+        supervisor = BackendProcessSupervisor(
+            config,
+            self.logs.put,
+            self.results.put,
+            on_exit=self.exit_codes.put,
+            registry=self.registry,
+            target=fake_child_main,
+            **kwargs,
+        )
+        self.addCleanup(supervisor.stop, 5)
+        return supervisor
+
+    def collected_logs(self):
+        logs = []
+        while not self.logs.empty():
+            logs.append(self.logs.get_nowait())
+        return logs
+
+    def test_child_events_and_status_reach_parent_and_stop_is_clean(self):
+        supervisor = self.make_supervisor({"lines": 3})
+        supervisor.start()
+
+        self.assertEqual(self.results.get(timeout=WAIT_SECONDS), {"filename": "a.txt", "lines": ["첫 줄"]})
+        self.assertTrue(wait_until(lambda: (supervisor.read_status() or {}).get("counters", {}).get(LINES_WRITTEN_TOTAL) == 3))
+        status = supervisor.read_status()
+        self.assertEqual(status["pid"], supervisor.process.pid)
+        self.assertTrue(status["alive"])
+
+        self.assertTrue(supervisor.stop(timeout_seconds=WAIT_SECONDS))
+        self.assertEqual(self.exit_codes.get(timeout=WAIT_SECONDS), 0)
+        self.assertEqual(self.registry.get_value(LINES_WRITTEN_TOTAL), 3)
+        logs = self.collected_logs()
+        self.assertIn("가짜 엔진 시작", logs)
+        self.assertIn("가짜 엔진 정리 완료", logs)
+
+    def test_stop_terminates_child_that_misses_the_deadline(self):
+        supervisor = self.make_supervisor({"ignore_stop": True})
+        supervisor.start()
+        self.results.get(timeout=WAIT_SECONDS)
+
+        started_at = time.monotonic()
+        self.assertFalse(supervisor.stop(timeout_seconds=0.5))
+        self.assertLess(time.monotonic() - started_at, 10)
+        self.assertFalse(supervisor.is_alive())
+        self.assertTrue(any("강제로 종료" in line for line in self.collected_logs()))
+
+    def test_crashed_child_is_restarted_and_counters_keep_growing(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crash_marker = os.path.join(temp_dir, "crashed")
+            supervisor = self.make_supervisor({"lines": 2, "crash_marker": crash_marker}, backoff_seconds=(0.1,))
+            supervisor.start()
+
+            # 바로 죽은 첫 자식의 이벤트는 큐에 다 실리지 못했을 수 있으므로 재시작만 기다린다.
+            self.assertTrue(wait_until(lambda: supervisor.restart_count == 1 and supervisor.is_alive()))
+            self.assertTrue(wait_until(lambda: supervisor.read_status()["counters"][LINES_WRITTEN_TOTAL] == 4))
+            self.assertTrue(supervisor.stop(timeout_seconds=WAIT_SECONDS))
+        self.assertTrue(any("비정상 종료" in line for line in self.collected_logs()))
+
+    def test_child_that_exits_by_itself_is_not_restarted(self):
+        supervisor = self.make_supervisor({"exit_immediately": True})
+        supervisor.start()
+
+        self.assertEqual(self.exit_codes.get(timeout=WAIT_SECONDS), 0)
+        self.assertEqual(supervisor.restart_count, 0)
+
+    def test_restart_limit_gives_up_after_repeated_crashes(self):
+        exits = threading.Event()
+        supervisor = self.make_supervisor({}, max_restarts=0)
+        supervisor.on_exit = lambda exitcode: exits.set()
+        supervisor.start()
+        supervisor.process.kill()
+
+        self.assertTrue(exits.wait(WAIT_SECONDS))
+        self.assertEqual(supervisor.restart_count, 0)
+        self.assertTrue(any("다시 시작하지 않습니다" in line for line in self.collected_logs()))
+
+
+if __name__ == "__main__":
+    unittest.main()
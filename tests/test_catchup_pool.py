@@ -0,0 +1,211 @@
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from src.auto_write_txt_to_docs import backend_processor, catchup_pool as catchup_pool_module
+from src.auto_write_txt_to_docs.catchup_pool import (
+    CatchupPool,
+    LineSpans,
+    fingerprint_chunk,
+    normalize_threshold_mb,
+    plan_chunks,
+)
+
+
+class FakeDocsService:
+    def __init__(self):
+        self.calls = []
+
+    def documents(self):
+        return self
+
+    def batchUpdate(self, documentId, body):
+        self.calls.append((documentId, body))
+        return self
+
+    def execute(self):
+        return {}
+
+
+def build_inline_pool(chunk_bytes):
+    """작업자 프로세스 대신 스레드로 같은 함수를 돌리는 풀 (피클/spawn 없이 결과만 확인)"""
+    pool = CatchupPool(max_workers=2, chunk_bytes=chunk_bytes)
+    pool.executor = ThreadPoolExecutor(2)
+    return pool
+
+
+class CatchupPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write_bytes(self, filename, raw_content):
+        filepath = os.path.join(self.temp_dir.name, filename)
+        with open(filepath, "wb") as target_file:
+            target_file.write(raw_content)
+        return filepath
+
+    def test_plan_chunks_cuts_right_after_newlines(self):
+        filepath = self.write_bytes("a.txt", b"aaaa\nbb\ncccccc\nd\n")
+
+        chunks = plan_chunks(filepath, 0, 17, chunk_bytes=3)
+
+        self.assertEqual(chunks, [(0, 5), (5, 15), (15, 17)])
+        self.assertEqual(plan_chunks(filepath, 5, 17, chunk_bytes=100), [(5, 17)])
+
+    def test_fingerprint_chunk_matches_backend_fingerprints(self):
+        content = "  첫 줄\r\n　전각 공백　\n\nNBSP\xa0\n끝\n"
+        for encoding in ("utf-8", "cp949"):
+            with self.subTest(encoding=encoding):
+                raw_content = content.replace("\xa0", " ").encode(encoding)
+                filepath = self.write_bytes(f"{encoding}.txt", raw_content)
+
+                chunk_encoding, fingerprints, starts, lengths = fingerprint_chunk(
+                    filepath, 0, len(raw_content), ("utf-8", "cp949")
+                )
+
+                expected_lines = backend_processor.split_decoded_lines(raw_content.decode(encoding))
+                self.assertEqual(chunk_encoding, encoding)
+                self.assertEqual(list(fingerprints), backend_processor.fingerprint_lines(expected_lines))
+                spans = LineSpans(filepath, starts, lengths).fetch(range(len(starts)))
+                self.assertEqual([span.decode(encoding).strip() for span in spans], expected_lines)
+
+    def test_fingerprint_chunk_reports_ascii_and_undecodable_chunks(self):
+        ascii_path = self.write_bytes("ascii.txt", b"plain\n line \n")
+        self.assertIsNone(fingerprint_chunk(ascii_path, 0, 13, ("utf-8",))[0])
+        broken_path = self.write_bytes("broken.txt", b"\xff\xfe\xfd\n")
+        self.assertIs(fingerprint_chunk(broken_path, 0, 4, ("utf-8",))[0], False)
+        utf16_path = self.write_bytes("utf16.txt", "a\nb\n".encode("utf-16-le"))
+        self.assertIs(fingerprint_chunk(utf16_path, 0, 8, ("utf-8",))[0], False)
+
+    def test_fingerprint_file_range_joins_chunks_in_order(self):
+        lines = [f"{index}번째 줄" for index in range(50)]
+        raw_content = ("\n".join(lines) + "\n").encode("utf-8")
+        filepath = self.write_bytes("chat.txt", raw_content)
+        pool = build_inline_pool(chunk_bytes=64)
+        self.addCleanup(pool.shutdown)
+
+        line_spans, fingerprints, encoding = pool.fingerprint_file_range(filepath, 0, len(raw_content))
+
+        self.assertEqual(encoding, "utf-8")
+        self.assertEqual(fingerprints, backend_processor.fingerprint_lines(lines))
+        self.assertEqual(line_spans.fetch([0, 49]), ["0번째 줄".encode("utf-8"), "49번째 줄".encode("utf-8")])
+
+    def test_fingerprint_file_range_gives_up_on_mixed_chunk_encodings(self):
+        raw_content = "가나다\n".encode("utf-8") * 20 + "가나다\n".encode("cp949") * 20
+        filepath = self.write_bytes("mixed.txt", raw_content)
+        pool = build_inline_pool(chunk_bytes=32)
+        self.addCleanup(pool.shutdown)
+
+        self.assertIsNone(pool.fingerprint_file_range(filepath, 0, len(raw_content)))
+
+    def test_concurrent_first_use_creates_one_process_pool(self):
+        created_executors = []
+
+        def slow_executor_factory(*_args, **_kwargs):
+            time.sleep(0.05)  # 두 읽기 작업자가 동시에 None을 보는 틈을 넓힌다.
+            executor = Mock()
+            created_executors.append(executor)
+            return executor
+
+        pool = CatchupPool(max_workers=2)
+        with patch.object(catchup_pool_module, "ProcessPoolExecutor", slow_executor_factory):
+            threads = [threading.Thread(target=pool.get_executor) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(created_executors), 1)
+        pool.shutdown()
+        created_executors[0].shutdown.assert_called_once_with(wait=True, cancel_futures=True)
+        self.assertIsNone(pool.executor)
+
+    def test_shutdown_without_cancel_futures_before_python_39(self):
+        pool = CatchupPool(max_workers=2)
+        pool.executor = Mock()
+        executor = pool.executor
+
+        with patch.object(catchup_pool_module.sys, "version_info", (3, 8, 10)):
+            pool.shutdown()
+
+        executor.shutdown.assert_called_once_with(wait=True)
+
+    def test_should_use_requires_backlog_threshold_and_more_than_one_cpu(self):
+        pool = CatchupPool(max_workers=2)
+        pool.configure(1)
+        with patch("os.cpu_count", return_value=4):
+            self.assertTrue(pool.should_use(1024 * 1024))
+            self.assertFalse(pool.should_use(1024 * 1024 - 1))
+            pool.configure(0)
+            self.assertFalse(pool.should_use(10 ** 12))
+        pool.configure(1)
+        with patch("os.cpu_count", return_value=1):
+            self.assertFalse(pool.should_use(10 ** 12))
+        self.assertEqual(normalize_threshold_mb("x"), 64)
+        self.assertEqual(normalize_threshold_mb(-1), 0)
+
+
+class CatchupPoolProcessFileTests(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        backend_processor.processed_file_states.clear()
+        backend_processor.file_encodings.clear()
+        backend_processor.added_lines_cache.clear()
+        backend_processor.file_queue = queue.Queue()
+        patches = [
+            patch.object(backend_processor, "PROCESSED_STATE_FILE", os.path.join(self.temp_dir.name, "state.json")),
+            patch.object(backend_processor, "LINE_CACHE_FILE", os.path.join(self.temp_dir.name, "cache.json")),
+            patch.object(backend_processor, "processed_state_save_timer", None),
+            patch.object(backend_processor.threading, "Timer", Mock()),
+            patch.object(backend_processor, "catchup_pool", build_inline_pool(chunk_bytes=16)),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        backend_processor.catchup_pool.should_use = lambda backlog_bytes: True
+        self.addCleanup(backend_processor.processed_file_states.clear)
+        self.addCleanup(backend_processor.added_lines_cache.clear)
+        self.addCleanup(backend_processor.file_encodings.clear)
+
+    def test_pooled_read_writes_same_text_as_serial_read(self):
+        filepath = os.path.join(self.temp_dir.name, "cp949.txt")
+        with open(filepath, "wb") as target_file:
+            target_file.write("이미 본 줄\r\n새로운 한글 줄\r\n또 새 줄\r\n".encode("cp949"))
+        backend_processor.remember_global_lines(["이미 본 줄"])
+        docs_service = FakeDocsService()
+
+        backend_processor.process_file(filepath, {"docs_id": "doc-1"}, {"docs": docs_service}, lambda _message: None)
+
+        inserted_text = docs_service.calls[0][1]["requests"][0]["insertText"]["text"]
+        self.assertIn("새로운 한글 줄\n또 새 줄\n", inserted_text)
+        self.assertNotIn("이미 본 줄", inserted_text)
+        self.assertEqual(backend_processor.file_encodings[filepath], "cp949")
+        self.assertEqual(
+            backend_processor.processed_file_states[filepath]["last_byte_offset"], os.path.getsize(filepath)
+        )
+
+    def test_pool_failure_falls_back_to_serial_read(self):
+        filepath = os.path.join(self.temp_dir.name, "chat.txt")
+        with open(filepath, "w", encoding="utf-8") as target_file:
+            target_file.write("첫 줄\n둘째 줄\n")
+        backend_processor.catchup_pool.fingerprint_file_range = Mock(side_effect=RuntimeError("작업자 종료"))
+        docs_service = FakeDocsService()
+
+        backend_processor.process_file(filepath, {"docs_id": "doc-1"}, {"docs": docs_service}, lambda _message: None)
+
+        inserted_text = docs_service.calls[0][1]["requests"][0]["insertText"]["text"]
+        self.assertIn("첫 줄\n둘째 줄\n", inserted_text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -36,6 +36,79 @@ class ConfigManagerTests(unittest.TestCase):
         self.assertEqual(config_data["max_cache_size"], 5000)
         self.assertNotIn("unknown_key", config_data)
 
+    def test_normalize_config_data_keeps_only_string_log_levels(self):
+        config_data = normalize_config_data({
+            "log_levels": {"backend_processor": "debug", "MessengerDocsApp": 10},
+        })
+
+        self.assertEqual(config_data["log_levels"], {"backend_processor": "DEBUG"})
+        self.assertEqual(normalize_config_data({"log_levels": "DEBUG"})["log_levels"], {})
+
+    def test_normalize_config_data_validates_notification_window(self):
+        self.assertEqual(normalize_config_data({"notification_window_seconds": "0"})["notification_window_seconds"], 0.0)
+        self.assertEqual(normalize_config_data({"notification_window_seconds": 120})["notification_window_seconds"], 60.0)
+        self.assertEqual(normalize_config_data({"notification_window_seconds": -1})["notification_window_seconds"], 3.0)
+        self.assertEqual(normalize_config_data({"notification_window_seconds": "x"})["notification_window_seconds"], 3.0)
+
+    def test_normalize_config_data_clamps_memory_budget(self):
+        self.assertEqual(normalize_config_data({})["memory_budget_mb"], 64)
+        self.assertEqual(normalize_config_data({"memory_budget_mb": "128"})["memory_budget_mb"], 128)
+        self.assertEqual(normalize_config_data({"memory_budget_mb": 1})["memory_budget_mb"], 8)
+        self.assertEqual(normalize_config_data({"memory_budget_mb": "x"})["memory_budget_mb"], 64)
+
+    def test_normalize_config_data_keeps_catchup_pool_threshold_non_negative(self):
+        self.assertEqual(normalize_config_data({})["catchup_pool_threshold_mb"], 64)
+        self.assertEqual(normalize_config_data({"catchup_pool_threshold_mb": "256"})["catchup_pool_threshold_mb"], 256)
+        self.assertEqual(normalize_config_data({"catchup_pool_threshold_mb": -5})["catchup_pool_threshold_mb"], 0)
+        self.assertEqual(normalize_config_data({"catchup_pool_threshold_mb": None})["catchup_pool_threshold_mb"], 64)
+
+    def test_normalize_config_data_keeps_long_term_dedupe_filter_usable(self):
+        normalized = normalize_config_data({
+            "long_term_dedupe": "true",
+            "long_term_dedupe_false_positive_rate": "0.0001",
+            "long_term_dedupe_generation_days": 0,
+            "long_term_dedupe_generations": 1000,
+        })
+
+        self.assertFalse(normalized["long_term_dedupe"])
+        self.assertEqual(normalized["long_term_dedupe_false_positive_rate"], 0.0001)
+        self.assertEqual(normalized["long_term_dedupe_generation_days"], 30)
+        self.assertEqual(normalized["long_term_dedupe_generations"], 120)
+        self.assertEqual(normalize_config_data({"long_term_dedupe_false_positive_rate": 1})["long_term_dedupe_false_positive_rate"], 0.001)
+
+    def test_normalize_config_data_falls_back_to_global_dedupe_scope(self):
+        self.assertEqual(normalize_config_data({})["dedupe_scope"], "global")
+        self.assertEqual(normalize_config_data({"dedupe_scope": " File "})["dedupe_scope"], "file")
+        self.assertEqual(normalize_config_data({"dedupe_scope": "route"})["dedupe_scope"], "global")
+        self.assertEqual(normalize_config_data({"dedupe_ttl_seconds": "3600"})["dedupe_ttl_seconds"], 3600)
+        self.assertEqual(normalize_config_data({"dedupe_ttl_seconds": "x"})["dedupe_ttl_seconds"], 0)
+
+    def test_normalize_config_data_keeps_history_limits_usable(self):
+        self.assertEqual(normalize_config_data({})["history_retention_days"], 365)
+        self.assertEqual(normalize_config_data({"history_retention_days": "0"})["history_retention_days"], 0)
+        self.assertEqual(normalize_config_data({"history_max_lines": -1})["history_max_lines"], 5_000_000)
+        self.assertEqual(normalize_config_data({"history_max_lines": "200000"})["history_max_lines"], 200000)
+
+    def test_normalize_config_data_only_enables_document_warmup_for_true(self):
+        self.assertFalse(normalize_config_data({})["warm_dedupe_from_document"])
+        self.assertTrue(normalize_config_data({"warm_dedupe_from_document": True})["warm_dedupe_from_document"])
+        self.assertFalse(normalize_config_data({"warm_dedupe_from_document": "true"})["warm_dedupe_from_document"])
+
+    def test_normalize_config_data_only_enables_process_isolation_for_true(self):
+        self.assertFalse(normalize_config_data({})["isolate_backend_process"])
+        self.assertTrue(normalize_config_data({"isolate_backend_process": True})["isolate_backend_process"])
+        self.assertFalse(normalize_config_data({"isolate_backend_process": "false"})["isolate_backend_process"])
+
+    def test_normalize_config_data_falls_back_to_thread_engine_for_unknown_names(self):
+        self.assertEqual(normalize_config_data({})["monitoring_engine"], "thread")
+        self.assertEqual(normalize_config_data({"monitoring_engine": " AsyncIO "})["monitoring_engine"], "asyncio")
+        self.assertEqual(normalize_config_data({"monitoring_engine": "trio"})["monitoring_engine"], "thread")
+
+    def test_get_default_config_returns_independent_log_levels(self):
+        get_default_config()["log_levels"]["backend_processor"] = "DEBUG"
+
+        self.assertEqual(get_default_config()["log_levels"], {})
+
     def test_normalize_config_data_falls_back_to_default_for_invalid_cache_size(self):
         config_data = normalize_config_data({
             "max_cache_size": "-10",
@@ -0,0 +1,142 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+from src.auto_write_txt_to_docs.daemon import (
+    EXIT_CONFIG_ERROR,
+    EXIT_ENGINE_STOPPED,
+    EXIT_OK,
+    JsonLogFormatter,
+    MonitoringDaemon,
+)
+
+VALID_DOC_ID = "EXAMPLE_DOC_ID_12345"
+
+
+class FakeEngine:
+    """run_monitoring 대신 호출되어, 받은 설정을 기록하고 정해진 동작을 한다."""
+
+    def __init__(self, actions):
+        self.actions = list(actions)
+        self.configs = []
+        self.kwargs = []
+
+    def __call__(self, config, log_func, stop_event, **kwargs):
+        self.configs.append(config)
+        self.kwargs.append(kwargs)
+        action = self.actions.pop(0)
+        action(stop_event)
+
+
+class MonitoringDaemonTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = os.path.join(self.temp_dir.name, "config.json")
+        self.write_config(watch_folder="/srv/chat", docs_input=VALID_DOC_ID)
+
+    def write_config(self, **config_data):
+        with open(self.config_path, "w", encoding="utf-8") as config_file:
+            json.dump(config_data, config_file)
+
+    def build_daemon(self, engine):
+        return MonitoringDaemon(
+            config_path=self.config_path,
+            legacy_config_path=self.config_path,
+            drain_timeout_seconds=3.0,
+            run_func=engine,
+            stop_event_factory=threading.Event,
+        )
+
+    def test_shutdown_signal_stops_engine_and_exits_cleanly(self):
+        daemon = None
+
+        def receive_sigterm(stop_event):
+            daemon.request_shutdown()
+            self.assertTrue(stop_event.is_set())
+
+        engine = FakeEngine([receive_sigterm])
+        daemon = self.build_daemon(engine)
+
+        self.assertEqual(daemon.run(), EXIT_OK)
+        self.assertEqual(engine.configs[0]["watch_folder"], "/srv/chat")
+        self.assertEqual(engine.configs[0]["docs_id"], VALID_DOC_ID)
+        self.assertEqual(engine.kwargs[0], {"drain_timeout_seconds": 3.0})
+
+    def test_reload_restarts_engine_with_new_config(self):
+        daemon = None
+
+        def receive_sighup(_stop_event):
+            self.write_config(watch_folder="/srv/other", docs_input=VALID_DOC_ID)
+            daemon.request_reload()
+
+        def receive_sigterm(_stop_event):
+            daemon.request_shutdown()
+
+        engine = FakeEngine([receive_sighup, receive_sigterm])
+        daemon = self.build_daemon(engine)
+
+        self.assertEqual(daemon.run(), EXIT_OK)
+        self.assertEqual([config["watch_folder"] for config in engine.configs], ["/srv/chat", "/srv/other"])
+
+    def test_invalid_config_on_reload_keeps_previous_config(self):
+        daemon = None
+
+        def receive_sighup(_stop_event):
+            self.write_config(watch_folder="/srv/other", docs_input="not a doc")
+            daemon.request_reload()
+
+        def receive_sigterm(_stop_event):
+            daemon.request_shutdown()
+
+        engine = FakeEngine([receive_sighup, receive_sigterm])
+        daemon = self.build_daemon(engine)
+
+        with self.assertLogs("auto_write_daemon", level="ERROR"):
+            self.assertEqual(daemon.run(), EXIT_OK)
+        self.assertEqual([config["watch_folder"] for config in engine.configs], ["/srv/chat", "/srv/chat"])
+
+    def test_missing_docs_target_is_a_config_error(self):
+        self.write_config(watch_folder="/srv/chat")
+        engine = FakeEngine([])
+
+        with self.assertLogs("auto_write_daemon", level="ERROR"):
+            self.assertEqual(self.build_daemon(engine).run(), EXIT_CONFIG_ERROR)
+        self.assertEqual(engine.configs, [])
+
+    def test_engine_stopping_on_its_own_is_reported(self):
+        engine = FakeEngine([lambda _stop_event: None])
+
+        with self.assertLogs("auto_write_daemon", level="ERROR"):
+            self.assertEqual(self.build_daemon(engine).run(), EXIT_ENGINE_STOPPED)
+
+
+class DaemonImportTests(unittest.TestCase):
+    def test_daemon_does_not_import_gui_libraries(self):
+        probe = (
+            "import sys; import src.auto_write_txt_to_docs.daemon; "
+            "print(sorted(name for name in sys.modules "
+            "if name.split('.')[0] in ('customtkinter', 'PIL', 'pystray', 'tkinter', 'tkinterdnd2')))"
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c", probe], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout
+
+        self.assertEqual(output.strip(), "[]")
+
+    def test_json_formatter_writes_one_object_per_line(self):
+        import logging
+
+        record = logging.LogRecord("auto_write_daemon", logging.INFO, __file__, 1, "감시 %s", ("시작",), None)
+        payload = json.loads(JsonLogFormatter().format(record))
+
+        self.assertEqual((payload["level"], payload["message"]), ("INFO", "감시 시작"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import random
+import tempfile
+import unittest
+
+from src.auto_write_txt_to_docs.dedupe_filter import (
+    FILTER_HEADER_SIZE,
+    GenerationalDedupeFilter,
+    format_dedupe_filter_status,
+    get_dedupe_filter_dir,
+    list_generation_files,
+    normalize_false_positive_rate,
+    normalize_generation_days,
+    normalize_generations,
+    read_dedupe_filter_status,
+    size_bloom_filter,
+)
+
+DAY_SECONDS = 86400
+
+
+def random_fingerprints(count, seed):
+    generator = random.Random(seed)
+    return [generator.getrandbits(64) for _ in range(count)]
+
+
+class DedupeFilterTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = os.path.join(self.temp_dir.name, "dedupe_filter")
+        self.dedupe_filter = GenerationalDedupeFilter()
+        self.addCleanup(self.dedupe_filter.close)
+
+    def test_added_fingerprints_are_found_after_reopen(self):
+        fingerprints = random_fingerprints(500, seed=1)
+        self.dedupe_filter.open(self.directory, now=1000.0)
+        self.dedupe_filter.add_many(fingerprints, now=1000.0)
+        self.dedupe_filter.close()
+
+        self.assertEqual(self.dedupe_filter.find_known(fingerprints), [])
+        self.assertEqual(self.dedupe_filter.open(self.directory, now=2000.0), 1)
+        self.assertEqual(self.dedupe_filter.find_known(fingerprints), fingerprints)
+        self.assertEqual(self.dedupe_filter.status()["item_count"], 500)
+
+    def test_measured_false_positive_rate_stays_near_target(self):
+        self.dedupe_filter.open(self.directory, false_positive_rate=0.01, generations=1, capacity=5000, now=0.0)
+        self.dedupe_filter.add_many(random_fingerprints(5000, seed=2), now=0.0)
+
+        unknown_fingerprints = random_fingerprints(20000, seed=3)
+        measured_rate = len(self.dedupe_filter.find_known(unknown_fingerprints)) / len(unknown_fingerprints)
+
+        self.assertLess(measured_rate, 0.02)
+        self.assertAlmostEqual(self.dedupe_filter.status()["estimated_false_positive_rate"], 0.01, delta=0.003)
+
+    def test_new_generation_opens_when_full_or_period_ends_and_old_ones_age_out(self):
+        self.dedupe_filter.open(self.directory, generation_days=1, generations=2, capacity=100, now=0.0)
+        self.dedupe_filter.add_many(random_fingerprints(150, seed=4), now=0.0)
+        self.assertEqual(len(list_generation_files(self.directory)), 2)
+
+        recent_fingerprints = random_fingerprints(10, seed=5)
+        self.dedupe_filter.add_many(recent_fingerprints, now=1.5 * DAY_SECONDS)
+        self.assertEqual(self.dedupe_filter.status()["generation_count"], 3)
+
+        self.dedupe_filter.add_many(random_fingerprints(1, seed=6), now=3 * DAY_SECONDS)
+
+        # 이틀(1일 x 2세대) 넘게 아무것도 넣지 않은 첫 두 세대는 지워진다.
+        self.assertEqual(self.dedupe_filter.status()["generation_count"], 2)
+        self.assertEqual(len(list_generation_files(self.directory)), 2)
+        self.assertEqual(self.dedupe_filter.find_known(recent_fingerprints), recent_fingerprints)
+
+    def test_status_is_read_from_file_headers_and_broken_files_are_skipped(self):
+        self.assertIsNone(read_dedupe_filter_status(self.directory))
+        self.dedupe_filter.open(self.directory, now=0.0)
+        self.dedupe_filter.add_many(random_fingerprints(1200, seed=7), now=0.0)
+        self.dedupe_filter.flush()
+        with open(os.path.join(self.directory, "broken.bloom"), "wb") as broken_file:
+            broken_file.write(b"not a filter")
+
+        status = read_dedupe_filter_status(self.directory)
+        messages = []
+        reopened = GenerationalDedupeFilter()
+        self.addCleanup(reopened.close)
+        reopened.open(self.directory, log_func=messages.append, now=0.0)
+
+        bit_count, _hash_count = size_bloom_filter(1_000_000, 0.001 / 12)
+        self.assertEqual(status["item_count"], 1200)
+        self.assertEqual(status["bytes"], FILTER_HEADER_SIZE + bit_count // 8)
+        self.assertEqual(reopened.status(), status)
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(format_dedupe_filter_status(status).startswith("장기 중복 필터 1,200줄/1세대 2.3 MB · 오탐 약 0.000%"))
+
+    def test_status_on_disk_follows_each_batch_before_close(self):
+        self.dedupe_filter.open(self.directory, generation_days=1, capacity=300, now=0.0)
+        self.dedupe_filter.add_many(random_fingerprints(500, seed=8), now=10.0)
+
+        status = read_dedupe_filter_status(self.directory)
+
+        self.assertEqual(status, self.dedupe_filter.status())
+        self.assertEqual((status["generation_count"], status["item_count"]), (2, 500))
+        self.assertGreater(status["estimated_false_positive_rate"], 0)
+
+    def test_document_scope_uses_separate_directory(self):
+        self.assertEqual(get_dedupe_filter_dir(self.directory), self.directory)
+        self.assertEqual(get_dedupe_filter_dir(self.directory, "global", "doc-1"), self.directory)
+        self.assertNotEqual(get_dedupe_filter_dir(self.directory, "document", "doc-1"), get_dedupe_filter_dir(self.directory, "document", "doc-2"))
+
+    def test_normalizers_fall_back_to_defaults(self):
+        self.assertEqual(normalize_false_positive_rate("0.01"), 0.01)
+        self.assertEqual(normalize_false_positive_rate(0), 0.001)
+        self.assertEqual(normalize_generation_days("x"), 30)
+        self.assertEqual(normalize_generations(-1), 12)
+        self.assertEqual(normalize_generations("500"), 120)
+
+
+if __name__ == "__main__":
+    unittest.main()
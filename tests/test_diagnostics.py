@@ -0,0 +1,154 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+from datetime import datetime
+
+from src.auto_write_txt_to_docs.diagnostics import (
+    TRUNCATED_MARKER,
+    build_diagnostics_bundle,
+    collect_memory_report,
+    describe_file_sizes,
+    format_thread_dump,
+    read_log_tails,
+)
+from fakes import FakeClock
+
+
+class DiagnosticsBundleTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def read_bundle(self, bundle_path):
+        with zipfile.ZipFile(bundle_path) as bundle:
+            return {name: bundle.read(name).decode("utf-8") for name in bundle.namelist()}
+
+    def test_bundle_contains_text_json_and_expanded_sections(self):
+        bundle_path = build_diagnostics_bundle(
+            self.temp_dir.name,
+            [
+                ("threads.txt", lambda: "스택"),
+                ("state.json", lambda: {"file_queue_depth": 3}),
+                ("logs/", lambda: {"app.log": "마지막 줄\n"}),
+            ],
+            now=datetime(2026, 1, 2, 3, 4, 5),
+            metadata={"app_version": "1.0.3"},
+        )
+
+        self.assertEqual(os.path.basename(bundle_path), "diagnostics_20260102_030405.zip")
+        entries = self.read_bundle(bundle_path)
+        self.assertEqual(entries["threads.txt"], "스택")
+        self.assertEqual(json.loads(entries["state.json"]), {"file_queue_depth": 3})
+        self.assertEqual(entries["logs/app.log"], "마지막 줄\n")
+        summary = json.loads(entries["summary.json"])
+        self.assertEqual(summary["app_version"], "1.0.3")
+        self.assertEqual(
+            {name: section["status"] for name, section in summary["sections"].items()},
+            {"threads.txt": "ok", "state.json": "ok", "logs/": "ok"},
+        )
+
+    def test_failed_section_is_recorded_and_others_still_collected(self):
+        def broken_section():
+            raise RuntimeError("읽기 실패")
+
+        bundle_path = build_diagnostics_bundle(
+            self.temp_dir.name,
+            [("broken.json", broken_section), ("ok.txt", lambda: "정상")],
+        )
+
+        entries = self.read_bundle(bundle_path)
+        self.assertNotIn("broken.json", entries)
+        self.assertEqual(entries["ok.txt"], "정상")
+        summary = json.loads(entries["summary.json"])
+        self.assertEqual(summary["sections"]["broken.json"]["status"], "error")
+        self.assertIn("읽기 실패", summary["sections"]["broken.json"]["error"])
+
+    def test_sections_after_time_limit_are_skipped(self):
+        clock = FakeClock()
+
+        def slow_section():
+            clock.now += 30.0
+            return "느린 항목"
+
+        never_called = []
+        bundle_path = build_diagnostics_bundle(
+            self.temp_dir.name,
+            [("slow.txt", slow_section), ("late.txt", lambda: never_called.append(True) or "늦음")],
+            time_limit_seconds=20.0,
+            clock=clock,
+        )
+
+        entries = self.read_bundle(bundle_path)
+        self.assertIn("slow.txt", entries)
+        self.assertNotIn("late.txt", entries)
+        self.assertEqual(never_called, [])
+        summary = json.loads(entries["summary.json"])
+        self.assertEqual(summary["sections"]["late.txt"]["status"], "skipped")
+
+    def test_large_entry_is_truncated(self):
+        bundle_path = build_diagnostics_bundle(
+            self.temp_dir.name,
+            [("big.txt", lambda: "가" * 1000)],
+            max_entry_bytes=100,
+        )
+
+        text = self.read_bundle(bundle_path)["big.txt"]
+        self.assertTrue(text.endswith(TRUNCATED_MARKER))
+        self.assertLessEqual(len(text[: -len(TRUNCATED_MARKER)].encode("utf-8")), 100)
+
+
+class DiagnosticsCollectorTests(unittest.TestCase):
+    def test_thread_dump_includes_named_threads(self):
+        stop_event = threading.Event()
+        worker = threading.Thread(target=stop_event.wait, name="diagnostics worker", daemon=True)
+        worker.start()
+        self.addCleanup(worker.join, 2.0)
+        self.addCleanup(stop_event.set)
+
+        dump = format_thread_dump()
+
+        self.assertIn("스레드 diagnostics worker", dump)
+        self.assertIn("threading.py", dump)
+
+    def test_file_sizes_list_directory_entries_and_missing_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, "app.log")
+            with open(log_path, "w", encoding="utf-8") as log_file:
+                log_file.write("1234")
+            missing_path = os.path.join(temp_dir, "missing.json")
+
+            sizes = describe_file_sizes([temp_dir, missing_path, None])
+
+        self.assertEqual(sizes, {log_path: 4, missing_path: None})
+
+    def test_log_tails_keep_only_the_end_of_recent_logs(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "app.log"), "w", encoding="utf-8") as log_file:
+                log_file.write("앞부분\n" + "끝부분\n")
+            with open(os.path.join(temp_dir, "note.txt"), "w", encoding="utf-8") as other_file:
+                other_file.write("로그 아님")
+
+            tails = read_log_tails(temp_dir, tail_bytes=len("끝부분\n".encode("utf-8")))
+
+        self.assertEqual(tails, {"app.log": "끝부분\n"})
+
+    def test_memory_report_samples_allocations_without_real_sleep(self):
+        sleeps = []
+
+        def allocate_during_sleep(seconds):
+            sleeps.append(seconds)
+            self.allocated = [bytearray(1024) for _ in range(100)]
+
+        report = collect_memory_report(sample_seconds=2.0, top_count=5, sleep=allocate_during_sleep)
+
+        self.assertEqual(sleeps, [2.0])
+        self.assertIn("RSS:", report)
+        self.assertIn("tracemalloc 추적 중:", report)
+        self.assertIn("test_diagnostics.py", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
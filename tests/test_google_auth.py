@@ -254,6 +254,9 @@ class GoogleAuthTests(unittest.TestCase):
         self.assertEqual(services["docs"], "docs-service")
         self.assertNotIn("drive", services)
         self.assertEqual(built_services["docs"], ("v1", fake_creds))
+        thread_http = services["http_factory"]()
+        self.assertIs(thread_http.credentials, fake_creds)
+        self.assertIsNot(services["http_factory"]().http, thread_http.http)
 
     def test_get_google_services_builds_docs_and_drive_services(self):
         fake_creds = object()
@@ -0,0 +1,213 @@
+import os
+import select
+import threading
+import time
+import unittest
+
+try:
+    import tkinter
+except ImportError:
+    tkinter = None
+
+from src.auto_write_txt_to_docs.gui_wakeup import (
+    GuiWakeupDispatcher,
+    WakeupRateMeter,
+)
+from fakes import FakeClock
+
+
+class FakeTkApp:
+    def __init__(self):
+        self.file_handlers = {}
+
+    def createfilehandler(self, fd, mask, callback):
+        self.file_handlers[fd] = callback
+
+    def deletefilehandler(self, fd):
+        self.file_handlers.pop(fd, None)
+
+
+class FakeRoot:
+    """Tk를 흉내 낸다. tk를 주지 않으면 파일 핸들러가 없는 Windows Tk처럼 동작한다."""
+
+    def __init__(self, with_file_handler=True):
+        self.tk = FakeTkApp() if with_file_handler else None
+        self.after_calls = []
+        self.cancelled_after_ids = []
+
+    def after(self, delay_ms, callback):
+        self.after_calls.append((delay_ms, callback))
+        return f"after#{len(self.after_calls)}"
+
+    def after_cancel(self, after_id):
+        self.cancelled_after_ids.append(after_id)
+
+    def run_after_calls(self):
+        calls, self.after_calls = self.after_calls, []
+        for _delay_ms, callback in calls:
+            callback()
+
+    def run_readable_file_handlers(self):
+        """select로 읽을 수 있는 파일 핸들러만 호출한다. (Tk 이벤트 루프 역할)"""
+        readable_fds, _writable, _errors = select.select(list(self.tk.file_handlers), [], [], 0)
+        for fd in readable_fds:
+            self.tk.file_handlers[fd](fd, 0)
+        return len(readable_fds)
+
+
+class GuiWakeupDispatcherPipeTests(unittest.TestCase):
+    def setUp(self):
+        if not hasattr(os, "set_blocking") or os.name == "nt":
+            self.skipTest("self-pipe 파일 핸들러는 POSIX Tk에서만 사용한다.")
+        self.root = FakeRoot()
+        self.drain_calls = []
+        self.dispatcher = GuiWakeupDispatcher(self.root, [lambda: self.drain_calls.append(1) or False])
+        self.dispatcher.start()
+        self.addCleanup(self.dispatcher.stop)
+        self.root.run_after_calls()
+        self.drain_calls.clear()
+
+    def test_idle_dispatcher_schedules_nothing(self):
+        self.assertTrue(self.dispatcher.uses_file_handler)
+        self.assertEqual(self.root.after_calls, [])
+        self.assertEqual(self.root.run_readable_file_handlers(), 0)
+
+    def test_notify_from_worker_returns_while_gui_thread_is_blocked(self):
+        notify_returned = threading.Event()
+
+        def worker():
+            for _ in range(100):
+                self.dispatcher.notify()
+            notify_returned.set()
+
+        # 테스트 스레드(GUI 역할)는 이벤트 루프를 돌리지 않고 기다리기만 한다.
+        threading.Thread(target=worker, daemon=True).start()
+
+        self.assertTrue(notify_returned.wait(timeout=2.0))
+        self.assertEqual(self.drain_calls, [])
+        self.assertEqual(self.root.run_readable_file_handlers(), 1)
+        self.assertEqual(self.drain_calls, [1])
+        self.assertEqual(self.dispatcher.get_stats()["coalesced_notifications"], 99)
+
+    def test_pipe_is_drained_and_next_notify_wakes_again(self):
+        self.dispatcher.notify()
+        self.root.run_readable_file_handlers()
+        self.assertEqual(self.root.run_readable_file_handlers(), 0)
+
+        self.dispatcher.notify()
+        self.root.run_readable_file_handlers()
+
+        self.assertEqual(len(self.drain_calls), 2)
+        self.assertEqual(self.dispatcher.get_stats()["pipe_wakeups"], 2)
+
+    def test_stop_removes_file_handler_and_notify_stays_safe(self):
+        self.dispatcher.stop()
+
+        self.assertEqual(self.root.tk.file_handlers, {})
+        self.dispatcher.notify()
+        self.assertFalse(self.dispatcher.uses_file_handler)
+
+
+class GuiWakeupDispatcherPollingTests(unittest.TestCase):
+    def test_polling_backs_off_when_idle_and_speeds_up_on_work(self):
+        root = FakeRoot(with_file_handler=False)
+        drain_calls = []
+        dispatcher = GuiWakeupDispatcher(
+            root,
+            [lambda: drain_calls.append(1) or False],
+            active_poll_interval_ms=50,
+            idle_poll_interval_ms=400,
+        )
+        dispatcher.start()
+        self.assertFalse(dispatcher.uses_file_handler)
+
+        poll_intervals = []
+        for _ in range(5):
+            root.run_after_calls()
+            poll_intervals.append(dispatcher.poll_interval_ms)
+        self.assertEqual(poll_intervals, [100, 200, 400, 400, 400])
+        self.assertEqual(len(drain_calls), 1)
+
+        dispatcher.notify()
+        root.run_after_calls()
+
+        self.assertEqual(len(drain_calls), 2)
+        self.assertEqual([delay for delay, _callback in root.after_calls], [50])
+        self.assertEqual(dispatcher.get_stats()["poll_wakeups"], 1)
+
+    def test_remaining_work_is_drained_in_follow_up_slices(self):
+        root = FakeRoot()
+        remaining = [3]
+
+        def drain():
+            remaining[0] -= 1
+            return remaining[0] > 0
+
+        dispatcher = GuiWakeupDispatcher(root, [drain])
+        dispatcher.started = True
+        dispatcher.dispatch()
+        for _ in range(5):
+            root.run_after_calls()
+
+        self.assertEqual(remaining[0], 0)
+        self.assertEqual(root.after_calls, [])
+        self.assertEqual(dispatcher.get_stats()["total_wakeups"], 3)
+
+    def test_drain_error_does_not_stop_other_queues(self):
+        root = FakeRoot()
+        drain_calls = []
+
+        def broken_drain():
+            raise ValueError("broken")
+
+        dispatcher = GuiWakeupDispatcher(root, [broken_drain, lambda: drain_calls.append(1) or False])
+        dispatcher.dispatch()
+
+        self.assertEqual(drain_calls, [1])
+
+
+class GuiWakeupDispatcherTclLoopTests(unittest.TestCase):
+    """화면 없이 만들 수 있는 실제 Tcl 이벤트 루프에서 self-pipe 깨우기를 확인한다."""
+
+    def setUp(self):
+        if tkinter is None or os.name == "nt":
+            self.skipTest("Tcl 파일 핸들러를 쓸 수 없는 환경")
+        self.interpreter = tkinter.Tcl()
+        self.drain_calls = []
+        self.dispatcher = GuiWakeupDispatcher(self.interpreter, [lambda: self.drain_calls.append(1) or False])
+        self.dispatcher.start()
+        self.addCleanup(self.dispatcher.stop)
+        self.interpreter.update()
+
+    def run_events_until(self, predicate, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            self.interpreter.tk.dooneevent(tkinter._tkinter.DONT_WAIT)
+            time.sleep(0.001)
+        return predicate()
+
+    def test_worker_notify_wakes_real_event_loop_without_polling(self):
+        self.assertTrue(self.dispatcher.uses_file_handler)
+        threading.Thread(target=self.dispatcher.notify, daemon=True).start()
+
+        self.assertTrue(self.run_events_until(lambda: len(self.drain_calls) == 2))
+
+        idle_wakeups = self.dispatcher.get_stats()["total_wakeups"]
+        self.run_events_until(lambda: False, timeout=0.2)
+        self.assertEqual(self.dispatcher.get_stats()["total_wakeups"], idle_wakeups)
+
+
+class WakeupRateMeterTests(unittest.TestCase):
+    def test_only_last_minute_is_counted(self):
+        clock = FakeClock()
+        meter = WakeupRateMeter(clock=clock)
+        for _ in range(10):
+            meter.record()
+            clock.now += 10.0
+
+        self.assertEqual(meter.per_minute(), 6)
+        self.assertEqual(meter.total_count, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
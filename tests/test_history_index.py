@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from src.auto_write_txt_to_docs.history_index import (
+    DEFAULT_MAX_LINES,
+    HistoryIndex,
+    HistorySearchMatch,
+    compact_history_database,
+    connect_history_database,
+    format_history_search_match,
+    normalize_max_lines,
+    normalize_retention_days,
+    search_history,
+    write_history_batch,
+)
+
+
+class NoFtsConnection(sqlite3.Connection):
+    """FTS5 모듈이 없는 SQLite 빌드처럼 fts5 가상 표 생성을 거절한다."""
+
+    def execute(self, sql, *args):
+        if "USING fts5" in sql:
+            raise sqlite3.OperationalError("no such module: fts5")
+        return super().execute(sql, *args)
+
+
+class HistoryIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "history.sqlite3")
+
+    def write_records(self, records):
+        connection, _use_fts = connect_history_database(self.path)
+        try:
+            write_history_batch(connection, records)
+        finally:
+            connection.close()
+
+    def test_recorded_lines_are_searchable_newest_first_with_record_details(self):
+        history_index = HistoryIndex()
+        history_index.open(self.path)
+        self.addCleanup(history_index.close)
+        history_index.record("doc-1", "/chat/a.txt", ["회의는 3시에 시작합니다", "점심 메뉴"], 0, 40, recorded_at=100.0)
+        history_index.record("doc-1", "/chat/b.txt", ["회의록 공유했습니다"], 10, 50, recorded_at=200.0)
+        history_index.record("doc-1", "/chat/c.txt", [], 0, 0)
+        self.assertTrue(history_index.flush())
+
+        matches, elapsed_seconds = search_history(self.path, "회의")
+
+        self.assertEqual([search_match.line_text for search_match in matches], ["회의록 공유했습니다", "회의는 3시에 시작합니다"])
+        self.assertEqual(
+            (matches[1].file_title, matches[1].file_path, matches[1].start_offset, matches[1].end_offset),
+            ("a.txt", "/chat/a.txt", 0, 40),
+        )
+        self.assertEqual((matches[0].docs_id, matches[0].recorded_at), ("doc-1", 200.0))
+        self.assertGreaterEqual(elapsed_seconds, 0)
+        # 세 글자 이상은 trigram 색인으로, 단어 중간 글자로도 찾는다.
+        self.assertEqual([search_match.line_text for search_match in search_history(self.path, "공유했")[0]], ["회의록 공유했습니다"])
+        self.assertEqual(search_history(self.path, "   ")[0], [])
+
+    def test_search_without_database_returns_nothing(self):
+        self.assertEqual(search_history(self.path, "아무거나")[0], [])
+        self.assertEqual(compact_history_database(self.path), 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_compact_removes_expired_records_and_lines_over_limit(self):
+        self.write_records([
+            (1000.0, "doc-1", "old.txt", "/chat/old.txt", 0, 10, ["오래된 줄 하나", "오래된 줄 둘"]),
+            (90000.0, "doc-1", "mid.txt", "/chat/mid.txt", 0, 10, ["중간 줄 하나", "중간 줄 둘"]),
+            (95000.0, "doc-1", "new.txt", "/chat/new.txt", 0, 10, ["최근 줄 하나", "최근 줄 둘"]),
+        ])
+
+        removed_count = compact_history_database(self.path, retention_days=1, max_lines=3, now=1000.0 + 86400 + 1)
+
+        self.assertEqual(removed_count, 3)
+        self.assertEqual(
+            [search_match.line_text for search_match in search_history(self.path, "줄")[0]],
+            ["최근 줄 둘", "최근 줄 하나", "중간 줄 둘"],
+        )
+        connection = sqlite3.connect(self.path)
+        self.addCleanup(connection.close)
+        self.assertEqual(
+            [row[0] for row in connection.execute("SELECT file_title FROM records ORDER BY id")], ["mid.txt", "new.txt"]
+        )
+
+    def test_zero_retention_days_keeps_index_closed(self):
+        history_index = HistoryIndex()
+
+        self.assertFalse(history_index.open(self.path, retention_days=0))
+        history_index.record("doc-1", "/chat/a.txt", ["기록 안 됨"])
+
+        self.assertFalse(history_index.is_open())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_plain_table_is_used_when_fts5_is_unavailable(self):
+        real_connect = sqlite3.connect
+        with patch.object(sqlite3, "connect", lambda *args, **kwargs: real_connect(*args, factory=NoFtsConnection, **kwargs)):
+            connection, use_fts = connect_history_database(self.path)
+            connection.close()
+            self.write_records([(1.0, "doc-1", "a.txt", "/chat/a.txt", 0, 10, ["일반 표에 들어간 줄", "둘째 줄"])])
+
+            matches = search_history(self.path, "들어간")[0]
+            removed_count = compact_history_database(self.path, retention_days=0, max_lines=1)
+
+        self.assertFalse(use_fts)
+        self.assertEqual([search_match.line_text for search_match in matches], ["일반 표에 들어간 줄"])
+        self.assertEqual(removed_count, 1)
+
+    def test_format_history_search_match_shows_time_file_and_byte_range(self):
+        search_match = HistorySearchMatch(1, "본문 줄", 0.0, "doc-1", "a.txt", "/chat/a.txt", 1200, 4096)
+
+        with patch("time.localtime", time.gmtime):
+            self.assertEqual(format_history_search_match(search_match), "1970-01-01 00:00:00  a.txt [1,200-4,096B]  본문 줄")
+            search_match.start_offset = None
+            self.assertEqual(format_history_search_match(search_match), "1970-01-01 00:00:00  a.txt  본문 줄")
+
+    def test_normalizers_fall_back_to_defaults(self):
+        self.assertEqual(normalize_retention_days("30"), 30)
+        self.assertEqual(normalize_retention_days(-3), 0)
+        self.assertEqual(normalize_retention_days("x"), 365)
+        self.assertEqual(normalize_max_lines(0), DEFAULT_MAX_LINES)
+        self.assertEqual(normalize_max_lines("1000"), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
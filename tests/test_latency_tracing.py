@@ -0,0 +1,112 @@
+import logging
+import unittest
+
+from src.auto_write_txt_to_docs.latency_tracing import (
+    HISTOGRAM_BUCKET_COUNT,
+    LATENCY_LOGGER_NAME,
+    LatencyHistogram,
+    LatencyTracker,
+    TraceContext,
+    format_latency_report,
+    format_latency_summary,
+    normalize_latency_sample_rate,
+)
+from fakes import FakeClock
+
+
+def build_trace(stage_seconds, filepath="a.txt"):
+    clock = FakeClock(100.0)
+    trace = TraceContext.start(filepath, clock=clock)
+    for stage, seconds in stage_seconds:
+        clock.now += seconds
+        trace.mark(stage)
+    return trace
+
+
+class TraceContextTests(unittest.TestCase):
+    def test_stage_durations_are_measured_from_previous_mark(self):
+        trace = build_trace([("dequeued", 0.002), ("settled", 0.5), ("read", 0.01), ("deduped", 0.001), ("written", 0.3)])
+
+        durations = trace.stage_durations()
+
+        self.assertAlmostEqual(durations["dequeued"], 0.002)
+        self.assertAlmostEqual(durations["settled"], 0.5)
+        self.assertAlmostEqual(durations["written"], 0.3)
+        self.assertAlmostEqual(durations["total"], 0.813)
+
+    def test_missing_stage_is_skipped_and_first_mark_wins(self):
+        clock = FakeClock(100.0)
+        trace = TraceContext.start("a.txt", clock=clock)
+        clock.now += 1.0
+        trace.mark("read")
+        clock.now += 5.0
+        trace.mark("read")
+
+        self.assertEqual(trace.stage_durations(), {"read": 1.0, "total": 1.0})
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def test_percentiles_stay_within_one_bucket_of_exact_value(self):
+        histogram = LatencyHistogram()
+        samples = [index / 1000 for index in range(1, 1001)]  # 1ms ~ 1s
+        for seconds in samples:
+            histogram.add(seconds)
+
+        for fraction, exact in ((0.50, 0.5), (0.95, 0.95), (0.99, 0.99)):
+            estimate = histogram.percentile(fraction)
+            self.assertGreaterEqual(estimate, exact)
+            self.assertLessEqual(estimate, exact * 1.25)
+
+    def test_memory_is_fixed_regardless_of_sample_count(self):
+        histogram = LatencyHistogram()
+        for _ in range(10000):
+            histogram.add(3600.0)
+
+        self.assertEqual(len(histogram.counts), HISTOGRAM_BUCKET_COUNT)
+        self.assertEqual(histogram.percentile(0.99), 3600.0)
+        self.assertIsNone(LatencyHistogram().percentile(0.5))
+
+
+class LatencyTrackerTests(unittest.TestCase):
+    def test_snapshot_reports_each_stage(self):
+        tracker = LatencyTracker(sample_rate=0)
+        tracker.record(build_trace([("dequeued", 0.001), ("written", 0.2)]))
+        tracker.record(build_trace([("dequeued", 0.001), ("written", 0.4)]))
+
+        snapshot = tracker.snapshot()
+
+        self.assertEqual(set(snapshot), {"dequeued", "written", "total"})
+        self.assertEqual(snapshot["written"]["count"], 2)
+        self.assertAlmostEqual(snapshot["written"]["p99"], 0.4)
+
+    def test_sampled_traces_are_logged_to_latency_logger(self):
+        tracker = LatencyTracker(sample_rate=0.5, random_func=iter([0.1, 0.9]).__next__)
+
+        with self.assertLogs(LATENCY_LOGGER_NAME, level=logging.INFO) as captured:
+            tracker.record(build_trace([("written", 0.2)], filepath="sampled.txt"))
+            tracker.record(build_trace([("written", 0.2)], filepath="skipped.txt"))
+
+        self.assertEqual(len(captured.records), 1)
+        self.assertIn("sampled.txt", captured.output[0])
+
+    def test_sample_rate_is_clamped(self):
+        self.assertEqual(normalize_latency_sample_rate("2"), 1.0)
+        self.assertEqual(normalize_latency_sample_rate(-1), 0.0)
+        self.assertEqual(normalize_latency_sample_rate("x"), 0.05)
+
+
+class LatencyFormattingTests(unittest.TestCase):
+    def test_summary_and_report_text(self):
+        tracker = LatencyTracker(sample_rate=0)
+        self.assertEqual(format_latency_summary(tracker.snapshot()), "처리 지연: 측정 전")
+
+        tracker.record(build_trace([("dequeued", 0.004), ("written", 1.5)]))
+        snapshot = tracker.snapshot()
+
+        self.assertTrue(format_latency_summary(snapshot).startswith("처리 지연 p50 1.5s"))
+        self.assertIn("Docs 기록: p50 1.5s", format_latency_report(snapshot))
+        self.assertIn("큐 대기: p50 4ms", format_latency_report(snapshot))
+
+
+if __name__ == "__main__":
+    unittest.main()
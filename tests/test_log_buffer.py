@@ -0,0 +1,244 @@
+import re
+import unittest
+
+from src.auto_write_txt_to_docs.log_buffer import (
+    DropOldestLogQueue,
+    LogRenderBuffer,
+    apply_log_frame,
+    group_lines_by_tag,
+    trim_text_widget_lines,
+)
+
+
+class FakeTextWidget:
+    """Tk Text의 인덱스 규칙(항상 끝에 빈 줄 하나)을 흉내 내는 테스트용 위젯."""
+
+    def __init__(self):
+        self.text = "\n"
+        self.insert_calls = []
+        self.delete_calls = []
+        self.seen = []
+        self.state = "disabled"
+
+    def configure(self, state=None):
+        if state is not None:
+            self.state = state
+
+    def _line_start(self, line_number):
+        lines = self.text.split("\n")
+        offset = sum(len(line) + 1 for line in lines[:max(0, line_number - 1)])
+        return min(offset, len(self.text))
+
+    def _offset_to_index(self, offset):
+        before = self.text[:offset]
+        line_number = before.count("\n") + 1
+        column = offset - (before.rfind("\n") + 1)
+        return f"{line_number}.{column}"
+
+    def _resolve(self, index):
+        match = re.fullmatch(r"end(?:-(\d+)([cl]))?", index)
+        if match:
+            offset = len(self.text)
+            if match.group(1):
+                amount = int(match.group(1))
+                if match.group(2) == "c":
+                    offset -= amount
+                else:
+                    line_number = int(self._offset_to_index(offset).split(".")[0])
+                    offset = self._line_start(line_number - amount)
+            return max(0, offset)
+        line_text, column_text = index.split(".")
+        return self._line_start(int(line_text)) + int(column_text)
+
+    def index(self, index):
+        return self._offset_to_index(self._resolve(index))
+
+    def insert(self, index, text, tag=None):
+        self.insert_calls.append((text, tag))
+        # Tk는 마지막 개행 뒤에는 삽입하지 않는다.
+        offset = min(self._resolve(index), len(self.text) - 1)
+        self.text = self.text[:offset] + text + self.text[offset:]
+
+    def delete(self, start, end):
+        self.delete_calls.append((start, end))
+        start_offset = self._resolve(start)
+        end_offset = min(self._resolve(end), len(self.text) - 1)
+        if end_offset > start_offset:
+            self.text = self.text[:start_offset] + self.text[end_offset:]
+
+    def see(self, index):
+        self.seen.append(index)
+
+    def lines(self):
+        return self.text[:-1].splitlines()
+
+
+def tag_by_prefix(line):
+    return "error" if line.startswith("오류") else "default"
+
+
+class LogRenderBufferTests(unittest.TestCase):
+    def test_repeated_messages_are_collapsed_into_one_entry(self):
+        buffer = LogRenderBuffer()
+
+        self.assertTrue(buffer.push("대기 중"))
+        self.assertFalse(buffer.push("대기 중"))
+        self.assertFalse(buffer.push("대기 중"))
+        frame = buffer.take_frame()
+
+        self.assertEqual(frame.new_lines, ["대기 중 (×3)"])
+        self.assertEqual(buffer.get_stats()["collapsed_count"], 2)
+
+    def test_repeat_after_render_updates_last_line_only(self):
+        buffer = LogRenderBuffer()
+        buffer.push("대기 중")
+        buffer.take_frame()
+
+        buffer.push("대기 중")
+        self.assertTrue(buffer.has_pending())
+        frame = buffer.take_frame()
+
+        self.assertEqual(frame.updated_last_line, "대기 중 (×2)")
+        self.assertEqual(frame.new_lines, [])
+        self.assertFalse(buffer.has_pending())
+
+    def test_pending_overflow_drops_oldest_and_reports_once(self):
+        buffer = LogRenderBuffer(max_lines=10, max_pending=3)
+        for index in range(5):
+            buffer.push(f"줄 {index}")
+
+        frame = buffer.take_frame()
+
+        self.assertIn("2줄을 화면 표시에서 생략", frame.new_lines[0])
+        self.assertEqual(frame.new_lines[1:], ["줄 2", "줄 3", "줄 4"])
+        self.assertFalse(buffer.has_pending())
+
+    def test_history_is_bounded_by_max_lines(self):
+        buffer = LogRenderBuffer(max_lines=3, max_pending=100)
+        for index in range(10):
+            buffer.push(f"줄 {index}")
+        buffer.take_frame()
+
+        self.assertEqual(buffer.snapshot_lines()[-3:], ["줄 7", "줄 8", "줄 9"])
+        self.assertLessEqual(len(buffer.snapshot_lines()), 3)
+
+    def test_trim_history_keeps_recent_lines_and_shrinks_estimate(self):
+        buffer = LogRenderBuffer(max_lines=100, max_pending=100)
+        for index in range(10):
+            buffer.push(f"줄 {index}")
+        buffer.take_frame()
+        size_before = buffer.estimate_bytes()
+
+        self.assertEqual(buffer.trim_history(4), 6)
+
+        self.assertEqual(buffer.snapshot_lines(), ["줄 6", "줄 7", "줄 8", "줄 9"])
+        self.assertLess(buffer.estimate_bytes(), size_before)
+
+    def test_clear_keeps_counters_but_empties_lines(self):
+        buffer = LogRenderBuffer(max_lines=10, max_pending=1)
+        buffer.push("a")
+        buffer.push("b")
+        buffer.clear()
+
+        self.assertEqual(buffer.snapshot_lines(), [])
+        self.assertFalse(buffer.has_pending())
+        self.assertEqual(buffer.get_stats()["dropped_count"], 1)
+
+
+class ApplyLogFrameTests(unittest.TestCase):
+    def test_group_lines_by_tag_merges_consecutive_tags(self):
+        groups = group_lines_by_tag(["a", "b", "오류 c", "d"], tag_by_prefix)
+
+        self.assertEqual(
+            groups,
+            [("a\nb\n", "default"), ("오류 c\n", "error"), ("d\n", "default")],
+        )
+
+    def test_apply_log_frame_inserts_one_block_per_tag_run(self):
+        widget = FakeTextWidget()
+        buffer = LogRenderBuffer()
+        for index in range(50):
+            buffer.push(f"줄 {index}")
+
+        apply_log_frame(widget, buffer.take_frame(), tag_by_prefix)
+
+        self.assertEqual(len(widget.insert_calls), 1)
+        self.assertEqual(widget.lines()[0], "줄 0")
+        self.assertEqual(widget.lines()[-1], "줄 49")
+        self.assertEqual(widget.state, "disabled")
+        self.assertEqual(widget.seen, ["end"])
+
+    def test_apply_log_frame_replaces_collapsed_last_line(self):
+        widget = FakeTextWidget()
+        buffer = LogRenderBuffer()
+        buffer.push("시작")
+        buffer.push("대기 중")
+        apply_log_frame(widget, buffer.take_frame(), tag_by_prefix)
+
+        buffer.push("대기 중")
+        buffer.push("대기 중")
+        apply_log_frame(widget, buffer.take_frame(), tag_by_prefix)
+
+        self.assertEqual(widget.lines(), ["시작", "대기 중 (×3)"])
+
+    def test_apply_log_frame_trims_to_max_lines(self):
+        widget = FakeTextWidget()
+        buffer = LogRenderBuffer(max_lines=5, max_pending=100)
+        for round_index in range(3):
+            for index in range(4):
+                buffer.push(f"{round_index}-{index}")
+            apply_log_frame(widget, buffer.take_frame(), tag_by_prefix, max_lines=5)
+
+        self.assertEqual(widget.lines(), ["1-3", "2-0", "2-1", "2-2", "2-3"])
+
+    def test_trim_text_widget_lines_deletes_front_in_one_call(self):
+        widget = FakeTextWidget()
+        widget.insert("end", "".join(f"{index}\n" for index in range(10)))
+
+        removed = trim_text_widget_lines(widget, 4)
+
+        self.assertEqual(removed, 6)
+        self.assertEqual(widget.delete_calls, [("1.0", "7.0")])
+        self.assertEqual(widget.lines(), ["6", "7", "8", "9"])
+        self.assertEqual(trim_text_widget_lines(widget, 4), 0)
+
+
+class DropOldestLogQueueTests(unittest.TestCase):
+    def test_full_queue_drops_oldest_plain_lines_and_keeps_status_lines(self):
+        log_queue = DropOldestLogQueue(maxsize=10)
+        log_queue.put_nowait("처리 시작: a.txt")
+        log_queue.put_nowait("오류: Docs 업데이트 API 오류")
+        for index in range(20):
+            log_queue.put_nowait(f"일반 {index}")
+        log_queue.put_nowait("백엔드: 모든 작업 완료.")
+
+        drained = []
+        while not log_queue.empty():
+            drained.append(log_queue.get_nowait())
+
+        self.assertEqual(drained[:2], ["처리 시작: a.txt", "오류: Docs 업데이트 API 오류"])
+        self.assertEqual(drained[-1], "백엔드: 모든 작업 완료.")
+        self.assertIn("일반 19", drained)
+        self.assertNotIn("일반 0", drained)
+        self.assertEqual(log_queue.dropped_count, 20 + 3 - len(drained))
+
+    def test_status_lines_are_never_dropped_even_over_limit(self):
+        log_queue = DropOldestLogQueue(maxsize=3)
+        for index in range(5):
+            log_queue.put_nowait(f"처리 완료: {index}.txt")
+
+        self.assertEqual(log_queue.qsize(), 5)
+        self.assertEqual(log_queue.dropped_count, 0)
+
+    def test_recorded_queue_drops_show_up_in_next_frame_notice(self):
+        buffer = LogRenderBuffer()
+        buffer.record_dropped(7)
+
+        frame = buffer.take_frame()
+
+        self.assertEqual(len(frame.new_lines), 1)
+        self.assertIn("7줄", frame.new_lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
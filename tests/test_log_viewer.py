@@ -0,0 +1,209 @@
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+
+from src.auto_write_txt_to_docs.log_viewer import (
+    LogFileIndex,
+    LogHistory,
+    LogViewport,
+    iter_log_search_matches,
+    list_log_files,
+    start_log_search,
+)
+from src.auto_write_txt_to_docs.logging_pipeline import DailySizeRotatingFileHandler
+
+
+class LogViewerTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_log(self, name, lines, mode="w"):
+        path = os.path.join(self.log_dir, name)
+        with open(path, mode, encoding="utf-8", newline="") as log_file:
+            log_file.write("".join(line + "\n" for line in lines))
+        return path
+
+    def test_file_index_counts_complete_lines_and_reads_window(self):
+        path = self.write_log("messenger_docs_20250101.log", [f"줄 {index}" for index in range(10)])
+        file_index = LogFileIndex(path)
+
+        self.assertEqual(file_index.refresh(), 10)
+        self.assertEqual(file_index.read_lines(3, 2), ["줄 3", "줄 4"])
+        self.assertEqual(file_index.read_lines(8, 5), ["줄 8", "줄 9"])
+
+    def test_file_index_refresh_reads_only_appended_lines(self):
+        path = self.write_log("messenger_docs_20250101.log", ["a", "b"])
+        file_index = LogFileIndex(path)
+        file_index.refresh()
+
+        with open(path, "a", encoding="utf-8", newline="") as log_file:
+            log_file.write("c\nd-partial")
+
+        self.assertEqual(file_index.refresh(), 1)
+        self.assertEqual(file_index.line_count(), 3)
+
+        with open(path, "a", encoding="utf-8", newline="") as log_file:
+            log_file.write("\n")
+
+        self.assertEqual(file_index.refresh(), 1)
+        self.assertEqual(file_index.read_lines(2, 10), ["c", "d-partial"])
+
+    def test_history_spans_multiple_files_in_date_order(self):
+        self.write_log("messenger_docs_20250102.log", ["둘째 날 0", "둘째 날 1"])
+        self.write_log("messenger_docs_20250101.log", ["첫날 0", "첫날 1", "첫날 2"])
+        self.write_log("other.txt", ["무시"])
+        history = LogHistory(self.log_dir)
+
+        self.assertEqual(history.refresh(), 5)
+        self.assertEqual(history.get_lines(2, 2), ["첫날 2", "둘째 날 0"])
+
+    def test_history_and_search_include_rotated_gzip_archives(self):
+        clock_values = [datetime(2025, 1, 1, 12, 0, 0)]
+        handler = DailySizeRotatingFileHandler(self.log_dir, "messenger_docs", max_bytes=40, clock=lambda: clock_values[0])
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(handler.close)
+
+        def emit(message):
+            handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None))
+
+        for index in range(6):
+            emit(f"첫날 기록 {index:02d} 가나다")
+        clock_values[0] = datetime(2025, 1, 2, 9, 0, 0)
+        emit("둘째 날 기록 오류 발생")
+
+        log_names = [os.path.basename(path) for path in list_log_files(self.log_dir)]
+        self.assertEqual(log_names[-2:], ["messenger_docs_20250101.log.gz", "messenger_docs_20250102.log"])
+        self.assertTrue(all(name.endswith(".log.gz") for name in log_names[:-1]))
+
+        history = LogHistory(self.log_dir)
+        history.refresh()
+        expected_lines = [f"첫날 기록 {index:02d} 가나다" for index in range(6)] + ["둘째 날 기록 오류 발생"]
+        self.assertEqual(history.get_lines(0, 100), expected_lines)
+
+        matches = list(iter_log_search_matches(history, "기록 0[24]", use_regex=True))
+        self.assertEqual([search_match.line_number for search_match in matches], [2, 4])
+        self.assertTrue(matches[0].path.endswith(".log.gz"))
+
+        # 재시작 시 지난 날짜 파일이 압축되어도 같은 기록을 계속 볼 수 있어야 한다.
+        handler.close()
+        clock_values[0] = datetime(2025, 1, 3, 9, 0, 0)
+        restarted_handler = DailySizeRotatingFileHandler(self.log_dir, "messenger_docs", clock=lambda: clock_values[0])
+        self.addCleanup(restarted_handler.close)
+        history.refresh()
+        self.assertEqual(history.get_lines(0, 100), expected_lines)
+
+    def test_viewport_follows_tail_until_scrolled_up(self):
+        path = self.write_log("messenger_docs_20250101.log", [str(index) for index in range(20)])
+        history = LogHistory(self.log_dir)
+        history.refresh()
+        viewport = LogViewport(history, window_lines=5)
+
+        self.assertEqual(viewport.visible_lines(), ["15", "16", "17", "18", "19"])
+        viewport.scroll_to(2)
+        self.assertFalse(viewport.follow_tail)
+
+        self.write_log(os.path.basename(path), ["20"], mode="a")
+        history.refresh()
+        self.assertEqual(viewport.visible_lines()[0], "2")
+
+        viewport.scroll_by(100)
+        self.assertTrue(viewport.follow_tail)
+        self.assertEqual(viewport.visible_lines()[-1], "20")
+
+    def test_search_is_case_insensitive_and_reports_global_line_numbers(self):
+        self.write_log("messenger_docs_20250101.log", ["INFO - 시작", "ERROR - Docs 실패", "INFO - error 재시도"])
+        self.write_log("messenger_docs_20250102.log", ["INFO - 정상", "ERROR - 다시 실패"])
+        history = LogHistory(self.log_dir)
+        history.refresh()
+
+        matches = list(iter_log_search_matches(history, "error"))
+
+        self.assertEqual([search_match.line_number for search_match in matches], [1, 2, 4])
+        self.assertEqual(matches[2].text, "ERROR - 다시 실패")
+        self.assertEqual(len(list(iter_log_search_matches(history, "error", case_sensitive=True))), 1)
+
+    def test_search_supports_regex_and_reports_each_line_once(self):
+        self.write_log("messenger_docs_20250101.log", ["12줄 추가 12줄", "추가 없음", "3줄 추가"])
+        history = LogHistory(self.log_dir)
+        history.refresh()
+
+        matches = list(iter_log_search_matches(history, r"^\d+줄 추가", use_regex=True))
+
+        self.assertEqual([search_match.line_number for search_match in matches], [0, 2])
+
+    def test_regex_search_matches_korean_by_character_within_one_line(self):
+        self.write_log("messenger_docs_20250101.log", ["가다나", "가나", "영문 only", "끝\t", "다음 줄 시작"])
+        history = LogHistory(self.log_dir)
+        history.refresh()
+
+        def line_numbers(query):
+            return [search_match.line_number for search_match in iter_log_search_matches(history, query, use_regex=True)]
+
+        self.assertEqual(line_numbers("가.나"), [0])
+        self.assertEqual(line_numbers(r"^\w+$"), [0, 1])
+        self.assertEqual(line_numbers("^[가-힣]+$"), [0, 1])
+        # \s와 부정 문자 집합이 줄바꿈을 넘어 다음 줄까지 이어 붙지 않아야 한다.
+        self.assertEqual(line_numbers(r"끝\s+다음"), [])
+        self.assertEqual(line_numbers(r"끝[^가]*다음"), [])
+
+    def test_search_stops_when_cancelled(self):
+        self.write_log("messenger_docs_20250101.log", ["hit"] * 10)
+        history = LogHistory(self.log_dir)
+        history.refresh()
+        cancel_event = threading.Event()
+
+        matches = []
+        for search_match in iter_log_search_matches(history, "hit", cancel_event=cancel_event):
+            matches.append(search_match)
+            cancel_event.set()
+
+        self.assertEqual(len(matches), 1)
+
+    def test_start_log_search_delivers_batches_then_done(self):
+        self.write_log("messenger_docs_20250101.log", [f"hit {index}" for index in range(7)])
+        history = LogHistory(self.log_dir)
+        history.refresh()
+        batches = []
+        done = threading.Event()
+        done_payload = []
+
+        start_log_search(
+            history,
+            "hit",
+            on_batch=batches.append,
+            on_done=lambda total_count, error_message: (done_payload.append((total_count, error_message)), done.set()),
+            batch_size=3,
+        )
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+        self.assertEqual(done_payload, [(7, None)])
+
+    def test_start_log_search_reports_invalid_regex(self):
+        self.write_log("messenger_docs_20250101.log", ["a"])
+        history = LogHistory(self.log_dir)
+        history.refresh()
+        done = threading.Event()
+        done_payload = []
+
+        start_log_search(
+            history,
+            "(",
+            on_batch=lambda batch: None,
+            on_done=lambda total_count, error_message: (done_payload.append(error_message), done.set()),
+            use_regex=True,
+        )
+
+        self.assertTrue(done.wait(5))
+        self.assertIn("정규식 오류", done_payload[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
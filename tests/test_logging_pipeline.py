@@ -0,0 +1,155 @@
+import gzip
+import logging
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime
+
+from src.auto_write_txt_to_docs.logging_pipeline import (
+    APP_LOGGER_NAME,
+    BACKEND_LOGGER_NAME,
+    DailySizeRotatingFileHandler,
+    LoggingPipeline,
+    apply_log_levels,
+    normalize_log_levels,
+)
+from fakes import FakeClock
+
+
+def make_record(message, name="test"):
+    return logging.LogRecord(name, logging.INFO, __file__, 1, message, None, None)
+
+
+class DailySizeRotatingFileHandlerTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = self.temp_dir.name
+        self.clock = FakeClock(datetime(2025, 1, 1, 12, 0, 0))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def create_handler(self, **kwargs):
+        handler = DailySizeRotatingFileHandler(self.log_dir, "app", clock=self.clock, **kwargs)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self.addCleanup(handler.close)
+        return handler
+
+    def read_archive(self, filename):
+        with gzip.open(os.path.join(self.log_dir, filename), "rt", encoding="utf-8") as archive_file:
+            return archive_file.read()
+
+    def test_size_rollover_compresses_numbered_parts(self):
+        handler = self.create_handler(max_bytes=30)
+
+        for index in range(6):
+            handler.emit(make_record(f"line-{index:02d}-xxxx"))
+
+        self.assertEqual(
+            sorted(os.listdir(self.log_dir)),
+            ["app_20250101.001.log.gz", "app_20250101.002.log.gz", "app_20250101.log"],
+        )
+        self.assertEqual(self.read_archive("app_20250101.001.log.gz"), "line-00-xxxx\nline-01-xxxx\n")
+
+    def test_day_rollover_compresses_previous_day(self):
+        handler = self.create_handler()
+        handler.emit(make_record("첫날"))
+
+        self.clock.now = datetime(2025, 1, 2, 0, 0, 1)
+        handler.emit(make_record("둘째 날"))
+
+        self.assertEqual(sorted(os.listdir(self.log_dir)), ["app_20250101.log.gz", "app_20250102.log"])
+        self.assertEqual(self.read_archive("app_20250101.log.gz"), "첫날\n")
+
+    def test_startup_archives_stale_uncompressed_logs(self):
+        with open(os.path.join(self.log_dir, "app_20241231.log"), "w", encoding="utf-8") as stale_file:
+            stale_file.write("어제\n")
+        with open(os.path.join(self.log_dir, "other_20241231.log"), "w", encoding="utf-8") as other_file:
+            other_file.write("다른 로그\n")
+
+        self.create_handler()
+
+        self.assertEqual(
+            sorted(os.listdir(self.log_dir)),
+            ["app_20241231.log.gz", "other_20241231.log"],
+        )
+
+    def test_retention_removes_expired_and_over_budget_archives(self):
+        now = time.time()
+        for name, age_days, size in (("app_20240101.log.gz", 90, 10), ("app_20250101.001.log.gz", 2, 60), ("app_20250102.log.gz", 1, 60)):
+            path = os.path.join(self.log_dir, name)
+            with open(path, "wb") as archive_file:
+                archive_file.write(b"x" * size)
+            modified_time = now - age_days * 86400
+            os.utime(path, (modified_time, modified_time))
+
+        handler = self.create_handler(retention_days=30, retention_total_bytes=100)
+
+        self.assertEqual(os.listdir(self.log_dir), ["app_20250102.log.gz"])
+        self.assertEqual(handler.enforce_retention(), [])
+
+
+class LoggingPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = self.temp_dir.name
+        self.saved_levels = {
+            name: logging.getLogger(name).level for name in (APP_LOGGER_NAME, BACKEND_LOGGER_NAME)
+        }
+
+    def tearDown(self):
+        for name, level in self.saved_levels.items():
+            target_logger = logging.getLogger(name)
+            target_logger.setLevel(level)
+            for handler in target_logger.handlers[:]:
+                target_logger.removeHandler(handler)
+            target_logger.propagate = True
+        self.temp_dir.cleanup()
+
+    def read_log(self, prefix):
+        filename = f"{prefix}_{datetime.now().strftime('%Y%m%d')}.log"
+        with open(os.path.join(self.log_dir, filename), "r", encoding="utf-8") as log_file:
+            return log_file.read()
+
+    def test_records_are_routed_to_subsystem_files_by_listener(self):
+        pipeline = LoggingPipeline(self.log_dir)
+        app_logger = pipeline.attach(APP_LOGGER_NAME)
+        backend_logger = pipeline.attach(BACKEND_LOGGER_NAME)
+        app_logger.setLevel(logging.INFO)
+        backend_logger.setLevel(logging.INFO)
+
+        self.assertIsInstance(app_logger.handlers[0], logging.handlers.QueueHandler)
+        app_logger.info("앱 기록")
+        backend_logger.warning("백엔드 경고")
+        pipeline.stop()
+
+        self.assertIn("INFO - 앱 기록", self.read_log("messenger_docs"))
+        self.assertNotIn("백엔드 경고", self.read_log("messenger_docs"))
+        self.assertIn("backend_processor - WARNING - 백엔드 경고", self.read_log("backend_log"))
+
+    def test_attach_is_idempotent(self):
+        pipeline = LoggingPipeline(self.log_dir)
+        pipeline.attach(APP_LOGGER_NAME)
+        pipeline.attach(APP_LOGGER_NAME)
+        pipeline.stop()
+
+        self.assertEqual(len(logging.getLogger(APP_LOGGER_NAME).handlers), 1)
+
+    def test_apply_log_levels_overrides_defaults_per_subsystem(self):
+        effective_levels = apply_log_levels({BACKEND_LOGGER_NAME: "debug", "bad": "LOUD"})
+
+        self.assertEqual(effective_levels[APP_LOGGER_NAME], "INFO")
+        self.assertTrue(logging.getLogger(BACKEND_LOGGER_NAME).isEnabledFor(logging.DEBUG))
+        self.assertNotIn("bad", effective_levels)
+
+        apply_log_levels({})
+        self.assertFalse(logging.getLogger(BACKEND_LOGGER_NAME).isEnabledFor(logging.INFO))
+
+    def test_normalize_log_levels_ignores_invalid_input(self):
+        self.assertEqual(normalize_log_levels(None), {})
+        self.assertEqual(normalize_log_levels({"": "INFO", "x": "warning"}), {"x": "WARNING"})
+
+
+if __name__ == "__main__":
+    unittest.main()
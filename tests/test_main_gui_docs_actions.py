@@ -167,5 +167,31 @@ class MainGuiDocsActionsTests(unittest.TestCase):
         app.open_docs_in_browser.assert_called_once()
 
 
+class LogPopupSearchOptionsTests(unittest.TestCase):
+    def test_open_popup_applies_search_options_before_starting_search(self):
+        app = main_gui.MessengerDocsApp.__new__(main_gui.MessengerDocsApp)
+        app.log_popup_window = Mock()
+        app.log_popup_window.winfo_exists.return_value = True
+        app.log_popup_text = Mock()
+        app.log_popup_widgets = {
+            "search_var": FakeVar(""),
+            "regex_var": FakeVar(False),
+            "case_sensitive_var": FakeVar(False),
+        }
+        app.sync_log_popup_content = Mock()
+        started_with = []
+        app.start_log_history_search = lambda: started_with.append(
+            (
+                app.log_popup_widgets["search_var"].get(),
+                app.log_popup_widgets["regex_var"].get(),
+                app.log_popup_widgets["case_sensitive_var"].get(),
+            )
+        )
+
+        app.show_log_popup(initial_query="가.나", use_regex=True, case_sensitive=True)
+
+        self.assertEqual(started_with, [("가.나", True, True)])
+
+
 if __name__ == "__main__":
     unittest.main()
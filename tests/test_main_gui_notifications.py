@@ -1,13 +1,18 @@
+import types
 import unittest
+from collections import deque
 from unittest.mock import patch
 
+import main_gui
 from main_gui import (
     MessengerDocsApp,
+    NotificationAggregator,
     build_error_notification_summary,
     build_work_result_notification,
     extract_docs_update_line_count,
+    extract_docs_upload_progress,
     extract_filename_from_log_message,
-    should_emit_debounced_failure_notification,
+    should_emit_debounced_notification,
 )
 
 
@@ -19,6 +24,18 @@ class FakeVar:
         return self.value
 
 
+class FakeRoot:
+    def __init__(self):
+        self.after_calls = []
+
+    def winfo_exists(self):
+        return True
+
+    def after(self, delay_ms, callback):
+        self.after_calls.append((delay_ms, callback))
+        return f"after-{len(self.after_calls)}"
+
+
 class FakePopupPresenter:
     def __init__(self):
         self.calls = []
@@ -44,6 +61,13 @@ class MainGuiNotificationTests(unittest.TestCase):
     def test_extract_docs_update_line_count_returns_none_without_line_count(self):
         self.assertIsNone(extract_docs_update_line_count("  - Google Docs 업데이트 완료."))
 
+    def test_extract_docs_upload_progress_from_chunk_log(self):
+        self.assertEqual(
+            extract_docs_upload_progress("  - Google Docs 분할 기록 2/5조각 완료 (파일: big.txt)"),
+            (2, 5),
+        )
+        self.assertIsNone(extract_docs_upload_progress("  - Google Docs 분할 기록 3/5조각에서 중단."))
+
     def test_extract_filename_from_log_message_uses_explicit_file_marker(self):
         self.assertEqual(
             extract_filename_from_log_message("  - 중복 내용만 감지되어 Google Docs 기록 생략 (파일: sample.txt, 중복 4줄)"),
@@ -90,25 +114,25 @@ class MainGuiNotificationTests(unittest.TestCase):
         self.assertIn("sample.txt · 작업 실패", message)
         self.assertIn("Docs API 오류 - Docs 업데이트 API 오류 - 403 quota exceeded", message)
 
-    def test_should_emit_debounced_failure_notification_suppresses_repeat(self):
+    def test_should_emit_debounced_notification_suppresses_repeat(self):
         recent_failures = {}
 
         self.assertTrue(
-            should_emit_debounced_failure_notification(
+            should_emit_debounced_notification(
                 "sample.txt|Docs API 오류",
                 recent_failures,
                 current_time=10.0,
             )
         )
         self.assertFalse(
-            should_emit_debounced_failure_notification(
+            should_emit_debounced_notification(
                 "sample.txt|Docs API 오류",
                 recent_failures,
                 current_time=11.0,
             )
         )
         self.assertTrue(
-            should_emit_debounced_failure_notification(
+            should_emit_debounced_notification(
                 "sample.txt|Docs API 오류",
                 recent_failures,
                 current_time=12.5,
@@ -137,7 +161,7 @@ class MainGuiNotificationTests(unittest.TestCase):
         app = MessengerDocsApp.__new__(MessengerDocsApp)
         app.show_success_notifications = FakeVar(True)
         app.play_event_sounds = FakeVar(True)
-        app.recent_failure_notifications = {}
+        app.recent_notification_signatures = {}
         call_order = []
         sound_calls = []
         app.show_result_popup_notification = lambda title, message, event_type: call_order.append(
@@ -163,7 +187,7 @@ class MainGuiNotificationTests(unittest.TestCase):
         app = MessengerDocsApp.__new__(MessengerDocsApp)
         app.show_success_notifications = FakeVar(False)
         app.play_event_sounds = FakeVar(True)
-        app.recent_failure_notifications = {}
+        app.recent_notification_signatures = {}
         popup_calls = []
         tray_calls = []
         sound_calls = []
@@ -189,7 +213,7 @@ class MainGuiNotificationTests(unittest.TestCase):
         app = MessengerDocsApp.__new__(MessengerDocsApp)
         app.show_success_notifications = FakeVar(True)
         app.play_event_sounds = FakeVar(True)
-        app.recent_failure_notifications = {}
+        app.recent_notification_signatures = {}
         popup_calls = []
         tray_calls = []
         sound_calls = []
@@ -218,6 +242,122 @@ class MainGuiNotificationTests(unittest.TestCase):
         self.assertEqual(len(tray_calls), 1)
         self.assertEqual(sound_calls, ["failure"])
 
+    def test_notify_background_event_suppresses_duplicate_successes(self):
+        app = MessengerDocsApp.__new__(MessengerDocsApp)
+        app.show_success_notifications = FakeVar(True)
+        app.play_event_sounds = FakeVar(True)
+        app.recent_notification_signatures = {}
+        popup_calls = []
+        tray_calls = []
+        sound_calls = []
+        app.show_result_popup_notification = lambda title, message, event_type: popup_calls.append(
+            (title, message, event_type)
+        ) or True
+        app.show_tray_notification = lambda title, message: tray_calls.append((title, message))
+        app.play_event_sound = lambda event_type: sound_calls.append(event_type)
+        app.log = lambda _message: None
+
+        with patch("main_gui.time.monotonic", side_effect=[10.0, 10.5]):
+            first_result = app.notify_background_event(
+                "success",
+                filename="sample.txt",
+                line_count=2,
+                preview_text="첫 줄\n둘째 줄",
+            )
+            second_result = app.notify_background_event(
+                "success",
+                filename="sample.txt",
+                line_count=2,
+                preview_text="첫 줄\n둘째 줄",
+            )
+
+        self.assertTrue(first_result)
+        self.assertFalse(second_result)
+        self.assertEqual(len(popup_calls), 1)
+        self.assertEqual(len(tray_calls), 1)
+        self.assertEqual(sound_calls, ["success"])
+
+    def test_notify_background_event_collapses_burst_into_one_summary(self):
+        app = MessengerDocsApp.__new__(MessengerDocsApp)
+        app.show_success_notifications = FakeVar(True)
+        app.play_event_sounds = FakeVar(True)
+        app.recent_notification_signatures = {}
+        app.notification_aggregator = NotificationAggregator(window_seconds=3)
+        app.notification_flush_after_id = None
+        app.root = FakeRoot()
+        delivered = []
+        app.deliver_notification = lambda title, message, event_type: delivered.append((message, event_type)) or True
+        app.log = lambda _message: None
+
+        for index in range(20):
+            app.notify_background_event("success", filename=f"file_{index}.txt", line_count=3, preview_text="줄")
+        app.notify_background_event("failure", filename="bad.txt", error_summary="Docs API 오류")
+
+        self.assertEqual(len(delivered), 1)
+        self.assertEqual(len(app.root.after_calls), 1)
+        self.assertEqual(app.root.after_calls[0][0], 3000)
+
+        app.root.after_calls.pop()[1]()
+
+        self.assertEqual(len(delivered), 2)
+        self.assertIn("20개 파일, 57줄 추가, 실패 1건", delivered[1][0])
+        self.assertEqual(delivered[1][1], "failure")
+        self.assertEqual(len(app.root.after_calls), 1)
+
+        app.root.after_calls.pop()[1]()
+        self.assertEqual(len(delivered), 2)
+        self.assertFalse(app.notification_aggregator.window_open)
+
+
+class FakeCardWidget:
+    created = []
+
+    def __init__(self, parent=None, **kwargs):
+        self.parent = parent
+        self.options = kwargs
+        self.children = []
+        self.destroyed = False
+        if parent is not None and hasattr(parent, "children"):
+            parent.children.append(self)
+        FakeCardWidget.created.append(self)
+
+    def pack(self, **_kwargs):
+        pass
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_children(self):
+        return [child for child in self.children if not child.destroyed]
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class ResultCardFallbackTests(unittest.TestCase):
+    def test_cards_are_rebuilt_when_card_pool_module_is_missing(self):
+        FakeCardWidget.created = []
+        fake_ctk = types.SimpleNamespace(CTkFrame=FakeCardWidget, CTkLabel=FakeCardWidget)
+        app = main_gui.MessengerDocsApp.__new__(main_gui.MessengerDocsApp)
+        app.result_cards_frame = FakeCardWidget()
+        app.build_ui_font = lambda size, weight="normal": (size, weight)
+        app.recent_results = deque(
+            [{
+                "file_title": "a.txt",
+                "extracted_time": "2025-01-01 00:00:00",
+                "line_count": 3,
+                "preview_text": "미리보기",
+                "result_type": "성공",
+            }]
+        )
+
+        with patch.object(main_gui, "ResultCardPool", None), patch.object(main_gui, "ctk", fake_ctk):
+            app.render_recent_result_cards()
+
+        label_texts = [widget.options.get("text") for widget in FakeCardWidget.created]
+        self.assertIn("a.txt", label_texts)
+        self.assertIn("미리보기", label_texts)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -522,6 +522,63 @@ class MainGuiDocsTargetTests(MainGuiTestBase):
         fake_thread.start.assert_called_once()
         app.log.assert_any_call("감시 시작을 위해 대상 문서를 자동으로 확정했습니다.")
 
+    def test_start_monitoring_uses_backend_process_when_isolation_is_enabled(self):
+        app = self.build_app()
+        app.watch_folder.set("C:/watch")
+        app.docs_input.set("https://docs.google.com/document/d/EXAMPLE_DOC_ID_12345/edit")
+        app.advanced_config_data = {"isolate_backend_process": True, "memory_budget_mb": 32}
+        app.stop_event = Mock()
+        app.parse_max_cache_size = Mock(return_value=10000)
+        app.log_threadsafe = Mock()
+        app.extracted_result_threadsafe = Mock()
+        app.disable_settings_widgets = Mock()
+        app.root.after = Mock()
+        fake_supervisor = Mock()
+        fake_supervisor_class = Mock(return_value=fake_supervisor)
+
+        with patch.object(main_gui, "ctk", self.fake_ctk), patch.object(
+            main_gui, "BackendProcessSupervisor", fake_supervisor_class
+        ), patch.object(main_gui.threading, "Thread") as thread_class:
+            app._start_monitoring_with_services({"docs": object()})
+
+        supervisor_config = fake_supervisor_class.call_args.args[0]
+        self.assertEqual(supervisor_config["docs_id"], "EXAMPLE_DOC_ID_12345")
+        self.assertEqual(supervisor_config["memory_budget_mb"], 32)
+        fake_supervisor.start.assert_called_once()
+        thread_class.assert_not_called()
+        self.assertIs(app.backend_supervisor, fake_supervisor)
+        self.assertTrue(app.is_monitoring)
+
+        with patch.object(main_gui.threading, "Thread") as stop_thread_class:
+            app.stop_monitoring()
+        stop_target = stop_thread_class.call_args.kwargs["target"]
+        stop_target()
+
+        fake_supervisor.stop.assert_called_once_with(main_gui.BACKEND_PROCESS_STOP_TIMEOUT_SECONDS)
+        app.root.after.assert_called_once_with(0, app.on_monitoring_stopped)
+
+    def test_start_monitoring_runs_asyncio_engine_when_configured(self):
+        app = self.build_app()
+        app.watch_folder.set("C:/watch")
+        app.docs_input.set("https://docs.google.com/document/d/EXAMPLE_DOC_ID_12345/edit")
+        app.advanced_config_data = {"monitoring_engine": "asyncio"}
+        app.stop_event = Mock()
+        app.parse_max_cache_size = Mock(return_value=10000)
+        app.log_threadsafe = Mock()
+        app.extracted_result_threadsafe = Mock()
+        app.disable_settings_widgets = Mock()
+        async_engine_func = Mock()
+
+        with patch.object(main_gui, "ctk", self.fake_ctk), patch.object(
+            main_gui,
+            "select_monitoring_engine",
+            Mock(return_value=async_engine_func),
+        ) as select_mock, patch.object(main_gui.threading, "Thread") as thread_class:
+            app._start_monitoring_with_services({"docs": object()})
+
+        self.assertEqual(select_mock.call_args.args[0]["monitoring_engine"], "asyncio")
+        self.assertIs(thread_class.call_args.kwargs["target"], async_engine_func)
+
     def test_handle_google_auth_action_required_requests_foreground_reauth_on_confirm(self):
         app = self.build_app()
         app._start_google_service_worker = Mock()
@@ -0,0 +1,112 @@
+import unittest
+
+from src.auto_write_txt_to_docs.memory_budget import (
+    BYTES_PER_MB,
+    MemoryBudgetManager,
+    estimate_container_bytes,
+    format_memory_budget_status,
+    normalize_memory_budget_mb,
+)
+from fakes import FakeClock
+
+
+class FakeStructure:
+    def __init__(self, size_bytes):
+        self.size_bytes = size_bytes
+        self.evict_requests = []
+
+    def size(self):
+        return self.size_bytes
+
+    def evict(self, bytes_to_free):
+        self.evict_requests.append(bytes_to_free)
+        self.size_bytes -= bytes_to_free
+        return "정리함"
+
+
+class MemoryBudgetManagerTests(unittest.TestCase):
+    def test_only_structures_over_their_share_are_evicted(self):
+        manager = MemoryBudgetManager(budget_mb=10)
+        hashes = FakeStructure(8 * BYTES_PER_MB)
+        line_cache = FakeStructure(1 * BYTES_PER_MB)
+        manager.register("hashes", "파일별 해시", 0.5, hashes.size, hashes.evict)
+        manager.register("line_cache", "전역 라인 캐시", 0.5, line_cache.size, line_cache.evict)
+
+        evictions = manager.enforce("backend")
+
+        self.assertEqual(hashes.evict_requests, [3 * BYTES_PER_MB])
+        self.assertEqual(line_cache.evict_requests, [])
+        self.assertEqual([eviction["name"] for eviction in evictions], ["hashes"])
+        self.assertEqual(evictions[0]["after_bytes"], 5 * BYTES_PER_MB)
+        snapshot = manager.snapshot()
+        self.assertEqual(snapshot["used_bytes"], 6 * BYTES_PER_MB)
+        self.assertEqual(snapshot["eviction_count"], 1)
+
+    def test_enforce_only_touches_requested_group(self):
+        manager = MemoryBudgetManager(budget_mb=10)
+        backend_structure = FakeStructure(20 * BYTES_PER_MB)
+        gui_structure = FakeStructure(20 * BYTES_PER_MB)
+        manager.register("backend", "백엔드", 0.5, backend_structure.size, backend_structure.evict)
+        manager.register("gui", "화면 로그", 0.5, gui_structure.size, gui_structure.evict, group="gui")
+
+        manager.enforce("gui")
+
+        self.assertEqual(backend_structure.evict_requests, [])
+        self.assertEqual(len(gui_structure.evict_requests), 1)
+
+    def test_failing_evictor_is_reported_without_stopping_others(self):
+        manager = MemoryBudgetManager(budget_mb=10)
+
+        def broken_evict(_bytes_to_free):
+            raise OSError("디스크 가득 참")
+
+        other = FakeStructure(20 * BYTES_PER_MB)
+        manager.register("broken", "깨진 항목", 0.1, lambda: 5 * BYTES_PER_MB, broken_evict)
+        manager.register("other", "다른 항목", 0.5, other.size, other.evict)
+
+        evictions = manager.enforce()
+
+        self.assertIn("디스크 가득 참", evictions[0]["summary"])
+        self.assertEqual(other.size(), 5 * BYTES_PER_MB)
+
+    def test_maybe_enforce_waits_for_interval(self):
+        clock = FakeClock()
+        manager = MemoryBudgetManager(budget_mb=10, clock=clock)
+        structure = FakeStructure(0)
+        manager.register("cache", "캐시", 0.5, structure.size, structure.evict)
+
+        manager.maybe_enforce("backend", min_interval_seconds=5.0)
+        structure.size_bytes = 20 * BYTES_PER_MB
+        clock.now = 4.0
+        self.assertEqual(manager.maybe_enforce("backend", min_interval_seconds=5.0), [])
+        clock.now = 5.0
+        self.assertEqual(len(manager.maybe_enforce("backend", min_interval_seconds=5.0)), 1)
+
+    def test_status_line_mentions_last_eviction(self):
+        manager = MemoryBudgetManager(budget_mb=10)
+        structure = FakeStructure(7 * BYTES_PER_MB)
+        manager.register("hashes", "파일별 해시", 0.5, structure.size, structure.evict)
+        manager.enforce()
+
+        self.assertEqual(
+            format_memory_budget_status(manager.snapshot()),
+            "캐시 예산 5.0/10.0 MB · 최근 정리: 파일별 해시 2.0 MB (정리함)",
+        )
+
+
+class MemoryBudgetHelperTests(unittest.TestCase):
+    def test_normalize_memory_budget_mb(self):
+        self.assertEqual(normalize_memory_budget_mb("32"), 32)
+        self.assertEqual(normalize_memory_budget_mb(0), 8)
+        self.assertEqual(normalize_memory_budget_mb(10 ** 6), 4096)
+        self.assertEqual(normalize_memory_budget_mb(None), 64)
+
+    def test_container_estimate_grows_with_items(self):
+        small = {f"{index:064x}" for index in range(10)}
+        large = {f"{index:064x}" for index in range(1000)}
+
+        self.assertGreater(estimate_container_bytes(large), estimate_container_bytes(small) * 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
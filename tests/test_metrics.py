@@ -0,0 +1,104 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.auto_write_txt_to_docs.metrics import (
+    DOCS_API_LATENCY,
+    FILE_QUEUE_DEPTH,
+    LINES_DEDUPED_TOTAL,
+    LINES_READ_TOTAL,
+    LINES_WRITTEN_TOTAL,
+    MetricsRegistry,
+    MetricsSummaryView,
+    MetricsTextfileExporter,
+    format_metrics_summary,
+)
+from fakes import FakeClock
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_counter_increments_from_many_threads_are_not_lost(self):
+        counter = MetricsRegistry().counter("test_total")
+
+        def worker():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter.get(), 80000)
+
+    def test_same_name_returns_same_metric_and_type_conflict_is_rejected(self):
+        registry = MetricsRegistry()
+        self.assertIs(registry.counter("a_total"), registry.counter("a_total"))
+        with self.assertRaises(ValueError):
+            registry.gauge("a_total")
+
+    def test_prometheus_text_has_cumulative_histogram_buckets(self):
+        registry = MetricsRegistry()
+        registry.counter("lines_total", "읽은 줄").inc(3)
+        registry.gauge("depth", value_func=lambda: 7)
+        histogram = registry.histogram("api_seconds", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        text = registry.render_prometheus_text()
+
+        self.assertIn("# HELP lines_total 읽은 줄\n# TYPE lines_total counter\nlines_total 3\n", text)
+        self.assertIn("depth 7\n", text)
+        self.assertIn('api_seconds_bucket{le="0.1"} 1\n', text)
+        self.assertIn('api_seconds_bucket{le="1"} 2\n', text)
+        self.assertIn('api_seconds_bucket{le="+Inf"} 3\n', text)
+        self.assertIn("api_seconds_count 3\n", text)
+
+    def test_exporter_stop_writes_final_textfile(self):
+        registry = MetricsRegistry()
+        registry.counter("exported_total").inc()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "metrics", "app.prom")
+            exporter = MetricsTextfileExporter(registry, path, interval_seconds=60)
+            exporter.start()
+            exporter.stop()
+
+            with open(path, encoding="utf-8") as metrics_file:
+                self.assertIn("exported_total 1", metrics_file.read())
+            self.assertEqual(os.listdir(os.path.dirname(path)), ["app.prom"])
+
+
+class MetricsSummaryViewTests(unittest.TestCase):
+    def test_summary_uses_last_minute_deltas(self):
+        registry = MetricsRegistry()
+        clock = FakeClock()
+        queue_depth = [2]
+        registry.gauge(FILE_QUEUE_DEPTH, value_func=lambda: queue_depth[0])
+        view = MetricsSummaryView(registry, clock=clock)
+
+        registry.counter(LINES_WRITTEN_TOTAL).inc(100)
+        view.refresh()
+        clock.now = 30.0
+        registry.counter(LINES_WRITTEN_TOTAL).inc(10)
+        registry.counter(LINES_READ_TOTAL).inc(20)
+        registry.counter(LINES_DEDUPED_TOTAL).inc(5)
+        registry.histogram(DOCS_API_LATENCY).observe(0.2)
+        registry.histogram(DOCS_API_LATENCY).observe(0.4)
+
+        summary = view.refresh()
+
+        self.assertAlmostEqual(summary["lines_per_minute"], 20.0)
+        self.assertAlmostEqual(summary["api_latency_seconds"], 0.3)
+        self.assertEqual(summary["queue_depth"], 2)
+        self.assertAlmostEqual(summary["cache_hit_ratio"], 0.25)
+        self.assertEqual(format_metrics_summary(summary), "처리량 20줄/분 · API 300ms · 큐 2 · 캐시 적중 25%")
+
+    def test_empty_summary_text(self):
+        summary = MetricsSummaryView(MetricsRegistry(), clock=FakeClock()).refresh()
+        self.assertEqual(format_metrics_summary(summary), "처리량 - · API - · 큐 0 · 캐시 적중 -")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from src.auto_write_txt_to_docs.monitoring_config import MonitoringConfigError, build_monitoring_config
+
+
+class BuildMonitoringConfigTests(unittest.TestCase):
+    def test_builds_engine_config_from_saved_settings(self):
+        monitoring_config = build_monitoring_config({
+            "watch_folder": " /srv/chat ",
+            "docs_input": "https://docs.google.com/document/d/EXAMPLE_DOC_ID_12345/edit",
+            "file_extensions": ".txt,.log",
+            "use_regex_filter": False,
+            "regex_pattern": "ignored",
+            "max_cache_size": 500,
+            "memory_budget_mb": 32,
+            "monitoring_engine": "asyncio",
+            "appearance_mode": "Dark",
+        })
+
+        self.assertEqual(monitoring_config, {
+            "watch_folder": "/srv/chat",
+            "docs_id": "EXAMPLE_DOC_ID_12345",
+            "file_extensions": ".txt,.log",
+            "use_regex_filter": False,
+            "regex_pattern": "",
+            "max_cache_size": 500,
+            "memory_budget_mb": 32,
+            "monitoring_engine": "asyncio",
+        })
+
+    def test_rejects_missing_folder_bad_docs_target_and_bad_regex(self):
+        valid = {"watch_folder": "/srv/chat", "docs_input": "EXAMPLE_DOC_ID_12345"}
+        for overrides in (
+            {"watch_folder": ""},
+            {"docs_input": "https://example.com/document/d/EXAMPLE_DOC_ID_12345"},
+            {"use_regex_filter": True, "regex_pattern": "[unclosed"},
+        ):
+            with self.subTest(overrides=overrides), self.assertRaises(MonitoringConfigError):
+                build_monitoring_config({**valid, **overrides})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from src.auto_write_txt_to_docs.notification_aggregator import (
+    DEFAULT_NOTIFICATION_WINDOW_SECONDS,
+    NotificationAggregator,
+    SoundRateLimiter,
+    normalize_notification_window_seconds,
+)
+from fakes import FakeClock
+
+
+class NotificationAggregatorTests(unittest.TestCase):
+    def test_first_event_is_immediate_and_burst_is_summarized(self):
+        aggregator = NotificationAggregator(window_seconds=3)
+
+        self.assertTrue(aggregator.admit("success", line_count=5))
+        admitted = [aggregator.admit("success", line_count=10) for _ in range(36)]
+        admitted.append(aggregator.admit("duplicate_skipped"))
+        admitted.append(aggregator.admit("duplicate_recorded"))
+
+        self.assertFalse(any(admitted))
+        summary = aggregator.flush()
+        self.assertEqual(summary.describe(), "38개 파일, 360줄 추가, 중복 2건")
+        self.assertEqual(summary.event_type, "success")
+        self.assertTrue(aggregator.window_open)
+
+        self.assertIsNone(aggregator.flush())
+        self.assertFalse(aggregator.window_open)
+        self.assertTrue(aggregator.admit("success"))
+
+    def test_failure_makes_summary_a_failure(self):
+        aggregator = NotificationAggregator(window_seconds=1)
+        aggregator.admit("success")
+        aggregator.admit("failure")
+        aggregator.admit("duplicate_skipped")
+
+        summary = aggregator.flush()
+
+        self.assertEqual(summary.event_type, "failure")
+        self.assertEqual(summary.describe(), "2개 파일, 중복 1건, 실패 1건")
+
+    def test_zero_window_disables_aggregation(self):
+        aggregator = NotificationAggregator(window_seconds=0)
+
+        self.assertTrue(all(aggregator.admit("success") for _ in range(5)))
+        self.assertIsNone(aggregator.flush())
+
+    def test_normalize_window_seconds(self):
+        self.assertEqual(normalize_notification_window_seconds("2.5"), 2.5)
+        self.assertEqual(normalize_notification_window_seconds(-1), DEFAULT_NOTIFICATION_WINDOW_SECONDS)
+        self.assertEqual(normalize_notification_window_seconds(None), DEFAULT_NOTIFICATION_WINDOW_SECONDS)
+        self.assertEqual(normalize_notification_window_seconds(600), 60.0)
+
+
+class SoundRateLimiterTests(unittest.TestCase):
+    def test_sounds_within_interval_are_dropped(self):
+        clock = FakeClock(10.0)
+        limiter = SoundRateLimiter(min_interval_seconds=1.5, clock=clock)
+
+        self.assertTrue(limiter.allow())
+        clock.now = 11.0
+        self.assertFalse(limiter.allow())
+        clock.now = 11.6
+        self.assertTrue(limiter.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
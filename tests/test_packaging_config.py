@@ -14,6 +14,12 @@ class PackagingConfigTests(unittest.TestCase):
         self.assertEqual(scripts["auto_write_gui"], "main_gui:main")
         self.assertIn("def main():", self.main_gui_source)
 
+    def test_headless_console_script_points_to_daemon_main(self):
+        scripts = self.pyproject_data["project"]["scripts"]
+        self.assertEqual(scripts["auto_write_daemon"], "src.auto_write_txt_to_docs.daemon:main")
+        daemon_source = Path("src/auto_write_txt_to_docs/daemon.py").read_text(encoding="utf-8")
+        self.assertIn("def main(argv=None):", daemon_source)
+
     def test_project_dependencies_include_runtime_packages(self):
         dependencies = self.pyproject_data["project"]["dependencies"]
         self.assertIn("psutil>=5.9.5", dependencies)
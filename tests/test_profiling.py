@@ -0,0 +1,117 @@
+import os
+import pstats
+import tempfile
+import threading
+import time
+import unittest
+
+from src.auto_write_txt_to_docs.profiling import (
+    ProfilingError,
+    SamplingProfiler,
+    ThreadProfileHook,
+    capture_sampling_profile,
+)
+
+
+def busy_wait_marker(stop_event):
+    while not stop_event.is_set():
+        profiled_work()
+
+
+def profiled_work():
+    return sum(range(200))
+
+
+class SamplingProfilerTests(unittest.TestCase):
+    def test_samples_other_threads_into_collapsed_stacks(self):
+        stop_event = threading.Event()
+        worker = threading.Thread(target=busy_wait_marker, args=(stop_event,), name="busy worker", daemon=True)
+        worker.start()
+        self.addCleanup(stop_event.set)
+
+        profiler = SamplingProfiler(interval_seconds=0.001)
+        profiler.run(0.05)
+        stop_event.set()
+        worker.join(timeout=2.0)
+
+        collapsed = profiler.render_collapsed()
+        worker_lines = [line for line in collapsed.splitlines() if line.startswith("busy_worker;")]
+        self.assertTrue(worker_lines)
+        self.assertTrue(any("busy_wait_marker (test_profiling.py:" in line for line in worker_lines))
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed.splitlines()))
+        self.assertNotIn("SamplingProfiler.run", collapsed)
+
+    def test_capture_writes_file_and_rejects_concurrent_capture(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results = []
+            first = threading.Thread(target=lambda: results.append(capture_sampling_profile(temp_dir, 0.2)))
+            first.start()
+            time.sleep(0.05)
+            with self.assertRaises(ProfilingError):
+                capture_sampling_profile(temp_dir, 0.01)
+            first.join(timeout=2.0)
+
+            self.assertEqual(len(results), 1)
+            self.assertTrue(results[0].endswith(".collapsed.txt"))
+            self.assertTrue(os.path.exists(results[0]))
+
+
+class ThreadProfileHookTests(unittest.TestCase):
+    def test_request_requires_attached_thread(self):
+        with self.assertRaises(ProfilingError):
+            ThreadProfileHook().request(1.0, "unused.pstats")
+
+    def test_target_loop_profiles_itself_and_writes_pstats(self):
+        hook = ThreadProfileHook()
+        wake_event = threading.Event()
+        stop_event = threading.Event()
+
+        def target_loop():
+            hook.attach(wake_func=wake_event.set)
+            try:
+                while not stop_event.is_set():
+                    hook.step()
+                    wake_event.wait(0.5)
+                    wake_event.clear()
+                    profiled_work()
+            finally:
+                hook.detach()
+
+        loop_thread = threading.Thread(target=target_loop, daemon=True)
+        loop_thread.start()
+        self.addCleanup(stop_event.set)
+        while not hook.attached:
+            time.sleep(0.001)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "loop.pstats")
+            self.assertEqual(hook.capture(output_path, duration_seconds=0.05, finish_timeout_seconds=2.0), output_path)
+
+            stats = pstats.Stats(output_path)
+            self.assertTrue(any(function_name == "profiled_work" for (_file, _line, function_name) in stats.stats))
+            self.assertTrue(os.path.exists(output_path + ".txt"))
+
+        stop_event.set()
+        loop_thread.join(timeout=2.0)
+        self.assertFalse(hook.attached)
+
+    def test_detach_saves_active_profile_and_fails_pending_request(self):
+        hook = ThreadProfileHook()
+        hook.attach()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            active_request = hook.request(60.0, os.path.join(temp_dir, "active.pstats"))
+            hook.step()
+            hook.detach()
+
+            self.assertTrue(active_request["done"].is_set())
+            self.assertIsNone(active_request["error"])
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "active.pstats")))
+
+        hook.attach()
+        pending_request = hook.request(60.0, "never.pstats")
+        hook.detach()
+        self.assertIn("감시가 종료", pending_request["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+
+from src.auto_write_txt_to_docs.result_cards import (
+    RESULT_CARD_EMPTY_TEXT,
+    ResultCardPool,
+    prepend_preview_block,
+)
+
+
+class FakeWidget:
+    created = []
+
+    def __init__(self, parent=None, **kwargs):
+        self.parent = parent
+        self.options = dict(kwargs)
+        self.configure_calls = []
+        self.packed = False
+        self.destroyed = False
+        FakeWidget.created.append(self)
+
+    def pack(self, **_kwargs):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def configure(self, **kwargs):
+        self.configure_calls.append(kwargs)
+        self.options.update(kwargs)
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class FakeCtk:
+    CTkFrame = FakeWidget
+    CTkLabel = FakeWidget
+
+
+class FakeFontFactory:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, size, weight="normal"):
+        self.calls.append((size, weight))
+        return (size, weight)
+
+
+class FakePreviewText:
+    def __init__(self):
+        self.text = "\n"
+        self.state = "disabled"
+
+    def configure(self, state=None):
+        self.state = state
+
+    def insert(self, index, text):
+        assert index == "1.0"
+        self.text = text + self.text
+
+    def index(self, index):
+        assert index == "end-1c"
+        return f"{self.text.count(chr(10))}.0"
+
+    def delete(self, start, end):
+        line_number = int(start.split(".")[0])
+        lines = self.text.split("\n")
+        self.text = "\n".join(lines[:line_number - 1]) + "\n"
+
+    def see(self, _index):
+        pass
+
+    def lines(self):
+        return self.text[:-1].splitlines()
+
+
+def build_card(index, result_type="성공"):
+    return {
+        "file_title": f"file_{index}.txt",
+        "extracted_time": f"2025-01-01 00:00:{index:02d}",
+        "line_count": index,
+        "preview_text": f"미리보기 {index}",
+        "result_type": result_type,
+    }
+
+
+class ResultCardPoolTests(unittest.TestCase):
+    def setUp(self):
+        FakeWidget.created = []
+        self.font_factory = FakeFontFactory()
+        self.pool = ResultCardPool(FakeWidget(), self.font_factory, limit=3, ctk_module=FakeCtk)
+
+    def test_cards_are_created_once_and_reused(self):
+        cards = []
+        self.pool.render(cards)
+        for index in range(10):
+            cards.insert(0, build_card(index))
+            self.pool.render(cards[:3])
+        created_after_fill = len(FakeWidget.created)
+
+        for index in range(10, 30):
+            cards.insert(0, build_card(index))
+            self.pool.render(cards[:3])
+
+        self.assertEqual(len(FakeWidget.created), created_after_fill)
+        self.assertEqual(len(self.pool.slots), 3)
+        self.assertEqual(len(self.font_factory.calls), 4)
+        self.assertEqual(self.pool.slots[0].title_label.options["text"], "file_29.txt")
+        self.assertFalse(any(widget.destroyed for widget in FakeWidget.created))
+
+    def test_unchanged_card_is_not_reconfigured(self):
+        card = build_card(1)
+        self.pool.render([card])
+        slot = self.pool.slots[0]
+        configure_count = len(slot.title_label.configure_calls)
+
+        self.pool.render([dict(card)])
+
+        self.assertEqual(len(slot.title_label.configure_calls), configure_count)
+
+    def test_only_changed_fields_are_updated(self):
+        self.pool.render([build_card(1)])
+        slot = self.pool.slots[0]
+
+        updated_card = build_card(1, result_type="중복 기록")
+        self.pool.render([updated_card])
+
+        self.assertEqual(len(slot.title_label.configure_calls), 1)
+        self.assertEqual(slot.badge.options["text"], "중복 기록")
+        self.assertEqual(slot.badge.options["fg_color"], "#FEF3C7")
+
+    def test_empty_state_toggles_with_card_visibility(self):
+        self.pool.render([])
+        self.assertTrue(self.pool.empty_label.packed)
+        self.assertEqual(self.pool.empty_label.options["text"], RESULT_CARD_EMPTY_TEXT)
+
+        self.pool.render([build_card(1), build_card(2)])
+        self.assertFalse(self.pool.empty_label.packed)
+        self.assertTrue(all(slot.frame.packed for slot in self.pool.slots))
+
+        self.pool.render([build_card(3)])
+        self.assertTrue(self.pool.slots[0].frame.packed)
+        self.assertFalse(self.pool.slots[1].frame.packed)
+
+
+class PrependPreviewBlockTests(unittest.TestCase):
+    def test_new_block_goes_first_and_tail_is_trimmed(self):
+        widget = FakePreviewText()
+        for index in range(5):
+            prepend_preview_block(widget, f"블록 {index}-1\n블록 {index}-2\n", max_lines=5)
+
+        self.assertEqual(widget.lines(), ["블록 4-1", "블록 4-2", "블록 3-1", "블록 3-2", "블록 2-1"])
+        self.assertEqual(widget.state, "disabled")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,11 @@ import unittest
 
 from src.auto_write_txt_to_docs.result_popup import (
     FAILURE_POPUP_DURATION_MS,
+    POPUP_UPDATE_MIN_INTERVAL_MS,
     SUCCESS_POPUP_DURATION_MS,
     ResultPopupPresenter,
 )
+from fakes import FakeClock
 
 
 class FakeRoot:
@@ -49,11 +51,18 @@ class FakeWidget:
         self.pack_args = args
         self.pack_kwargs = kwargs
 
+    def configure(self, **kwargs):
+        self.kwargs.update(kwargs)
+
 
 class FakeToplevel:
+    instances = []
+
     def __init__(self, root):
+        self.__class__.instances.append(self)
         self.root = root
         self.destroyed = False
+        self.withdrawn = False
         self.geometry_value = None
         self.title_value = None
         self.width = 260
@@ -96,7 +105,10 @@ class FakeToplevel:
         self.geometry_value = value
 
     def deiconify(self):
-        pass
+        self.withdrawn = False
+
+    def withdraw(self):
+        self.withdrawn = True
 
     def lift(self):
         pass
@@ -134,30 +146,60 @@ class ResultPopupPresenterTests(unittest.TestCase):
     def setUp(self):
         FakeWidget.instances = []
         FakeButton.instances = []
+        FakeToplevel.instances = []
 
-    def test_show_replaces_existing_popup_and_resets_timer(self):
+    def test_show_reuses_existing_popup_and_resets_timer(self):
         root = FakeRoot()
-        presenter = ResultPopupPresenter(root, ctk_module=FakeCtkModule)
+        clock = FakeClock(100.0)
+        presenter = ResultPopupPresenter(root, ctk_module=FakeCtkModule, clock=clock)
         presenter._get_windows_work_area = lambda _popup_window: (0, 0, 1920, 1040)
 
         first_result = presenter.show("첫 알림", "첫 줄\n둘째 줄", "success")
         first_popup = presenter.popup_window
         first_after_id = presenter.close_after_id
+        widget_count = len(FakeWidget.instances)
 
+        clock.now += 5
         second_result = presenter.show("둘째 알림", "하나\n둘\n셋\n넷", "failure")
 
         self.assertTrue(first_result)
         self.assertTrue(second_result)
-        self.assertTrue(first_popup.destroyed)
+        self.assertFalse(first_popup.destroyed)
+        self.assertIs(presenter.popup_window, first_popup)
+        self.assertEqual(len(FakeToplevel.instances), 1)
+        self.assertEqual(len(FakeWidget.instances), widget_count)
         self.assertEqual(root.after_cancel_calls, [first_after_id])
         self.assertEqual(root.after_calls[0][1], SUCCESS_POPUP_DURATION_MS)
         self.assertEqual(root.after_calls[1][1], FAILURE_POPUP_DURATION_MS)
         self.assertEqual(presenter.last_payload["level"], "failure")
         self.assertEqual(presenter.last_payload["message"], "하나\n둘\n셋  외 1줄")
-        self.assertNotEqual(presenter.popup_window, first_popup)
+        self.assertEqual(presenter.popup_widgets["message_label"].kwargs["text"], "하나\n둘\n셋  외 1줄")
         self.assertEqual(presenter.popup_window.title_value, "둘째 알림")
         self.assertEqual(presenter.popup_window.geometry_value, "260x128+1648+900")
 
+    def test_rapid_updates_are_coalesced_into_latest_payload(self):
+        root = FakeRoot()
+        clock = FakeClock(100.0)
+        presenter = ResultPopupPresenter(root, ctk_module=FakeCtkModule, clock=clock)
+        presenter._get_windows_work_area = lambda _popup_window: (0, 0, 1920, 1040)
+
+        presenter.show("1", "첫 알림", "success")
+        clock.now += 0.1
+        presenter.show("2", "둘째 알림", "success")
+        presenter.show("3", "셋째 알림", "duplicate")
+
+        self.assertEqual(presenter.last_payload["title"], "1")
+        pending_calls = [call for call in root.after_calls if call[2] == presenter._render_pending_payload]
+        self.assertEqual(len(pending_calls), 1)
+        self.assertLessEqual(pending_calls[0][1], POPUP_UPDATE_MIN_INTERVAL_MS)
+
+        clock.now += 1
+        pending_calls[0][2]()
+
+        self.assertEqual(presenter.last_payload["title"], "3")
+        self.assertEqual(presenter.last_payload["level"], "duplicate")
+        self.assertIsNone(presenter.pending_payload)
+
     def test_show_uses_requested_width_for_right_edge_alignment(self):
         root = FakeRoot()
         presenter = ResultPopupPresenter(root, ctk_module=FakeCtkModule)
@@ -179,9 +221,22 @@ class ResultPopupPresenterTests(unittest.TestCase):
         close_button = FakeButton.instances[-1]
         close_button.kwargs["command"]()
 
-        self.assertTrue(presenter.popup_window is None)
+        self.assertTrue(presenter.popup_window.withdrawn)
+        self.assertFalse(presenter.popup_visible)
         self.assertTrue(root.after_cancel_calls)
 
+    def test_destroy_removes_reusable_popup(self):
+        root = FakeRoot()
+        presenter = ResultPopupPresenter(root, ctk_module=FakeCtkModule)
+        presenter._get_windows_work_area = lambda _popup_window: (0, 0, 1920, 1040)
+
+        presenter.show("종료 테스트", "본문", "success")
+        popup_window = presenter.popup_window
+        presenter.destroy()
+
+        self.assertTrue(popup_window.destroyed)
+        self.assertIsNone(presenter.popup_window)
+
     def test_close_safely_handles_missing_popup(self):
         root = FakeRoot()
         presenter = ResultPopupPresenter(root, ctk_module=FakeCtkModule)
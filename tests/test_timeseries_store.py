@@ -0,0 +1,135 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.auto_write_txt_to_docs.metrics import (
+    DOCS_API_CALLS_TOTAL,
+    DOCS_API_LATENCY,
+    FILE_QUEUE_DEPTH,
+    LINES_WRITTEN_TOTAL,
+    MetricsRegistry,
+)
+from src.auto_write_txt_to_docs.timeseries_store import (
+    HEADER_STRUCT,
+    SLOT_STRUCT,
+    TimeSeriesRecorder,
+    TimeSeriesStore,
+    build_sparkline,
+    empty_bucket,
+    export_csv,
+    format_sparkline_report,
+    main,
+)
+from fakes import FakeClock
+
+
+def bucket(**values):
+    result = empty_bucket()
+    result.update(values)
+    return result
+
+
+class TimeSeriesStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "series.bin")
+
+    def test_file_size_is_fixed_and_old_minutes_are_overwritten(self):
+        store = TimeSeriesStore(self.path, slot_count=10)
+        for minute in range(1000, 1025):
+            store.add_to_bucket(minute, bucket(lines_written=minute))
+
+        self.assertEqual(os.path.getsize(self.path), HEADER_STRUCT.size + 10 * SLOT_STRUCT.size)
+        rows = store.read_range(1000, 1024)
+        self.assertEqual([minute for minute, _bucket in rows], list(range(1015, 1025)))
+        self.assertEqual(rows[-1][1]["lines_written"], 1024)
+
+    def test_same_minute_adds_counters_and_keeps_max_fields(self):
+        store = TimeSeriesStore(self.path, slot_count=10)
+        store.add_to_bucket(500, bucket(lines_written=3, api_latency_max_ms=80, queue_depth_max=4))
+        store.add_to_bucket(500, bucket(lines_written=2, api_latency_max_ms=50, queue_depth_max=9))
+
+        (_minute, stored), = store.read_range(500, 500)
+        self.assertEqual(stored["lines_written"], 5)
+        self.assertEqual(stored["api_latency_max_ms"], 80)
+        self.assertEqual(stored["queue_depth_max"], 9)
+
+    def test_missing_or_foreign_file_reads_as_empty(self):
+        store = TimeSeriesStore(self.path, slot_count=10)
+        self.assertEqual(store.read_range(1, 2), [(1, empty_bucket()), (2, empty_bucket())])
+
+        with open(self.path, "wb") as foreign_file:
+            foreign_file.write(b"not a series file")
+        self.assertEqual(store.read_range(1, 1), [(1, empty_bucket())])
+        store.add_to_bucket(1, bucket(retries=1))
+        self.assertEqual(store.read_range(1, 1)[0][1]["retries"], 1)
+
+
+class TimeSeriesRecorderTests(unittest.TestCase):
+    def test_sample_records_counter_deltas_into_current_minute(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            registry = MetricsRegistry()
+            registry.counter(LINES_WRITTEN_TOTAL).inc(100)
+            registry.gauge(FILE_QUEUE_DEPTH, value_func=lambda: 3)
+            clock = FakeClock(60 * 700 + 5)
+            store = TimeSeriesStore(os.path.join(temp_dir, "series.bin"), slot_count=10)
+            recorder = TimeSeriesRecorder(store, registry=registry, clock=clock)
+
+            registry.counter(LINES_WRITTEN_TOTAL).inc(7)
+            registry.counter(DOCS_API_CALLS_TOTAL).inc(2)
+            registry.histogram(DOCS_API_LATENCY).observe(0.1)
+            registry.histogram(DOCS_API_LATENCY).observe(0.3)
+            recorder.sample()
+            recorder.sample()
+
+            (_minute, stored), = store.read_range(700, 700)
+            self.assertEqual(stored["lines_written"], 7)
+            self.assertEqual(stored["docs_calls"], 2)
+            self.assertEqual(stored["api_latency_sum_ms"], 400)
+            self.assertEqual(stored["api_latency_max_ms"], 300)
+            self.assertEqual(stored["queue_depth_max"], 3)
+
+    def test_thread_writes_final_sample_on_stop(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            registry = MetricsRegistry()
+            store = TimeSeriesStore(os.path.join(temp_dir, "series.bin"), slot_count=10)
+            recorder = TimeSeriesRecorder(store, registry=registry, sample_interval_seconds=60, clock=FakeClock(60 * 42))
+            recorder.start()
+            registry.counter(LINES_WRITTEN_TOTAL).inc(5)
+            recorder.stop()
+
+            self.assertEqual(store.read_range(42, 42)[0][1]["lines_written"], 5)
+
+
+class TimeSeriesOutputTests(unittest.TestCase):
+    def test_sparkline_scales_to_maximum(self):
+        self.assertEqual(build_sparkline([0, 4, 8]), "▁▅█")
+        self.assertEqual(build_sparkline([0, 0]), "▁▁")
+
+    def test_report_and_csv_export(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "series.bin")
+            store = TimeSeriesStore(path, slot_count=60 * 24 * 7)
+            store.add_to_bucket(30_000_000, bucket(lines_written=12, docs_calls=2, api_latency_sum_ms=500))
+
+            report = format_sparkline_report(store, 24, current_time=30_000_000 * 60)
+            self.assertIn("기록 줄 (합계 12, 최대 12)", report)
+            self.assertIn("API 평균(ms) (합계 250, 최대 250)", report)
+
+            output = io.StringIO()
+            self.assertEqual(export_csv(store, output, 29_999_990, 30_000_000), 1)
+            header, row = output.getvalue().splitlines()
+            self.assertTrue(header.startswith("minute_utc,lines_written,bytes_read"))
+            self.assertTrue(row.startswith("2027-01-15T"))
+            self.assertIn(",12,", row)
+
+            csv_path = os.path.join(temp_dir, "out.csv")
+            self.assertEqual(main(["--path", path, "--hours", "1", "-o", csv_path]), 0)
+            with open(csv_path, encoding="utf-8") as csv_file:
+                self.assertTrue(csv_file.readline().startswith("minute_utc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
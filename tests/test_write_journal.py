@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.auto_write_txt_to_docs.write_journal import WriteJournal, count_utf16_units
+
+
+class WriteJournalTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "journal.jsonl")
+
+    def read_records(self):
+        with open(self.path, encoding="utf-8") as journal_file:
+            return [json.loads(line) for line in journal_file]
+
+    def test_pending_entry_survives_reopen_and_completed_entry_does_not(self):
+        journal = WriteJournal()
+        journal.open(self.path)
+        first_entry = journal.begin("doc-1", "/chat/a.txt", "첫 기록\n", 0, 10)
+        journal.begin("doc-1", "/chat/b.txt", "둘째 기록\n", 0, 12)
+        journal.complete(first_entry, revision_id="rev-2")
+
+        reopened = WriteJournal()
+        reopened.open(self.path)
+
+        self.assertEqual([entry["filepath"] for entry in reopened.pending.values()], ["/chat/b.txt"])
+        self.assertEqual(reopened.pending_for("/chat/b.txt")[0]["text"], "둘째 기록\n")
+        self.assertEqual(reopened.documents["doc-1"]["revision_id"], "rev-2")
+        self.assertEqual(reopened.begin("doc-1", "/chat/c.txt", "셋째\n")["id"], 3)
+
+    def test_file_is_compacted_when_nothing_is_pending(self):
+        journal = WriteJournal()
+        journal.open(self.path)
+        journal.remember_document_state("doc-1", "rev-1", 100)
+        entry = journal.begin("doc-1", "/chat/a.txt", "가나\n", 0, 7)
+
+        journal.complete(entry, revision_id="rev-2")
+
+        self.assertEqual(self.read_records(), [
+            {"op": "document", "docs_id": "doc-1", "revision_id": "rev-2", "end_index": 100 + count_utf16_units("가나\n")},
+        ])
+        self.assertFalse(journal.has_pending())
+
+    def test_end_index_is_unknown_after_someone_else_changed_the_document(self):
+        journal = WriteJournal()
+        journal.remember_document_state("doc-1", "rev-1", 100)
+        entry = journal.begin("doc-1", "/chat/a.txt", "가\n")
+        journal.remember_document_state("doc-1", "rev-5", 180)
+
+        journal.complete(entry, revision_id="rev-6")
+
+        self.assertEqual(journal.documents["doc-1"], {"revision_id": "rev-6", "end_index": None})
+
+    def test_torn_last_line_and_tampered_entry_are_ignored(self):
+        journal = WriteJournal()
+        journal.open(self.path)
+        journal.begin("doc-1", "/chat/a.txt", "원래 기록\n", 0, 10)
+        records = self.read_records()
+        records[-1]["entry"]["text"] = "바뀐 기록\n"
+        with open(self.path, "w", encoding="utf-8") as journal_file:
+            for record in records:
+                journal_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            journal_file.write('{"op": "begin", "entry": {"id": 9')
+        messages = []
+
+        reopened = WriteJournal()
+        reopened.open(self.path, messages.append)
+
+        self.assertFalse(reopened.has_pending())
+        self.assertEqual(messages, ["경고: Docs 기록 저널의 깨진 줄을 건너뜁니다."])
+
+
+if __name__ == "__main__":
+    unittest.main()